@@ -10,6 +10,7 @@ from pathlib import Path
 
 from ..shared.dependencies.container import Container, ServiceLifetime
 from ..shared.events.event_bus import EventBus, AsyncEventBus
+from ..shared.query_cache import QueryCache
 
 # Domain Services
 from ..domains.pipeline.services import (
@@ -29,7 +30,8 @@ from ..domains.content.services import (
     StyleManagementService,
     ContentGenerationService,
     TemplateRenderingService,
-    ContentValidationService
+    ContentValidationService,
+    create_template_management_service
 )
 from ..domains.execution.services import (
     LLMOrchestrationService,
@@ -314,6 +316,9 @@ class DIConfiguration:
         # Event Bus (singleton)
         container.register_singleton(EventBus, AsyncEventBus)
         
+        # Query result cache shared by the cached query handlers (singleton)
+        container.register_factory(QueryCache, lambda: QueryCache(), ServiceLifetime.SINGLETON)
+        
         return container
     
     @staticmethod
@@ -357,9 +362,12 @@ class DIConfiguration:
         )
         
         # Content Domain Services
-        container.register_scoped(
+        # Analyzes dependencies with the repository's persisted dependency index
+        container.register_factory(
             TemplateManagementService,
-            TemplateManagementService
+            create_template_management_service,
+            ServiceLifetime.SCOPED,
+            async_factory=True
         )
         container.register_scoped(
             StyleManagementService,
@@ -820,6 +828,7 @@ class DIConfiguration:
         return {
             # Event Bus
             "event_bus": EventBus,
+            "query_cache": QueryCache,
             
             # Domain Services
             "pipeline_validation_service": PipelineValidationService,
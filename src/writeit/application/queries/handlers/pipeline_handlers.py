@@ -4,7 +4,7 @@ Concrete implementations of pipeline-related query handlers.
 """
 
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Type
 from datetime import datetime
 
 from ...queries.pipeline_queries import (
@@ -31,10 +31,92 @@ from ....domains.workspace.repositories import WorkspaceRepository
 from ....domains.pipeline.entities import PipelineTemplate, PipelineRun
 from ....domains.pipeline.value_objects import PipelineId, PipelineName
 from ....domains.workspace.value_objects import WorkspaceName
+from ....domains.pipeline.events import (
+    PipelineCreated,
+    PipelineUpdated,
+    PipelineDeleted,
+    PipelinePublished,
+    PipelineDeprecated,
+    PipelineExecutionStarted,
+    PipelineExecutionCompleted,
+    PipelineExecutionFailed,
+    PipelineExecutionCancelled,
+    StepExecutionStarted,
+    StepExecutionCompleted,
+    StepExecutionFailed,
+    StepExecutionSkipped,
+    StepExecutionRetried,
+)
 from ....shared.errors import RepositoryError, QueryError
+from ....shared.events import EventBus
+from ....shared.events.domain_event import DomainEvent
+from ....shared.query_cache import InvalidationRule, QueryCache
 
 logger = logging.getLogger(__name__)
 
+# Cache namespaces and TTLs (seconds). Events invalidate entries precisely;
+# the TTLs only bound staleness from writes that publish no event.
+LIST_TEMPLATES_CACHE_NAMESPACE = "pipeline_templates.list"
+LIST_TEMPLATES_CACHE_TTL = 300.0
+LIST_RUNS_CACHE_NAMESPACE = "pipeline_runs.list"
+LIST_RUNS_CACHE_TTL = 15.0
+ANALYTICS_CACHE_NAMESPACE = "pipeline_runs.analytics"
+ANALYTICS_CACHE_TTL = 60.0
+
+TEMPLATES_TAG = "pipeline_templates"
+RUNS_TAG = "pipeline_runs"
+
+
+def _workspace_tag(prefix: str, workspace_name: Optional[str]) -> str:
+    return f"{prefix}:{workspace_name or '*'}"
+
+
+def _template_tags(workspace_name: Optional[str]) -> List[str]:
+    return [TEMPLATES_TAG, _workspace_tag(TEMPLATES_TAG, workspace_name)]
+
+
+def _run_tags(workspace_name: Optional[str]) -> List[str]:
+    return [RUNS_TAG, _workspace_tag(RUNS_TAG, workspace_name)]
+
+
+def _execution_event_tags(event: DomainEvent) -> List[str]:
+    # Results for the run's workspace and unscoped results ("*") include it
+    workspace_name = getattr(event, "workspace_name", None)
+    return [_workspace_tag(RUNS_TAG, workspace_name), _workspace_tag(RUNS_TAG, None)]
+
+
+def _step_event_tags(event: DomainEvent) -> List[str]:
+    # Step events carry no workspace, so they invalidate every run result
+    return [RUNS_TAG]
+
+
+def _template_event_tags(event: DomainEvent) -> List[str]:
+    # Template events carry no workspace either
+    return [TEMPLATES_TAG]
+
+
+PIPELINE_QUERY_INVALIDATIONS: Dict[Type[DomainEvent], InvalidationRule] = {
+    PipelineCreated: _template_event_tags,
+    PipelineUpdated: _template_event_tags,
+    PipelineDeleted: _template_event_tags,
+    PipelinePublished: _template_event_tags,
+    PipelineDeprecated: _template_event_tags,
+    PipelineExecutionStarted: _execution_event_tags,
+    PipelineExecutionCompleted: _execution_event_tags,
+    PipelineExecutionFailed: _execution_event_tags,
+    PipelineExecutionCancelled: _execution_event_tags,
+    StepExecutionStarted: _step_event_tags,
+    StepExecutionCompleted: _step_event_tags,
+    StepExecutionFailed: _step_event_tags,
+    StepExecutionSkipped: _step_event_tags,
+    StepExecutionRetried: _step_event_tags,
+}
+
+
+async def register_pipeline_query_cache_invalidation(event_bus: EventBus, query_cache: QueryCache) -> None:
+    """Invalidate cached pipeline query results from pipeline domain events."""
+    await query_cache.subscribe(event_bus, PIPELINE_QUERY_INVALIDATIONS)
+
 
 class ConcreteGetPipelineTemplateQueryHandler(GetPipelineTemplateQueryHandler):
     """Handler for getting pipeline template by ID."""
@@ -119,13 +201,24 @@ class ConcreteListPipelineTemplatesQueryHandler(ListPipelineTemplatesQueryHandle
     def __init__(
         self,
         pipeline_template_repository: PipelineTemplateRepository,
-        workspace_repository: WorkspaceRepository
+        workspace_repository: WorkspaceRepository,
+        query_cache: QueryCache
     ):
         self.pipeline_template_repository = pipeline_template_repository
         self.workspace_repository = workspace_repository
+        self.query_cache = query_cache
+        query_cache.configure(LIST_TEMPLATES_CACHE_NAMESPACE, LIST_TEMPLATES_CACHE_TTL)
     
     async def handle(self, query: ListPipelineTemplatesQuery) -> PipelineTemplateQueryResult:
         """Handle list pipeline templates query."""
+        return await self.query_cache.get_or_compute(
+            query,
+            LIST_TEMPLATES_CACHE_NAMESPACE,
+            lambda: self._list_templates(query),
+            tags=_template_tags(query.workspace_name)
+        )
+    
+    async def _list_templates(self, query: ListPipelineTemplatesQuery) -> PipelineTemplateQueryResult:
         try:
             logger.debug(f"Listing pipeline templates with filters: {query}")
             
@@ -258,10 +351,12 @@ class ConcreteSearchPipelineTemplatesQueryHandler(SearchPipelineTemplatesQueryHa
     def __init__(
         self,
         pipeline_template_repository: PipelineTemplateRepository,
-        workspace_repository: WorkspaceRepository
+        workspace_repository: WorkspaceRepository,
+        query_cache: QueryCache
     ):
         self.pipeline_template_repository = pipeline_template_repository
         self.workspace_repository = workspace_repository
+        self.query_cache = query_cache
     
     async def handle(self, query: SearchPipelineTemplatesQuery) -> PipelineTemplateQueryResult:
         """Handle search pipeline templates query."""
@@ -280,7 +375,8 @@ class ConcreteSearchPipelineTemplatesQueryHandler(SearchPipelineTemplatesQueryHa
             
             list_handler = ConcreteListPipelineTemplatesQueryHandler(
                 self.pipeline_template_repository,
-                self.workspace_repository
+                self.workspace_repository,
+                self.query_cache
             )
             
             result = await list_handler.handle(list_query)
@@ -381,11 +477,21 @@ class ConcreteGetPipelineRunQueryHandler(GetPipelineRunQueryHandler):
 class ConcreteListPipelineRunsQueryHandler(ListPipelineRunsQueryHandler):
     """Handler for listing pipeline runs."""
     
-    def __init__(self, pipeline_run_repository: PipelineRunRepository):
+    def __init__(self, pipeline_run_repository: PipelineRunRepository, query_cache: QueryCache):
         self.pipeline_run_repository = pipeline_run_repository
+        self.query_cache = query_cache
+        query_cache.configure(LIST_RUNS_CACHE_NAMESPACE, LIST_RUNS_CACHE_TTL)
     
     async def handle(self, query: ListPipelineRunsQuery) -> PipelineRunQueryResult:
         """Handle list pipeline runs query."""
+        return await self.query_cache.get_or_compute(
+            query,
+            LIST_RUNS_CACHE_NAMESPACE,
+            lambda: self._list_runs(query),
+            tags=_run_tags(query.workspace_name)
+        )
+    
+    async def _list_runs(self, query: ListPipelineRunsQuery) -> PipelineRunQueryResult:
         try:
             logger.debug(f"Listing pipeline runs with filters: {query}")
             
@@ -492,95 +598,40 @@ class ConcreteGetPipelineAnalyticsQueryHandler(GetPipelineAnalyticsQueryHandler)
     def __init__(
         self,
         pipeline_run_repository: PipelineRunRepository,
-        pipeline_template_repository: PipelineTemplateRepository
+        pipeline_template_repository: PipelineTemplateRepository,
+        query_cache: QueryCache
     ):
         self.pipeline_run_repository = pipeline_run_repository
         self.pipeline_template_repository = pipeline_template_repository
+        self.query_cache = query_cache
+        query_cache.configure(ANALYTICS_CACHE_NAMESPACE, ANALYTICS_CACHE_TTL)
     
     async def handle(self, query: GetPipelineAnalyticsQuery) -> PipelineAnalyticsQueryResult:
         """Handle get pipeline analytics query."""
+        return await self.query_cache.get_or_compute(
+            query,
+            ANALYTICS_CACHE_NAMESPACE,
+            lambda: self._compute_analytics(query),
+            tags=_run_tags(query.workspace_name)
+        )
+    
+    async def _compute_analytics(self, query: GetPipelineAnalyticsQuery) -> PipelineAnalyticsQueryResult:
         try:
             logger.debug(f"Getting pipeline analytics: {query}")
             
-            # Get all runs in time range
-            specs = []
-            
-            if query.time_range_start:
-                from ....shared.repository import Specification
-                class StartedAfterSpec(Specification):
-                    def __init__(self, date: datetime):
-                        self.date = date
-                    def is_satisfied_by(self, run: PipelineRun) -> bool:
-                        return run.started_at >= self.date
-                specs.append(StartedAfterSpec(query.time_range_start))
-            
-            if query.time_range_end:
-                from ....shared.repository import Specification
-                class StartedBeforeSpec(Specification):
-                    def __init__(self, date: datetime):
-                        self.date = date
-                    def is_satisfied_by(self, run: PipelineRun) -> bool:
-                        return run.started_at <= self.date
-                specs.append(StartedBeforeSpec(query.time_range_end))
-            
-            spec = None
-            if specs:
-                from ....shared.repository import AndSpecification
-                spec = AndSpecification(*specs)
-            
-            runs = await self.pipeline_run_repository.find_all(spec=spec)
-            
-            # Calculate analytics
-            total_runs = len(runs)
-            successful_runs = len([r for r in runs if r.status == "completed"])
-            failed_runs = len([r for r in runs if r.status == "failed"])
-            success_rate = (successful_runs / total_runs * 100) if total_runs > 0 else 0
-            
-            # Calculate execution time statistics
-            execution_times = []
-            for run in runs:
-                if run.started_at and run.completed_at:
-                    duration = (run.completed_at - run.started_at).total_seconds()
-                    execution_times.append(duration)
-            
-            avg_execution_time = sum(execution_times) / len(execution_times) if execution_times else 0
-            
-            # Group by time period
-            time_series_data = []
-            if runs:
-                # Group runs by the specified time period
-                from collections import defaultdict
-                grouped_runs = defaultdict(list)
-                
-                for run in runs:
-                    if query.group_by == "hour":
-                        key = run.started_at.strftime("%Y-%m-%d %H:00")
-                    elif query.group_by == "day":
-                        key = run.started_at.strftime("%Y-%m-%d")
-                    elif query.group_by == "week":
-                        # Get Monday of the week
-                        monday = run.started_at - datetime.timedelta(days=run.started_at.weekday())
-                        key = monday.strftime("%Y-%m-%d")
-                    else:  # month
-                        key = run.started_at.strftime("%Y-%m")
-                    
-                    grouped_runs[key].append(run)
-                
-                # Create time series data
-                for period, period_runs in grouped_runs.items():
-                    period_successful = len([r for r in period_runs if r.status == "completed"])
-                    period_total = len(period_runs)
-                    period_success_rate = (period_successful / period_total * 100) if period_total > 0 else 0
-                    
-                    time_series_data.append({
-                        "period": period,
-                        "total_runs": period_total,
-                        "successful_runs": period_successful,
-                        "success_rate": period_success_rate
-                    })
-                
-                # Sort by period
-                time_series_data.sort(key=lambda x: x["period"])
+            # Read precomputed hourly aggregates instead of loading every run
+            run_analytics = await self.pipeline_run_repository.get_run_analytics(
+                query.time_range_start,
+                query.time_range_end
+            )
+            summary = run_analytics.summary()
+            
+            total_runs = summary["total_runs"]
+            successful_runs = summary["successful_runs"]
+            failed_runs = summary["failed_runs"]
+            success_rate = summary["success_rate"] * 100
+            avg_execution_time = summary["avg_duration"]
+            time_series_data = run_analytics.time_series(query.group_by)
             
             analytics = {
                 "total_runs": total_runs,
@@ -0,0 +1,39 @@
+"""
+WriteIt load-simulation benchmarks
+
+Runs reproducible load scenarios against a seeded mock provider and
+produces JSON reports that can be compared against stored baselines:
+- Scenario files describing templates, concurrency and duration
+- Seeded heavy-tailed latencies, token-rate streaming and rate limiting
+- p50/p95/p99 latencies, throughput and resident memory per run
+- Regression detection against a baseline report
+"""
+
+from .scenario import (
+    Scenario,
+    ScenarioError,
+    TemplateLoad,
+    ProviderProfile,
+    LatencyProfile,
+)
+from .runner import BenchmarkRunner, run_scenario
+from .report import (
+    MetricComparison,
+    compare_reports,
+    load_report,
+    save_report,
+)
+
+__all__ = [
+    "Scenario",
+    "ScenarioError",
+    "TemplateLoad",
+    "ProviderProfile",
+    "LatencyProfile",
+    "BenchmarkRunner",
+    "run_scenario",
+    "MetricComparison",
+    "compare_reports",
+    "load_report",
+    "save_report",
+]
@@ -0,0 +1,128 @@
+"""
+Benchmark reports and baseline comparison
+
+Reports are plain JSON so they can be stored next to the code as
+baselines and diffed by other tools. Latencies are in simulated
+milliseconds (wall-clock time divided by the scenario's ``time_scale``),
+so reports of the same scenario compare across time scales.
+"""
+
+import json
+import math
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Sequence
+
+
+REPORT_VERSION = 1
+
+# Metrics checked by `compare_reports` and whether larger values are better
+COMPARED_METRICS: Dict[str, bool] = {
+    "runs.latency_ms.p50": False,
+    "runs.latency_ms.p95": False,
+    "runs.latency_ms.p99": False,
+    "runs.throughput_per_second": True,
+    "requests.latency_ms.p50": False,
+    "requests.latency_ms.p95": False,
+    "requests.latency_ms.p99": False,
+    "requests.throughput_per_second": True,
+    "memory.rss_peak_mb": False,
+}
+
+
+def percentile(values: Sequence[float], fraction: float) -> float:
+    """Percentile by linear interpolation between closest ranks."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * fraction
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize_latencies(values: Sequence[float]) -> Dict[str, float]:
+    """p50/p95/p99, mean and max of latency samples."""
+    return {
+        "count": len(values),
+        "p50": percentile(values, 0.50),
+        "p95": percentile(values, 0.95),
+        "p99": percentile(values, 0.99),
+        "mean": sum(values) / len(values) if values else 0.0,
+        "max": max(values) if values else 0.0,
+    }
+
+
+def save_report(report: Dict[str, Any], path: Path) -> None:
+    """Write a report as indented JSON."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def load_report(path: Path) -> Dict[str, Any]:
+    """Read a report written by ``save_report``."""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@dataclass
+class MetricComparison:
+    """One metric of a report compared against its baseline."""
+
+    metric: str
+    baseline: float
+    current: float
+    change: float
+    regressed: bool
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "metric": self.metric,
+            "baseline": self.baseline,
+            "current": self.current,
+            "change": self.change,
+            "regressed": self.regressed,
+        }
+
+
+def compare_reports(
+    current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = 0.10
+) -> List[MetricComparison]:
+    """Compare a report with a baseline.
+
+    A metric regresses when it is worse than the baseline by more than
+    ``tolerance`` (a fraction: 0.10 allows 10%). Metrics missing from
+    either report are skipped.
+
+    Args:
+        current: Report of the run being judged
+        baseline: Stored reference report
+        tolerance: Allowed relative change in the bad direction
+
+    Returns:
+        One comparison per metric present in both reports
+    """
+    comparisons = []
+    for metric, higher_is_better in COMPARED_METRICS.items():
+        before = _lookup(baseline, metric)
+        after = _lookup(current, metric)
+        if before is None or after is None:
+            continue
+        if before == 0:
+            change = 0.0 if after == 0 else math.inf
+        else:
+            change = (after - before) / before
+        worse = -change if higher_is_better else change
+        comparisons.append(MetricComparison(metric, before, after, change, worse > tolerance))
+    return comparisons
+
+
+def _lookup(report: Dict[str, Any], metric: str) -> Any:
+    value: Any = report
+    for part in metric.split("."):
+        if not isinstance(value, dict) or part not in value:
+            return None
+        value = value[part]
+    return value if isinstance(value, (int, float)) else None
@@ -0,0 +1,270 @@
+"""
+Benchmark runner
+
+Runs a scenario against a seeded ``MockLLMProvider``. Each virtual user
+repeatedly picks a template (weighted, from its own seeded generator) and
+runs its steps in order, feeding earlier step outputs into later prompts
+like a pipeline run does. Provider calls go through the same admission
+scheduler the orchestration service uses, and rate-limited calls are
+retried after the provider's ``retry_after``.
+
+Request ids are derived from the user, iteration, step and attempt, so the
+provider's random draws, and therefore the simulated latencies and
+errors, are the same on every run of a scenario.
+"""
+
+import asyncio
+import platform
+import random
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import psutil
+
+from writeit.domains.execution.services.admission_scheduler import AdmissionScheduler
+from writeit.infrastructure.llm.base_provider import LLMRequest, ProviderError, RateLimitError
+from writeit.infrastructure.llm.mock_provider import MockLLMProvider
+from writeit.shared.single_flight import SingleFlight
+
+from .report import REPORT_VERSION, summarize_latencies
+from .scenario import Scenario, TemplateLoad
+
+
+PROVIDER_NAME = "mock"
+
+# How often resident memory is sampled while a scenario runs
+RSS_SAMPLE_INTERVAL = 0.05
+
+_PLACEHOLDER = re.compile(r"\{\{\s*([\w.]+)\s*\}\}")
+
+
+def render_prompt(template: str, context: Dict[str, Any]) -> str:
+    """Substitute ``{{ dotted.names }}`` from a nested context; unknown names render empty."""
+
+    def lookup(match: "re.Match[str]") -> str:
+        value: Any = context
+        for part in match.group(1).split("."):
+            if not isinstance(value, dict) or part not in value:
+                return ""
+            value = value[part]
+        return str(value)
+
+    return _PLACEHOLDER.sub(lookup, template)
+
+
+@dataclass
+class _Measurements:
+    run_latencies: List[float] = field(default_factory=list)
+    request_latencies: List[float] = field(default_factory=list)
+    first_token_latencies: List[float] = field(default_factory=list)
+    failed_runs: int = 0
+    failed_requests: int = 0
+    rate_limited: int = 0
+    retries: int = 0
+    completion_tokens: int = 0
+    rss_samples: List[float] = field(default_factory=list)
+
+
+class BenchmarkRunner:
+    """Run a scenario and produce a JSON-serializable report."""
+
+    def __init__(self, scenario: Scenario):
+        """Initialize runner.
+
+        Args:
+            scenario: Scenario to simulate
+        """
+        self.scenario = scenario
+        self._provider = MockLLMProvider(
+            scenario.provider.to_mock_config(scenario.seed, scenario.time_scale)
+        )
+        self._scheduler = AdmissionScheduler(default_capacity=scenario.provider.max_concurrent)
+        self._single_flight = SingleFlight() if scenario.coalesce else None
+        self._measurements = _Measurements()
+        self._runs_started = 0
+        self._deadline: Optional[float] = None
+
+    async def run(self) -> Dict[str, Any]:
+        """Run the scenario to completion.
+
+        Returns:
+            Benchmark report (see ``writeit.benchmarks.report``)
+        """
+        await self._provider.initialize()
+        process = psutil.Process()
+        rss_start = process.memory_info().rss
+        sampler = asyncio.create_task(self._sample_rss(process))
+
+        started_at = datetime.now()
+        start = time.perf_counter()
+        if self.scenario.duration_seconds is not None:
+            self._deadline = start + self.scenario.duration_seconds
+        try:
+            await asyncio.gather(*(self._user(user) for user in range(self.scenario.concurrency)))
+        finally:
+            sampler.cancel()
+        wall_seconds = time.perf_counter() - start
+        rss_end = process.memory_info().rss
+
+        return self._report(started_at, wall_seconds, rss_start, rss_end)
+
+    async def _user(self, user: int) -> None:
+        rng = random.Random(f"{self.scenario.seed}:user:{user}")
+        templates = self.scenario.templates
+        weights = [template.weight for template in templates]
+        iteration = 0
+        while self._take_run():
+            template = rng.choices(templates, weights)[0]
+            await self._run_template(template, f"u{user}-i{iteration}")
+            iteration += 1
+
+    def _take_run(self) -> bool:
+        if self._deadline is not None and time.perf_counter() >= self._deadline:
+            return False
+        if self.scenario.runs is not None and self._runs_started >= self.scenario.runs:
+            return False
+        self._runs_started += 1
+        return True
+
+    async def _run_template(self, template: TemplateLoad, run_id: str) -> None:
+        context: Dict[str, Any] = {
+            "inputs": template.inputs,
+            "defaults": template.defaults,
+            "steps": {},
+        }
+        start = time.perf_counter()
+        try:
+            for step_id, prompt_template in template.steps:
+                prompt = render_prompt(prompt_template, context)
+                context["steps"][step_id] = await self._request(prompt, f"{run_id}-{step_id}")
+        except ProviderError:
+            self._measurements.failed_runs += 1
+            return
+        self._measurements.run_latencies.append(self._simulated_ms(time.perf_counter() - start))
+
+    async def _request(self, prompt: str, request_id: str) -> str:
+        if self._single_flight is not None:
+            return await self._single_flight.do(prompt, lambda: self._call(prompt, request_id))
+        return await self._call(prompt, request_id)
+
+    async def _call(self, prompt: str, request_id: str) -> str:
+        measurements = self._measurements
+        start = time.perf_counter()
+        attempt = 0
+        while True:
+            request = LLMRequest(
+                prompt=prompt,
+                model=self.scenario.provider.model,
+                stream=self.scenario.provider.streaming,
+                request_id=f"{request_id}-a{attempt}",
+            )
+            try:
+                async with self._scheduler.slot(PROVIDER_NAME, "bench", "normal"):
+                    if request.stream:
+                        content, tokens, first_token = await self._stream(request, start)
+                        measurements.first_token_latencies.append(first_token)
+                    else:
+                        response = await self._provider.generate(request)
+                        content = response.content
+                        tokens = response.token_usage.completion_tokens if response.token_usage else 0
+            except RateLimitError as e:
+                measurements.rate_limited += 1
+                if attempt >= self.scenario.max_retries:
+                    measurements.failed_requests += 1
+                    raise
+                attempt += 1
+                measurements.retries += 1
+                await asyncio.sleep((e.retry_after or 1) * self.scenario.time_scale)
+                continue
+            except ProviderError:
+                measurements.failed_requests += 1
+                raise
+
+            measurements.completion_tokens += tokens
+            measurements.request_latencies.append(self._simulated_ms(time.perf_counter() - start))
+            return content
+
+    async def _stream(self, request: LLMRequest, start: float) -> Tuple[str, int, float]:
+        parts = []
+        tokens = 0
+        first_token: Optional[float] = None
+        async for chunk in self._provider.generate_stream(request):
+            if chunk.content and first_token is None:
+                first_token = self._simulated_ms(time.perf_counter() - start)
+            parts.append(chunk.content)
+            if chunk.token_usage:
+                tokens = chunk.token_usage.completion_tokens
+        return "".join(parts), tokens, first_token or 0.0
+
+    async def _sample_rss(self, process: psutil.Process) -> None:
+        while True:
+            self._measurements.rss_samples.append(process.memory_info().rss)
+            await asyncio.sleep(RSS_SAMPLE_INTERVAL)
+
+    def _simulated_ms(self, seconds: float) -> float:
+        return seconds * 1000 / self.scenario.time_scale
+
+    def _report(
+        self, started_at: datetime, wall_seconds: float, rss_start: int, rss_end: int
+    ) -> Dict[str, Any]:
+        scenario = self.scenario
+        measurements = self._measurements
+        simulated_seconds = wall_seconds / scenario.time_scale
+        runs = len(measurements.run_latencies)
+        requests = len(measurements.request_latencies)
+        mb = 1024 * 1024
+
+        report: Dict[str, Any] = {
+            "version": REPORT_VERSION,
+            "scenario": scenario.name,
+            "seed": scenario.seed,
+            "concurrency": scenario.concurrency,
+            "time_scale": scenario.time_scale,
+            "started_at": started_at.isoformat(),
+            "wall_seconds": wall_seconds,
+            "simulated_seconds": simulated_seconds,
+            "runs": {
+                "completed": runs,
+                "failed": measurements.failed_runs,
+                "throughput_per_second": runs / simulated_seconds if simulated_seconds else 0.0,
+                "latency_ms": summarize_latencies(measurements.run_latencies),
+            },
+            "requests": {
+                "completed": requests,
+                "failed": measurements.failed_requests,
+                "rate_limited": measurements.rate_limited,
+                "retries": measurements.retries,
+                "throughput_per_second": requests / simulated_seconds if simulated_seconds else 0.0,
+                "latency_ms": summarize_latencies(measurements.request_latencies),
+                "completion_tokens": measurements.completion_tokens,
+                "tokens_per_second": (
+                    measurements.completion_tokens / simulated_seconds if simulated_seconds else 0.0
+                ),
+            },
+            "memory": {
+                "rss_start_mb": rss_start / mb,
+                "rss_peak_mb": max(measurements.rss_samples + [rss_start, rss_end]) / mb,
+                "rss_end_mb": rss_end / mb,
+            },
+            "admission": self._scheduler.get_stats()["wait_times"],
+            "environment": {
+                "python": sys.version.split()[0],
+                "platform": platform.platform(),
+            },
+        }
+        if scenario.provider.streaming:
+            report["requests"]["time_to_first_token_ms"] = summarize_latencies(
+                measurements.first_token_latencies
+            )
+        if self._single_flight is not None:
+            report["requests"]["coalesced"] = self._single_flight.get_stats()["coalesced"]
+        return report
+
+
+def run_scenario(scenario: Scenario) -> Dict[str, Any]:
+    """Run a scenario in a fresh event loop and return its report."""
+    return asyncio.run(BenchmarkRunner(scenario).run())
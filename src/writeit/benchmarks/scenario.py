@@ -0,0 +1,216 @@
+"""
+Benchmark scenario files
+
+A scenario describes a simulated load: which templates virtual users run,
+how many users run at once, for how long, and how the simulated provider
+behaves. Scenarios are YAML (or JSON) files:
+
+    name: fan-out
+    seed: 42
+    concurrency: 16
+    duration_seconds: 10        # or `runs: 200` for a fixed amount of work
+    time_scale: 0.05            # simulated delays run 20x faster
+    provider:
+      latency: {distribution: lognormal, median_ms: 800, sigma: 0.6}
+      tokens_per_second: 60
+      streaming: true
+      rate_limit: {rate: 0.02, retry_after_seconds: 2}
+      max_concurrent: 8
+    templates:
+      - path: ../templates/quick-article.yaml
+        weight: 3
+        inputs: {topic: "solar power", audience: general}
+      - name: one-shot
+        prompt: "Summarize {{ inputs.text }}"
+        inputs: {text: "..."}
+
+Template paths are relative to the scenario file.
+"""
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+
+
+class ScenarioError(ValueError):
+    """Raised when a scenario file is invalid."""
+
+    pass
+
+
+@dataclass
+class LatencyProfile:
+    """Distribution of simulated provider latency (time to first token when streaming)."""
+
+    distribution: str = "lognormal"
+    median_ms: float = 500.0
+    sigma: float = 0.5
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyProfile":
+        profile = cls(
+            distribution=data.get("distribution", "lognormal"),
+            median_ms=float(data.get("median_ms", 500.0)),
+            sigma=float(data.get("sigma", 0.5)),
+        )
+        if profile.distribution not in ("fixed", "lognormal"):
+            raise ScenarioError(f"Unknown latency distribution: {profile.distribution}")
+        return profile
+
+
+@dataclass
+class ProviderProfile:
+    """Behaviour of the simulated provider."""
+
+    model: str = "mock-fast"
+    latency: LatencyProfile = field(default_factory=LatencyProfile)
+    tokens_per_second: Optional[float] = None
+    streaming: bool = False
+    rate_limit_rate: float = 0.0
+    retry_after_seconds: int = 1
+    failure_rate: float = 0.0
+    max_concurrent: int = 4
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ProviderProfile":
+        rate_limit = data.get("rate_limit", {})
+        return cls(
+            model=data.get("model", "mock-fast"),
+            latency=LatencyProfile.from_dict(data.get("latency", {})),
+            tokens_per_second=data.get("tokens_per_second"),
+            streaming=bool(data.get("streaming", False)),
+            rate_limit_rate=float(rate_limit.get("rate", 0.0)),
+            retry_after_seconds=int(rate_limit.get("retry_after_seconds", 1)),
+            failure_rate=float(data.get("failure_rate", 0.0)),
+            max_concurrent=int(data.get("max_concurrent", 4)),
+        )
+
+    def to_mock_config(self, seed: int, time_scale: float) -> Dict[str, Any]:
+        """Configuration for ``MockLLMProvider``."""
+        return {
+            "latency_ms": self.latency.median_ms,
+            "latency_distribution": self.latency.distribution,
+            "latency_sigma": self.latency.sigma,
+            "tokens_per_second": self.tokens_per_second,
+            "rate_limit_rate": self.rate_limit_rate,
+            "retry_after_seconds": self.retry_after_seconds,
+            "failure_rate": self.failure_rate,
+            "seed": seed,
+            "time_scale": time_scale,
+        }
+
+
+@dataclass
+class TemplateLoad:
+    """A template run by virtual users, as an ordered list of step prompts."""
+
+    name: str
+    steps: List[Tuple[str, str]]
+    inputs: Dict[str, Any] = field(default_factory=dict)
+    defaults: Dict[str, Any] = field(default_factory=dict)
+    weight: float = 1.0
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], base_dir: Path) -> "TemplateLoad":
+        weight = float(data.get("weight", 1.0))
+        if weight <= 0:
+            raise ScenarioError("Template weight must be positive")
+
+        if "path" in data:
+            path = (base_dir / data["path"]).resolve()
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    template = yaml.safe_load(f) or {}
+            except (OSError, yaml.YAMLError) as e:
+                raise ScenarioError(f"Cannot load template {path}: {e}") from e
+
+            steps = [
+                (step_id, step.get("prompt_template", ""))
+                for step_id, step in (template.get("steps") or {}).items()
+                if isinstance(step, dict) and step.get("prompt_template")
+            ]
+            inputs = {
+                key: spec.get("default")
+                for key, spec in (template.get("inputs") or {}).items()
+                if isinstance(spec, dict) and "default" in spec
+            }
+            inputs.update(data.get("inputs", {}))
+            name = data.get("name") or template.get("metadata", {}).get("name") or path.stem
+            defaults = template.get("defaults") or {}
+        elif "prompt" in data:
+            steps = [("prompt", data["prompt"])]
+            inputs = dict(data.get("inputs", {}))
+            name = data.get("name", "prompt")
+            defaults = {}
+        else:
+            raise ScenarioError("A template needs either 'path' or 'prompt'")
+
+        if not steps:
+            raise ScenarioError(f"Template '{name}' has no LLM steps")
+        return cls(name=name, steps=steps, inputs=inputs, defaults=defaults, weight=weight)
+
+
+@dataclass
+class Scenario:
+    """A complete load simulation."""
+
+    name: str
+    templates: List[TemplateLoad]
+    provider: ProviderProfile = field(default_factory=ProviderProfile)
+    concurrency: int = 1
+    duration_seconds: Optional[float] = None
+    runs: Optional[int] = None
+    seed: int = 0
+    time_scale: float = 1.0
+    max_retries: int = 3
+    coalesce: bool = False
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], base_dir: Path = Path(".")) -> "Scenario":
+        """Build a scenario from parsed file contents.
+
+        Raises:
+            ScenarioError: If the scenario is invalid
+        """
+        templates = [TemplateLoad.from_dict(t, base_dir) for t in data.get("templates", [])]
+        if not templates:
+            raise ScenarioError("A scenario needs at least one template")
+
+        scenario = cls(
+            name=data.get("name", "scenario"),
+            templates=templates,
+            provider=ProviderProfile.from_dict(data.get("provider", {})),
+            concurrency=int(data.get("concurrency", 1)),
+            duration_seconds=data.get("duration_seconds"),
+            runs=data.get("runs"),
+            seed=int(data.get("seed", 0)),
+            time_scale=float(data.get("time_scale", 1.0)),
+            max_retries=int(data.get("max_retries", 3)),
+            coalesce=bool(data.get("coalesce", False)),
+        )
+        if scenario.concurrency < 1:
+            raise ScenarioError("concurrency must be at least 1")
+        if scenario.duration_seconds is None and scenario.runs is None:
+            raise ScenarioError("A scenario needs 'duration_seconds' or 'runs'")
+        if scenario.time_scale <= 0:
+            raise ScenarioError("time_scale must be positive")
+        return scenario
+
+    @classmethod
+    def load(cls, path: Path) -> "Scenario":
+        """Load a scenario from a YAML or JSON file.
+
+        Raises:
+            ScenarioError: If the file cannot be read or is invalid
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f) if path.suffix == ".json" else yaml.safe_load(f)
+        except (OSError, ValueError, yaml.YAMLError) as e:
+            raise ScenarioError(f"Cannot load scenario {path}: {e}") from e
+        if not isinstance(data, dict):
+            raise ScenarioError(f"Scenario {path} must be a mapping")
+        return cls.from_dict(data, path.parent)
@@ -0,0 +1,178 @@
+# ABOUTME: Benchmark commands for WriteIt CLI
+# ABOUTME: Run load-simulation scenarios and compare reports against baselines
+
+import json
+from pathlib import Path
+from typing import List, Optional
+
+import typer
+from rich.table import Table
+
+from writeit.benchmarks import (
+    MetricComparison,
+    Scenario,
+    ScenarioError,
+    compare_reports,
+    load_report,
+    run_scenario,
+    save_report,
+)
+from writeit.cli.output import console, print_error, print_success, print_warning
+
+
+app = typer.Typer(
+    name="bench", help="Run load-simulation benchmarks", rich_markup_mode="rich"
+)
+
+
+def _load_baseline(path: Path) -> dict:
+    try:
+        return load_report(path)
+    except (OSError, ValueError) as e:
+        print_error(f"Cannot read report {path}: {e}")
+        raise typer.Exit(2)
+
+
+def _show_comparison(comparisons: List[MetricComparison], tolerance: float) -> bool:
+    """Print a comparison table; returns True if any metric regressed."""
+    table = Table(title=f"Comparison against baseline (tolerance {tolerance:.0%})")
+    table.add_column("Metric", style="cyan")
+    table.add_column("Baseline", justify="right")
+    table.add_column("Current", justify="right")
+    table.add_column("Change", justify="right")
+
+    for comparison in comparisons:
+        style = "red" if comparison.regressed else "green"
+        table.add_row(
+            comparison.metric,
+            f"{comparison.baseline:.2f}",
+            f"{comparison.current:.2f}",
+            f"[{style}]{comparison.change:+.1%}[/{style}]",
+        )
+    console.print(table)
+
+    regressed = [c.metric for c in comparisons if c.regressed]
+    if regressed:
+        print_error(f"Regressed: {', '.join(regressed)}", "Performance Regression")
+    else:
+        print_success("No regressions against baseline")
+    return bool(regressed)
+
+
+@app.command()
+def run(
+    scenario_file: Path = typer.Argument(..., help="Scenario file (YAML or JSON)"),
+    output: Optional[Path] = typer.Option(
+        None, "--output", "-o", help="Write the JSON report to this file"
+    ),
+    seed: Optional[int] = typer.Option(None, "--seed", help="Override the scenario seed"),
+    baseline: Optional[Path] = typer.Option(
+        None, "--baseline", "-b", help="Compare against this baseline report"
+    ),
+    tolerance: float = typer.Option(
+        0.10, "--tolerance", "-t", help="Allowed relative regression (0.10 = 10%)"
+    ),
+    json_output: bool = typer.Option(
+        False, "--json", help="Print the report as JSON instead of a summary"
+    ),
+):
+    """
+    Run a load-simulation scenario against the mock provider.
+
+    Exits with status 1 when --baseline is given and a metric regressed.
+
+    [bold cyan]Examples:[/bold cyan]
+
+    Run a scenario and store its report:
+      [dim]$ writeit bench run benchmarks/fan-out.yaml -o reports/fan-out.json[/dim]
+
+    Run and check against a stored baseline:
+      [dim]$ writeit bench run benchmarks/fan-out.yaml -b baselines/fan-out.json[/dim]
+    """
+    try:
+        scenario = Scenario.load(scenario_file)
+    except ScenarioError as e:
+        print_error(str(e), "Invalid Scenario")
+        raise typer.Exit(2)
+    if seed is not None:
+        scenario.seed = seed
+
+    baseline_report = _load_baseline(baseline) if baseline else None
+
+    with console.status(f"Running scenario '{scenario.name}'..."):
+        report = run_scenario(scenario)
+
+    if output:
+        save_report(report, output)
+
+    if json_output:
+        console.print_json(json.dumps(report))
+    else:
+        _show_summary(report)
+        if output:
+            print_success(f"Report written to {output}")
+
+    if baseline_report is not None:
+        comparisons = compare_reports(report, baseline_report, tolerance)
+        if _show_comparison(comparisons, tolerance):
+            raise typer.Exit(1)
+
+
+@app.command()
+def compare(
+    report_file: Path = typer.Argument(..., help="Report to judge"),
+    baseline: Path = typer.Argument(..., help="Baseline report"),
+    tolerance: float = typer.Option(
+        0.10, "--tolerance", "-t", help="Allowed relative regression (0.10 = 10%)"
+    ),
+):
+    """
+    Compare a benchmark report against a baseline report.
+
+    Exits with status 1 when a metric regressed by more than the tolerance.
+    """
+    report = _load_baseline(report_file)
+    baseline_report = _load_baseline(baseline)
+    if report.get("scenario") != baseline_report.get("scenario"):
+        print_warning(
+            f"Comparing different scenarios: '{report.get('scenario')}' "
+            f"against '{baseline_report.get('scenario')}'"
+        )
+
+    comparisons = compare_reports(report, baseline_report, tolerance)
+    if _show_comparison(comparisons, tolerance):
+        raise typer.Exit(1)
+
+
+def _show_summary(report: dict) -> None:
+    """Print the headline numbers of a report."""
+    table = Table(title=f"Benchmark: {report['scenario']} (seed {report['seed']})")
+    table.add_column("", style="cyan")
+    table.add_column("Completed", justify="right")
+    table.add_column("Failed", justify="right")
+    table.add_column("Throughput/s", justify="right")
+    table.add_column("p50 ms", justify="right")
+    table.add_column("p95 ms", justify="right")
+    table.add_column("p99 ms", justify="right")
+
+    for kind in ("runs", "requests"):
+        section = report[kind]
+        latency = section["latency_ms"]
+        table.add_row(
+            kind.capitalize(),
+            str(section["completed"]),
+            str(section["failed"]),
+            f"{section['throughput_per_second']:.2f}",
+            f"{latency['p50']:.0f}",
+            f"{latency['p95']:.0f}",
+            f"{latency['p99']:.0f}",
+        )
+    console.print(table)
+
+    requests = report["requests"]
+    memory = report["memory"]
+    console.print(
+        f"Rate limited: {requests['rate_limited']} (retries: {requests['retries']})  "
+        f"Tokens/s: {requests['tokens_per_second']:.1f}  "
+        f"Peak RSS: {memory['rss_peak_mb']:.1f} MB"
+    )
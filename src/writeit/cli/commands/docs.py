@@ -36,13 +36,25 @@ def generate_docs(
         True, "--validate/--no-validate", help="Validate documentation after generation"
     ),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output"),
+    cache: bool = typer.Option(
+        True,
+        "--cache/--no-cache",
+        help="Reuse module documentation extracted from unchanged files",
+    ),
+    jobs: Optional[int] = typer.Option(
+        None, "--jobs", "-j", help="Processes for module extraction (default: CPU count)"
+    ),
 ):
     """Generate documentation from code"""
     console.print(Panel("📚 Generating Documentation", style="bold blue"))
 
     try:
         # Initialize generator
-        generator = DocumentationGenerator(config_path=config)
+        generator = DocumentationGenerator(
+            config_path=config, cache_dir=output / ".cache", workers=jobs
+        )
+        if not cache:
+            generator.cache_dir = None
 
         with Progress(
             SpinnerColumn(),
@@ -60,7 +72,9 @@ def generate_docs(
 
         # Validate if requested
         if validate:
-            validator = DocumentationValidator()
+            validator = DocumentationValidator(
+                link_cache_path=output / ".cache" / "links.json" if cache else None
+            )
             console.print("\n")
             with Progress(
                 SpinnerColumn(),
@@ -107,7 +121,9 @@ def validate_docs(
     console.print(Panel("🔍 Validating Documentation", style="bold yellow"))
 
     try:
-        validator = DocumentationValidator()
+        validator = DocumentationValidator(
+            link_cache_path=docs_path / ".cache" / "links.json"
+        )
 
         # Load existing documentation or generate it
         if docs_path.exists():
@@ -271,7 +287,10 @@ def _display_generation_results(docs, metrics: DocumentationMetrics, verbose: bo
         )
 
     if docs.module_docs:
-        console.print(f"• Module Documentation: {len(docs.module_docs)} modules")
+        console.print(
+            f"• Module Documentation: {len(docs.module_docs)} modules "
+            f"({metrics.extracted_modules} extracted, {metrics.cached_modules} cached)"
+        )
         if verbose:
             for module in docs.module_docs:
                 console.print(
@@ -0,0 +1,110 @@
+# ABOUTME: Lazy command registry for the WriteIt CLI
+# ABOUTME: Defers importing command modules until a command is invoked or its help is shown
+
+import importlib
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import typer
+from typer.core import TyperCommand, TyperGroup
+
+Command = Union[TyperCommand, TyperGroup]
+
+
+@dataclass(frozen=True)
+class LazyCommand:
+    """A CLI command whose implementation module is imported on first use.
+
+    Attributes:
+        name: Command name as typed on the command line
+        import_path: "module:attribute" path of a Typer sub-app or a command
+            function
+        help: Short help shown in command listings and shell completion, so
+            listing commands does not import them
+    """
+
+    name: str
+    import_path: str
+    help: str
+
+    def resolve(self) -> Union[typer.Typer, Callable[..., Any]]:
+        """Import and return the Typer sub-app or command function."""
+        module_name, attribute = self.import_path.split(":", 1)
+        return getattr(importlib.import_module(module_name), attribute)
+
+    def load(self) -> Command:
+        """Import the implementation and build its command."""
+        target = self.resolve()
+        if isinstance(target, typer.Typer):
+            command = typer.main.get_group(target)
+        else:
+            wrapper = typer.Typer(add_completion=False)
+            wrapper.command(name=self.name)(target)
+            command = typer.main.get_command(wrapper)
+
+        command.name = self.name
+        return command
+
+    def placeholder(self) -> TyperCommand:
+        """Build a lightweight stand-in used only for listings."""
+        return TyperCommand(name=self.name, help=self.help, short_help=self.help)
+
+
+class LazyTyperGroup(TyperGroup):
+    """Typer group that resolves registered lazy commands on demand.
+
+    Commands registered eagerly on the Typer app behave as usual. Lazy
+    commands are imported when invoked or when their own help is requested;
+    the group's help and shell completion list them from their registered
+    short help without importing anything.
+    """
+
+    lazy_commands: Dict[str, LazyCommand] = {}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._listing = False
+
+    @classmethod
+    def with_commands(cls, *commands: LazyCommand) -> type:
+        """Create a group class bound to the given lazy commands."""
+        return type(
+            cls.__name__,
+            (cls,),
+            {"lazy_commands": {command.name: command for command in commands}},
+        )
+
+    def list_commands(self, ctx) -> List[str]:
+        names = super().list_commands(ctx)
+        names.extend(name for name in self.lazy_commands if name not in self.commands)
+        return names
+
+    def get_command(self, ctx, cmd_name: str) -> Optional[Command]:
+        command = self.commands.get(cmd_name)
+        if command is not None:
+            return command
+
+        lazy_command = self.lazy_commands.get(cmd_name)
+        if lazy_command is None:
+            return None
+        if self._listing:
+            return lazy_command.placeholder()
+
+        command = lazy_command.load()
+        self.commands[cmd_name] = command
+        return command
+
+    def format_help(self, ctx, formatter) -> None:
+        self._listing = True
+        try:
+            return super().format_help(ctx, formatter)
+        finally:
+            self._listing = False
+
+    def shell_complete(self, ctx, incomplete: str):
+        self._listing = True
+        try:
+            return super().shell_complete(ctx, incomplete)
+        finally:
+            self._listing = False
+
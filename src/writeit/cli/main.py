@@ -4,35 +4,68 @@
 import sys
 import logging
 
+import typer
+
 from writeit.cli.app import app
-from writeit.cli.commands.workspace import app as workspace_app
-from writeit.cli.commands.pipeline import app as pipeline_app
-from writeit.cli.commands.pipeline import (
-    list_pipelines,
-    run,
-)  # Move here to fix import order
-from writeit.cli.commands.validate import app as validate_app
-from writeit.cli.commands.template import app as template_app
-from writeit.cli.commands.style import app as style_app
-from writeit.cli.commands.docs import app as docs_app
-from writeit.cli.commands.config import app as config_app
-
-
-# Add all command modules to the main app
-# Import init command directly since it's a single command
-from writeit.cli.commands.init import init
-
-app.command(name="init")(init)
-app.add_typer(workspace_app, name="workspace")
-app.add_typer(pipeline_app, name="pipeline")
-app.add_typer(validate_app, name="validate")
-app.add_typer(template_app, name="template")
-app.add_typer(style_app, name="style")
-app.add_typer(docs_app, name="docs")
-app.add_typer(config_app, name="config")
-
-app.command(name="list-pipelines")(list_pipelines)
-app.command(name="run")(run)
+from writeit.cli.lazy import LazyCommand, LazyTyperGroup
+
+
+# Command modules are imported only when a command is invoked or its help is
+# requested; the short help here is what `writeit --help` and shell
+# completion show.
+LAZY_COMMANDS = (
+    LazyCommand(
+        "init", "writeit.cli.commands.init:init",
+        "Initialize WriteIt home directory (~/.writeit).",
+    ),
+    LazyCommand(
+        "workspace", "writeit.cli.commands.workspace:app", "Manage WriteIt workspaces"
+    ),
+    LazyCommand("pipeline", "writeit.cli.commands.pipeline:app", "Pipeline operations"),
+    LazyCommand(
+        "validate", "writeit.cli.commands.validate:app",
+        "Validate pipeline templates and style primers",
+    ),
+    LazyCommand(
+        "template", "writeit.cli.commands.template:app", "Manage pipeline templates"
+    ),
+    LazyCommand("style", "writeit.cli.commands.style:app", "Manage style primers"),
+    LazyCommand(
+        "docs", "writeit.cli.commands.docs:app",
+        "Documentation generation and management commands",
+    ),
+    LazyCommand("config", "writeit.cli.commands.config:app", "Manage WriteIt configuration"),
+    LazyCommand("bench", "writeit.cli.commands.bench:app", "Run load-simulation benchmarks"),
+    LazyCommand(
+        "list-pipelines", "writeit.cli.commands.pipeline:list_pipelines",
+        "List available pipeline templates.",
+    ),
+    LazyCommand(
+        "run", "writeit.cli.commands.pipeline:run",
+        "Run pipeline execution (CLI or TUI mode).",
+    ),
+)
+
+app.info.cls = LazyTyperGroup.with_commands(*LAZY_COMMANDS)
+
+
+def load_all_commands() -> None:
+    """Register every lazy command on the Typer app.
+
+    Used by tools that introspect the Typer app itself (e.g. documentation
+    generation) rather than the Click command tree.
+    """
+    registered = {group.name for group in app.registered_groups}
+    registered.update(command.name for command in app.registered_commands)
+
+    for lazy_command in LAZY_COMMANDS:
+        if lazy_command.name in registered:
+            continue
+        target = lazy_command.resolve()
+        if isinstance(target, typer.Typer):
+            app.add_typer(target, name=lazy_command.name)
+        else:
+            app.command(name=lazy_command.name)(target)
 
 
 def main():
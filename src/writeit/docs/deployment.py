@@ -10,6 +10,7 @@ from typing import List, Optional
 from .models import DocumentationSet
 from .templates import DocumentationTemplateSystem, TemplateConfig
 from .html_generator import HTMLDocumentationGenerator
+from .incremental import documentation_fingerprint, write_if_changed
 from .pdf_generator import PDFDocumentationGenerator
 
 
@@ -69,8 +70,7 @@ class DocumentationDeployment:
         # Main documentation file
         try:
             main_content = self.template_system.render_documentation(docs)
-            with open(output_path / "README.md", "w") as f:
-                f.write(main_content)
+            write_if_changed(output_path / "README.md", main_content)
         except Exception as e:
             print(f"Warning: Could not render main template: {e}")
             self._write_index_markdown(docs, output_path)
@@ -83,8 +83,7 @@ class DocumentationDeployment:
                 )
                 api_dir = output_path / "api"
                 api_dir.mkdir(exist_ok=True)
-                with open(api_dir / "README.md", "w") as f:
-                    f.write(api_content)
+                write_if_changed(api_dir / "README.md", api_content)
 
                 # Individual endpoint files
                 self._write_api_markdown(docs.api_docs, output_path)
@@ -100,8 +99,7 @@ class DocumentationDeployment:
                 )
                 modules_dir = output_path / "modules"
                 modules_dir.mkdir(exist_ok=True)
-                with open(modules_dir / "README.md", "w") as f:
-                    f.write(modules_content)
+                write_if_changed(modules_dir / "README.md", modules_content)
 
                 # Individual module files
                 self._write_module_markdown(docs.module_docs, output_path)
@@ -117,8 +115,7 @@ class DocumentationDeployment:
                 )
                 cli_dir = output_path / "cli"
                 cli_dir.mkdir(exist_ok=True)
-                with open(cli_dir / "README.md", "w") as f:
-                    f.write(cli_content)
+                write_if_changed(cli_dir / "README.md", cli_content)
             except Exception as e:
                 print(f"Warning: Could not render CLI template: {e}")
                 self._write_cli_markdown(docs.cli_docs, output_path)
@@ -139,16 +136,14 @@ class DocumentationDeployment:
                     f"- [{guide.title}]({guide.title.replace(' ', '-').lower()}.md)\n"
                 )
 
-            with open(guides_dir / "README.md", "w") as f:
-                f.write(guides_index)
+            write_if_changed(guides_dir / "README.md", guides_index)
 
             # Individual guide files
             for guide in docs.user_guides:
                 try:
                     guide_content = self.template_system.render_user_guide(guide)
                     filename = guide.title.replace(" ", "-").lower() + ".md"
-                    with open(guides_dir / filename, "w") as f:
-                        f.write(guide_content)
+                    write_if_changed(guides_dir / filename, guide_content)
                 except Exception as e:
                     print(f"Warning: Could not render guide template: {e}")
 
@@ -203,8 +198,7 @@ class DocumentationDeployment:
                 f"- [{endpoint.method} {endpoint.path}](endpoints/{filename})\n"
             )
 
-        with open(api_dir / "README.md", "w") as f:
-            f.write(overview_content)
+        write_if_changed(api_dir / "README.md", overview_content)
 
         # Individual endpoint files
         endpoints_dir = api_dir / "endpoints"
@@ -214,8 +208,7 @@ class DocumentationDeployment:
             filename = f"{endpoint.method.lower()}{endpoint.path.replace('/', '_').replace('{', '_').replace('}', '_')}.md"
             content = self._generate_endpoint_markdown(endpoint)
 
-            with open(endpoints_dir / filename, "w") as f:
-                f.write(content)
+            write_if_changed(endpoints_dir / filename, content)
 
     def _generate_endpoint_markdown(self, endpoint) -> str:
         """Generate Markdown for a single endpoint"""
@@ -260,8 +253,7 @@ class DocumentationDeployment:
                 f"- [{module.name}]({module.name.replace('.', '/')}.md)\n"
             )
 
-        with open(modules_dir / "README.md", "w") as f:
-            f.write(overview_content)
+        write_if_changed(modules_dir / "README.md", overview_content)
 
         # Individual module files
         for module in module_docs:
@@ -269,8 +261,7 @@ class DocumentationDeployment:
             module_path.parent.mkdir(parents=True, exist_ok=True)
 
             content = self._generate_module_markdown(module)
-            with open(module_path, "w") as f:
-                f.write(content)
+            write_if_changed(module_path, content)
 
     def _generate_module_markdown(self, module) -> str:
         """Generate Markdown for a single module"""
@@ -338,8 +329,7 @@ class DocumentationDeployment:
                     content += f"```bash\n{example}\n```\n"
                 content += "\n"
 
-        with open(cli_dir / "README.md", "w") as f:
-            f.write(content)
+        write_if_changed(cli_dir / "README.md", content)
 
     def _write_template_markdown(self, template_docs, output_path: Path):
         """Write template documentation as Markdown"""
@@ -375,8 +365,7 @@ class DocumentationDeployment:
                 content += f"### {style.name}\n\n"
                 content += f"{style.description}\n\n"
 
-        with open(templates_dir / "README.md", "w") as f:
-            f.write(content)
+        write_if_changed(templates_dir / "README.md", content)
 
     def _write_guides_markdown(self, user_guides: List, output_path: Path):
         """Write user guides as Markdown"""
@@ -388,8 +377,7 @@ class DocumentationDeployment:
         for guide in user_guides:
             overview_content += f"- [{guide.title}]({guide.title.replace(' ', '-').lower()}.md) - {guide.description}\n"
 
-        with open(guides_dir / "README.md", "w") as f:
-            f.write(overview_content)
+        write_if_changed(guides_dir / "README.md", overview_content)
 
         # Individual guide files
         for guide in user_guides:
@@ -418,8 +406,7 @@ class DocumentationDeployment:
                 for related in guide.related_guides:
                     content += f"- {related}\n"
 
-            with open(guides_dir / filename, "w") as f:
-                f.write(content)
+            write_if_changed(guides_dir / filename, content)
 
     def _write_index_markdown(self, docs: DocumentationSet, output_path: Path):
         """Write main index file"""
@@ -460,8 +447,7 @@ If you need help with WriteIt:
 *This documentation is automatically generated. Please report any issues or inconsistencies.*
 """
 
-        with open(output_path / "README.md", "w") as f:
-            f.write(content)
+        write_if_changed(output_path / "README.md", content)
 
     def _deploy_html_enhanced(self, docs: DocumentationSet, output_path: Path):
         """Deploy documentation as enhanced HTML using new generator"""
@@ -576,6 +562,17 @@ If you need help with WriteIt:
     ):
         """Deploy documentation as PDF using enhanced generator"""
         try:
+            # Skip regeneration when the documentation content is unchanged
+            fingerprint = documentation_fingerprint(docs)
+            stamp_file = output_path.with_name(output_path.name + ".sha256")
+            if (
+                output_path.exists()
+                and stamp_file.exists()
+                and stamp_file.read_text().strip() == fingerprint
+            ):
+                print(f"✅ PDF documentation up to date: {output_path}")
+                return
+
             pdf_generator = PDFDocumentationGenerator()
 
             # Try to use existing HTML if available
@@ -588,6 +585,7 @@ If you need help with WriteIt:
             )
 
             if success:
+                stamp_file.write_text(fingerprint)
                 print(f"✅ PDF documentation generated: {output_path}")
             else:
                 print("⚠️  PDF generation failed, trying fallback methods...")
@@ -616,8 +614,7 @@ This is a simplified PDF version. For full documentation, please use the HTML ve
 
             # Write as text file if PDF generation completely fails
             text_output = output_path.with_suffix(".txt")
-            with open(text_output, "w") as f:
-                f.write(content)
+            write_if_changed(text_output, content)
 
             print(f"⚠️  Created simplified text documentation: {text_output}")
             print("   For PDF support, install: pip install weasyprint reportlab")
@@ -4,8 +4,11 @@ Main documentation generator orchestrator
 
 import importlib
 import inspect
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
 from .models import (
@@ -27,6 +30,16 @@ from .extractors import (
     ExampleExtractor,
 )
 from .generators import UserGuideGenerator
+from .incremental import ModuleDocumentationCache, content_hash
+
+
+# Below this many changed modules, process pool startup costs more than it saves
+PARALLEL_EXTRACTION_THRESHOLD = 8
+
+
+def _extract_module_docs(module_path: Path) -> Optional[ModuleDocumentation]:
+    """Extract module documentation in a worker process"""
+    return ModuleExtractor().extract_module(module_path)
 
 
 @dataclass
@@ -43,12 +56,31 @@ class ExtractorRegistry:
 class DocumentationGenerator:
     """Main documentation generator orchestrator"""
 
-    def __init__(self, config_path: Optional[Path] = None):
+    def __init__(
+        self,
+        config_path: Optional[Path] = None,
+        cache_dir: Optional[Path] = None,
+        workers: Optional[int] = None,
+    ):
+        """Initialize generator
+
+        Args:
+            config_path: Documentation configuration file
+            cache_dir: Directory for the extracted module cache (defaults to
+                ``sources.modules.cache_dir``; no caching if neither is set)
+            workers: Processes for module extraction (defaults to
+                ``sources.modules.workers``, then the CPU count)
+        """
         self.config = self._load_config(config_path)
         self.extractors = self._init_extractors()
         self.metrics = DocumentationMetrics()
         self.generation_start_time = None
 
+        modules_config = self.config.sources.get("modules") or {}
+        cache_dir = cache_dir or modules_config.get("cache_dir")
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.workers = workers or modules_config.get("workers") or os.cpu_count() or 1
+
     def _load_config(self, config_path: Optional[Path]) -> DocumentationConfig:
         """Load documentation configuration"""
         if config_path and config_path.exists():
@@ -139,37 +171,100 @@ class DocumentationGenerator:
         return None
 
     def _generate_module_docs(self) -> List[ModuleDocumentation]:
-        """Generate module documentation from source code"""
+        """Generate module documentation from source code
+
+        Modules whose content hash matches the cache are reused; the rest
+        are extracted, in parallel when there are enough of them.
+        """
         modules_config = self.config.sources.get("modules", {})
         base_path = Path(modules_config.get("path", "src/writeit"))
         patterns = modules_config.get("patterns", ["**/*.py"])
         exclude = modules_config.get("exclude", ["**/__pycache__/**", "**/tests/**"])
 
-        module_docs = []
+        cache = ModuleDocumentationCache(self.cache_dir) if self.cache_dir else None
 
+        # Source files in discovery order, with cached docs where still valid
+        sources: List[Tuple[Path, str, bool, Optional[ModuleDocumentation]]] = []
+        seen = set()
         for pattern in patterns:
             for py_file in base_path.rglob(pattern):
-                if any(py_file.match(excl) for excl in exclude):
+                if py_file in seen or any(py_file.match(excl) for excl in exclude):
                     continue
+                seen.add(py_file)
 
                 try:
-                    module_doc = self.extractors.module_extractor.extract_module(
-                        py_file
-                    )
-                    if module_doc:
-                        module_docs.append(module_doc)
-                        self._update_module_metrics(module_doc)
-                except Exception as e:
+                    digest = content_hash(py_file.read_bytes())
+                except OSError as e:
                     print(f"Warning: Could not extract docs from {py_file}: {e}")
+                    continue
+                cached, module_doc = (
+                    cache.lookup(py_file, digest) if cache else (False, None)
+                )
+                sources.append((py_file, digest, cached, module_doc))
+
+        changed = [py_file for py_file, _, cached, _ in sources if not cached]
+        extracted = self._extract_modules(changed)
+
+        module_docs = []
+        for py_file, digest, cached, module_doc in sources:
+            if not cached:
+                module_doc = extracted.get(py_file)
+                if cache:
+                    cache.put(py_file, digest, module_doc)
+            if module_doc:
+                module_docs.append(module_doc)
+                self._update_module_metrics(module_doc)
+
+        self.metrics.cached_modules = len(sources) - len(changed)
+        self.metrics.extracted_modules = len(changed)
+
+        if cache:
+            try:
+                cache.save()
+            except OSError as e:
+                print(f"Warning: Could not save module documentation cache: {e}")
 
         return module_docs
 
+    def _extract_modules(
+        self, module_paths: List[Path]
+    ) -> Dict[Path, Optional[ModuleDocumentation]]:
+        """Extract documentation for modules, across processes if worthwhile"""
+        if self.workers > 1 and len(module_paths) >= PARALLEL_EXTRACTION_THRESHOLD:
+            try:
+                workers = min(self.workers, len(module_paths))
+                chunksize = max(1, len(module_paths) // (workers * 4))
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    return dict(
+                        zip(
+                            module_paths,
+                            pool.map(
+                                _extract_module_docs, module_paths, chunksize=chunksize
+                            ),
+                        )
+                    )
+            except (OSError, BrokenProcessPool) as e:
+                print(
+                    f"Warning: Parallel extraction unavailable, extracting serially: {e}"
+                )
+
+        extracted = {}
+        for py_file in module_paths:
+            try:
+                extracted[py_file] = self.extractors.module_extractor.extract_module(
+                    py_file
+                )
+            except Exception as e:
+                print(f"Warning: Could not extract docs from {py_file}: {e}")
+        return extracted
+
     def _generate_cli_docs(self) -> Optional[CLIDocumentation]:
         """Generate CLI documentation"""
         try:
             # Try to import Typer app
-            from writeit.cli.main import app
+            from writeit.cli.main import app, load_all_commands
 
+            load_all_commands()
             return self.extractors.cli_extractor.extract_cli_docs(app)
         except ImportError:
             print("Warning: Could not import CLI app for documentation generation")
@@ -2,13 +2,17 @@
 Enhanced HTML documentation generator with MkDocs
 """
 
-import shutil
 import subprocess
 import json
 from pathlib import Path
 from typing import Dict, Any, Optional
 
 from .models import DocumentationSet
+from .incremental import sync_tree, write_if_changed
+
+
+# Files generated into the MkDocs docs directory besides the markdown pages
+_GENERATED_PAGES = ("index.md", "404.md", "stylesheets/extra.css")
 
 
 class HTMLDocumentationGenerator:
@@ -149,40 +153,50 @@ class HTMLDocumentationGenerator:
         markdown_path: Path,
         config: Dict[str, Any],
     ):
-        """Setup complete MkDocs project structure"""
-        # Create docs directory
+        """Setup complete MkDocs project structure
+
+        Only files whose content changed are rewritten, and the site is
+        rebuilt only if something changed.
+        """
+        # Mirror markdown into the docs directory
         docs_dir = output_path / "docs"
+        copied, removed = 0, 0
         if markdown_path.exists():
-            if docs_dir.exists():
-                shutil.rmtree(docs_dir)
-            shutil.copytree(markdown_path, docs_dir)
+            copied, removed = sync_tree(
+                markdown_path, docs_dir, preserve=_GENERATED_PAGES
+            )
+        docs_dir.mkdir(parents=True, exist_ok=True)
+        changed = copied + removed
 
         # Create index.md from README.md
         readme_file = docs_dir / "README.md"
-        index_file = docs_dir / "index.md"
-        if readme_file.exists() and not index_file.exists():
-            shutil.copy2(readme_file, index_file)
+        if readme_file.exists() and not (markdown_path / "index.md").exists():
+            changed += write_if_changed(docs_dir / "index.md", readme_file.read_text())
 
         # Create custom CSS
-        self._create_custom_css(docs_dir)
+        changed += self._create_custom_css(docs_dir)
 
         # Create additional assets
-        self._create_additional_assets(docs_dir, docs)
+        changed += self._create_additional_assets(docs_dir, docs)
 
         # Write MkDocs configuration
         import yaml
 
         mkdocs_file = output_path / "mkdocs.yml"
-        with open(mkdocs_file, "w") as f:
-            yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+        changed += write_if_changed(
+            mkdocs_file, yaml.dump(config, default_flow_style=False, sort_keys=False)
+        )
 
         # Try to build with MkDocs
-        self._build_with_mkdocs(output_path)
+        site_path = output_path / "site"
+        if changed or not site_path.exists():
+            self._build_with_mkdocs(output_path, dirty=site_path.exists() and not removed)
+        else:
+            print(f"✅ HTML documentation up to date at {site_path}")
 
-    def _create_custom_css(self, docs_dir: Path):
+    def _create_custom_css(self, docs_dir: Path) -> bool:
         """Create custom CSS for enhanced styling"""
         stylesheets_dir = docs_dir / "stylesheets"
-        stylesheets_dir.mkdir(exist_ok=True)
 
         css_content = """/* Custom WriteIt Documentation Styles */
 
@@ -265,10 +279,9 @@ class HTMLDocumentationGenerator:
 }
 """
 
-        with open(stylesheets_dir / "extra.css", "w") as f:
-            f.write(css_content)
+        return write_if_changed(stylesheets_dir / "extra.css", css_content)
 
-    def _create_additional_assets(self, docs_dir: Path, docs: DocumentationSet):
+    def _create_additional_assets(self, docs_dir: Path, docs: DocumentationSet) -> bool:
         """Create additional assets and pages"""
         # Create 404 page
         not_found_file = docs_dir / "404.md"
@@ -289,14 +302,20 @@ Sorry, the page you are looking for doesn't exist.
 Use the search functionality above to find what you're looking for.
 """
 
-            with open(not_found_file, "w") as f:
-                f.write(content)
+            write_if_changed(not_found_file, content)
+            return True
+        return False
+
+    def _build_with_mkdocs(self, output_path: Path, dirty: bool = False):
+        """Build documentation with MkDocs
 
-    def _build_with_mkdocs(self, output_path: Path):
-        """Build documentation with MkDocs"""
+        Args:
+            output_path: MkDocs project directory
+            dirty: Only rebuild pages whose sources changed since the last build
+        """
         try:
             subprocess.run(
-                ["mkdocs", "build", "--site-dir", "site", "--clean"],
+                ["mkdocs", "build", "--site-dir", "site", "--dirty" if dirty else "--clean"],
                 cwd=output_path,
                 check=True,
                 capture_output=True,
@@ -0,0 +1,194 @@
+"""
+Incremental documentation build support
+
+Caches extracted module documentation by source content hash and only
+rewrites output files whose content changed, so repeated documentation
+builds only redo the work for what actually changed.
+"""
+
+import hashlib
+import os
+import pickle
+import shutil
+from dataclasses import replace
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+from .models import DocumentationSet, ModuleDocumentation
+
+
+# Bump when the cached data layout changes
+CACHE_FORMAT_VERSION = 1
+
+# Sources whose changes invalidate all cached module documentation
+_EXTRACTOR_SOURCES = (
+    Path(__file__).parent / "models.py",
+    Path(__file__).parent / "extractors" / "modules.py",
+)
+
+
+def content_hash(data: bytes) -> str:
+    """SHA-256 hex digest of file content"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def extractor_fingerprint() -> str:
+    """Fingerprint of the module extractor and documentation models"""
+    digest = hashlib.sha256(str(CACHE_FORMAT_VERSION).encode("utf-8"))
+    for source in _EXTRACTOR_SOURCES:
+        try:
+            digest.update(source.read_bytes())
+        except OSError:
+            digest.update(source.name.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class ModuleDocumentationCache:
+    """On-disk cache of extracted module documentation
+
+    Entries are keyed by source path and validated against the SHA-256 of
+    the file content, so a module is only re-extracted when it changes.
+    Failed extractions are cached too, as they fail again until it changes.
+    The whole cache is invalidated when the extractor itself changes.
+    """
+
+    FILENAME = "modules.pickle"
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir)
+        self.cache_file = self.cache_dir / self.FILENAME
+        self.fingerprint = extractor_fingerprint()
+        self._entries: Dict[str, Tuple[str, Optional[ModuleDocumentation]]] = {}
+        self._seen: Dict[str, Tuple[str, Optional[ModuleDocumentation]]] = {}
+        self.hits = 0
+        self.misses = 0
+        self._load()
+
+    def _load(self):
+        """Load cached entries, discarding them if stale or unreadable"""
+        try:
+            with open(self.cache_file, "rb") as f:
+                data = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            return
+
+        if isinstance(data, dict) and data.get("fingerprint") == self.fingerprint:
+            self._entries = data.get("entries", {})
+
+    def lookup(
+        self, source_file: Path, digest: str
+    ) -> Tuple[bool, Optional[ModuleDocumentation]]:
+        """Look up documentation for a source file with the given content hash
+
+        Returns:
+            Whether the file was cached, and its documentation (None if
+            extraction failed for this content)
+        """
+        entry = self._entries.get(str(source_file))
+        if entry is not None and entry[0] == digest:
+            self.hits += 1
+            self._seen[str(source_file)] = entry
+            return True, entry[1]
+        self.misses += 1
+        return False, None
+
+    def put(
+        self, source_file: Path, digest: str, module_doc: Optional[ModuleDocumentation]
+    ):
+        """Store documentation extracted from a source file"""
+        entry = (digest, module_doc)
+        self._entries[str(source_file)] = entry
+        self._seen[str(source_file)] = entry
+
+    def save(self, prune: bool = True):
+        """Write the cache to disk
+
+        Args:
+            prune: Drop entries for files not looked up since loading
+        """
+        entries = self._seen if prune else self._entries
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        temp_file = self.cache_file.with_suffix(".tmp")
+        with open(temp_file, "wb") as f:
+            pickle.dump(
+                {"fingerprint": self.fingerprint, "entries": entries},
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(temp_file, self.cache_file)
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """Write a text file unless it already has exactly this content
+
+    Leaving unchanged files untouched keeps their modification times, so
+    downstream builds (MkDocs, PDF) can skip them.
+
+    Returns:
+        True if the file was written
+    """
+    path = Path(path)
+    data = content.encode("utf-8")
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return True
+
+
+def sync_tree(
+    source: Path, target: Path, preserve: Iterable[str] = ()
+) -> Tuple[int, int]:
+    """Mirror a directory tree, copying only files whose content differs
+
+    Args:
+        source: Directory to mirror
+        target: Directory to update
+        preserve: Target-relative paths of generated files to keep
+
+    Returns:
+        Number of copied files and number of removed stale files
+    """
+    source = Path(source)
+    target = Path(target)
+    target.mkdir(parents=True, exist_ok=True)
+
+    copied = 0
+    expected = {Path(path) for path in preserve}
+    for source_file in source.rglob("*"):
+        if not source_file.is_file():
+            continue
+        relative = source_file.relative_to(source)
+        expected.add(relative)
+        target_file = target / relative
+        if target_file.exists() and _same_content(source_file, target_file):
+            continue
+        target_file.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(source_file, target_file)
+        copied += 1
+
+    removed = 0
+    for target_file in list(target.rglob("*")):
+        if target_file.is_file() and target_file.relative_to(target) not in expected:
+            target_file.unlink()
+            removed += 1
+
+    return copied, removed
+
+
+def documentation_fingerprint(docs: DocumentationSet) -> str:
+    """Content fingerprint of a documentation set, ignoring its generation time"""
+    return hashlib.sha256(
+        repr(replace(docs, generated_at=datetime.min)).encode("utf-8")
+    ).hexdigest()
+
+
+def _same_content(first: Path, second: Path) -> bool:
+    if first.stat().st_size != second.stat().st_size:
+        return False
+    return first.read_bytes() == second.read_bytes()
@@ -0,0 +1,281 @@
+"""
+Concurrent external link checking with a persistent result cache
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+
+
+# Status codes after which a HEAD request is retried as GET
+_HEAD_FALLBACK_STATUSES = {403, 405, 501}
+
+
+@dataclass
+class LinkCheckResult:
+    """Outcome of checking an external link"""
+
+    url: str
+    status: Optional[int] = None
+    error: Optional[str] = None
+    checked_at: float = 0.0
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    from_cache: bool = False
+    revalidated: bool = False
+
+    @property
+    def is_broken(self) -> bool:
+        """Whether the link answered with an error status
+
+        Links that could not be reached at all (timeouts, DNS or connection
+        failures) are not considered broken, as that may be a network issue.
+        """
+        return self.status is not None and self.status >= 400
+
+
+class LinkCheckCache:
+    """JSON file cache of link check results with TTLs
+
+    Working links are trusted for ``ttl`` seconds and broken ones for
+    ``broken_ttl`` seconds. Expired entries that carry an ETag or
+    Last-Modified header are revalidated with a conditional request.
+    Unreachable links are never cached.
+    """
+
+    VERSION = 1
+
+    def __init__(
+        self,
+        path: Path,
+        ttl: float = 24 * 60 * 60,
+        broken_ttl: float = 60 * 60,
+    ):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.broken_ttl = broken_ttl
+        self._entries: Dict[str, LinkCheckResult] = {}
+        self._load()
+
+    def _load(self):
+        """Load cached results, ignoring unreadable files"""
+        try:
+            data = json.loads(self.path.read_text())
+            if data.get("version") != self.VERSION:
+                return
+            self._entries = {
+                url: LinkCheckResult(**entry)
+                for url, entry in data.get("entries", {}).items()
+            }
+        except (OSError, ValueError, TypeError, AttributeError):
+            self._entries = {}
+
+    def get(self, url: str) -> Optional[LinkCheckResult]:
+        """Get the cached result for a URL, fresh or not"""
+        return self._entries.get(url)
+
+    def is_fresh(self, result: LinkCheckResult, now: Optional[float] = None) -> bool:
+        """Check whether a cached result is still within its TTL"""
+        ttl = self.broken_ttl if result.is_broken else self.ttl
+        return (now if now is not None else time.time()) - result.checked_at < ttl
+
+    def put(self, result: LinkCheckResult):
+        """Store a result, unless the link could not be reached"""
+        if result.status is None:
+            return
+        self._entries[result.url] = result
+
+    def save(self):
+        """Write the cache to disk"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        entries = {}
+        for url, result in self._entries.items():
+            entry = asdict(result)
+            entry.pop("from_cache")
+            entry.pop("revalidated")
+            entries[url] = entry
+
+        temp_file = self.path.with_suffix(".tmp")
+        temp_file.write_text(json.dumps({"version": self.VERSION, "entries": entries}))
+        os.replace(temp_file, self.path)
+
+
+class AsyncLinkChecker:
+    """Check external links concurrently
+
+    All requests share one HTTP session, so connections to a host are kept
+    alive and reused. The number of simultaneous checks per host is
+    limited, so one slow host only delays its own links. The timeout of a
+    check starts once it holds a slot, so links queued behind a slow host
+    are still checked. Each link is checked with HEAD, falling back to GET
+    for servers that reject HEAD.
+    """
+
+    def __init__(
+        self,
+        cache: Optional[LinkCheckCache] = None,
+        per_host_limit: int = 4,
+        total_limit: int = 32,
+        timeout: float = 10.0,
+        user_agent: str = "Mozilla/5.0 (Documentation Validator) WriteIt/1.0",
+    ):
+        self.cache = cache
+        self.per_host_limit = per_host_limit
+        self.total_limit = total_limit
+        self.timeout = timeout
+        self.headers = {"User-Agent": user_agent}
+
+    def check_all(self, urls: Iterable[str]) -> Dict[str, LinkCheckResult]:
+        """Check links from synchronous code"""
+        urls = list(dict.fromkeys(urls))
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.check_all_async(urls))
+
+        # Called from a running event loop: check on a separate thread
+        results: Dict[str, LinkCheckResult] = {}
+
+        def run():
+            results.update(asyncio.run(self.check_all_async(urls)))
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join()
+        return results
+
+    async def check_all_async(self, urls: Iterable[str]) -> Dict[str, LinkCheckResult]:
+        """Check links, answering from the cache where possible"""
+        urls = list(dict.fromkeys(urls))
+        results: Dict[str, LinkCheckResult] = {}
+        pending = []
+
+        now = time.time()
+        for url in urls:
+            cached = self.cache.get(url) if self.cache else None
+            if cached is not None and self.cache.is_fresh(cached, now):
+                cached.from_cache = True
+                results[url] = cached
+            else:
+                pending.append((url, cached))
+
+        if pending:
+            # Checks wait for slots here rather than in the connector, where
+            # the waiting time would count against their timeout
+            total_slots = asyncio.Semaphore(self.total_limit)
+            host_slots: Dict[str, asyncio.Semaphore] = {}
+            for url, _ in pending:
+                host = urlsplit(url).netloc
+                if host not in host_slots:
+                    host_slots[host] = asyncio.Semaphore(self.per_host_limit)
+
+            connector = aiohttp.TCPConnector(
+                limit=self.total_limit, limit_per_host=self.per_host_limit, ssl=False
+            )
+            async with aiohttp.ClientSession(
+                connector=connector,
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            ) as session:
+
+                async def check_in_slot(url, cached):
+                    async with host_slots[urlsplit(url).netloc], total_slots:
+                        return await self._check(session, url, cached)
+
+                checked = await asyncio.gather(
+                    *(check_in_slot(url, cached) for url, cached in pending)
+                )
+
+            for result in checked:
+                results[result.url] = result
+                if self.cache:
+                    self.cache.put(result)
+
+        if self.cache and pending:
+            try:
+                self.cache.save()
+            except OSError as e:
+                print(f"Warning: Could not save link check cache: {e}")
+
+        return {url: results[url] for url in urls}
+
+    async def _check(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        cached: Optional[LinkCheckResult],
+    ) -> LinkCheckResult:
+        """Check a single link"""
+        try:
+            # Revalidate an expired working result with a conditional request
+            if cached is not None and not cached.is_broken:
+                conditional = {}
+                if cached.etag:
+                    conditional["If-None-Match"] = cached.etag
+                if cached.last_modified:
+                    conditional["If-Modified-Since"] = cached.last_modified
+                if conditional:
+                    status, etag, last_modified = await self._request(
+                        session, "HEAD", url, conditional
+                    )
+                    if status == 304:
+                        return LinkCheckResult(
+                            url=url,
+                            status=cached.status,
+                            checked_at=time.time(),
+                            etag=etag or cached.etag,
+                            last_modified=last_modified or cached.last_modified,
+                            revalidated=True,
+                        )
+                    if status not in _HEAD_FALLBACK_STATUSES:
+                        return self._result(url, status, etag, last_modified)
+
+            status, etag, last_modified = await self._request(session, "HEAD", url)
+            if status in _HEAD_FALLBACK_STATUSES:
+                status, etag, last_modified = await self._request(session, "GET", url)
+            return self._result(url, status, etag, last_modified)
+
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            return LinkCheckResult(
+                url=url, error=str(e) or type(e).__name__, checked_at=time.time()
+            )
+
+    async def _request(
+        self,
+        session: aiohttp.ClientSession,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        """Send a request and return its status and validators"""
+        async with session.request(
+            method, url, headers=headers, allow_redirects=True
+        ) as response:
+            return (
+                response.status,
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+            )
+
+    def _result(
+        self,
+        url: str,
+        status: int,
+        etag: Optional[str],
+        last_modified: Optional[str],
+    ) -> LinkCheckResult:
+        return LinkCheckResult(
+            url=url,
+            status=status,
+            checked_at=time.time(),
+            etag=etag,
+            last_modified=last_modified,
+        )
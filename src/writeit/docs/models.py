@@ -322,6 +322,8 @@ class DocumentationMetrics:
     valid_examples: int = 0
     broken_links: int = 0
     generation_time: float = 0.0
+    cached_modules: int = 0
+    extracted_modules: int = 0
 
     @property
     def module_coverage(self) -> float:
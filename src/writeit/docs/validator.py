@@ -3,18 +3,33 @@ Documentation validation system
 """
 
 import re
-from typing import List, Set
-from urllib.error import URLError
+from pathlib import Path
+from typing import Dict, List, Optional, Set
 
 from .models import DocumentationSet, ValidationResult, DocumentationMetrics
+from .link_checker import AsyncLinkChecker, LinkCheckCache, LinkCheckResult
 
 
 class DocumentationValidator:
     """Validate documentation quality and consistency"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        link_cache_path: Optional[Path] = None,
+        link_checker: Optional[AsyncLinkChecker] = None,
+    ):
+        """Initialize validator
+
+        Args:
+            link_cache_path: File for caching external link check results
+            link_checker: Checker for external links (built from
+                ``link_cache_path`` if not given)
+        """
         self.metrics = DocumentationMetrics()
         self.validation_results = []
+        self.link_checker = link_checker or AsyncLinkChecker(
+            cache=LinkCheckCache(link_cache_path) if link_cache_path else None
+        )
 
     def validate_all(self, docs: DocumentationSet) -> ValidationResult:
         """Perform comprehensive validation of documentation"""
@@ -35,13 +50,13 @@ class DocumentationValidator:
         # Validate code examples
         self._validate_code_examples(docs, results)
 
+        # Check completeness
+        self._validate_completeness(docs, results)
+
         # Validate links
         if results.coverage_percentage > 0:  # Only validate if we have docs
             self._validate_links(docs, results)
 
-        # Check completeness
-        self._validate_completeness(docs, results)
-
         # Calculate overall validity
         results.is_valid = len(results.errors) == 0
 
@@ -420,10 +435,13 @@ class DocumentationValidator:
                 all_links.update(self._extract_links(guide.content))
                 all_links.update(self._extract_links(guide.description))
 
-        # Validate external links
+        # Validate external links concurrently
         broken_external_links = 0
-        for link in all_links:
-            if self._is_external_link(link) and self._is_broken_link(link):
+        link_results = self._check_links(
+            link for link in all_links if self._is_external_link(link)
+        )
+        for link, link_result in sorted(link_results.items()):
+            if link_result.is_broken:
                 results.add_error(
                     "broken_external_link", f"Broken external link: {link}"
                 )
@@ -431,8 +449,9 @@ class DocumentationValidator:
 
         # Validate internal references
         broken_internal_refs = 0
+        reference_index = self._build_reference_index(docs)
         for ref in internal_refs:
-            if not self._validate_internal_reference(ref, docs):
+            if not self._validate_internal_reference(ref, docs, reference_index):
                 results.add_error(
                     "broken_internal_ref", f"Broken internal reference: {ref}"
                 )
@@ -490,86 +509,69 @@ class DocumentationValidator:
         """Check if URL is external"""
         return url.startswith("http")
 
-    def _validate_internal_reference(self, ref: str, docs: DocumentationSet) -> bool:
+    def _build_reference_index(self, docs: DocumentationSet) -> Set[str]:
+        """Index the names internal references may point at"""
+        index = set()
+        for module in docs.module_docs or []:
+            for cls in module.classes:
+                index.update((cls.name, f"{module.name}.{cls.name}"))
+                for method in cls.methods:
+                    index.update((method.name, f"{cls.name}.{method.name}"))
+            for func in module.functions:
+                index.update((func.name, f"{module.name}.{func.name}"))
+        return index
+
+    def _validate_internal_reference(
+        self,
+        ref: str,
+        docs: DocumentationSet,
+        reference_index: Optional[Set[str]] = None,
+    ) -> bool:
         """Validate internal reference exists in documentation"""
-        # For now, just check if it looks like a valid reference format
-        # This could be enhanced to actually check if the referenced item exists
-
         # Skip validation for file paths and URLs
         if "/" in ref or ref.startswith("http") or ref.startswith("#"):
             return True
 
         # Check if reference matches any documented classes or functions
-        if docs.module_docs:
-            for module in docs.module_docs:
-                for cls in module.classes:
-                    if ref == cls.name or ref == f"{module.name}.{cls.name}":
-                        return True
-                    for method in cls.methods:
-                        if ref == method.name or ref == f"{cls.name}.{method.name}":
-                            return True
-                for func in module.functions:
-                    if ref == func.name or ref == f"{module.name}.{func.name}":
-                        return True
+        if reference_index is None:
+            reference_index = self._build_reference_index(docs)
+        if ref in reference_index:
+            return True
 
         # If we can't validate it, assume it's valid to avoid false positives
         return True
 
-    def _is_broken_link(self, url: str) -> bool:
-        """Check if an external link is broken"""
-        try:
-            # Skip localhost and example links
-            skip_domains = [
-                "localhost",
-                "127.0.0.1",
-                "example.com",
-                "example.org",
-                "test.com",
-            ]
-            if any(domain in url for domain in skip_domains):
-                return False
-
-            # Skip obviously placeholder URLs
-            if "your-domain" in url or "placeholder" in url or url.endswith(".example"):
-                return False
+    def _should_check_link(self, url: str) -> bool:
+        """Check whether an external link is worth requesting"""
+        # Skip localhost and example links
+        skip_domains = [
+            "localhost",
+            "127.0.0.1",
+            "example.com",
+            "example.org",
+            "test.com",
+        ]
+        if any(domain in url for domain in skip_domains):
+            return False
 
-            # Try HEAD request first (faster), then GET if that fails
-            import urllib.request
-            import ssl
-
-            # Create SSL context that doesn't verify certificates (for testing)
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
-
-            # Set user agent to avoid being blocked
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Documentation Validator) WriteIt/1.0"
-            }
-
-            try:
-                req = urllib.request.Request(url, headers=headers)
-                with urllib.request.urlopen(
-                    req, timeout=10, context=ssl_context
-                ) as response:
-                    return response.status >= 400
-            except urllib.error.HTTPError as e:
-                # If HEAD fails, try GET
-                if e.code in [405, 501]:  # Method not allowed, not implemented
-                    try:
-                        req = urllib.request.Request(url, headers=headers)
-                        with urllib.request.urlopen(
-                            req, timeout=10, context=ssl_context
-                        ) as response:
-                            return response.status >= 400
-                    except Exception:
-                        return True
-                return e.code >= 400
-
-        except (URLError, ValueError, Exception):
-            # Don't mark as broken if we can't check (might be network issue)
+        # Skip obviously placeholder URLs
+        if "your-domain" in url or "placeholder" in url or url.endswith(".example"):
             return False
 
+        return True
+
+    def _check_links(self, urls) -> Dict[str, LinkCheckResult]:
+        """Check external links concurrently, skipping placeholder links"""
+        urls = [url for url in urls if self._should_check_link(url)]
+        if not urls:
+            return {}
+        return self.link_checker.check_all(urls)
+
+    def _is_broken_link(self, url: str) -> bool:
+        """Check if an external link is broken"""
+        result = self._check_links([url]).get(url)
+        return result is not None and result.is_broken
+
     def _validate_completeness(self, docs: DocumentationSet, results: ValidationResult):
         """Validate documentation completeness"""
         total_items = 0
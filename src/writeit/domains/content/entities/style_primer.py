@@ -47,6 +47,7 @@ class StylePrimer:
     applicable_content_types: List[ContentType] = field(default_factory=list)
     examples: List[str] = field(default_factory=list)
     tags: List[str] = field(default_factory=list)
+    parent_styles: List[StyleName] = field(default_factory=list)  # Inherited from, most specific first
     is_published: bool = False
     is_deprecated: bool = False
     created_at: datetime = field(default_factory=datetime.now)
@@ -304,6 +305,29 @@ class StylePrimer:
             updated_at=datetime.now()
         )
     
+    def inherit_from(self, parent: StyleName) -> Self:
+        """Inherit from another style primer.
+        
+        Earlier parents take precedence over later ones; this style's own
+        settings override all of them.
+        
+        Args:
+            parent: Name of the parent style primer
+            
+        Returns:
+            Updated style primer
+        """
+        if parent == self.name:
+            raise ValueError("Style primer cannot inherit from itself")
+        if parent in self.parent_styles:
+            return self
+            
+        return dataclass_replace(
+            self,
+            parent_styles=self.parent_styles + [parent],
+            updated_at=datetime.now()
+        )
+    
     def add_tag(self, tag: str) -> Self:
         """Add a tag to the style primer.
         
@@ -6,7 +6,7 @@ file management, validation, and template resolution.
 
 from abc import abstractmethod
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, TYPE_CHECKING
 from pathlib import Path
 
 from ....shared.repository import WorkspaceAwareRepository, Specification
@@ -16,6 +16,9 @@ from ..value_objects.template_name import TemplateName
 from ..value_objects.content_type import ContentType
 from ..value_objects.content_format import ContentFormat
 
+if TYPE_CHECKING:
+    from ..services.template_dependency_index import TemplateDependencyIndex
+
 
 class ContentTemplateRepository(WorkspaceAwareRepository[Template]):
     """Repository for content template persistence and retrieval.
@@ -239,6 +242,31 @@ class ContentTemplateRepository(WorkspaceAwareRepository[Template]):
         """
         pass
     
+    async def load_dependency_index(self) -> "TemplateDependencyIndex":
+        """Get the dependency graph of all templates in the workspace.
+        
+        This default parses every template of the workspace on each call;
+        implementations that persist the graph override it.
+        
+        Returns:
+            Dependency index of all templates in the workspace
+            
+        Raises:
+            RepositoryError: If query operation fails
+        """
+        from ..services.template_dependency_index import (
+            TemplateDependencyIndex,
+            extract_template_dependencies,
+        )
+        
+        index = TemplateDependencyIndex()
+        for template in await self.find_by_workspace():
+            index.set_dependencies(
+                template.name.value,
+                [dep.value for dep in extract_template_dependencies(template.yaml_content)]
+            )
+        return index
+    
     @abstractmethod
     async def copy_template(
         self, 
@@ -343,4 +343,4 @@ class InheritsFromSpecification(Specification[StylePrimer]):
         self.parent_style = parent_style
     
     def is_satisfied_by(self, style: StylePrimer) -> bool:
-        return style.parent_style == self.parent_style
+        return self.parent_style.name in style.parent_styles
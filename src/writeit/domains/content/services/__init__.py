@@ -15,6 +15,12 @@ from .template_management_service import (
     TemplateInheritanceChain,
     TemplatePerformanceMetrics,
     TemplateVersionComparison,
+    create_template_management_service,
+)
+
+from .template_dependency_index import (
+    TemplateDependencyIndex,
+    extract_template_dependencies,
 )
 
 from .style_management_service import (
@@ -34,6 +40,12 @@ from .style_management_service import (
     StyleComparison,
 )
 
+from .style_inheritance import (
+    StyleInheritanceResolver,
+    FlattenedStyle,
+    style_version_hash,
+)
+
 from .content_generation_service import (
     ContentGenerationService,
     ContentValidationError,
@@ -77,6 +89,21 @@ from .content_validation_service import (
     FormatValidationError,
 )
 
+from .text_statistics import (
+    TextStatsAnalyzer,
+    TextStats,
+    HeadingInfo,
+    count_syllables,
+    get_text_stats_analyzer,
+)
+
+from .validation_plan import (
+    KeywordMatcher,
+    ContentScan,
+    CompiledValidationPlan,
+    compile_validation_plan,
+)
+
 __all__ = [
     # Template Management Service
     "TemplateManagementService",
@@ -89,6 +116,11 @@ __all__ = [
     "TemplateInheritanceChain",
     "TemplatePerformanceMetrics",
     "TemplateVersionComparison",
+    "create_template_management_service",
+    
+    # Template Dependency Index
+    "TemplateDependencyIndex",
+    "extract_template_dependencies",
     
     # Style Management Service
     "StyleManagementService",
@@ -106,6 +138,11 @@ __all__ = [
     "StyleRecommendation",
     "StyleComparison",
     
+    # Style Inheritance
+    "StyleInheritanceResolver",
+    "FlattenedStyle",
+    "style_version_hash",
+    
     # Content Generation Service
     "ContentGenerationService",
     "ContentValidationError",
@@ -145,4 +182,17 @@ __all__ = [
     "ContentValidationError",
     "ValidationConfigurationError",
     "FormatValidationError",
+    
+    # Text Statistics
+    "TextStatsAnalyzer",
+    "TextStats",
+    "HeadingInfo",
+    "count_syllables",
+    "get_text_stats_analyzer",
+    
+    # Validation Plans
+    "KeywordMatcher",
+    "ContentScan",
+    "CompiledValidationPlan",
+    "compile_validation_plan",
 ]
\ No newline at end of file
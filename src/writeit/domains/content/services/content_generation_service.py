@@ -23,6 +23,7 @@ from ..value_objects.content_format import ContentFormat
 from ..value_objects.content_length import ContentLength
 from ..value_objects.validation_rule import ValidationRule
 from ..repositories.generated_content_repository import GeneratedContentRepository
+from .text_statistics import TextStatsAnalyzer, count_syllables, get_text_stats_analyzer
 
 
 class ContentValidationError(Exception):
@@ -213,14 +214,17 @@ class ContentGenerationService:
     
     def __init__(
         self,
-        content_repository: GeneratedContentRepository
+        content_repository: GeneratedContentRepository,
+        text_analyzer: Optional[TextStatsAnalyzer] = None
     ) -> None:
         """Initialize content generation service.
         
         Args:
             content_repository: Repository for content persistence
+            text_analyzer: Shared text statistics analyzer (optional)
         """
         self._content_repo = content_repository
+        self._text_analyzer = text_analyzer or get_text_stats_analyzer()
         self._validation_cache = {}
         self._quality_cache = {}
         self._analytics_cache = {}
@@ -899,10 +903,11 @@ class ContentGenerationService:
         style: Optional[StylePrimer]
     ) -> Dict[str, Any]:
         """Generate metadata for content."""
+        stats = self._text_analyzer.analyze(content.content_text)
         metadata = {
-            "word_count": len(content.content_text.split()),
-            "character_count": len(content.content_text),
-            "paragraph_count": len(content.content_text.split('\n\n')),
+            "word_count": stats.word_count,
+            "character_count": stats.character_count,
+            "paragraph_count": stats.paragraph_count,
             "generated_at": datetime.now().isoformat(),
             "template_name": str(template.name),
             "content_type": str(template.content_type)
@@ -930,24 +935,23 @@ class ContentGenerationService:
         # This would implement sophisticated quality scoring
         # For now, return a simple heuristic based on length and structure
         text = content.content_text
+        stats = self._text_analyzer.analyze(text)
         
         score = 0.0
         
         # Length factor
-        word_count = len(text.split())
+        word_count = stats.word_count
         if 100 <= word_count <= 2000:
             score += 0.3
         elif word_count > 50:
             score += 0.2
         
         # Structure factor
-        paragraph_count = len(text.split('\n\n'))
-        if paragraph_count > 1:
+        if stats.paragraph_count > 1:
             score += 0.2
         
         # Sentence variety
-        sentences = text.split('.')
-        avg_sentence_length = sum(len(s.split()) for s in sentences) / max(len(sentences), 1)
+        avg_sentence_length = stats.average_sentence_length
         if 10 <= avg_sentence_length <= 25:
             score += 0.2
         
@@ -973,15 +977,14 @@ class ContentGenerationService:
         if not text:
             return 0.0
         
-        words = text.split()
-        sentences = text.split('.')
+        stats = self._text_analyzer.analyze(text)
         
-        if not words or not sentences:
+        if not stats.word_count or not stats.sentence_count:
             return 0.0
         
         # Simple Flesch-like formula
-        avg_sentence_length = len(words) / len(sentences)
-        avg_syllables = sum(self._count_syllables(word) for word in words) / len(words)
+        avg_sentence_length = stats.average_sentence_length
+        avg_syllables = stats.average_syllables_per_word
         
         # Simplified readability score (0-1 scale)
         score = 1.0 - (avg_sentence_length / 50 + avg_syllables / 5)
@@ -989,22 +992,7 @@ class ContentGenerationService:
     
     def _count_syllables(self, word: str) -> int:
         """Count syllables in a word (simplified)."""
-        word = word.lower()
-        vowels = 'aeiouy'
-        syllable_count = 0
-        prev_was_vowel = False
-        
-        for char in word:
-            is_vowel = char in vowels
-            if is_vowel and not prev_was_vowel:
-                syllable_count += 1
-            prev_was_vowel = is_vowel
-        
-        # Handle silent e
-        if word.endswith('e') and syllable_count > 1:
-            syllable_count -= 1
-        
-        return max(1, syllable_count)
+        return count_syllables(word)
     
     async def _assess_content_originality(
         self,
@@ -1014,19 +1002,16 @@ class ContentGenerationService:
         """Assess content originality."""
         # This would implement plagiarism detection and originality scoring
         # For now, return a placeholder score based on content uniqueness
-        text = content.content_text
-        
-        # Simple uniqueness indicators
-        unique_words = len(set(text.lower().split()))
-        total_words = len(text.split())
+        stats = self._text_analyzer.analyze(content.content_text)
         
-        if total_words == 0:
+        if stats.word_count == 0:
             return 0.0
         
-        uniqueness_ratio = unique_words / total_words
+        # Simple uniqueness indicators
+        uniqueness_ratio = stats.unique_word_ratio
         
         # Boost score for longer, more diverse content
-        length_factor = min(1.0, len(text) / 1000)
+        length_factor = min(1.0, stats.character_count / 1000)
         
         originality_score = (uniqueness_ratio * 0.7 + length_factor * 0.3)
         return min(1.0, originality_score)
@@ -1045,7 +1030,7 @@ class ContentGenerationService:
         
         # Check length constraints
         if template.content_length:
-            word_count = len(content.content_text.split())
+            word_count = self._text_analyzer.analyze(content.content_text).word_count
             if template.content_length.min_words and word_count < template.content_length.min_words:
                 errors.append(f"Content too short: {word_count} words, minimum {template.content_length.min_words}")
             if template.content_length.max_words and word_count > template.content_length.max_words:
@@ -1098,7 +1083,7 @@ class ContentGenerationService:
         # For now, provide basic implementations
         
         if rule.rule_type == "word_count":
-            word_count = len(content.content_text.split())
+            word_count = self._text_analyzer.analyze(content.content_text).word_count
             if "min" in rule.parameters and word_count < rule.parameters["min"]:
                 errors.append(f"Word count below minimum: {word_count} < {rule.parameters['min']}")
             if "max" in rule.parameters and word_count > rule.parameters["max"]:
@@ -1137,7 +1122,8 @@ class ContentGenerationService:
         metrics = {}
         
         # Basic metrics
-        metrics["word_density"] = len(content.content_text.split()) / max(1, len(content.content_text))
+        stats = self._text_analyzer.analyze(content.content_text)
+        metrics["word_density"] = stats.word_count / max(1, stats.character_count)
         metrics["sentence_variety"] = len(set(content.content_text.split('.'))) / max(1, len(content.content_text.split('.')))
         metrics["readability"] = await self._calculate_readability_score(content)
         
@@ -7,7 +7,7 @@ rules, quality standards, and format requirements.
 import json
 import re
 import yaml
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
 from typing import Any, Dict, List, Optional, Set, Union, Pattern
 from xml.etree import ElementTree as ET
@@ -18,6 +18,19 @@ from ..value_objects.content_type import ContentType
 from ..value_objects.content_format import ContentFormat, ContentFormatEnum
 from ..value_objects.validation_rule import ValidationRule, ValidationRuleType
 from ....shared.repository import RepositoryError
+from .text_statistics import TextStatsAnalyzer, get_text_stats_analyzer
+from .validation_plan import (
+    CompiledValidationPlan,
+    ContentScan,
+    compile_validation_plan,
+    compute_plan_hash,
+    keyword_requirement,
+)
+
+
+_MARKDOWN_LINK_PATTERN = re.compile(r'\[([^\]]*)\]\(([^)]*)\)')
+_HTML_TAG_PATTERN = re.compile(r'<(/?)(\w+)(?:\s[^>]*)?/?>')
+_HTML_SELF_CLOSING_TAGS = frozenset({'img', 'br', 'hr', 'input', 'meta', 'link'})
 
 
 class ValidationSeverity(Enum):
@@ -171,8 +184,18 @@ class ContentValidationService:
                 print(f"{issue.severity}: {issue.message}")
     """
     
-    def __init__(self):
-        """Initialize content validation service."""
+    def __init__(
+        self,
+        text_analyzer: Optional[TextStatsAnalyzer] = None,
+        max_cached_validations: int = 512
+    ):
+        """Initialize content validation service.
+        
+        Args:
+            text_analyzer: Shared text statistics analyzer (optional)
+            max_cached_validations: Maximum number of cached validation results
+        """
+        self._text_analyzer = text_analyzer or get_text_stats_analyzer()
         self._format_validators = {
             ContentFormatEnum.MARKDOWN.value: self._validate_markdown,
             ContentFormatEnum.JSON.value: self._validate_json,
@@ -182,6 +205,8 @@ class ContentValidationService:
         }
         
         self._validation_cache: Dict[str, ValidationResult] = {}
+        self._plan_cache: Dict[str, CompiledValidationPlan] = {}
+        self._max_cached_validations = max_cached_validations
     
     async def validate_content(
         self, 
@@ -203,20 +228,28 @@ class ContentValidationService:
         """
         try:
             issues: List[ValidationIssue] = []
-            rules_applied: List[ValidationRuleType] = []
             
             # Validate configuration
             self._validate_context(context)
             
+            # Unchanged content validated with an unchanged plan is served from cache
+            plan = self.compile_plan(context)
+            stats = self._text_analyzer.analyze(content.content_text)
+            cache_key = f"{stats.content_hash}:{plan.plan_hash}"
+            cached = self._validation_cache.get(cache_key)
+            if cached is not None:
+                return self._copy_result(cached, str(content.id))
+            
             # Format validation
             format_issues = await self._validate_format(content, context)
             issues.extend(format_issues)
             
-            # Apply validation rules
-            for rule in context.rules:
-                rule_issues = await self._apply_validation_rule(content, rule, context)
+            # Apply all validation rules against a single content scan
+            scan = plan.scan(content.content_text, stats)
+            for rule in plan.rules:
+                rule_issues = await self._apply_validation_rule(content, rule, context, scan)
                 issues.extend(rule_issues)
-                rules_applied.append(rule.type)
+            rules_applied = plan.rule_types
             
             # Structure validation
             structure_issues = await self._validate_structure(content, context)
@@ -238,12 +271,15 @@ class ContentValidationService:
             ):
                 is_valid = False
             
-            return ValidationResult(
+            result = ValidationResult(
                 is_valid=is_valid,
                 issues=issues,
                 content_id=str(content.id),
                 rules_applied=rules_applied
             )
+            self._cache_result(cache_key, result)
+            
+            return result
             
         except Exception as e:
             if isinstance(e, (ContentValidationError, ValidationConfigurationError)):
@@ -370,6 +406,56 @@ class ContentValidationService:
         
         return rules
     
+    def compile_plan(self, context: ValidationContext) -> CompiledValidationPlan:
+        """Compile a validation context into a reusable plan.
+        
+        Plans are cached by a hash of the rules, content type, format and
+        strictness, so contexts built repeatedly from the same template
+        share one compiled plan.
+        
+        Args:
+            context: Validation context to compile
+            
+        Returns:
+            Compiled validation plan
+            
+        Raises:
+            ValidationConfigurationError: If a rule cannot be compiled
+        """
+        plan_hash = compute_plan_hash(
+            context.rules,
+            context.content_type,
+            context.content_format,
+            context.strict_mode
+        )
+        plan = self._plan_cache.get(plan_hash)
+        if plan is None:
+            try:
+                plan = compile_validation_plan(context.rules, plan_hash)
+            except re.error as e:
+                raise ValidationConfigurationError(f"Invalid validation pattern: {e}") from e
+            self._plan_cache[plan_hash] = plan
+        return plan
+    
+    def _cache_result(self, cache_key: str, result: ValidationResult) -> None:
+        """Store a validation result, evicting the oldest entry when full."""
+        if len(self._validation_cache) >= self._max_cached_validations:
+            self._validation_cache.pop(next(iter(self._validation_cache)))
+        self._validation_cache[cache_key] = self._copy_result(result, result.content_id)
+    
+    def _copy_result(
+        self,
+        result: ValidationResult,
+        content_id: Optional[str]
+    ) -> ValidationResult:
+        """Copy a validation result so cached entries are never mutated."""
+        return replace(
+            result,
+            issues=list(result.issues),
+            content_id=content_id,
+            rules_applied=list(result.rules_applied)
+        )
+    
     def _validate_context(self, context: ValidationContext) -> None:
         """Validate the validation context configuration."""
         if not context.rules:
@@ -402,9 +488,7 @@ class ContentValidationService:
         issues = []
         
         # Check for unclosed code blocks
-        code_block_pattern = r'```'
-        code_blocks = re.findall(code_block_pattern, content_text)
-        if len(code_blocks) % 2 != 0:
+        if content_text.count('```') % 2 != 0:
             issues.append(ValidationIssue(
                 category=ValidationCategory.FORMAT,
                 severity=ValidationSeverity.ERROR,
@@ -414,9 +498,7 @@ class ContentValidationService:
             ))
         
         # Check for malformed links
-        link_pattern = r'\[([^\]]*)\]\(([^)]*)\)'
-        links = re.findall(link_pattern, content_text)
-        for link_text, link_url in links:
+        for link_text, link_url in _MARKDOWN_LINK_PATTERN.findall(content_text):
             if not link_url.strip():
                 issues.append(ValidationIssue(
                     category=ValidationCategory.FORMAT,
@@ -427,15 +509,7 @@ class ContentValidationService:
                 ))
         
         # Check heading structure
-        heading_pattern = r'^(#{1,6})\s+(.+)$'
-        lines = content_text.split('\n')
-        heading_levels = []
-        
-        for i, line in enumerate(lines):
-            match = re.match(heading_pattern, line)
-            if match:
-                level = len(match.group(1))
-                heading_levels.append((i + 1, level))
+        heading_levels = self._text_analyzer.analyze(content_text).heading_levels
         
         # Check for skipped heading levels
         for i in range(1, len(heading_levels)):
@@ -511,16 +585,12 @@ class ContentValidationService:
         issues = []
         
         # Basic HTML validation - check for unclosed tags
-        tag_pattern = r'<(/?)(\w+)(?:\s[^>]*)?/?>'
-        tags = re.findall(tag_pattern, content_text)
-        
         tag_stack: List[str] = []
-        self_closing_tags = {'img', 'br', 'hr', 'input', 'meta', 'link'}
         
-        for is_closing, tag_name in tags:
+        for is_closing, tag_name in _HTML_TAG_PATTERN.findall(content_text):
             tag_name = tag_name.lower()
             
-            if tag_name in self_closing_tags:
+            if tag_name in _HTML_SELF_CLOSING_TAGS:
                 continue
             
             if is_closing:
@@ -553,11 +623,22 @@ class ContentValidationService:
         self,
         content: GeneratedContent,
         rule: ValidationRule,
-        context: ValidationContext
+        context: ValidationContext,
+        scan: Optional[ContentScan] = None
     ) -> List[ValidationIssue]:
-        """Apply a single validation rule to content."""
+        """Apply a single validation rule to content.
+        
+        Rules read precomputed statistics and keyword counts from ``scan``;
+        when no scan is given, one is built from the compiled context plan.
+        """
         issues = []
         
+        if scan is None:
+            scan = self.compile_plan(context).scan(
+                content.content_text,
+                self._text_analyzer.analyze(content.content_text)
+            )
+        
         if rule.type == ValidationRuleType.LENGTH_MIN:
             if len(content.content_text) < rule.value:
                 issues.append(ValidationIssue(
@@ -579,7 +660,7 @@ class ContentValidationService:
                 ))
         
         elif rule.type == ValidationRuleType.WORD_COUNT_MIN:
-            word_count = len(content.content_text.split())
+            word_count = scan.stats.word_count
             if word_count < rule.value:
                 issues.append(ValidationIssue(
                     category=ValidationCategory.CONTENT_QUALITY,
@@ -590,7 +671,7 @@ class ContentValidationService:
                 ))
         
         elif rule.type == ValidationRuleType.WORD_COUNT_MAX:
-            word_count = len(content.content_text.split())
+            word_count = scan.stats.word_count
             if word_count > rule.value:
                 issues.append(ValidationIssue(
                     category=ValidationCategory.CONTENT_QUALITY,
@@ -601,11 +682,12 @@ class ContentValidationService:
                 ))
         
         elif rule.type == ValidationRuleType.KEYWORD_PRESENCE:
-            if isinstance(rule.value, list):
-                missing_keywords = []
-                for keyword in rule.value:
-                    if keyword.lower() not in content.content_text.lower():
-                        missing_keywords.append(keyword)
+            keywords, min_occurrences = keyword_requirement(rule)
+            if keywords:
+                missing_keywords = [
+                    keyword for keyword in keywords
+                    if scan.keyword_count(keyword) < min_occurrences
+                ]
                 
                 if missing_keywords:
                     issues.append(ValidationIssue(
@@ -616,6 +698,21 @@ class ContentValidationService:
                         suggestion=f"Include the following keywords: {', '.join(missing_keywords)}"
                     ))
         
+        elif rule.type == ValidationRuleType.CUSTOM_REGEX:
+            source = rule.parameters.get("pattern")
+            if isinstance(source, str):
+                must_match = rule.parameters.get("must_match", True)
+                matched = scan.pattern(source).search(content.content_text) is not None
+                if matched != must_match:
+                    expectation = "must match" if must_match else "must not match"
+                    issues.append(ValidationIssue(
+                        category=ValidationCategory.BUSINESS_RULES,
+                        severity=ValidationSeverity.WARNING,
+                        message=f"Content {expectation} pattern: {source}",
+                        rule_type=rule.type,
+                        suggestion=rule.description
+                    ))
+        
         return issues
     
     async def _validate_structure(
@@ -653,19 +750,15 @@ class ContentValidationService:
         """Validate content quality metrics."""
         issues = []
         
-        text = content.content_text
+        stats = self._text_analyzer.analyze(content.content_text)
         
         # Check for excessive repetition
-        words = text.lower().split()
-        if len(words) > 20:  # Only check if there's enough content
-            word_freq: Dict[str, int] = {}
-            for word in words:
-                if len(word) > 3:  # Skip short words
-                    word_freq[word] = word_freq.get(word, 0) + 1
-            
+        if stats.word_count > 20:  # Only check if there's enough content
             # Find words that appear too frequently
-            total_words = len(words)
-            for word, count in word_freq.items():
+            total_words = stats.word_count
+            for word, count in stats.word_frequencies.items():
+                if len(word) <= 3:  # Skip short words
+                    continue
                 frequency = count / total_words
                 if frequency > 0.10:  # More than 10% frequency (more reasonable threshold)
                     issues.append(ValidationIssue(
@@ -681,9 +774,11 @@ class ContentValidationService:
     def clear_cache(self) -> None:
         """Clear validation cache."""
         self._validation_cache.clear()
+        self._plan_cache.clear()
     
     def get_cache_stats(self) -> Dict[str, int]:
         """Get validation cache statistics."""
         return {
-            "cached_validations": len(self._validation_cache)
+            "cached_validations": len(self._validation_cache),
+            "compiled_plans": len(self._plan_cache)
         }
\ No newline at end of file
@@ -0,0 +1,316 @@
+"""Style inheritance resolution.
+
+Flattens a style primer and its ancestors into one fully merged, immutable
+style. Ancestors are ordered with C3 linearization (as Python orders base
+classes), so in diamond hierarchies a shared ancestor is applied once and
+before everything that derives from it.
+
+Flattened styles are memoized per style. A cached style is reused while the
+version hash of the style itself is unchanged; its ancestors are not loaded
+again. Saving or deleting a style must invalidate it, which drops every
+cached style that inherits from it, so using a style with a deep stack of
+ancestors merges it once and then costs a single hash.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from functools import cached_property
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Set, Tuple
+
+from ..entities.style_primer import StylePrimer
+from ..value_objects.content_type import ContentType
+from ..value_objects.style_name import StyleName
+
+
+StyleLoader = Callable[[StyleName], Awaitable[Optional[StylePrimer]]]
+
+# Scalar settings; the most specific style that sets one wins
+_SCALAR_SETTINGS = ("tone", "voice", "writing_style", "target_audience", "language")
+
+
+def style_version_hash(style: StylePrimer) -> str:
+    """Hash of the settings of a style primer that inheritance depends on."""
+    content = {
+        "name": style.name.value,
+        "version": style.version,
+        "settings": [getattr(style, attr) for attr in _SCALAR_SETTINGS],
+        "guidelines": style.guidelines,
+        "examples": style.examples,
+        "formatting": style.formatting_preferences,
+        "vocabulary": style.vocabulary_preferences,
+        "content_types": [str(content_type) for content_type in style.applicable_content_types],
+        "parents": [parent.value for parent in style.parent_styles],
+    }
+    encoded = json.dumps(content, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+@dataclass(frozen=True)
+class FlattenedStyle:
+    """A style primer with all inherited settings merged in."""
+    name: StyleName
+    style_hash: str  # Version hash of the style itself
+    version_key: str  # Version hash of the style and all its ancestors
+    resolution_order: Tuple[StyleName, ...]  # Most specific first
+    depth: int
+    tone: Optional[str]
+    voice: Optional[str]
+    writing_style: Optional[str]
+    target_audience: Optional[str]
+    language: str
+    guidelines: Tuple[str, ...]
+    examples: Tuple[str, ...]
+    applicable_content_types: Tuple[ContentType, ...]
+    formatting_preferences: Mapping[str, Any]
+    vocabulary_preferences: Mapping[str, Any]
+    overridden_rules: Tuple[str, ...]
+    conflicts: Tuple[str, ...]
+
+    @cached_property
+    def prompt_text(self) -> str:
+        """Style guidance for prompts (rendered once per flattened style)."""
+        lines = [f"Style: {self.name}"]
+        settings = [
+            f"{label}: {value}"
+            for label, value in (
+                ("Tone", self.tone),
+                ("Voice", self.voice.replace("_", " ") if self.voice else None),
+                ("Writing style", self.writing_style),
+                ("Audience", self.target_audience),
+            )
+            if value
+        ]
+        if settings:
+            lines.append(", ".join(settings))
+        if self.guidelines:
+            lines.append("Guidelines:")
+            lines.extend(f"- {guideline}" for guideline in self.guidelines)
+        for label, preferences in (
+            ("Formatting", self.formatting_preferences),
+            ("Vocabulary", self.vocabulary_preferences),
+        ):
+            if preferences:
+                lines.append(f"{label}: " + "; ".join(f"{key}: {value}" for key, value in preferences.items()))
+        return "\n".join(lines)
+
+
+class StyleInheritanceResolver:
+    """Resolve and memoize flattened style primers.
+
+    Examples:
+        resolver = StyleInheritanceResolver(style_repo.find_by_name)
+
+        flattened = await resolver.resolve(style)
+        prompt_guidance = flattened.prompt_text
+
+        # After saving a changed style
+        resolver.invalidate(style.name)
+    """
+
+    def __init__(self, load_style: StyleLoader, max_depth: int = 32) -> None:
+        """Initialize resolver.
+
+        Args:
+            load_style: Loads a style primer by name (None if it does not exist)
+            max_depth: Maximum length of an inheritance chain
+        """
+        self._load_style = load_style
+        self._max_depth = max_depth
+        self._flattened: Dict[str, FlattenedStyle] = {}
+        self._styles: Dict[str, StylePrimer] = {}
+        self._descendants: Dict[str, Set[str]] = {}
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    async def resolve(self, style: StylePrimer) -> FlattenedStyle:
+        """Flatten a style primer with its ancestors.
+
+        Args:
+            style: Style to flatten
+
+        Returns:
+            Flattened style (shared, immutable)
+
+        Raises:
+            ValueError: If a parent is missing, inheritance is cyclic or too
+                deep, or the parents cannot be linearized consistently
+        """
+        return await self._resolve(style, ())
+
+    def invalidate(self, name: StyleName) -> int:
+        """Drop a style and every cached style inheriting from it.
+
+        Args:
+            name: Name of the changed or deleted style
+
+        Returns:
+            Number of dropped flattened styles
+        """
+        key = str(name)
+        dropped = 0
+        for dependent in {key} | self._descendants.pop(key, set()):
+            if self._flattened.pop(dependent, None) is not None:
+                dropped += 1
+        self._styles.pop(key, None)
+        self._invalidations += dropped
+        return dropped
+
+    def clear(self) -> None:
+        """Drop all flattened styles."""
+        self._flattened.clear()
+        self._styles.clear()
+        self._descendants.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Cache counters."""
+        return {
+            "cached": len(self._flattened),
+            "hits": self._hits,
+            "misses": self._misses,
+            "invalidations": self._invalidations,
+        }
+
+    async def _resolve(self, style: StylePrimer, stack: Tuple[str, ...]) -> FlattenedStyle:
+        key = style.name.value
+        if key in stack:
+            cycle = " -> ".join(stack[stack.index(key):] + (key,))
+            raise ValueError(f"Circular style inheritance: {cycle}")
+        if len(stack) >= self._max_depth:
+            raise ValueError(f"Style inheritance deeper than {self._max_depth} levels at '{key}'")
+
+        style_hash = style_version_hash(style)
+        cached = self._flattened.get(key)
+        if cached is not None and cached.style_hash == style_hash:
+            # Ancestors are current: changing one invalidates this entry
+            self._hits += 1
+            return cached
+        if cached is not None:
+            # The style changed since it was flattened
+            self.invalidate(style.name)
+
+        parents = []
+        for parent_name in style.parent_styles:
+            parent = await self._load_style(parent_name)
+            if parent is None:
+                raise ValueError(f"Parent style '{parent_name}' of '{key}' not found")
+            parents.append(await self._resolve(parent, stack + (key,)))
+
+        version_key = _version_key(style_hash, parents)
+        self._misses += 1
+        self._styles[key] = style
+        flattened = self._flatten(style, style_hash, version_key, parents)
+        self._flattened[key] = flattened
+        for ancestor in flattened.resolution_order[1:]:
+            self._descendants.setdefault(ancestor.value, set()).add(key)
+        return flattened
+
+    def _flatten(
+        self, style: StylePrimer, style_hash: str, version_key: str, parents: List[FlattenedStyle]
+    ) -> FlattenedStyle:
+        """Merge the own settings of every style in the resolution order."""
+        order = _c3_linearize(style.name, parents)
+
+        settings: Dict[str, Any] = {}
+        setting_sources: Dict[str, str] = {}
+        guidelines: Dict[str, None] = {}
+        examples: Dict[str, None] = {}
+        content_types: List[ContentType] = []
+        formatting: Dict[str, Any] = {}
+        vocabulary: Dict[str, Any] = {}
+        overridden: List[str] = []
+
+        # Most general first, so more specific styles override
+        for name in reversed(order):
+            source = self._styles[name.value]
+            for attr in _SCALAR_SETTINGS:
+                value = getattr(source, attr)
+                if value is None:
+                    continue
+                if attr in settings and settings[attr] != value:
+                    overridden.append(
+                        f"{attr}: '{settings[attr]}' from {setting_sources[attr]} "
+                        f"overridden by '{value}' from {name}"
+                    )
+                settings[attr] = value
+                setting_sources[attr] = name.value
+            for preferences, own in (
+                (formatting, source.formatting_preferences),
+                (vocabulary, source.vocabulary_preferences),
+            ):
+                for pref_key, value in own.items():
+                    if pref_key in preferences and preferences[pref_key] != value:
+                        overridden.append(f"{pref_key}: overridden by {name}")
+                    preferences[pref_key] = value
+            guidelines.update(dict.fromkeys(source.guidelines))
+            examples.update(dict.fromkeys(source.examples))
+            if source.applicable_content_types:
+                content_types = list(source.applicable_content_types)
+
+        return FlattenedStyle(
+            name=style.name,
+            style_hash=style_hash,
+            version_key=version_key,
+            resolution_order=tuple(order),
+            depth=1 + max(parent.depth for parent in parents) if parents else 0,
+            tone=settings.get("tone"),
+            voice=settings.get("voice"),
+            writing_style=settings.get("writing_style"),
+            target_audience=settings.get("target_audience"),
+            language=settings.get("language", style.language),
+            guidelines=tuple(guidelines),
+            examples=tuple(examples),
+            applicable_content_types=tuple(content_types),
+            formatting_preferences=MappingProxyType(formatting),
+            vocabulary_preferences=MappingProxyType(vocabulary),
+            overridden_rules=tuple(overridden),
+            conflicts=tuple(_parent_conflicts(style, parents)),
+        )
+
+
+def _version_key(style_hash: str, parents: List[FlattenedStyle]) -> str:
+    """Version hash of a style and all its ancestors."""
+    return hashlib.sha256(
+        "".join([style_hash] + [parent.version_key for parent in parents]).encode("utf-8")
+    ).hexdigest()
+
+
+def _c3_linearize(name: StyleName, parents: List[FlattenedStyle]) -> List[StyleName]:
+    """C3 linearization of a style over its flattened parents."""
+    sequences = [list(parent.resolution_order) for parent in parents]
+    sequences.append([parent.name for parent in parents])
+    order = [name]
+    while True:
+        sequences = [sequence for sequence in sequences if sequence]
+        if not sequences:
+            return order
+        for sequence in sequences:
+            head = sequence[0]
+            if not any(head in other[1:] for other in sequences):
+                break
+        else:
+            raise ValueError(f"Inconsistent style inheritance order for '{name}'")
+        order.append(head)
+        for sequence in sequences:
+            if sequence[0] == head:
+                del sequence[0]
+
+
+def _parent_conflicts(style: StylePrimer, parents: List[FlattenedStyle]) -> List[str]:
+    """Settings the style does not set itself on which its parents disagree."""
+    conflicts = []
+    for attr in _SCALAR_SETTINGS:
+        if getattr(style, attr) is not None:
+            continue
+        values = {
+            parent.name.value: getattr(parent, attr)
+            for parent in parents
+            if getattr(parent, attr) is not None
+        }
+        if len(set(values.values())) > 1:
+            conflicts.append(
+                f"{attr}: " + ", ".join(f"{name} '{value}'" for name, value in values.items())
+            )
+    return conflicts
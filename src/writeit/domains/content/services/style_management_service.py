@@ -18,6 +18,7 @@ from ..value_objects.style_name import StyleName
 from ..value_objects.content_type import ContentType
 from ..value_objects.content_format import ContentFormat
 from ..repositories.style_primer_repository import StylePrimerRepository
+from .style_inheritance import FlattenedStyle, StyleInheritanceResolver
 
 
 class StyleValidationError(Exception):
@@ -195,6 +196,7 @@ class StyleManagementService:
         self._compatibility_cache = {}
         self._performance_cache = {}
         self._recommendation_cache = {}
+        self._inheritance = StyleInheritanceResolver(self._load_style)
         
         # Style analysis patterns
         self._tone_indicators = {
@@ -280,6 +282,7 @@ class StyleManagementService:
         
         # Save style
         style = await self._style_repo.save(style, workspace_name)
+        self._inheritance.invalidate(name)
         
         return style
     
@@ -418,6 +421,64 @@ class StyleManagementService:
         except Exception as e:
             raise StyleInheritanceError(f"Inheritance analysis failed: {e}") from e
     
+    async def resolve_style(self, style: StylePrimer) -> FlattenedStyle:
+        """Flatten a style with everything it inherits.
+        
+        The result is memoized by the version hashes of the style and its
+        ancestors, so rendering with a deep style stack merges it only once.
+        
+        Args:
+            style: Style to resolve
+            
+        Returns:
+            Fully merged, immutable style
+            
+        Raises:
+            StyleInheritanceError: If a parent is missing or inheritance is cyclic
+        """
+        try:
+            return await self._inheritance.resolve(style)
+        except ValueError as e:
+            raise StyleInheritanceError(str(e)) from e
+    
+    async def save_style(self, style: StylePrimer, workspace_name: Optional[str] = None) -> StylePrimer:
+        """Save a changed style and forget flattened styles built from it.
+        
+        Args:
+            style: Style to save
+            workspace_name: Target workspace
+            
+        Returns:
+            Saved style primer
+            
+        Raises:
+            RepositoryError: If save operation fails
+        """
+        saved = await self._style_repo.save(style, workspace_name)
+        self._inheritance.invalidate(style.name)
+        return saved
+    
+    async def delete_style(self, style: StylePrimer, workspace_name: Optional[str] = None) -> None:
+        """Delete a style and forget flattened styles built from it.
+        
+        Args:
+            style: Style to delete
+            workspace_name: Workspace context
+            
+        Raises:
+            RepositoryError: If delete operation fails
+        """
+        await self._style_repo.delete(style)
+        self._inheritance.invalidate(style.name)
+    
+    def invalidate_style(self, name: StyleName) -> None:
+        """Forget flattened styles after a style was changed or deleted.
+        
+        Args:
+            name: Name of the changed style
+        """
+        self._inheritance.invalidate(name)
+    
     async def check_style_compatibility(
         self,
         style_a: StylePrimer,
@@ -582,6 +643,7 @@ class StyleManagementService:
             
             # Save composed style
             composed = await self._style_repo.save(composed, workspace_name)
+            self._inheritance.invalidate(composed.name)
             
             return composed
             
@@ -998,9 +1060,19 @@ class StyleManagementService:
     # Additional helper methods would be implemented here
     # These are placeholder implementations for the complex logic
     
+    async def _load_style(self, name: StyleName) -> Optional[StylePrimer]:
+        """Load a style by name for inheritance resolution."""
+        return await self._style_repo.find_by_name(name)
+    
     async def _find_parent_styles(self, style: StylePrimer, workspace_name: Optional[str]) -> List[StylePrimer]:
         """Find parent styles in inheritance chain."""
-        return []  # Placeholder
+        parents = []
+        for parent_name in style.parent_styles:
+            parent = await self._load_style(parent_name)
+            if parent is None:
+                raise StyleInheritanceError(f"Parent style '{parent_name}' of '{style.name}' not found")
+            parents.append(parent)
+        return parents
     
     async def _find_child_styles(self, style: StylePrimer, workspace_name: Optional[str]) -> List[StylePrimer]:
         """Find child styles in inheritance chain."""
@@ -1008,23 +1080,23 @@ class StyleManagementService:
     
     async def _calculate_inheritance_depth(self, style: StylePrimer, workspace_name: Optional[str]) -> int:
         """Calculate inheritance depth."""
-        return 0  # Placeholder
+        return (await self.resolve_style(style)).depth
     
     async def _analyze_inheritance_conflicts(self, style: StylePrimer, parents: List[StylePrimer], workspace_name: Optional[str]) -> List[str]:
         """Analyze inheritance conflicts."""
-        return []  # Placeholder
+        return list((await self.resolve_style(style)).conflicts)
     
     async def _merge_inherited_guidelines(self, style: StylePrimer, parents: List[StylePrimer]) -> Set[str]:
         """Merge guidelines from inheritance chain."""
-        return set()  # Placeholder
+        return set((await self.resolve_style(style)).guidelines)
     
     async def _find_overridden_rules(self, style: StylePrimer, parents: List[StylePrimer]) -> List[str]:
         """Find overridden rules in inheritance chain."""
-        return []  # Placeholder
+        return list((await self.resolve_style(style)).overridden_rules)
     
     async def _determine_resolution_order(self, style: StylePrimer, parents: List[StylePrimer]) -> List[StyleName]:
         """Determine resolution order for inheritance."""
-        return []  # Placeholder
+        return list((await self.resolve_style(style)).resolution_order)
     
     async def _generate_compatibility_recommendations(self, comparison: StyleComparison) -> List[str]:
         """Generate compatibility recommendations."""
@@ -0,0 +1,312 @@
+"""Template dependency index.
+
+In-memory dependency graph over template names, kept as forward and
+reverse adjacency and updated one template at a time. Transitive
+closures, strongly connected components (cycles) and dependency depths
+are memoized; a change to a template only invalidates the closures of the
+templates that can reach it.
+"""
+
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+import yaml
+
+from ..value_objects.template_name import TemplateName
+
+
+def extract_template_dependencies(yaml_content: str) -> List[TemplateName]:
+    """Extract the templates a template's YAML refers to.
+
+    Dependencies come from ``extends``, ``includes`` and the ``template`` of
+    each step. Unparseable YAML has no dependencies.
+
+    Args:
+        yaml_content: Template YAML
+
+    Returns:
+        Referenced template names in document order
+    """
+    dependencies = []
+
+    try:
+        parsed = yaml.safe_load(yaml_content)
+
+        # Look for template includes/extends
+        if "extends" in parsed:
+            dependencies.append(TemplateName.from_user_input(parsed["extends"]))
+
+        if "includes" in parsed:
+            includes = parsed["includes"]
+            if isinstance(includes, list):
+                dependencies.extend(
+                    TemplateName.from_user_input(inc) for inc in includes
+                )
+            elif isinstance(includes, str):
+                dependencies.append(TemplateName.from_user_input(includes))
+
+        # Look for step dependencies on other templates
+        for step_config in parsed.get("steps", {}).values():
+            if isinstance(step_config, dict):
+                if "template" in step_config:
+                    dependencies.append(
+                        TemplateName.from_user_input(step_config["template"])
+                    )
+
+    except Exception:
+        pass
+
+    return dependencies
+
+
+class TemplateDependencyIndex:
+    """Forward and reverse template dependency adjacency with memoized analysis.
+
+    Nodes are template names. A name is a known template once its
+    dependencies have been set; names that are only referenced are missing.
+
+    Examples:
+        index = TemplateDependencyIndex()
+        index.set_dependencies("article", ["base", "footer"])
+        index.set_dependencies("base", [])
+
+        index.transitive_dependencies("article")  # {"base", "footer"}
+        index.missing_dependencies("article")     # ["footer"]
+        index.cycles()                            # []
+    """
+
+    def __init__(self, adjacency: Optional[Dict[str, Iterable[str]]] = None) -> None:
+        """Initialize index.
+
+        Args:
+            adjacency: Dependencies by template name to start from
+        """
+        self._forward: Dict[str, Tuple[str, ...]] = {}
+        self._reverse: Dict[str, Set[str]] = {}
+        self._closures: Dict[str, FrozenSet[str]] = {}
+        self._components: Optional[List[List[str]]] = None
+        self._depths: Optional[Dict[str, int]] = None
+        self.version = 0
+
+        for name, dependencies in (adjacency or {}).items():
+            self.set_dependencies(name, dependencies)
+
+    # Incremental maintenance
+
+    def set_dependencies(self, name: str, dependencies: Iterable[str]) -> bool:
+        """Add or replace the dependencies of a template.
+
+        Args:
+            name: Template name
+            dependencies: Names of the templates it depends on
+
+        Returns:
+            True if the graph changed
+        """
+        name = str(name)
+        new = tuple(dict.fromkeys(str(dependency) for dependency in dependencies))
+        old = self._forward.get(name)
+        if old == new:
+            return False
+
+        self._invalidate(name)
+        for dependency in old or ():
+            self._reverse[dependency].discard(name)
+        for dependency in new:
+            self._reverse.setdefault(dependency, set()).add(name)
+        self._forward[name] = new
+        return True
+
+    def remove_template(self, name: str) -> bool:
+        """Remove a template; templates still referring to it see it as missing.
+
+        Returns:
+            True if the template was known
+        """
+        name = str(name)
+        if name not in self._forward:
+            return False
+
+        self._invalidate(name)
+        for dependency in self._forward.pop(name):
+            self._reverse[dependency].discard(name)
+        return True
+
+    # Queries
+
+    @property
+    def templates(self) -> List[str]:
+        """Names of the known templates."""
+        return list(self._forward)
+
+    def has_template(self, name: str) -> bool:
+        """Whether the dependencies of ``name`` are known."""
+        return str(name) in self._forward
+
+    def to_adjacency(self) -> Dict[str, List[str]]:
+        """Dependencies by template name."""
+        return {name: list(dependencies) for name, dependencies in self._forward.items()}
+
+    def dependencies(self, name: str) -> List[str]:
+        """Direct dependencies of a template."""
+        return list(self._forward.get(str(name), ()))
+
+    def dependents(self, name: str) -> List[str]:
+        """Templates that depend directly on ``name``."""
+        return sorted(self._reverse.get(str(name), ()))
+
+    def transitive_dependencies(self, name: str) -> FrozenSet[str]:
+        """All templates reachable from ``name`` (memoized).
+
+        Includes ``name`` itself only if it is on a cycle.
+        """
+        name = str(name)
+        cached = self._closures.get(name)
+        if cached is not None:
+            return cached
+
+        reached: Set[str] = set()
+        stack = list(self._forward.get(name, ()))
+        while stack:
+            node = stack.pop()
+            if node in reached:
+                continue
+            reached.add(node)
+            known = self._closures.get(node)
+            if known is not None:
+                # A memoized closure is complete, so there is no need to walk it
+                reached.update(known)
+                continue
+            stack.extend(self._forward.get(node, ()))
+
+        closure = frozenset(reached)
+        self._closures[name] = closure
+        return closure
+
+    def transitive_dependents(self, name: str) -> Set[str]:
+        """All templates that can reach ``name``."""
+        reached: Set[str] = set()
+        stack = list(self._reverse.get(str(name), ()))
+        while stack:
+            node = stack.pop()
+            if node not in reached:
+                reached.add(node)
+                stack.extend(self._reverse.get(node, ()))
+        return reached
+
+    def missing_dependencies(self, name: str) -> List[str]:
+        """Transitive dependencies of ``name`` that are not known templates."""
+        return sorted(
+            dependency for dependency in self.transitive_dependencies(name)
+            if dependency not in self._forward
+        )
+
+    def strongly_connected_components(self) -> List[List[str]]:
+        """Strongly connected components, dependencies before dependents (memoized)."""
+        if self._components is None:
+            self._components = self._tarjan()
+        return self._components
+
+    def cycles(self) -> List[List[str]]:
+        """Components forming dependency cycles, including self-references."""
+        return [
+            component for component in self.strongly_connected_components()
+            if len(component) > 1 or component[0] in self._forward.get(component[0], ())
+        ]
+
+    def cycle_containing(self, name: str) -> Optional[List[str]]:
+        """The cycle ``name`` is part of, if any."""
+        name = str(name)
+        if name not in self.transitive_dependencies(name):
+            return None
+        for component in self.strongly_connected_components():
+            if name in component:
+                return component
+        return None
+
+    def depth(self, name: str) -> int:
+        """Length of the longest dependency chain below ``name``.
+
+        Templates on a cycle count as one level.
+        """
+        if self._depths is None:
+            self._depths = self._compute_depths()
+        return self._depths.get(str(name), 0)
+
+    # Internal helpers
+
+    def _invalidate(self, name: str) -> None:
+        """Drop memoized results that may change when ``name`` changes."""
+        self.version += 1
+        self._components = None
+        self._depths = None
+        if self._closures:
+            self._closures.pop(name, None)
+            for dependent in self.transitive_dependents(name):
+                self._closures.pop(dependent, None)
+
+    def _nodes(self) -> List[str]:
+        nodes = dict.fromkeys(self._forward)
+        for dependencies in self._forward.values():
+            nodes.update(dict.fromkeys(dependencies))
+        return list(nodes)
+
+    def _tarjan(self) -> List[List[str]]:
+        """Iterative Tarjan SCC; emits components in reverse topological order."""
+        index: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        on_stack: Set[str] = set()
+        stack: List[str] = []
+        components: List[List[str]] = []
+        counter = 0
+
+        for root in self._nodes():
+            if root in index:
+                continue
+            work = [(root, iter(self._forward.get(root, ())))]
+            index[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+
+            while work:
+                node, children = work[-1]
+                for child in children:
+                    if child not in index:
+                        index[child] = lowlink[child] = counter
+                        counter += 1
+                        stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, iter(self._forward.get(child, ()))))
+                        break
+                    if child in on_stack:
+                        lowlink[node] = min(lowlink[node], index[child])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[node])
+                    if lowlink[node] == index[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == node:
+                                break
+                        components.append(component)
+
+        return components
+
+    def _compute_depths(self) -> Dict[str, int]:
+        """Longest chain per node over the component graph, in one pass."""
+        depths: Dict[str, int] = {}
+        for component in self.strongly_connected_components():
+            members = set(component)
+            depth = 0
+            for member in component:
+                for dependency in self._forward.get(member, ()):
+                    if dependency not in members:
+                        depth = max(depth, depths[dependency] + 1)
+            for member in component:
+                depths[member] = depth
+        return depths
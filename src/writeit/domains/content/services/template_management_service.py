@@ -14,14 +14,15 @@ import yaml
 import asyncio
 from collections import defaultdict
 
-from ....shared.repository import EntityAlreadyExistsError, EntityNotFoundError, RepositoryError
-from ..entities.template import Template, TemplateScope
+from ....shared.repository import EntityAlreadyExistsError, EntityNotFoundError
+from ..entities.template import Template
 from ..value_objects.template_name import TemplateName
 from ..value_objects.content_type import ContentType
 from ..value_objects.content_format import ContentFormat
 from ..value_objects.validation_rule import ValidationRule
 from ..value_objects.content_length import ContentLength
 from ..repositories.content_template_repository import ContentTemplateRepository
+from .template_dependency_index import TemplateDependencyIndex, extract_template_dependencies
 
 logger = logging.getLogger(__name__)
 
@@ -148,16 +149,24 @@ class TemplateManagementService:
     
     def __init__(
         self,
-        template_repository: ContentTemplateRepository
+        template_repository: ContentTemplateRepository,
+        dependency_index: Optional[TemplateDependencyIndex] = None
     ) -> None:
         """Initialize template management service.
         
         Args:
             template_repository: Repository for template persistence
+            dependency_index: Dependency graph of the workspace, normally the
+                repository's persisted index (see
+                create_template_management_service). Defaults to an empty
+                graph holding only the templates passed to this service.
         """
         self._template_repo = template_repository
         self._validation_cache = {}
         self._dependency_cache = {}
+        self._dependency_index = (
+            dependency_index if dependency_index is not None else TemplateDependencyIndex()
+        )
         self._performance_cache = {}
         self._optimization_rules = []
         self._inheritance_analyzers = []
@@ -245,6 +254,10 @@ class TemplateManagementService:
         # Save template
         template = await self._template_repo.save(template, workspace_name)
         
+        self._dependency_index.set_dependencies(
+            name.value, [dep.value for dep in extract_template_dependencies(yaml_content)]
+        )
+        
         # Create dependencies if requested
         if options.create_dependencies:
             await self._create_template_dependencies(template, workspace_name)
@@ -340,15 +353,19 @@ class TemplateManagementService:
         Raises:
             TemplateDependencyError: If dependency analysis fails
         """
-        # Check cache first
-        cache_key = f"{template.id}:{workspace_name}:{max_depth}"
-        if cache_key in self._dependency_cache:
-            return self._dependency_cache[cache_key]
-        
         try:
-            # Extract direct dependencies
+            # Extract direct dependencies and bring the graph up to date
             direct_deps = await self._extract_direct_dependencies(template)
+            self._dependency_index.set_dependencies(
+                template.name.value, [dep.value for dep in direct_deps]
+            )
             
+            # Check cache first; cached analyses are dropped when the graph changes
+            cache_key = f"{template.id}:{workspace_name}:{max_depth}:{self._dependency_index.version}"
+            if cache_key in self._dependency_cache:
+                return self._dependency_cache[cache_key]
+            
+
             # Resolve indirect dependencies
             indirect_deps = await self._resolve_indirect_dependencies(
                 template, direct_deps, max_depth, workspace_name
@@ -392,6 +409,25 @@ class TemplateManagementService:
         except Exception as e:
             raise TemplateDependencyError(f"Dependency analysis failed: {e}") from e
     
+    def update_template_dependencies(self, template: Template) -> None:
+        """Record a saved template's dependencies in the dependency graph.
+        
+        Args:
+            template: Template that was created or updated
+        """
+        self._dependency_index.set_dependencies(
+            template.name.value,
+            [dep.value for dep in extract_template_dependencies(template.yaml_content)]
+        )
+    
+    def remove_template_dependencies(self, name: TemplateName) -> None:
+        """Drop a deleted template from the dependency graph.
+        
+        Args:
+            name: Name of the deleted template
+        """
+        self._dependency_index.remove_template(name.value)
+    
     async def analyze_template_inheritance(
         self,
         template: Template,
@@ -947,36 +983,7 @@ class TemplateManagementService:
     
     async def _extract_direct_dependencies(self, template: Template) -> List[TemplateName]:
         """Extract direct template dependencies."""
-        dependencies = []
-        
-        try:
-            parsed = yaml.safe_load(template.yaml_content)
-            
-            # Look for template includes/extends
-            if "extends" in parsed:
-                dependencies.append(TemplateName.from_user_input(parsed["extends"]))
-            
-            if "includes" in parsed:
-                includes = parsed["includes"]
-                if isinstance(includes, list):
-                    dependencies.extend(
-                        TemplateName.from_user_input(inc) for inc in includes
-                    )
-                elif isinstance(includes, str):
-                    dependencies.append(TemplateName.from_user_input(includes))
-            
-            # Look for step dependencies on other templates
-            for step_config in parsed.get("steps", {}).values():
-                if isinstance(step_config, dict):
-                    if "template" in step_config:
-                        dependencies.append(
-                            TemplateName.from_user_input(step_config["template"])
-                        )
-            
-        except Exception:
-            pass
-        
-        return dependencies
+        return extract_template_dependencies(template.yaml_content)
     
     async def _resolve_indirect_dependencies(
         self,
@@ -985,33 +992,25 @@ class TemplateManagementService:
         max_depth: int,
         workspace_name: Optional[str]
     ) -> List[TemplateName]:
-        """Resolve indirect dependencies recursively."""
+        """Resolve dependencies reachable through direct ones, up to ``max_depth`` levels."""
+        direct = {dep.value for dep in direct_deps}
+        visited = set(direct)
+        frontier = list(direct)
         indirect_deps = []
-        visited = set()
-        
-        async def _resolve_recursive(deps: List[TemplateName], depth: int):
-            if depth >= max_depth:
-                return
-            
-            for dep_name in deps:
-                if dep_name in visited:
-                    continue
-                visited.add(dep_name)
-                
-                # Load dependency template
-                dep_template = await self._template_repo.find_by_name(dep_name)
-                if dep_template:
-                    # Get its dependencies
-                    sub_deps = await self._extract_direct_dependencies(dep_template)
-                    indirect_deps.extend(sub_deps)
-                    
-                    # Recurse
-                    await _resolve_recursive(sub_deps, depth + 1)
-        
-        await _resolve_recursive(direct_deps, 0)
         
-        # Remove duplicates and direct dependencies
-        return list(set(indirect_deps) - set(direct_deps))
+        for _ in range(max_depth):
+            next_frontier = []
+            for dep_name in frontier:
+                for sub_dep in self._dependency_index.dependencies(dep_name):
+                    if sub_dep not in visited:
+                        visited.add(sub_dep)
+                        next_frontier.append(sub_dep)
+            indirect_deps.extend(next_frontier)
+            frontier = next_frontier
+            if not frontier:
+                break
+        
+        return [TemplateName(dep) for dep in indirect_deps if dep != template.name.value]
     
     async def _find_template_dependents(
         self,
@@ -1019,7 +1018,13 @@ class TemplateManagementService:
         workspace_name: Optional[str]
     ) -> List[TemplateName]:
         """Find templates that depend on this template."""
-        dependents = await self._template_repo.get_template_dependents(template)
+        dependents = list(await self._template_repo.get_template_dependents(template))
+        known = set(dependents)
+        for dependent in self._dependency_index.dependents(template.name.value):
+            dep_name = TemplateName(dependent)
+            if dep_name not in known:
+                known.add(dep_name)
+                dependents.append(dep_name)
         return dependents
     
     async def _detect_circular_dependencies(
@@ -1028,18 +1033,11 @@ class TemplateManagementService:
         dependencies: List[TemplateName],
         workspace_name: Optional[str]
     ) -> List[List[TemplateName]]:
-        """Detect circular dependencies."""
-        circular_deps = []
-        
-        # Simple cycle detection - could be enhanced with graph algorithms
-        for dep_name in dependencies:
-            dep_template = await self._template_repo.find_by_name(dep_name)
-            if dep_template:
-                dep_dependencies = await self._extract_direct_dependencies(dep_template)
-                if template.name in dep_dependencies:
-                    circular_deps.append([template.name, dep_name])
-        
-        return circular_deps
+        """Detect the dependency cycle the template is part of (Tarjan SCC)."""
+        cycle = self._dependency_index.cycle_containing(template.name.value)
+        if cycle is None:
+            return []
+        return [[TemplateName(name) for name in cycle]]
     
     async def _find_missing_dependencies(
         self,
@@ -1047,14 +1045,10 @@ class TemplateManagementService:
         workspace_name: Optional[str]
     ) -> List[TemplateName]:
         """Find missing dependency templates."""
-        missing = []
-        
-        for dep_name in dependencies:
-            dep_template = await self._template_repo.find_by_name(dep_name)
-            if not dep_template:
-                missing.append(dep_name)
-        
-        return missing
+        return [
+            dep_name for dep_name in dependencies
+            if not self._dependency_index.has_template(dep_name.value)
+        ]
     
     async def _calculate_dependency_depth(
         self,
@@ -1062,10 +1056,7 @@ class TemplateManagementService:
         workspace_name: Optional[str]
     ) -> int:
         """Calculate maximum dependency depth."""
-        # This would implement a graph traversal to find maximum depth
-        # For now, return a simple estimate
-        direct_deps = await self._extract_direct_dependencies(template)
-        return len(direct_deps)
+        return self._dependency_index.depth(template.name.value)
     
     async def _apply_prompt_optimizations(self, template: Template) -> Template:
         """Apply prompt-level optimizations."""
@@ -1229,18 +1220,13 @@ class TemplateManagementService:
     ) -> None:
         """Create missing template dependencies."""
         # Extract dependencies from template content
-        dependencies = self._extract_template_dependencies(template.content)
+        dependencies = await self._extract_direct_dependencies(template)
         
         if not dependencies:
             return
         
         # Check which dependencies exist
-        missing_deps = []
-        for dep_name in dependencies:
-            try:
-                await self._template_repository.get_by_name(dep_name, workspace_name)
-            except RepositoryError:
-                missing_deps.append(dep_name)
+        missing_deps = await self._find_missing_dependencies(dependencies, workspace_name)
         
         if missing_deps:
             # Log missing dependencies
@@ -1264,19 +1250,33 @@ class TemplateManagementService:
                 # Create a basic template stub for the missing dependency
                 stub_template = Template.create(
                     name=dep_name,
-                    content=f"# Auto-generated template stub for {dep_name}\n\n{{{{ content }}}}",
+                    content_type=ContentType.generic(),
+                    yaml_content=f"# Auto-generated template stub for {dep_name}\nsteps: {{}}\n",
                     description=f"Auto-generated dependency template for {dep_name}",
-                    template_type=ContentType.TEMPLATE_STUB,
-                    scope=TemplateScope.WORKSPACE if workspace_name else TemplateScope.GLOBAL,
-                    workspace_name=workspace_name,
                     author="system",
                     tags=["auto-generated", "dependency-stub"]
                 )
                 
-                await self._template_repository.save(stub_template)
+                await self._template_repo.save(stub_template)
+                self.update_template_dependencies(stub_template)
                 
                 logger.info(f"Auto-created template dependency stub: {dep_name}")
                 
             except Exception as e:
                 logger.error(f"Failed to auto-create template dependency {dep_name}: {e}")
-                # Continue with other dependencies even if one fails
\ No newline at end of file
+                # Continue with other dependencies even if one fails
+
+
+async def create_template_management_service(
+    template_repository: ContentTemplateRepository
+) -> TemplateManagementService:
+    """Create a template management service over the workspace dependency graph.
+    
+    Args:
+        template_repository: Repository for template persistence
+        
+    Returns:
+        Service analyzing dependencies with the repository's index
+    """
+    dependency_index = await template_repository.load_dependency_index()
+    return TemplateManagementService(template_repository, dependency_index)
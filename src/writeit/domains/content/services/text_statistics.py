@@ -0,0 +1,206 @@
+"""Text statistics analyzer.
+
+Shared single-pass tokenizer used by content quality scoring and content
+validation. Statistics are memoized by content hash so every quality and
+validation dimension reads the same precomputed result.
+"""
+
+import hashlib
+import re
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+
+_VOWEL_GROUP_PATTERN = re.compile(r'[aeiouy]+')
+_SENTENCE_PATTERN = re.compile(r'[^\s.!?][^.!?]*')
+_HEADING_PATTERN = re.compile(r'^(#{1,6})[^\S\n]+(.+)$', re.MULTILINE)
+_PARAGRAPH_BREAK_PATTERN = re.compile(r'\n[^\S\n]*\n')
+
+
+@lru_cache(maxsize=16384)
+def count_syllables(word: str) -> int:
+    """Count syllables in a word (simplified vowel-group heuristic).
+
+    Args:
+        word: Word to count syllables for
+
+    Returns:
+        Number of syllables, at least 1
+    """
+    word = word.lower()
+    syllable_count = len(_VOWEL_GROUP_PATTERN.findall(word))
+
+    # Handle silent e
+    if word.endswith('e') and syllable_count > 1:
+        syllable_count -= 1
+
+    return max(1, syllable_count)
+
+
+@dataclass(frozen=True)
+class HeadingInfo:
+    """Markdown heading found in content text."""
+    line: int
+    level: int
+    text: str
+
+
+@dataclass(frozen=True)
+class TextStats:
+    """Precomputed statistics for a piece of content text.
+
+    Instances are shared between callers through the analyzer cache and
+    must be treated as read-only.
+    """
+    content_hash: str
+    character_count: int
+    word_count: int
+    sentence_count: int
+    syllable_count: int
+    unique_word_count: int
+    paragraph_count: int
+    headings: Tuple[HeadingInfo, ...] = ()
+    word_frequencies: Dict[str, int] = field(default_factory=dict, compare=False)
+
+    @property
+    def unique_word_ratio(self) -> float:
+        """Ratio of distinct (case-insensitive) words to total words."""
+        if self.word_count == 0:
+            return 0.0
+        return self.unique_word_count / self.word_count
+
+    @property
+    def average_sentence_length(self) -> float:
+        """Average number of words per sentence."""
+        if self.sentence_count == 0:
+            return 0.0
+        return self.word_count / self.sentence_count
+
+    @property
+    def average_syllables_per_word(self) -> float:
+        """Average number of syllables per word."""
+        if self.word_count == 0:
+            return 0.0
+        return self.syllable_count / self.word_count
+
+    @property
+    def heading_levels(self) -> List[Tuple[int, int]]:
+        """Heading (line, level) pairs in document order."""
+        return [(heading.line, heading.level) for heading in self.headings]
+
+
+class TextStatsAnalyzer:
+    """Tokenizes content text once and memoizes statistics by content hash.
+
+    Examples:
+        analyzer = TextStatsAnalyzer()
+        stats = analyzer.analyze(content.content_text)
+
+        print(stats.word_count, stats.sentence_count, stats.unique_word_ratio)
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        """Initialize text statistics analyzer.
+
+        Args:
+            max_entries: Maximum number of memoized results to keep
+        """
+        self._max_entries = max_entries
+        self._cache: "OrderedDict[str, TextStats]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def content_hash(text: str) -> str:
+        """Compute the memoization key for content text."""
+        return hashlib.sha256(text.encode('utf-8', 'surrogatepass')).hexdigest()
+
+    def analyze(self, text: str) -> TextStats:
+        """Get statistics for content text, computing them at most once.
+
+        Args:
+            text: Content text to analyze
+
+        Returns:
+            Precomputed text statistics
+        """
+        key = self.content_hash(text)
+        stats = self._cache.get(key)
+        if stats is not None:
+            self._hits += 1
+            self._cache.move_to_end(key)
+            return stats
+
+        self._misses += 1
+        stats = self._compute(text, key)
+        self._cache[key] = stats
+        if len(self._cache) > self._max_entries:
+            self._cache.popitem(last=False)
+        return stats
+
+    def clear_cache(self) -> None:
+        """Clear memoized statistics."""
+        self._cache.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Get memoization cache statistics."""
+        return {
+            "cached_stats": len(self._cache),
+            "hits": self._hits,
+            "misses": self._misses,
+        }
+
+    def _compute(self, text: str, key: str) -> TextStats:
+        """Tokenize text once and derive all statistics from the tokens."""
+        word_frequencies = Counter(text.lower().split())
+        word_count = sum(word_frequencies.values())
+
+        # Syllables are counted once per distinct word and weighted by frequency
+        syllable_count = sum(
+            count_syllables(word) * count for word, count in word_frequencies.items()
+        )
+
+        sentence_count = sum(1 for _ in _SENTENCE_PATTERN.finditer(text))
+
+        paragraph_count = sum(
+            1 for paragraph in _PARAGRAPH_BREAK_PATTERN.split(text) if paragraph.strip()
+        )
+
+        headings: List[HeadingInfo] = []
+        line = 1
+        position = 0
+        for match in _HEADING_PATTERN.finditer(text):
+            line += text.count('\n', position, match.start())
+            position = match.start()
+            headings.append(HeadingInfo(
+                line=line,
+                level=len(match.group(1)),
+                text=match.group(2).strip()
+            ))
+
+        return TextStats(
+            content_hash=key,
+            character_count=len(text),
+            word_count=word_count,
+            sentence_count=sentence_count,
+            syllable_count=syllable_count,
+            unique_word_count=len(word_frequencies),
+            paragraph_count=paragraph_count,
+            headings=tuple(headings),
+            word_frequencies=dict(word_frequencies),
+        )
+
+
+_shared_analyzer: Optional[TextStatsAnalyzer] = None
+
+
+def get_text_stats_analyzer() -> TextStatsAnalyzer:
+    """Get the process-wide analyzer shared by the content services."""
+    global _shared_analyzer
+    if _shared_analyzer is None:
+        _shared_analyzer = TextStatsAnalyzer()
+    return _shared_analyzer
@@ -0,0 +1,233 @@
+"""Compiled validation plans.
+
+Compiles validation rule sets into reusable plans: keyword rules share one
+Aho-Corasick automaton and regex rules are compiled once, so a single scan
+of the content evaluates every rule.
+"""
+
+import hashlib
+import json
+import re
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Pattern, Sequence, Tuple
+
+from ..value_objects.validation_rule import ValidationRule, ValidationRuleType
+from .text_statistics import TextStats
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton counting occurrences of many keywords at once.
+
+    Matching is case-insensitive substring matching, equivalent to
+    ``keyword.lower() in text.lower()`` for every keyword, but the text is
+    scanned once regardless of how many keywords are registered.
+
+    Examples:
+        matcher = KeywordMatcher(["machine learning", "python"])
+        counts = matcher.count_occurrences(text.lower())
+    """
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        """Build the automaton.
+
+        Args:
+            keywords: Keywords to match (case-insensitive)
+        """
+        self._keywords: Tuple[str, ...] = tuple(
+            dict.fromkeys(keyword.lower() for keyword in keywords if keyword)
+        )
+
+        goto: List[Dict[str, int]] = [{}]
+        output: List[Tuple[int, ...]] = [()]
+        for index, keyword in enumerate(self._keywords):
+            state = 0
+            for char in keyword:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto.append({})
+                    output.append(())
+                    goto[state][char] = next_state
+                state = next_state
+            output[state] += (index,)
+
+        # Breadth-first construction of failure links, folded directly into a
+        # deterministic transition table so scanning never follows fail links.
+        fail = [0] * len(goto)
+        delta: List[Dict[str, int]] = [dict() for _ in goto]
+        delta[0] = dict(goto[0])
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            delta[state] = {**delta[fail[state]], **goto[state]}
+            for char, next_state in goto[state].items():
+                fail[next_state] = delta[fail[state]].get(char, 0) if state else 0
+                output[next_state] += output[fail[next_state]]
+                queue.append(next_state)
+
+        self._delta = delta
+        self._output = output
+
+    @property
+    def keywords(self) -> Tuple[str, ...]:
+        """Registered (lowercased) keywords."""
+        return self._keywords
+
+    def count_occurrences(self, lowered_text: str) -> Dict[str, int]:
+        """Count occurrences of every keyword in a single pass.
+
+        Args:
+            lowered_text: Lowercased text to scan
+
+        Returns:
+            Mapping of keyword to number of (possibly overlapping) occurrences
+        """
+        delta = self._delta
+        output = self._output
+        counts = [0] * len(self._keywords)
+        state = 0
+
+        for char in lowered_text:
+            state = delta[state].get(char, 0)
+            if output[state]:
+                for index in output[state]:
+                    counts[index] += 1
+
+        return dict(zip(self._keywords, counts))
+
+
+def keyword_requirement(rule: ValidationRule) -> Tuple[Tuple[str, ...], int]:
+    """Extract required keywords and minimum occurrences from a rule.
+
+    Args:
+        rule: Keyword presence rule
+
+    Returns:
+        Tuple of (keywords, minimum occurrences); keywords is empty when the
+        rule does not carry a keyword list
+    """
+    keywords = rule.parameters.get("value", rule.parameters.get("keywords"))
+    if not isinstance(keywords, (list, tuple)):
+        return (), 0
+    return tuple(str(keyword) for keyword in keywords), int(rule.parameters.get("min_occurrences", 1))
+
+
+@dataclass
+class ContentScan:
+    """Result of scanning content once for a compiled plan."""
+    text: str
+    stats: TextStats
+    keyword_counts: Dict[str, int] = field(default_factory=dict)
+    patterns: Dict[str, Pattern[str]] = field(default_factory=dict)
+    _lowered_text: Optional[str] = None
+
+    @property
+    def lowered_text(self) -> str:
+        """Lowercased content text, computed at most once."""
+        if self._lowered_text is None:
+            self._lowered_text = self.text.lower()
+        return self._lowered_text
+
+    def keyword_count(self, keyword: str) -> int:
+        """Get occurrence count for a keyword.
+
+        Keywords outside the compiled plan fall back to a direct search.
+        """
+        lowered = keyword.lower()
+        if lowered in self.keyword_counts:
+            return self.keyword_counts[lowered]
+        return self.lowered_text.count(lowered)
+
+    def pattern(self, source: str) -> Pattern[str]:
+        """Get a compiled pattern, compiling it if it is not part of the plan."""
+        compiled = self.patterns.get(source)
+        if compiled is None:
+            compiled = re.compile(source, re.MULTILINE)
+            self.patterns[source] = compiled
+        return compiled
+
+
+@dataclass(frozen=True)
+class CompiledValidationPlan:
+    """Validation context compiled for repeated evaluation."""
+    plan_hash: str
+    rules: Tuple[ValidationRule, ...]
+    keyword_matcher: Optional[KeywordMatcher] = None
+    patterns: Dict[str, Pattern[str]] = field(default_factory=dict, compare=False)
+
+    @property
+    def rule_types(self) -> List[ValidationRuleType]:
+        """Types of the rules in plan order."""
+        return [rule.type for rule in self.rules]
+
+    def scan(self, text: str, stats: TextStats) -> ContentScan:
+        """Scan content once for every keyword in the plan.
+
+        Args:
+            text: Content text
+            stats: Precomputed statistics for the text
+
+        Returns:
+            Content scan shared by all rule evaluations
+        """
+        scan = ContentScan(text=text, stats=stats, patterns=dict(self.patterns))
+        if self.keyword_matcher is not None:
+            scan.keyword_counts = self.keyword_matcher.count_occurrences(scan.lowered_text)
+        return scan
+
+
+def compute_plan_hash(
+    rules: Sequence[ValidationRule],
+    content_type: Any,
+    content_format: Any,
+    strict_mode: bool
+) -> str:
+    """Compute a stable hash identifying a validation configuration."""
+    payload = {
+        "rules": [
+            [rule.rule_type, rule.parameters, rule.severity]
+            for rule in rules
+        ],
+        "content_type": str(content_type),
+        "content_format": getattr(content_format, "value", str(content_format)),
+        "strict_mode": strict_mode,
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def compile_validation_plan(
+    rules: Sequence[ValidationRule],
+    plan_hash: str
+) -> CompiledValidationPlan:
+    """Compile validation rules into a reusable plan.
+
+    Args:
+        rules: Rules to compile
+        plan_hash: Hash identifying the validation configuration
+
+    Returns:
+        Compiled validation plan
+
+    Raises:
+        re.error: If a custom regex rule has an invalid pattern
+    """
+    keywords: List[str] = []
+    patterns: Dict[str, Pattern[str]] = {}
+
+    for rule in rules:
+        if rule.type == ValidationRuleType.KEYWORD_PRESENCE:
+            rule_keywords, _ = keyword_requirement(rule)
+            keywords.extend(rule_keywords)
+        elif rule.type == ValidationRuleType.CUSTOM_REGEX:
+            source = rule.parameters.get("pattern")
+            if isinstance(source, str) and source not in patterns:
+                patterns[source] = re.compile(source, re.MULTILINE)
+
+    return CompiledValidationPlan(
+        plan_hash=plan_hash,
+        rules=tuple(rules),
+        keyword_matcher=KeywordMatcher(keywords) if keywords else None,
+        patterns=patterns,
+    )
@@ -19,6 +19,11 @@ from .llm_orchestration_service import (
     ProviderLoadBalancer,
 )
 
+from .admission_scheduler import (
+    AdmissionScheduler,
+    AdmissionTimeoutError,
+)
+
 from .cache_management_service import (
     CacheManagementService,
     CacheManagementError,
@@ -64,6 +69,10 @@ __all__ = [
     "LLMResponse",
     "ProviderLoadBalancer",
     
+    # Admission Scheduling
+    "AdmissionScheduler",
+    "AdmissionTimeoutError",
+    
     # Cache Management Service
     "CacheManagementService",
     "CacheManagementError",
@@ -0,0 +1,281 @@
+"""Admission scheduling for LLM requests.
+
+Limits how many requests run on each provider at once and decides which
+waiting request runs next. Waiting requests are ordered by start-time fair
+queuing: every (priority, workspace) pair is a flow whose weight comes
+from its priority, so a priority's share of a saturated provider follows
+its weight and workspaces at the same priority share equally. A request
+whose deadline is close jumps the fair order, and one whose deadline
+passes while waiting is rejected instead of being sent.
+"""
+
+import asyncio
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Deque, Dict, List, Optional, Tuple
+
+
+# Share of a saturated provider per priority, relative to "low"
+DEFAULT_PRIORITY_WEIGHTS: Dict[str, float] = {
+    "critical": 16.0,
+    "high": 8.0,
+    "normal": 2.0,
+    "low": 1.0,
+}
+
+Flow = Tuple[str, str]  # (priority, workspace)
+
+
+def _priority_key(priority: Any) -> str:
+    """Plain string of a priority, accepting ``RequestPriority`` members."""
+    return str(getattr(priority, "value", priority))
+
+
+class AdmissionTimeoutError(Exception):
+    """Raised when a request's deadline passes before it is admitted."""
+    pass
+
+
+@dataclass
+class _Waiter:
+    flow: Flow
+    start_tag: float
+    finish_tag: float
+    sequence: int
+    enqueued_at: float
+    deadline: Optional[float]
+    future: "asyncio.Future[None]"
+
+
+@dataclass
+class WaitTimeStats:
+    """Wait times of admitted requests (seconds)."""
+    admitted: int = 0
+    expired: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+    recent: Deque[float] = field(default_factory=lambda: deque(maxlen=512))
+
+    def record(self, wait: float) -> None:
+        self.admitted += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        self.recent.append(wait)
+
+    def to_dict(self) -> Dict[str, Any]:
+        recent = sorted(self.recent)
+        p95 = recent[min(len(recent) - 1, math.ceil(len(recent) * 0.95) - 1)] if recent else 0.0
+        return {
+            "admitted": self.admitted,
+            "expired": self.expired,
+            "avg_wait_seconds": self.total_wait / self.admitted if self.admitted else 0.0,
+            "p95_wait_seconds": p95,
+            "max_wait_seconds": self.max_wait,
+        }
+
+
+@dataclass
+class _ProviderQueue:
+    capacity: int
+    in_flight: int = 0
+    virtual_time: float = 0.0
+    waiters: List[_Waiter] = field(default_factory=list)
+    last_finish: Dict[Flow, float] = field(default_factory=dict)
+
+
+class AdmissionScheduler:
+    """Per-provider in-flight cap with weighted fair, deadline-aware queuing.
+
+    Examples:
+        scheduler = AdmissionScheduler(default_capacity=4)
+        async with scheduler.slot("openai", "my-workspace", "high", timeout_seconds=30):
+            response = await provider.generate(request)
+    """
+
+    def __init__(
+        self,
+        default_capacity: int = 4,
+        priority_weights: Optional[Dict[str, float]] = None,
+        urgency_seconds: float = 1.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """Initialize scheduler.
+
+        Args:
+            default_capacity: In-flight requests allowed per provider
+            priority_weights: Relative share of each priority
+            urgency_seconds: Remaining time under which a waiting request
+                is admitted ahead of the fair order (earliest deadline first)
+            clock: Monotonic time source (seconds)
+        """
+        self.default_capacity = default_capacity
+        self.priority_weights = dict(priority_weights or DEFAULT_PRIORITY_WEIGHTS)
+        self.urgency_seconds = urgency_seconds
+        self._clock = clock
+        self._queues: Dict[str, _ProviderQueue] = {}
+        self._wait_stats: Dict[str, WaitTimeStats] = {}
+        self._sequence = 0
+
+    def set_capacity(self, provider_name: str, capacity: int) -> None:
+        """Set how many requests may run on a provider at once."""
+        if capacity < 1:
+            raise ValueError("Provider capacity must be at least 1")
+        queue = self._queue(provider_name)
+        queue.capacity = capacity
+        self._dispatch(queue)
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        provider_name: str,
+        workspace: str,
+        priority: str,
+        timeout_seconds: Optional[float] = None
+    ) -> AsyncIterator[float]:
+        """Hold one of a provider's in-flight slots for the block.
+
+        Args:
+            provider_name: Provider the request runs on
+            workspace: Workspace the request belongs to
+            priority: Request priority (a ``RequestPriority`` value)
+            timeout_seconds: Time left before the request's deadline
+
+        Yields:
+            Seconds spent waiting for admission
+
+        Raises:
+            AdmissionTimeoutError: If the deadline passes while waiting
+        """
+        waited = await self.acquire(provider_name, workspace, priority, timeout_seconds)
+        try:
+            yield waited
+        finally:
+            self.release(provider_name)
+
+    async def acquire(
+        self,
+        provider_name: str,
+        workspace: str,
+        priority: str,
+        timeout_seconds: Optional[float] = None
+    ) -> float:
+        """Wait for a slot on a provider; pair with ``release``.
+
+        Returns:
+            Seconds spent waiting for admission
+
+        Raises:
+            AdmissionTimeoutError: If the deadline passes while waiting
+        """
+        priority = _priority_key(priority)
+        queue = self._queue(provider_name)
+        stats = self._stats(priority)
+        if queue.in_flight < queue.capacity and not queue.waiters:
+            queue.in_flight += 1
+            stats.record(0.0)
+            return 0.0
+
+        now = self._clock()
+        flow = (priority, workspace)
+        start = max(queue.virtual_time, queue.last_finish.get(flow, 0.0))
+        finish = start + 1.0 / self._weight(priority)
+        queue.last_finish[flow] = finish
+        self._sequence += 1
+        waiter = _Waiter(
+            flow=flow,
+            start_tag=start,
+            finish_tag=finish,
+            sequence=self._sequence,
+            enqueued_at=now,
+            deadline=now + timeout_seconds if timeout_seconds is not None else None,
+            future=asyncio.get_running_loop().create_future(),
+        )
+        queue.waiters.append(waiter)
+
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.future), timeout_seconds)
+        except BaseException as e:
+            if waiter.future.done() and not waiter.future.cancelled() and waiter.future.exception() is None:
+                # Admitted just as the wait ended; give the slot back
+                self.release(provider_name)
+            elif waiter in queue.waiters:
+                queue.waiters.remove(waiter)
+                waiter.future.cancel()
+            if isinstance(e, asyncio.TimeoutError):
+                stats.expired += 1
+                raise AdmissionTimeoutError(
+                    f"Request not admitted to '{provider_name}' within {timeout_seconds}s"
+                ) from e
+            raise
+
+        waited = self._clock() - now
+        stats.record(waited)
+        return waited
+
+    def release(self, provider_name: str) -> None:
+        """Free a slot taken by ``acquire`` and admit the next waiter."""
+        queue = self._queue(provider_name)
+        queue.in_flight = max(0, queue.in_flight - 1)
+        self._dispatch(queue)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue depths, in-flight counts and wait times."""
+        providers = {}
+        for name, queue in sorted(self._queues.items()):
+            by_priority: Dict[str, int] = {}
+            by_workspace: Dict[str, int] = {}
+            for waiter in queue.waiters:
+                priority, workspace = waiter.flow
+                by_priority[priority] = by_priority.get(priority, 0) + 1
+                by_workspace[workspace] = by_workspace.get(workspace, 0) + 1
+            providers[name] = {
+                "capacity": queue.capacity,
+                "in_flight": queue.in_flight,
+                "queue_depth": len(queue.waiters),
+                "queue_depth_by_priority": by_priority,
+                "queue_depth_by_workspace": by_workspace,
+            }
+        return {
+            "providers": providers,
+            "wait_times": {
+                priority: stats.to_dict() for priority, stats in sorted(self._wait_stats.items())
+            },
+        }
+
+    def _queue(self, provider_name: str) -> _ProviderQueue:
+        queue = self._queues.get(provider_name)
+        if queue is None:
+            queue = self._queues[provider_name] = _ProviderQueue(self.default_capacity)
+        return queue
+
+    def _stats(self, priority: str) -> WaitTimeStats:
+        stats = self._wait_stats.get(priority)
+        if stats is None:
+            stats = self._wait_stats[priority] = WaitTimeStats()
+        return stats
+
+    def _weight(self, priority: str) -> float:
+        return self.priority_weights.get(priority, 1.0)
+
+    def _dispatch(self, queue: _ProviderQueue) -> None:
+        now = self._clock()
+        # Waiters whose wait already ended are dropped by acquire
+        queue.waiters = [w for w in queue.waiters if not w.future.done()]
+        while queue.in_flight < queue.capacity and queue.waiters:
+            waiter = self._next_waiter(queue, now)
+            queue.waiters.remove(waiter)
+            queue.virtual_time = max(queue.virtual_time, waiter.start_tag)
+            queue.in_flight += 1
+            waiter.future.set_result(None)
+
+    def _next_waiter(self, queue: _ProviderQueue, now: float) -> _Waiter:
+        urgent = [
+            w for w in queue.waiters
+            if w.deadline is not None and w.deadline - now <= self.urgency_seconds
+        ]
+        if urgent:
+            return min(urgent, key=lambda w: (w.deadline, w.sequence))
+        return min(queue.waiters, key=lambda w: (w.finish_tag, w.sequence))
@@ -10,14 +10,17 @@ from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Set, Any, Tuple, AsyncIterator
 from enum import Enum
-from collections import defaultdict, deque
+from collections import defaultdict
 
 from ..entities.execution_context import ExecutionContext
 from ..entities.llm_provider import LLMProvider, ProviderStatus, ProviderType
 from ..value_objects.model_name import ModelName
 from ..value_objects.token_count import TokenCount
+from ..value_objects.cache_key import CacheKey
+from .admission_scheduler import AdmissionScheduler, AdmissionTimeoutError
 from ....infrastructure.llm.provider_factory import ProviderFactory
 from ....infrastructure.llm.base_provider import LLMRequest, LLMResponse, StreamingChunk
+from ....shared.single_flight import SingleFlight
 
 
 class ProviderSelectionStrategy(str, Enum):
@@ -265,7 +268,9 @@ class LLMOrchestrationService:
         selection_strategy: ProviderSelectionStrategy = ProviderSelectionStrategy.PERFORMANCE_BASED,
         default_timeout: int = 30,
         max_retries: int = 3,
-        enable_metrics: bool = True
+        enable_metrics: bool = True,
+        admission_scheduler: Optional[AdmissionScheduler] = None,
+        coalesce_requests: bool = True
     ) -> None:
         """Initialize LLM orchestration service.
         
@@ -275,6 +280,9 @@ class LLMOrchestrationService:
             default_timeout: Default request timeout in seconds
             max_retries: Maximum retry attempts
             enable_metrics: Whether to collect performance metrics
+            admission_scheduler: Scheduler admitting requests to providers
+            coalesce_requests: Whether identical concurrent requests share
+                one provider call
         """
         self._provider_factory = provider_factory or ProviderFactory()
         self._providers: Dict[str, LLMProvider] = {}
@@ -283,9 +291,9 @@ class LLMOrchestrationService:
         self._default_timeout = default_timeout
         self._max_retries = max_retries
         self._enable_metrics = enable_metrics
-        self._request_queue: Dict[RequestPriority, deque] = {
-            priority: deque() for priority in RequestPriority
-        }
+        self._admission = admission_scheduler or AdmissionScheduler()
+        self._coalesce_requests = coalesce_requests
+        self._single_flight = SingleFlight()
         self._active_requests: Dict[str, RequestContext] = {}
         self._rate_limiters: Dict[str, Dict[str, Any]] = defaultdict(dict)
         self._health_check_interval = 60  # seconds
@@ -305,6 +313,10 @@ class LLMOrchestrationService:
         
         self._providers[provider.name] = provider
         
+        max_concurrent = provider.get_rate_limit("max_concurrent_requests")
+        if max_concurrent:
+            self._admission.set_capacity(provider.name, max_concurrent)
+        
         # Create and register infrastructure provider
         try:
             infrastructure_provider = self._provider_factory.create_provider(
@@ -385,7 +397,16 @@ class LLMOrchestrationService:
         
         try:
             self._active_requests[request_id] = request_ctx
-            return await self._execute_with_fallback(request_ctx)
+            if not self._coalesce_requests:
+                return await self._execute_with_fallback(request_ctx)
+            response = await self._single_flight.do(
+                self._coalescing_key(request_ctx),
+                lambda: self._execute_with_fallback(request_ctx)
+            )
+            if response.request_id != request_id:
+                # Shared with an identical request already in flight
+                response = replace(response, request_id=request_id)
+            return response
         finally:
             self._active_requests.pop(request_id, None)
     
@@ -433,7 +454,14 @@ class LLMOrchestrationService:
         
         try:
             self._active_requests[request_id] = request_ctx
-            async for chunk in self._execute_streaming_with_fallback(request_ctx):
+            if self._coalesce_requests:
+                chunks = self._single_flight.stream(
+                    self._coalescing_key(request_ctx),
+                    lambda: self._execute_streaming_with_fallback(request_ctx)
+                )
+            else:
+                chunks = self._execute_streaming_with_fallback(request_ctx)
+            async for chunk in chunks:
                 yield chunk
         finally:
             self._active_requests.pop(request_id, None)
@@ -458,9 +486,10 @@ class LLMOrchestrationService:
                     await self._record_rate_limit_hit(provider)
                     continue
                 
-                start_time = time.time()
-                response = await self._execute_on_provider(request_ctx, provider, model)
-                latency_ms = (time.time() - start_time) * 1000
+                async with self._admission_slot(request_ctx, provider):
+                    start_time = time.time()
+                    response = await self._execute_on_provider(request_ctx, provider, model)
+                    latency_ms = (time.time() - start_time) * 1000
                 
                 # Update metrics
                 if self._enable_metrics:
@@ -468,6 +497,9 @@ class LLMOrchestrationService:
                 
                 return response
                 
+            except AdmissionTimeoutError:
+                # The deadline has passed; other providers cannot help
+                raise
             except Exception as e:
                 last_error = e
                 if self._enable_metrics:
@@ -496,15 +528,43 @@ class LLMOrchestrationService:
                 if not await self._check_rate_limits(provider):
                     continue
                 
-                async for chunk in self._execute_streaming_on_provider(request_ctx, provider, model):
-                    yield chunk
+                async with self._admission_slot(request_ctx, provider):
+                    async for chunk in self._execute_streaming_on_provider(request_ctx, provider, model):
+                        yield chunk
                 return
                 
+            except AdmissionTimeoutError:
+                raise
             except Exception:
                 continue
         
         raise ProviderUnavailableError("No available providers for streaming request")
     
+    def _coalescing_key(self, request_ctx: RequestContext) -> Tuple[str, str]:
+        """Key under which identical concurrent requests share one call."""
+        key = CacheKey.from_components(
+            model=",".join(str(model) for model in request_ctx.model_preference),
+            prompt=request_ctx.prompt,
+            temperature=request_ctx.temperature,
+            max_tokens=request_ctx.max_tokens,
+            stop_sequences=request_ctx.stop_sequences,
+            workspace=request_ctx.execution_context.workspace_name
+        )
+        return ("stream" if request_ctx.streaming else "request", str(key))
+    
+    def _admission_slot(self, request_ctx: RequestContext, provider: LLMProvider):
+        """Wait for an in-flight slot on a provider within the request's deadline."""
+        remaining = None
+        if request_ctx.timeout_seconds:
+            elapsed = (datetime.now() - request_ctx.created_at).total_seconds()
+            remaining = max(0.0, request_ctx.timeout_seconds - elapsed)
+        return self._admission.slot(
+            provider.name,
+            request_ctx.execution_context.workspace_name,
+            request_ctx.priority,
+            remaining
+        )
+    
     async def _execute_on_provider(
         self, 
         request_ctx: RequestContext, 
@@ -703,6 +763,22 @@ class LLMOrchestrationService:
         """
         return list(self._active_requests.values())
     
+    def get_admission_stats(self) -> Dict[str, Any]:
+        """Get admission queue depths, in-flight counts and wait times.
+        
+        Returns:
+            Dict with per-provider queue state and per-priority wait times
+        """
+        return self._admission.get_stats()
+    
+    def get_coalescing_stats(self) -> Dict[str, int]:
+        """Get counts of provider calls shared by identical concurrent requests.
+        
+        Returns:
+            Dict with executed, coalesced and in-flight call counts
+        """
+        return self._single_flight.get_stats()
+    
     def analyze_provider_performance(self) -> Dict[str, Dict[str, Any]]:
         """Analyze provider performance and generate insights.
         
@@ -6,7 +6,7 @@ execution state persistence, history tracking, and performance analytics.
 
 from abc import abstractmethod
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, TYPE_CHECKING
 from uuid import UUID
 
 from ....shared.repository import WorkspaceAwareRepository, Specification
@@ -15,6 +15,9 @@ from ..entities.pipeline_run import PipelineRun
 from ..value_objects.pipeline_id import PipelineId
 from ..value_objects.execution_status import ExecutionStatus
 
+if TYPE_CHECKING:
+    from ..services.run_analytics import RunAnalytics
+
 
 class PipelineRunRepository(WorkspaceAwareRepository[PipelineRun]):
     """Repository for pipeline run persistence and retrieval.
@@ -208,6 +211,53 @@ class PipelineRunRepository(WorkspaceAwareRepository[PipelineRun]):
         """
         pass
 
+    async def record_step_event(self, run: PipelineRun, step_id: str, event: str) -> None:
+        """Persist a run's progress after one of its steps started or completed.
+
+        Only the run's token usage and execution time are expected to have
+        changed since it was last saved. This default saves the whole run;
+        implementations that keep a run journal append a small record
+        instead.
+
+        Args:
+            run: Run in its current state
+            step_id: Step the event belongs to
+            event: Event name, such as "started" or "completed"
+
+        Raises:
+            RepositoryError: If save operation fails
+        """
+        await self.save(run)
+
+    async def get_run_analytics(
+        self, 
+        start_date: Optional[datetime] = None, 
+        end_date: Optional[datetime] = None
+    ) -> "RunAnalytics":
+        """Get analytics over runs started within a time range.
+        
+        This default aggregates the workspace's runs on every call;
+        implementations that maintain hourly aggregates override it.
+        
+        Args:
+            start_date: Start of time range (inclusive)
+            end_date: End of time range (inclusive)
+            
+        Returns:
+            Run analytics for the range
+            
+        Raises:
+            RepositoryError: If query operation fails
+        """
+        from ..services.run_analytics import RunAnalytics
+        
+        runs = [
+            run for run in await self.find_by_workspace()
+            if (start_date is None or (run.started_at or run.created_at) >= start_date)
+            and (end_date is None or (run.started_at or run.created_at) <= end_date)
+        ]
+        return RunAnalytics.from_entities(runs)
+
 
 # Specifications for pipeline run queries
 
@@ -7,9 +7,21 @@ that doesn't belong to individual entities.
 from .pipeline_validation_service import PipelineValidationService
 from .pipeline_execution_service import PipelineExecutionService
 from .step_dependency_service import StepDependencyService
+from .run_analytics import AnalyticsBucket, RunAnalytics
+from .prompt_budget import ModelLimits, PackingReport, PackingStrategy, TokenBudgetPlanner
+from .step_output_spill import SpilledOutput, StepOutputBlobStore, StepOutputSpiller
 
 __all__ = [
     "PipelineValidationService", 
     "PipelineExecutionService",
     "StepDependencyService",
+    "AnalyticsBucket",
+    "RunAnalytics",
+    "ModelLimits",
+    "PackingReport",
+    "PackingStrategy",
+    "TokenBudgetPlanner",
+    "SpilledOutput",
+    "StepOutputBlobStore",
+    "StepOutputSpiller",
 ]
\ No newline at end of file
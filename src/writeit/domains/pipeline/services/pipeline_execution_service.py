@@ -21,6 +21,8 @@ from ..value_objects.prompt_template import PromptTemplate
 from ..repositories.pipeline_template_repository import PipelineTemplateRepository
 from ..repositories.pipeline_run_repository import PipelineRunRepository
 from ..repositories.step_execution_repository import StepExecutionRepository
+from .prompt_budget import TokenBudgetPlanner
+from .step_output_spill import StepOutputSpiller
 
 
 class ExecutionMode(str, Enum):
@@ -206,7 +208,9 @@ class PipelineExecutionService:
         template_repository: PipelineTemplateRepository,
         run_repository: PipelineRunRepository,
         step_repository: StepExecutionRepository,
-        step_executors: Optional[List[StepExecutor]] = None
+        step_executors: Optional[List[StepExecutor]] = None,
+        token_budget: Optional[TokenBudgetPlanner] = None,
+        output_spiller: Optional[StepOutputSpiller] = None
     ) -> None:
         """Initialize execution service.
         
@@ -215,6 +219,9 @@ class PipelineExecutionService:
             run_repository: Repository for pipeline runs
             step_repository: Repository for step executions
             step_executors: List of step executors for different step types
+            token_budget: Planner fitting step prompts into token budgets
+            output_spiller: Moves large step outputs into a blob store, so
+                run and step records persist references instead
         """
         self._template_repo = template_repository
         self._run_repo = run_repository
@@ -224,6 +231,8 @@ class PipelineExecutionService:
         self._default_execution_strategy = StepExecutionStrategy.STREAMING
         self._max_parallel_steps = 5
         self._step_timeout_seconds = 300  # 5 minutes
+        self._token_budget = token_budget
+        self._output_spiller = output_spiller
     
     async def execute_pipeline(
         self,
@@ -476,7 +485,10 @@ class PipelineExecutionService:
                 context.step_executions[execution.step_id.value] = execution
                 if execution.is_completed:
                     context.completed_steps.add(execution.step_id.value)
-                    context.add_step_output(execution.step_id.value, execution.outputs)
+                    outputs = execution.outputs
+                    if self._output_spiller is not None:
+                        outputs = self._output_spiller.from_refs(outputs)
+                    context.add_step_output(execution.step_id.value, outputs)
                 elif execution.is_failed:
                     context.failed_steps.add(execution.step_id.value)
         
@@ -493,7 +505,9 @@ class PipelineExecutionService:
                     yield event
             
             # Complete pipeline
-            pipeline_run = context.pipeline_run.complete(context.variables.get("steps", {}))
+            pipeline_run = context.pipeline_run.complete(
+                self._persisted(context.variables.get("steps", {}))
+            )
             await self._run_repo.save(pipeline_run, pipeline_run.workspace_name)
             
             yield ExecutionEvent(
@@ -644,11 +658,12 @@ class PipelineExecutionService:
         
         # Start step execution
         step_inputs = self._prepare_step_inputs(context, step_template)
-        step_execution = step_execution.start(step_inputs)
+        step_execution = step_execution.start(self._persisted(step_inputs))
         context.step_executions[step_key] = step_execution
         
         # Save step execution
         await self._step_repo.save(step_execution, context.pipeline_run.workspace_name)
+        await self._run_repo.record_step_event(context.pipeline_run, step_key, "started")
         
         yield ExecutionEvent(
             event_type=ExecutionEventType.STEP_STARTED,
@@ -668,8 +683,11 @@ class PipelineExecutionService:
                 timeout=self._step_timeout_seconds
             )
             
-            # Complete step execution
-            step_execution = step_execution.complete(result.outputs)
+            # Complete step execution, spilling large outputs to blobs
+            outputs = result.outputs
+            if self._output_spiller is not None:
+                outputs = self._output_spiller.spill(outputs)
+            step_execution = step_execution.complete(self._persisted(outputs))
             
             # Add token usage
             for provider, tokens in result.tokens_used.items():
@@ -678,11 +696,11 @@ class PipelineExecutionService:
             
             context.step_executions[step_key] = step_execution
             context.completed_steps.add(step_key)
-            context.add_step_output(step_key, result.outputs)
+            context.add_step_output(step_key, outputs)
             
             # Save updated state
             await self._step_repo.save(step_execution, context.pipeline_run.workspace_name)
-            await self._run_repo.save(context.pipeline_run, context.pipeline_run.workspace_name)
+            await self._run_repo.record_step_event(context.pipeline_run, step_key, "completed")
             
             yield ExecutionEvent(
                 event_type=ExecutionEventType.STEP_COMPLETED,
@@ -765,10 +783,29 @@ class PipelineExecutionService:
             else:
                 raise RuntimeError(error_msg)
     
+    def _persisted(self, value: Any) -> Any:
+        """Form of a value to persist: large strings as blob references."""
+        if self._output_spiller is None:
+            return value
+        return self._output_spiller.to_refs(self._output_spiller.spill(value))
+    
     def _prepare_step_inputs(self, context: ExecutionContext, step_template: PipelineStepTemplate) -> Dict[str, Any]:
         """Prepare inputs for step execution."""
+        token_budget = None
+        if self._token_budget is not None:
+            rendered_prompt, report = self._token_budget.pack_template(
+                step_template.id.value,
+                step_template.prompt_template,
+                context.variables,
+                step_template.model_preference.primary_model,
+                step_template.model_preference.max_tokens
+            )
+            token_budget = report.to_dict()
+        else:
+            rendered_prompt = context.render_step_template(step_template)
+        
         inputs = {
-            "rendered_prompt": context.render_step_template(step_template),
+            "rendered_prompt": rendered_prompt,
             "step_type": step_template.type,
             "model_preference": step_template.model_preference,
             "selection_prompt": step_template.selection_prompt,
@@ -782,5 +819,7 @@ class PipelineExecutionService:
             inputs["validation"] = step_template.validation
         if hasattr(step_template, 'retry_config'):
             inputs["retry_config"] = step_template.retry_config
+        if token_budget is not None:
+            inputs["token_budget"] = token_budget
             
         return inputs
@@ -0,0 +1,374 @@
+"""Token budgets for step prompts.
+
+Later steps of a pipeline usually embed the outputs of earlier steps in
+their prompts, so prompts grow along a chain. The planner estimates the
+size of a rendered prompt and, when it exceeds the step's budget, shrinks
+the values substituted into the template until the prompt fits:
+
+- the budget is the model's context length minus the tokens reserved for
+  the response, capped by an optional per-step budget
+- the template text itself is never changed; only substituted values are
+- values are reduced "water-filling" style: small values are kept whole
+  and the remaining room is shared equally among the large ones
+- each value is reduced with its configured strategy (keep the middle
+  out, keep the head, keep the tail, or use a cached summary of the step
+  that produced it)
+
+Every packing is reported with the tokens it saved.
+"""
+
+import re
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..value_objects.prompt_template import PromptTemplate
+
+
+# Characters per token of the default estimator, as used by the providers
+CHARS_PER_TOKEN = 4
+
+# Values are never reduced below this many tokens
+MIN_VALUE_TOKENS = 32
+
+_PLACEHOLDER = re.compile(r'\{\{[^{}]*\}\}')
+
+TokenEstimator = Callable[[str, Optional[str]], int]
+
+
+def estimate_tokens(text: str, model: Optional[str] = None) -> int:
+    """Rough token count of ``text`` (about four characters per token)."""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+class PackingStrategy(str, Enum):
+    """Ways of reducing an over-budget value."""
+    TRUNCATE_MIDDLE = "truncate_middle"  # Keep head and tail, drop the middle
+    KEEP_HEAD = "keep_head"
+    KEEP_TAIL = "keep_tail"
+    SUMMARY = "summary"  # Cached summary of the producing step, else truncate_middle
+
+
+@dataclass(frozen=True)
+class ModelLimits:
+    """Context window of a model."""
+    context_length: int
+    max_output_tokens: Optional[int] = None
+
+
+@dataclass
+class PackingReport:
+    """Outcome of packing one step prompt."""
+    step_key: str
+    model: Optional[str]
+    budget_tokens: Optional[int]
+    original_tokens: int
+    packed_tokens: int
+    reduced: Dict[str, str] = field(default_factory=dict)  # variable path -> strategy used
+
+    @property
+    def tokens_saved(self) -> int:
+        """Tokens removed from the prompt."""
+        return self.original_tokens - self.packed_tokens
+
+    @property
+    def within_budget(self) -> bool:
+        """Whether the packed prompt fits the budget."""
+        return self.budget_tokens is None or self.packed_tokens <= self.budget_tokens
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "step_key": self.step_key,
+            "model": self.model,
+            "budget_tokens": self.budget_tokens,
+            "original_tokens": self.original_tokens,
+            "packed_tokens": self.packed_tokens,
+            "tokens_saved": self.tokens_saved,
+            "within_budget": self.within_budget,
+            "reduced": dict(self.reduced),
+        }
+
+
+class TokenBudgetPlanner:
+    """Fit step prompts into per-model and per-step token budgets.
+
+    Examples:
+        planner = TokenBudgetPlanner(
+            model_limits={"gpt-4o-mini": ModelLimits(128000, 16384)},
+            step_budgets={"polish": 6000},
+            strategies={"steps.research": PackingStrategy.SUMMARY},
+        )
+        planner.register_summary("research", research_summary)
+        prompt, report = planner.pack_template("polish", template, variables, "gpt-4o-mini")
+    """
+
+    def __init__(
+        self,
+        model_limits: Optional[Dict[str, ModelLimits]] = None,
+        default_context_length: Optional[int] = None,
+        reserve_output_tokens: int = 1024,
+        step_budgets: Optional[Dict[str, int]] = None,
+        strategies: Optional[Dict[str, PackingStrategy]] = None,
+        default_strategy: PackingStrategy = PackingStrategy.TRUNCATE_MIDDLE,
+        token_estimator: TokenEstimator = estimate_tokens
+    ) -> None:
+        """Initialize planner.
+
+        Args:
+            model_limits: Context windows by model name
+            default_context_length: Context length of models without limits;
+                None leaves them unbudgeted (unless a step budget applies)
+            reserve_output_tokens: Tokens kept free for the response when the
+                model or step does not say how long the response may be
+            step_budgets: Prompt budgets by step key
+            strategies: Strategy by variable path (``"steps.outline"``) or
+                root (``"steps"``)
+            default_strategy: Strategy of values without one
+            token_estimator: Estimates the tokens of a text for a model;
+                reduced values are cut to fit by this estimate
+        """
+        self._model_limits = dict(model_limits or {})
+        self._default_context_length = default_context_length
+        self._reserve_output_tokens = reserve_output_tokens
+        self._step_budgets = dict(step_budgets or {})
+        self._strategies = dict(strategies or {})
+        self._default_strategy = default_strategy
+        self._estimate = token_estimator
+        self._summaries: Dict[str, str] = {}
+        self._reports: Dict[str, PackingReport] = {}
+        self._total_saved = 0
+
+    @classmethod
+    def from_model_infos(cls, model_infos: Iterable[Any], **kwargs: Any) -> "TokenBudgetPlanner":
+        """Create a planner using the limits of provider model descriptions.
+
+        Args:
+            model_infos: Objects with ``name``, ``context_length`` and
+                ``max_output_tokens`` (e.g. provider ``ModelInfo``)
+            **kwargs: Other planner arguments
+        """
+        limits = {
+            info.name: ModelLimits(info.context_length, info.max_output_tokens)
+            for info in model_infos
+        }
+        limits.update(kwargs.pop("model_limits", None) or {})
+        return cls(model_limits=limits, **kwargs)
+
+    def budget_for(
+        self,
+        step_key: str,
+        model: Optional[str],
+        max_output_tokens: Optional[int] = None
+    ) -> Optional[int]:
+        """Prompt budget of a step, or None if nothing limits it.
+
+        Args:
+            step_key: Step being prepared
+            model: Model the prompt is sent to
+            max_output_tokens: Response length requested by the step
+        """
+        budgets = []
+        limits = self._model_limits.get(model) if model else None
+        context_length = limits.context_length if limits else self._default_context_length
+        if context_length is not None:
+            reserved = max_output_tokens or (limits.max_output_tokens if limits else None)
+            reserved = min(reserved or self._reserve_output_tokens, context_length // 2)
+            budgets.append(context_length - reserved)
+        if step_key in self._step_budgets:
+            budgets.append(self._step_budgets[step_key])
+        return min(budgets) if budgets else None
+
+    def register_summary(self, step_key: str, summary: str) -> None:
+        """Cache a summary of a step's output for the ``summary`` strategy."""
+        self._summaries[step_key] = summary
+
+    def pack_values(
+        self,
+        step_key: str,
+        fixed_text: str,
+        values: Dict[str, str],
+        model: Optional[str] = None,
+        max_output_tokens: Optional[int] = None,
+        summaries: Optional[Dict[str, str]] = None
+    ) -> Tuple[Dict[str, str], PackingReport]:
+        """Reduce the values substituted into a prompt until it fits the budget.
+
+        Args:
+            step_key: Step being prepared
+            fixed_text: Prompt text outside the substituted values
+            values: Substituted values by variable path
+            model: Model the prompt is sent to
+            max_output_tokens: Response length requested by the step
+            summaries: Summaries of values by variable path, preferred over
+                registered step summaries
+
+        Returns:
+            Values to substitute (reduced where needed) and the report
+        """
+        budget = self.budget_for(step_key, model, max_output_tokens)
+        fixed_tokens = self._estimate(fixed_text, model)
+        sizes = {path: self._estimate(value, model) for path, value in values.items()}
+        original = fixed_tokens + sum(sizes.values())
+
+        packed = dict(values)
+        reduced: Dict[str, str] = {}
+        if budget is not None and original > budget:
+            cap = self._water_level(list(sizes.values()), budget - fixed_tokens)
+            for path, size in sizes.items():
+                if size > cap:
+                    summary = (summaries or {}).get(path)
+                    packed[path], reduced[path] = self._reduce(path, values[path], cap, model, summary)
+
+        packed_tokens = fixed_tokens + sum(self._estimate(value, model) for value in packed.values())
+        report = PackingReport(step_key, model, budget, original, packed_tokens, reduced)
+        self._record(report)
+        return packed, report
+
+    def pack_template(
+        self,
+        step_key: str,
+        template: PromptTemplate,
+        variables: Dict[str, Any],
+        model: Optional[str] = None,
+        max_output_tokens: Optional[int] = None
+    ) -> Tuple[str, PackingReport]:
+        """Render a prompt template within the step's budget.
+
+        A ``summary`` entry in a step's outputs (``steps.<key>.summary``)
+        serves as the summary of that step for the ``summary`` strategy.
+
+        Args:
+            step_key: Step being prepared
+            template: Step prompt template
+            variables: Rendering context
+            model: Model the prompt is sent to
+            max_output_tokens: Response length requested by the step
+
+        Returns:
+            Rendered prompt and the packing report
+        """
+        values = {}
+        summaries = {}
+        for path in template.nested_variables:
+            value = _resolve(variables, path)
+            if value is None:
+                continue
+            values[path] = str(value)
+            parts = path.split(".")
+            if parts[0] == "steps" and len(parts) > 1:
+                summary = _resolve(variables, f"steps.{parts[1]}.summary")
+                if isinstance(summary, str) and path != f"steps.{parts[1]}.summary":
+                    summaries[path] = summary
+
+        fixed_text = _PLACEHOLDER.sub("", template.template)
+        packed, report = self.pack_values(
+            step_key, fixed_text, values, model, max_output_tokens, summaries
+        )
+
+        context = variables
+        for path in report.reduced:
+            context = _with_value(context, path, packed[path])
+        return template.render(context), report
+
+    def get_report(self, step_key: str) -> Optional[PackingReport]:
+        """Latest packing report of a step."""
+        return self._reports.get(step_key)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Tokens saved overall and by step (latest packing of each step)."""
+        return {
+            "packed_steps": len(self._reports),
+            "reduced_steps": sum(1 for report in self._reports.values() if report.reduced),
+            "over_budget_steps": sum(1 for report in self._reports.values() if not report.within_budget),
+            "tokens_saved": self._total_saved,
+            "tokens_saved_by_step": {
+                step_key: report.tokens_saved for step_key, report in self._reports.items()
+            },
+        }
+
+    def _record(self, report: PackingReport) -> None:
+        self._reports[report.step_key] = report
+        self._total_saved += report.tokens_saved
+
+    @staticmethod
+    def _water_level(sizes: List[int], available: int) -> int:
+        """Largest per-value cap keeping the sum of capped sizes within ``available``."""
+        remaining = max(0, available)
+        ordered = sorted(sizes)
+        for index, size in enumerate(ordered):
+            share = remaining // (len(ordered) - index)
+            if size > share:
+                return max(share, MIN_VALUE_TOKENS)
+            remaining -= size
+        return max(ordered) if ordered else 0
+
+    def _strategy_for(self, path: str) -> PackingStrategy:
+        if path in self._strategies:
+            return self._strategies[path]
+        return self._strategies.get(path.split(".")[0], self._default_strategy)
+
+    def _reduce(
+        self, path: str, text: str, tokens: int, model: Optional[str], summary: Optional[str] = None
+    ) -> Tuple[str, str]:
+        """Shrink ``text`` to about ``tokens`` tokens; returns it and the strategy used."""
+        strategy = self._strategy_for(path)
+        if strategy == PackingStrategy.SUMMARY:
+            parts = path.split(".")
+            if summary is None and parts[0] == "steps" and len(parts) > 1:
+                summary = self._summaries.get(parts[1])
+            if summary is not None:
+                if self._estimate(summary, model) <= tokens:
+                    return summary, strategy.value
+                text = summary
+            strategy = PackingStrategy.TRUNCATE_MIDDLE
+
+        omitted = self._estimate(text, model) - tokens
+        marker = f"[... {omitted} tokens omitted ...]"
+
+        def cut(keep: int) -> str:
+            if strategy == PackingStrategy.KEEP_HEAD:
+                return f"{text[:keep]}\n{marker}"
+            if strategy == PackingStrategy.KEEP_TAIL:
+                return f"{marker}\n{text[len(text) - keep:]}"
+            head = keep // 2
+            return f"{text[:head]}\n{marker}\n{text[len(text) - (keep - head):]}"
+
+        # Most characters that fit, measured with the configured estimator
+        low, high = 0, len(text)
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self._estimate(cut(middle), model) <= tokens:
+                low = middle
+            else:
+                high = middle - 1
+        return cut(low), strategy.value
+
+
+def _resolve(variables: Dict[str, Any], path: str) -> Any:
+    value: Any = variables
+    for part in path.split("."):
+        if isinstance(value, dict):
+            if part not in value:
+                return None
+            value = value[part]
+        else:
+            value = getattr(value, part, None)
+        if value is None:
+            return None
+    return value
+
+
+def _with_value(variables: Dict[str, Any], path: str, value: str) -> Dict[str, Any]:
+    """Copy of ``variables`` with ``path`` set to ``value`` (copies only the dicts on the path)."""
+    parts = path.split(".")
+    root = dict(variables)
+    node = root
+    for part in parts[:-1]:
+        child = node.get(part)
+        if not isinstance(child, dict):
+            return variables
+        child = dict(child)
+        node[part] = child
+        node = child
+    node[parts[-1]] = value
+    return root
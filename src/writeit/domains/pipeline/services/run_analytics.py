@@ -0,0 +1,434 @@
+"""Run analytics aggregates.
+
+Pipeline run and step execution statistics kept as hourly buckets, so
+analytics over a time range merge a handful of precomputed buckets
+instead of rescanning every run. Each run and step contributes a small
+record (its hour, status, duration and so on) to one bucket; storage
+keeps the contribution alongside the entity so an update can subtract
+the old contribution before adding the new one.
+
+Buckets hold, per hour:
+
+- per-pipeline run counters, token totals and duration histograms
+- per-step execution counters, duration histograms and error counts
+- the slowest successful runs and slowest step executions (top K)
+"""
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..entities.pipeline_run import PipelineRun
+from ..repositories.step_execution_repository import StepExecution
+
+
+HOUR_FORMAT = "%Y%m%d%H"
+
+# Upper bounds (seconds) of the duration histogram bins; one more bin
+# catches everything slower
+DURATION_BOUNDS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0, 3600.0)
+
+TOP_K = 10
+
+# Distinct error messages counted per step and hour
+MAX_ERRORS_PER_STEP = 20
+
+# Contribution records, as stored next to each run and step
+RunContribution = Dict[str, Any]
+StepContribution = Dict[str, Any]
+
+
+def hour_of(moment: datetime) -> str:
+    """Bucket name (``YYYYMMDDHH``) of the hour containing ``moment``."""
+    return moment.strftime(HOUR_FORMAT)
+
+
+def _outcome(status: Any) -> Optional[str]:
+    if status.is_successful:
+        return "successful"
+    if status.is_failed:
+        return "failed"
+    if status.is_cancelled:
+        return "cancelled"
+    return None
+
+
+def run_contribution(run: PipelineRun) -> RunContribution:
+    """Contribution of a run to its hourly bucket."""
+    duration = None
+    if run.status.is_terminal and run.started_at and run.completed_at:
+        duration = (run.completed_at - run.started_at).total_seconds()
+    return {
+        "hour": hour_of(run.started_at or run.created_at),
+        "pipeline": str(getattr(run.pipeline_id, "value", run.pipeline_id)),
+        "status": str(getattr(run.status.status, "value", run.status.status)),
+        "outcome": _outcome(run.status),
+        "duration": duration,
+        "tokens": run.get_total_tokens(),
+    }
+
+
+def step_contribution(execution: StepExecution) -> StepContribution:
+    """Contribution of a step execution to its hourly bucket."""
+    outcome = _outcome(execution.status)
+    duration = None
+    if execution.execution_time_ms is not None and execution.status.is_terminal:
+        duration = execution.execution_time_ms / 1000
+    return {
+        "hour": hour_of(execution.started_at),
+        "step": str(execution.step_id),
+        "run_id": str(execution.run_id),
+        "outcome": outcome,
+        "duration": duration,
+        "error": execution.error_message if outcome == "failed" else None,
+    }
+
+
+@dataclass
+class DurationHistogram:
+    """Fixed-bin histogram of durations in seconds."""
+    counts: List[int] = field(default_factory=lambda: [0] * (len(DURATION_BOUNDS) + 1))
+    count: int = 0
+    total: float = 0.0
+
+    def add(self, seconds: float, weight: int = 1) -> None:
+        self.counts[bisect_left(DURATION_BOUNDS, seconds)] += weight
+        self.count += weight
+        self.total += seconds * weight
+
+    def merge(self, other: "DurationHistogram") -> None:
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.count += other.count
+        self.total += other.total
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bin holding the ``q`` quantile (None if empty).
+
+        Durations beyond the last bound report the last bound.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, bin_count in enumerate(self.counts):
+            seen += bin_count
+            if seen >= rank and bin_count:
+                return DURATION_BOUNDS[min(index, len(DURATION_BOUNDS) - 1)]
+        return DURATION_BOUNDS[-1]
+
+    def to_list(self) -> List[Any]:
+        return [self.counts, self.count, self.total]
+
+    @classmethod
+    def from_list(cls, data: List[Any]) -> "DurationHistogram":
+        return cls(counts=list(data[0]), count=data[1], total=data[2])
+
+
+@dataclass
+class RunCounters:
+    """Run counters of one pipeline in one hour."""
+    runs: int = 0
+    statuses: Dict[str, int] = field(default_factory=dict)
+    outcomes: Dict[str, int] = field(default_factory=dict)
+    tokens: int = 0
+    durations: DurationHistogram = field(default_factory=DurationHistogram)
+
+    def apply(self, contribution: RunContribution, sign: int) -> None:
+        self.runs += sign
+        _bump(self.statuses, contribution["status"], sign)
+        if contribution["outcome"]:
+            _bump(self.outcomes, contribution["outcome"], sign)
+        self.tokens += contribution["tokens"] * sign
+        if contribution["duration"] is not None:
+            self.durations.add(contribution["duration"], sign)
+
+    def merge(self, other: "RunCounters") -> None:
+        self.runs += other.runs
+        for status, count in other.statuses.items():
+            _bump(self.statuses, status, count)
+        for outcome, count in other.outcomes.items():
+            _bump(self.outcomes, outcome, count)
+        self.tokens += other.tokens
+        self.durations.merge(other.durations)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "runs": self.runs,
+            "statuses": self.statuses,
+            "outcomes": self.outcomes,
+            "tokens": self.tokens,
+            "durations": self.durations.to_list(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RunCounters":
+        return cls(
+            runs=data["runs"],
+            statuses=dict(data["statuses"]),
+            outcomes=dict(data["outcomes"]),
+            tokens=data["tokens"],
+            durations=DurationHistogram.from_list(data["durations"]),
+        )
+
+
+@dataclass
+class StepCounters:
+    """Execution counters of one pipeline step in one hour."""
+    executions: int = 0
+    outcomes: Dict[str, int] = field(default_factory=dict)
+    errors: Dict[str, int] = field(default_factory=dict)
+    durations: DurationHistogram = field(default_factory=DurationHistogram)
+
+    @property
+    def failures(self) -> int:
+        return self.outcomes.get("failed", 0)
+
+    def apply(self, contribution: StepContribution, sign: int) -> None:
+        self.executions += sign
+        if contribution["outcome"]:
+            _bump(self.outcomes, contribution["outcome"], sign)
+        error = contribution["error"]
+        if error and sign < 0:
+            # Errors past the per-step limit were never counted
+            if error in self.errors:
+                remaining = self.errors[error] + sign
+                if remaining > 0:
+                    self.errors[error] = remaining
+                else:
+                    del self.errors[error]
+        elif error and (error in self.errors or len(self.errors) < MAX_ERRORS_PER_STEP):
+            _bump(self.errors, error, sign)
+        if contribution["duration"] is not None:
+            self.durations.add(contribution["duration"], sign)
+
+    def merge(self, other: "StepCounters") -> None:
+        self.executions += other.executions
+        for outcome, count in other.outcomes.items():
+            _bump(self.outcomes, outcome, count)
+        for error, count in other.errors.items():
+            _bump(self.errors, error, count)
+        self.durations.merge(other.durations)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "executions": self.executions,
+            "outcomes": self.outcomes,
+            "errors": self.errors,
+            "durations": self.durations.to_list(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "StepCounters":
+        return cls(
+            executions=data["executions"],
+            outcomes=dict(data["outcomes"]),
+            errors=dict(data["errors"]),
+            durations=DurationHistogram.from_list(data["durations"]),
+        )
+
+
+def _bump(counts: Dict[str, int], key: str, delta: int) -> None:
+    value = counts.get(key, 0) + delta
+    if value:
+        counts[key] = value
+    else:
+        counts.pop(key, None)
+
+
+# Top-K entries: (duration, run_id) for runs, (duration, execution_id, run_id) for steps
+RunRank = Tuple[float, str]
+StepRank = Tuple[float, str, str]
+
+
+@dataclass
+class AnalyticsBucket:
+    """Aggregates of the runs and step executions started in one hour.
+
+    Top-K lists only ever hold entries of this hour. Removing an entry
+    (a run updated or deleted) can leave fewer than K entries, since the
+    next slowest is not known without a rescan.
+    """
+    hour: str
+    pipelines: Dict[str, RunCounters] = field(default_factory=dict)
+    steps: Dict[str, StepCounters] = field(default_factory=dict)
+    slowest_runs: List[RunRank] = field(default_factory=list)
+    slowest_steps: List[StepRank] = field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.pipelines and not self.steps
+
+    def apply_run(self, run_id: str, contribution: RunContribution, sign: int) -> None:
+        """Add (``sign=1``) or subtract (``sign=-1``) a run's contribution."""
+        pipeline = contribution["pipeline"]
+        counters = self.pipelines.setdefault(pipeline, RunCounters())
+        counters.apply(contribution, sign)
+        if counters.runs <= 0:
+            del self.pipelines[pipeline]
+
+        self.slowest_runs = [entry for entry in self.slowest_runs if entry[1] != run_id]
+        if sign > 0 and contribution["outcome"] == "successful" and contribution["duration"] is not None:
+            self.slowest_runs = _top_k(self.slowest_runs + [(contribution["duration"], run_id)])
+
+    def apply_step(self, execution_id: str, contribution: StepContribution, sign: int) -> None:
+        """Add (``sign=1``) or subtract (``sign=-1``) a step execution's contribution."""
+        step = contribution["step"]
+        counters = self.steps.setdefault(step, StepCounters())
+        counters.apply(contribution, sign)
+        if counters.executions <= 0:
+            del self.steps[step]
+
+        self.slowest_steps = [entry for entry in self.slowest_steps if entry[1] != execution_id]
+        if sign > 0 and contribution["duration"] is not None:
+            self.slowest_steps = _top_k(
+                self.slowest_steps + [(contribution["duration"], execution_id, contribution["run_id"])]
+            )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "hour": self.hour,
+            "pipelines": {name: counters.to_dict() for name, counters in self.pipelines.items()},
+            "steps": {name: counters.to_dict() for name, counters in self.steps.items()},
+            "slowest_runs": [list(entry) for entry in self.slowest_runs],
+            "slowest_steps": [list(entry) for entry in self.slowest_steps],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AnalyticsBucket":
+        return cls(
+            hour=data["hour"],
+            pipelines={name: RunCounters.from_dict(c) for name, c in data["pipelines"].items()},
+            steps={name: StepCounters.from_dict(c) for name, c in data["steps"].items()},
+            slowest_runs=[(entry[0], entry[1]) for entry in data["slowest_runs"]],
+            slowest_steps=[(entry[0], entry[1], entry[2]) for entry in data["slowest_steps"]],
+        )
+
+
+def _top_k(entries: List[Any]) -> List[Any]:
+    return sorted(entries, key=lambda entry: entry[0], reverse=True)[:TOP_K]
+
+
+def _period(hour: str, group_by: str) -> str:
+    moment = datetime.strptime(hour, HOUR_FORMAT)
+    if group_by == "hour":
+        return moment.strftime("%Y-%m-%d %H:00")
+    if group_by == "day":
+        return moment.strftime("%Y-%m-%d")
+    if group_by == "week":
+        return (moment - timedelta(days=moment.weekday())).strftime("%Y-%m-%d")
+    return moment.strftime("%Y-%m")
+
+
+class RunAnalytics:
+    """Analytics over a set of hourly buckets.
+
+    Examples:
+        analytics = RunAnalytics.from_entities(runs, steps)
+        analytics.summary()["success_rate"]
+        analytics.time_series("day")
+    """
+
+    def __init__(self, buckets: Iterable[AnalyticsBucket]):
+        self.buckets = sorted(buckets, key=lambda bucket: bucket.hour)
+
+    @classmethod
+    def from_entities(
+        cls,
+        runs: Iterable[PipelineRun] = (),
+        steps: Iterable[StepExecution] = ()
+    ) -> "RunAnalytics":
+        """Aggregate runs and step executions directly (no stored buckets)."""
+        buckets: Dict[str, AnalyticsBucket] = {}
+        for run in runs:
+            contribution = run_contribution(run)
+            bucket = buckets.setdefault(contribution["hour"], AnalyticsBucket(contribution["hour"]))
+            bucket.apply_run(str(run.id), contribution, 1)
+        for execution in steps:
+            contribution = step_contribution(execution)
+            bucket = buckets.setdefault(contribution["hour"], AnalyticsBucket(contribution["hour"]))
+            bucket.apply_step(str(execution.execution_id), contribution, 1)
+        return cls(buckets.values())
+
+    def run_counters(self, pipeline_id: Optional[str] = None) -> RunCounters:
+        """Run counters merged over all buckets, optionally for one pipeline."""
+        total = RunCounters()
+        for bucket in self.buckets:
+            for name, counters in bucket.pipelines.items():
+                if pipeline_id is None or name == pipeline_id:
+                    total.merge(counters)
+        return total
+
+    def summary(self, pipeline_id: Optional[str] = None) -> Dict[str, Any]:
+        """Run totals, success rate (0-1), duration statistics and tokens."""
+        counters = self.run_counters(pipeline_id)
+        successful = counters.outcomes.get("successful", 0)
+        return {
+            "total_runs": counters.runs,
+            "successful_runs": successful,
+            "failed_runs": counters.outcomes.get("failed", 0),
+            "cancelled_runs": counters.outcomes.get("cancelled", 0),
+            "success_rate": successful / counters.runs if counters.runs else 0.0,
+            "avg_duration": counters.durations.mean,
+            "p50_duration": counters.durations.quantile(0.5),
+            "p95_duration": counters.durations.quantile(0.95),
+            "total_tokens": counters.tokens,
+            "status_counts": dict(counters.statuses),
+        }
+
+    def time_series(self, group_by: str = "day", pipeline_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Run counts per hour, day, week (starting Monday) or month."""
+        periods: Dict[str, RunCounters] = {}
+        for bucket in self.buckets:
+            counters = periods.setdefault(_period(bucket.hour, group_by), RunCounters())
+            for name, pipeline_counters in bucket.pipelines.items():
+                if pipeline_id is None or name == pipeline_id:
+                    counters.merge(pipeline_counters)
+
+        series = []
+        for period, counters in sorted(periods.items()):
+            if not counters.runs:
+                continue
+            successful = counters.outcomes.get("successful", 0)
+            series.append({
+                "period": period,
+                "total_runs": counters.runs,
+                "successful_runs": successful,
+                "success_rate": successful / counters.runs * 100,
+            })
+        return series
+
+    def slowest_runs(self, limit: int = TOP_K) -> List[RunRank]:
+        """``(duration, run_id)`` of the slowest successful runs, slowest first."""
+        return _top_k([entry for bucket in self.buckets for entry in bucket.slowest_runs])[:limit]
+
+    def slowest_steps(self, limit: int = TOP_K) -> List[StepRank]:
+        """``(duration, execution_id, run_id)`` of the slowest step executions."""
+        return _top_k([entry for bucket in self.buckets for entry in bucket.slowest_steps])[:limit]
+
+    def step_counters(self) -> Dict[str, StepCounters]:
+        """Step counters merged over all buckets, by step ID."""
+        merged: Dict[str, StepCounters] = {}
+        for bucket in self.buckets:
+            for name, counters in bucket.steps.items():
+                merged.setdefault(name, StepCounters()).merge(counters)
+        return merged
+
+    def most_failed_steps(self, limit: int = TOP_K) -> List[Dict[str, Any]]:
+        """Steps with the highest failure rates and their most common errors."""
+        result = []
+        for name, counters in self.step_counters().items():
+            common_errors = sorted(counters.errors.items(), key=lambda item: item[1], reverse=True)[:5]
+            result.append({
+                "step_id": name,
+                "total_executions": counters.executions,
+                "failed_executions": counters.failures,
+                "failure_rate": counters.failures / counters.executions if counters.executions else 0.0,
+                "common_errors": [{"error": error, "count": count} for error, count in common_errors],
+            })
+        result.sort(key=lambda item: item["failure_rate"], reverse=True)
+        return result[:limit]
@@ -0,0 +1,185 @@
+"""Step output spilling.
+
+Large step outputs are written once to a content-addressed blob store and
+replaced by small references. Run and step execution records then persist
+only the reference, and execution contexts hold lazy handles that load the
+text when a later template actually renders it, so memory and per-save
+serialization cost stay bounded however many large steps a run has.
+
+A persisted reference is a plain dictionary::
+
+    {"$blob": "<sha256 hex digest>", "size": <byte length>}
+"""
+
+import hashlib
+from abc import ABC, abstractmethod
+from typing import Any, Dict
+
+
+BLOB_REF_KEY = "$blob"
+
+# Outputs smaller than this stay inline
+DEFAULT_SPILL_THRESHOLD_BYTES = 8 * 1024
+
+
+def blob_digest(data: bytes) -> str:
+    """Content address of a blob."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def is_output_ref(value: Any) -> bool:
+    """Check whether a value is a persisted blob reference."""
+    return isinstance(value, dict) and BLOB_REF_KEY in value and len(value) <= 2
+
+
+class StepOutputBlobStore(ABC):
+    """Content-addressed, write-once storage for step output blobs."""
+
+    @abstractmethod
+    def put(self, data: bytes) -> str:
+        """Store a blob unless it already exists.
+
+        Args:
+            data: Blob content
+
+        Returns:
+            Digest of the content
+        """
+        pass
+
+    @abstractmethod
+    def get(self, digest: str) -> bytes:
+        """Load a blob.
+
+        Raises:
+            KeyError: If no blob has this digest
+        """
+        pass
+
+    @abstractmethod
+    def contains(self, digest: str) -> bool:
+        """Check whether a blob exists."""
+        pass
+
+
+class SpilledOutput:
+    """Lazy handle to a step output stored as a blob.
+
+    Renders as the output text, loading it from the store each time it is
+    needed rather than keeping it in memory.
+    """
+
+    __slots__ = ("digest", "size", "_store")
+
+    def __init__(self, digest: str, size: int, store: StepOutputBlobStore) -> None:
+        self.digest = digest
+        self.size = size
+        self._store = store
+
+    def load(self) -> str:
+        """Load the output text."""
+        return self._store.get(self.digest).decode("utf-8")
+
+    def to_ref(self) -> Dict[str, Any]:
+        """Persisted reference to the output."""
+        return {BLOB_REF_KEY: self.digest, "size": self.size}
+
+    def __str__(self) -> str:
+        return self.load()
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, SpilledOutput):
+            return self.digest == other.digest
+        if isinstance(other, str):
+            return self.load() == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.digest)
+
+    def __repr__(self) -> str:
+        return f"SpilledOutput({self.digest[:12]}, {self.size} bytes)"
+
+
+class StepOutputSpiller:
+    """Move large step output strings into a blob store.
+
+    Examples:
+        spiller = StepOutputSpiller(FileStepOutputBlobStore(blob_dir))
+
+        outputs = spiller.spill(result.outputs)  # Large strings become handles
+        step_execution = step_execution.complete(spiller.to_refs(outputs))
+        context.add_step_output(step_key, outputs)
+    """
+
+    def __init__(
+        self,
+        store: StepOutputBlobStore,
+        threshold_bytes: int = DEFAULT_SPILL_THRESHOLD_BYTES
+    ) -> None:
+        """Initialize spiller.
+
+        Args:
+            store: Blob store for spilled outputs
+            threshold_bytes: Minimum UTF-8 size of a string to spill
+        """
+        self._store = store
+        self._threshold = threshold_bytes
+        self._spilled = 0
+        self._spilled_bytes = 0
+
+    def spill(self, value: Any) -> Any:
+        """Replace large strings in a value with lazy handles.
+
+        Dictionaries and lists are processed recursively; other values are
+        returned unchanged.
+        """
+        if isinstance(value, str):
+            data = value.encode("utf-8")
+            if len(data) < self._threshold:
+                return value
+            digest = self._store.put(data)
+            self._spilled += 1
+            self._spilled_bytes += len(data)
+            return SpilledOutput(digest, len(data), self._store)
+        if isinstance(value, dict):
+            return {key: self.spill(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self.spill(item) for item in value]
+        return value
+
+    def to_refs(self, value: Any) -> Any:
+        """Replace lazy handles with persisted references."""
+        if isinstance(value, SpilledOutput):
+            return value.to_ref()
+        if isinstance(value, dict):
+            return {key: self.to_refs(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self.to_refs(item) for item in value]
+        return value
+
+    def from_refs(self, value: Any) -> Any:
+        """Replace persisted references with lazy handles."""
+        if is_output_ref(value):
+            return SpilledOutput(value[BLOB_REF_KEY], value.get("size", 0), self._store)
+        if isinstance(value, dict):
+            return {key: self.from_refs(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self.from_refs(item) for item in value]
+        return value
+
+    def materialize(self, value: Any) -> Any:
+        """Replace lazy handles and persisted references with the output text."""
+        if isinstance(value, SpilledOutput):
+            return value.load()
+        if is_output_ref(value):
+            return self._store.get(value[BLOB_REF_KEY]).decode("utf-8")
+        if isinstance(value, dict):
+            return {key: self.materialize(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self.materialize(item) for item in value]
+        return value
+
+    def get_stats(self) -> Dict[str, int]:
+        """Number and total size of spilled outputs."""
+        return {"spilled": self._spilled, "spilled_bytes": self._spilled_bytes}
@@ -117,7 +117,9 @@ class PromptTemplate:
         
         # Handle nested variable access (e.g., steps.outline, inputs.topic)
         for var_path in self.nested_variables:
-            placeholder = f"{{{ var_path }}}"
+            placeholder = re.compile(
+                r'\{\{\s*' + re.escape(var_path) + r'\s*(?:\|[^{}]*)?\}\}'
+            )
             
             # Navigate nested context
             value = context
@@ -130,11 +132,11 @@ class PromptTemplate:
                         
                 # Convert to string
                 str_value = str(value) if value is not None else ""
-                result = result.replace(placeholder, str_value)
+                result = placeholder.sub(lambda _: str_value, result)
                 
             except (KeyError, AttributeError, TypeError):
                 # Variable path not found, leave as is or replace with empty
-                result = result.replace(placeholder, "")
+                result = placeholder.sub("", result)
         
         return result
     
@@ -0,0 +1,823 @@
+"""Compiled per-type codecs for safe entity serialization.
+
+The generic serializer in ``safe_serialization`` inspects every value with
+``dataclasses.fields()`` and an ``isinstance`` chain on every save and load.
+This module compiles, once per entity type, an encoder and decoder that are
+specialised from the type's annotations:
+
+* the dict codec produces exactly the structure of the generic JSON path,
+  so stored documents and schema validation are unaffected;
+* the compact codec produces positional arrays for MessagePack, with the
+  field layout of every dataclass recorded once in the record header.
+
+Every specialised path checks the exact runtime type of the value it
+handles and hands anything unexpected to the generic serializer, so
+compiled codecs never change what a value round-trips to.
+"""
+
+import inspect
+import threading
+import types
+import typing
+from contextlib import contextmanager
+from dataclasses import MISSING, fields, is_dataclass
+from datetime import datetime
+from enum import Enum
+from threading import RLock
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Type
+from uuid import UUID
+
+Encoder = Callable[[Any], Any]
+Decoder = Callable[[Any], Any]
+
+# Keys the generic serializer uses to tag non-JSON values
+TAG_KEYS = frozenset({
+    '__uuid__', '__datetime__', '__value_object__', '__dataclass__',
+    '__set__', '__tuple__', '__str__',
+})
+
+# Compact values that could not be specialised are wrapped under this key
+# and carry the generic (self-describing) encoding instead
+GENERIC_KEY = '__generic__'
+
+SCALAR_TYPES = (int, float, bool)
+PRIMITIVE_TYPES = (str, int, float, bool)
+
+Layouts = Dict[str, List[str]]
+
+
+class EntityCodec:
+    """Compiled encoders and decoders for one entity type.
+
+    Attributes:
+        entity_type: Type the codec was compiled for
+        field_names: Field names in declaration order
+        encode: Entity to dict, identical to the generic JSON path
+        decode: Dict produced by ``encode`` back to the entity
+        encode_compact: Entity to a positional list for MessagePack
+        decode_compact: Positional list back to the entity, assuming the
+            current field layout
+    """
+
+    __slots__ = (
+        'entity_type', 'field_names', 'encode', 'decode',
+        'encode_compact', 'decode_compact',
+    )
+
+    def __init__(self, entity_type: Type, field_names: List[str]):
+        self.entity_type = entity_type
+        self.field_names = field_names
+        self.encode: Encoder = _uncompiled
+        self.decode: Decoder = _uncompiled
+        self.encode_compact: Encoder = _uncompiled
+        self.decode_compact: Decoder = _uncompiled
+
+
+def _uncompiled(value: Any) -> Any:
+    raise RuntimeError("Codec used before compilation finished")
+
+
+class CodecCompiler:
+    """Compile and cache specialised codecs per entity type.
+
+    The compiler shares the type registry, value object set and limits of
+    the serializer that owns it. Registering a new type must call
+    ``clear()`` because compiled codecs capture registry lookups.
+
+    Nesting depth is tracked per thread in one counter that compiled codecs
+    and the serializer's generic path both advance, so the depth limit holds
+    across nested dataclasses whichever path encodes them.
+
+    Args:
+        type_registry: Registered types by name (shared, not copied)
+        value_object_types: Registered value object types (shared)
+        generic_encode: Fallback encoder for a single value
+        generic_decode: Fallback decoder for a single value
+        max_string_length: Longest string the specialised paths pass through
+        max_list_length: Largest list or dict the specialised paths handle
+        max_depth: Deepest nesting of dataclasses encoded or decoded
+    """
+
+    def __init__(self,
+                 type_registry: Dict[str, Type],
+                 value_object_types: Set[Type],
+                 generic_encode: Encoder,
+                 generic_decode: Decoder,
+                 max_string_length: int,
+                 max_list_length: int,
+                 max_depth: int = 100):
+        self._type_registry = type_registry
+        self._value_object_types = value_object_types
+        self._generic_encode = generic_encode
+        self._generic_decode = generic_decode
+        self._max_string_length = max_string_length
+        self._max_list_length = max_list_length
+        self._max_depth = max_depth
+        self._state = threading.local()
+        self._codecs: Dict[Type, EntityCodec] = {}
+        self._attribute_encoders: Dict[Type, Encoder] = {}
+        self._layouts: Dict[Type, Layouts] = {}
+        self._layout_decoders: Dict[Tuple[Type, Tuple], Decoder] = {}
+        self._lock = RLock()
+
+    def clear(self) -> None:
+        """Drop all compiled codecs, e.g. after the type registry changed."""
+        with self._lock:
+            self._codecs.clear()
+            self._attribute_encoders.clear()
+            self._layouts.clear()
+            self._layout_decoders.clear()
+
+    @property
+    def depth(self) -> int:
+        """Nesting depth of the value being encoded or decoded in this thread."""
+        return getattr(self._state, 'depth', 0)
+
+    @contextmanager
+    def at_depth(self, depth: int) -> Iterator[None]:
+        """Run codecs called by the generic path at that path's depth."""
+        previous = self.depth
+        self._state.depth = depth
+        try:
+            yield
+        finally:
+            self._state.depth = previous
+
+    def codec_for(self, entity_type: Type) -> EntityCodec:
+        """Get the compiled codec for an entity type, compiling it once.
+
+        Dataclasses get fully generated codecs. Plain classes are encoded
+        from their public attributes and decoded through ``__init__``
+        keyword arguments; they have no compact form.
+
+        Args:
+            entity_type: Entity class
+
+        Returns:
+            Compiled codec
+        """
+        codec = self._codecs.get(entity_type)
+        if codec is not None:
+            return codec
+
+        with self._lock:
+            codec = self._codecs.get(entity_type)
+            if codec is None:
+                if is_dataclass(entity_type):
+                    codec = self._compile(entity_type)
+                else:
+                    codec = self._compile_init_codec(entity_type)
+            return codec
+
+    def attribute_encoder(self, entity_type: Type) -> Encoder:
+        """Get a cached encoder for a non-dataclass type.
+
+        Public, non-callable class attributes are resolved once per type;
+        only instance attributes are discovered per call. The output matches
+        walking ``dir(entity)``.
+
+        Args:
+            entity_type: Any class
+
+        Returns:
+            Function converting an instance to a dict
+        """
+        encoder = self._attribute_encoders.get(entity_type)
+        if encoder is None:
+            encoder = self._compile_attribute_encoder(entity_type)
+            self._attribute_encoders[entity_type] = encoder
+        return encoder
+
+    def layouts_for(self, entity_type: Type) -> Layouts:
+        """Get field layouts of a type and every dataclass reachable from it.
+
+        Args:
+            entity_type: Root dataclass type
+
+        Returns:
+            Field names by dataclass name, as stored in compact headers
+        """
+        layouts = self._layouts.get(entity_type)
+        if layouts is None:
+            layouts = {}
+            pending = [entity_type]
+            while pending:
+                current = pending.pop()
+                if current.__name__ in layouts:
+                    continue
+                hints = _field_hints(current)
+                layouts[current.__name__] = [f.name for f in _codec_fields(current)]
+                for hint in hints.values():
+                    pending.extend(
+                        nested for nested in _referenced_types(hint)
+                        if is_dataclass(nested) and nested not in self._value_object_types
+                    )
+            self._layouts[entity_type] = layouts
+        return layouts
+
+    def compact_decoder(self, entity_type: Type, layouts: Layouts) -> Decoder:
+        """Get a compact decoder for data written with the given layouts.
+
+        Data written with the current layouts uses the compiled positional
+        decoder. Data written by an older or newer version of a type is
+        mapped by field name: removed fields are ignored and added fields
+        fall back to their defaults.
+
+        Args:
+            entity_type: Dataclass type to decode
+            layouts: Layouts from the record header
+
+        Returns:
+            Decoder for the record payload
+        """
+        if layouts == self.layouts_for(entity_type):
+            return self.codec_for(entity_type).decode_compact
+
+        key = (entity_type, tuple(sorted((name, tuple(names)) for name, names in layouts.items())))
+        decoder = self._layout_decoders.get(key)
+        if decoder is None:
+            decoder = self._compile_layout_decoder(entity_type, layouts, {})
+            self._layout_decoders[key] = decoder
+        return decoder
+
+    def compact_to_dict(self, entity_type: Type, layouts: Layouts, payload: List[Any]) -> Dict[str, Any]:
+        """Convert a compact payload to the dict form of the generic path.
+
+        Values are keyed by their stored field names, so migrations written
+        against JSON documents apply to compact records too. Fields the type
+        still declares are converted through their current codecs; other
+        values are kept as stored.
+
+        Args:
+            entity_type: Dataclass type the record was written for
+            layouts: Layouts from the record header
+            payload: Positional field values
+
+        Returns:
+            Field values by name
+        """
+        stored_names = layouts.get(entity_type.__name__)
+        if stored_names is None:
+            raise ValueError(f"No field layout stored for {entity_type.__name__}")
+
+        hints = _field_hints(entity_type)
+        data = {}
+        for name, raw in zip(stored_names, payload):
+            if name in hints:
+                value = self._compact_decoder(hints[name], layouts, {})(raw)
+                data[name] = self._dict_encoder(hints[name])(value)
+            elif type(raw) is dict and GENERIC_KEY in raw:
+                data[name] = raw[GENERIC_KEY]
+            else:
+                data[name] = raw
+        return data
+
+    # Compilation
+
+    def _compile(self, entity_type: Type) -> EntityCodec:
+        all_fields = fields(entity_type)
+        hints = _field_hints(entity_type)
+        codec = EntityCodec(entity_type, [f.name for f in all_fields if f.init])
+        # Register before compiling fields so self-referencing types resolve
+        self._codecs[entity_type] = codec
+
+        namespace: Dict[str, Any] = {
+            '_cls': entity_type,
+            '_t': type,
+            '_len': len,
+            '_str': str,
+            '_scalars': SCALAR_TYPES,
+            '_max_str': self._max_string_length,
+            '_g': self._generic_encode,
+            '_prims': PRIMITIVE_TYPES,
+            '_missing': _missing_field,
+        }
+        encode_items = []
+        compact_items = []
+        decode_lines = []
+        compact_args = []
+
+        position = 0
+        for index, field_info in enumerate(all_fields):
+            name = field_info.name
+            hint = hints.get(name, Any)
+            required = field_info.default is MISSING and field_info.default_factory is MISSING
+
+            # The dict form mirrors the generic path, which includes every field
+            namespace[f'_e{index}'] = self._dict_encoder(hint)
+            encode_items.append(f"{name!r}: {self._inline_encode(hint, f'entity.{name}', f'_e{index}')}")
+            if not field_info.init:
+                continue
+
+            namespace[f'_d{index}'] = self._dict_decoder(hint)
+            namespace[f'_ce{index}'] = self._compact_encoder(hint)
+            namespace[f'_cd{index}'] = self._compact_decoder(hint)
+            compact_items.append(f"_ce{index}(entity.{name})")
+            compact_args.append(f"{name}=_cd{index}(data[{position}])")
+            position += 1
+            decoded = self._inline_decode(hint, f"data[{name!r}]", f"_d{index}")
+            decode_lines.append(f"    if {name!r} in data: kwargs[{name!r}] = {decoded}")
+            if required:
+                decode_lines.append(f"    else: _missing({name!r})")
+
+        source = "\n".join([
+            "def encode(entity):",
+            "    return {" + ", ".join(encode_items) + "}",
+            "",
+            "def decode(data):",
+            "    kwargs = {}",
+            *decode_lines,
+            "    return _cls(**kwargs)",
+            "",
+            "def encode_compact(entity):",
+            "    return [" + ", ".join(compact_items) + "]",
+            "",
+            "def decode_compact(data):",
+            "    return _cls(" + ", ".join(compact_args) + ")",
+        ])
+        exec(compile(source, f"<codec {entity_type.__qualname__}>", "exec"), namespace)
+
+        codec.encode = namespace['encode']
+        codec.decode = namespace['decode']
+        codec.encode_compact = namespace['encode_compact']
+        codec.decode_compact = namespace['decode_compact']
+        return codec
+
+    def _compile_init_codec(self, entity_type: Type) -> EntityCodec:
+        try:
+            parameters = [
+                parameter for parameter in
+                list(inspect.signature(entity_type.__init__).parameters.values())[1:]
+                if parameter.kind in (parameter.POSITIONAL_OR_KEYWORD, parameter.KEYWORD_ONLY)
+            ]
+        except (TypeError, ValueError):
+            parameters = []
+        if not parameters:
+            raise ValueError(f"Cannot derive a codec from the constructor of {entity_type.__name__}")
+
+        try:
+            hints = typing.get_type_hints(entity_type.__init__)
+        except Exception:
+            hints = {}
+
+        plan = [
+            (parameter.name, self._dict_decoder(hints.get(parameter.name, Any)),
+             parameter.default is parameter.empty)
+            for parameter in parameters
+        ]
+
+        def decode(data: Dict[str, Any]) -> Any:
+            kwargs = {}
+            for name, value_decoder, required in plan:
+                if name in data:
+                    kwargs[name] = value_decoder(data[name])
+                elif required:
+                    _missing_field(name)
+            return entity_type(**kwargs)
+
+        def compact_unsupported(value: Any) -> Any:
+            raise ValueError(f"{entity_type.__name__} has no compact encoding")
+
+        codec = EntityCodec(entity_type, [name for name, _, _ in plan])
+        codec.encode = self.attribute_encoder(entity_type)
+        codec.decode = decode
+        codec.encode_compact = compact_unsupported
+        codec.decode_compact = compact_unsupported
+        self._codecs[entity_type] = codec
+        return codec
+
+    def _inline_encode(self, hint: Any, expression: str, fallback: str) -> str:
+        """Inline the encoder of primitive fields into the generated source."""
+        kind, _ = self._classify(hint)
+        if kind == 'str':
+            return (f"(_v if _t(_v := {expression}) is _str and _len(_v) <= _max_str "
+                    f"else _g(_v))")
+        if kind == 'scalar':
+            return f"(_v if _t(_v := {expression}) in _scalars else _g(_v))"
+        return f"{fallback}({expression})"
+
+    def _inline_decode(self, hint: Any, expression: str, fallback: str) -> str:
+        """Inline the decoder of primitive fields into the generated source."""
+        kind, _ = self._classify(hint)
+        if kind in ('str', 'scalar'):
+            return f"(_v if _t(_v := {expression}) in _prims else {fallback}(_v))"
+        return f"{fallback}({expression})"
+
+    def _compile_attribute_encoder(self, entity_type: Type) -> Encoder:
+        class_attributes = [
+            name for name in dir(entity_type)
+            if not name.startswith('_') and not callable(getattr(entity_type, name, None))
+        ]
+        class_attribute_set = set(class_attributes)
+        generic_encode = self._generic_encode
+
+        def encode(entity: Any) -> Dict[str, Any]:
+            names = class_attributes
+            instance_attributes = getattr(entity, '__dict__', None)
+            if instance_attributes:
+                extra = [
+                    name for name in instance_attributes
+                    if not name.startswith('_') and name not in class_attribute_set
+                ]
+                if extra:
+                    names = sorted(class_attributes + extra)
+
+            result = {}
+            for name in names:
+                try:
+                    value = getattr(entity, name)
+                    if callable(value):
+                        continue
+                    result[name] = generic_encode(value)
+                except (AttributeError, TypeError):
+                    continue
+            return result
+
+        return encode
+
+    def _compile_layout_decoder(self, entity_type: Type, layouts: Layouts,
+                                building: Dict[Type, Decoder]) -> Decoder:
+        if entity_type in building:
+            return building[entity_type]
+
+        stored_names = layouts.get(entity_type.__name__)
+        if stored_names is None:
+            raise ValueError(f"No field layout stored for {entity_type.__name__}")
+
+        positions = {name: index for index, name in enumerate(stored_names)}
+        hints = _field_hints(entity_type)
+        plan = []
+
+        def decode(data: List[Any]) -> Any:
+            kwargs = {}
+            for name, position, value_decoder, required in plan:
+                if position is not None and position < len(data):
+                    kwargs[name] = value_decoder(data[position])
+                elif required:
+                    _missing_field(name)
+            return entity_type(**kwargs)
+
+        building[entity_type] = decode
+        for field_info in _codec_fields(entity_type):
+            hint = hints.get(field_info.name, Any)
+            required = field_info.default is MISSING and field_info.default_factory is MISSING
+            plan.append((
+                field_info.name,
+                positions.get(field_info.name),
+                self._compact_decoder(hint, layouts=layouts, building=building),
+                required,
+            ))
+        return decode
+
+    def _descend(self, call: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        """Wrap a nested dataclass codec so it runs one level deeper."""
+        state = self._state
+        max_depth = self._max_depth
+
+        def descend(value):
+            depth = getattr(state, 'depth', 0) + 1
+            if depth > max_depth:
+                _depth_exceeded(max_depth)
+            state.depth = depth
+            try:
+                return call(value)
+            finally:
+                state.depth = depth - 1
+        return descend
+
+    def _lazy_codec(self, entity_type: Type) -> Callable[[], EntityCodec]:
+        """Resolve a nested type's codec on first use, then reuse it.
+
+        Deferring the lookup lets self-referencing types compile.
+        """
+        resolved: List[EntityCodec] = []
+
+        def get() -> EntityCodec:
+            if not resolved:
+                resolved.append(self.codec_for(entity_type))
+            return resolved[0]
+        return get
+
+    # Type classification
+
+    def _classify(self, hint: Any) -> Tuple[str, Any]:
+        """Reduce a type hint to the codec kind that handles it."""
+        origin = typing.get_origin(hint)
+        if origin is typing.Union or origin is types.UnionType:
+            args = [arg for arg in typing.get_args(hint) if arg is not type(None)]
+            if args and all(isinstance(arg, type) and issubclass(arg, Enum) for arg in args):
+                return 'enum', tuple(args)
+            if len(args) != 1:
+                return 'any', None
+            return self._classify(args[0])
+
+        if origin in (list, List):
+            args = typing.get_args(hint)
+            return 'list', args[0] if args else Any
+        if origin in (dict, Dict):
+            args = typing.get_args(hint)
+            return 'dict', args[1] if len(args) == 2 else Any
+        if origin is not None or not isinstance(hint, type):
+            return 'any', None
+
+        if hint is str:
+            return 'str', None
+        if hint in SCALAR_TYPES:
+            return 'scalar', None
+        if hint is datetime:
+            return 'datetime', None
+        if hint is UUID:
+            return 'uuid', None
+        if issubclass(hint, Enum):
+            return 'enum', (hint,)
+        if hint in self._value_object_types:
+            dataclass_fields = getattr(hint, '__dataclass_fields__', {})
+            if 'value' in dataclass_fields:
+                return 'value_object', hint
+            if dataclass_fields and not hasattr(hint, 'value'):
+                # No ``value`` to unwrap: the generic path stores it as a dataclass
+                return 'dataclass', hint
+            return 'any', None
+        if is_dataclass(hint):
+            return 'dataclass', hint
+        return 'any', None
+
+    # Dict (JSON-compatible) codecs
+
+    def _any_encoder(self) -> Encoder:
+        """Encoder for untyped values: plain JSON values inline, others generic."""
+        generic = self._generic_encode
+        max_str = self._max_string_length
+        max_items = self._max_list_length
+
+        def encode_any(v):
+            value_type = type(v)
+            if value_type in SCALAR_TYPES or v is None:
+                return v
+            if value_type is str:
+                return v if len(v) <= max_str else generic(v)
+            if value_type is dict and len(v) <= max_items:
+                return {k: encode_any(i) for k, i in v.items()}
+            if value_type is list and len(v) <= max_items:
+                return [encode_any(i) for i in v]
+            return generic(v)
+        return encode_any
+
+    def _any_decoder(self) -> Decoder:
+        """Decoder for untyped values: plain JSON values inline, others generic."""
+        generic = self._generic_decode
+        max_items = self._max_list_length
+
+        def decode_any(r):
+            value_type = type(r)
+            if value_type in PRIMITIVE_TYPES or r is None:
+                return r
+            if value_type is dict and r.keys().isdisjoint(TAG_KEYS):
+                return {k: decode_any(i) for k, i in r.items()}
+            if value_type is list and len(r) <= max_items:
+                return [decode_any(i) for i in r]
+            return generic(r)
+        return decode_any
+
+    def _enum_decoder(self, enum_types: Tuple[Type[Enum], ...], fallback: Decoder) -> Decoder:
+        """Restore enum members from their value, or from the generic string form.
+
+        The generic path stores str and int enums as their value and other
+        enums as ``{'__str__': 'Enum.NAME', '__type__': 'Enum'}``; both are
+        mapped back to a member of the first matching annotated enum.
+        """
+        by_name = {enum_type.__name__: enum_type for enum_type in enum_types}
+
+        def decode_enum(r):
+            if type(r) in PRIMITIVE_TYPES:
+                for enum_type in enum_types:
+                    try:
+                        return enum_type(r)
+                    except ValueError:
+                        continue
+            elif type(r) is dict and len(r) == 2 and r.get('__type__') in by_name \
+                    and type(r.get('__str__')) is str:
+                member = by_name[r['__type__']].__members__.get(r['__str__'].rpartition('.')[2])
+                if member is not None:
+                    return member
+            return fallback(r)
+        return decode_enum
+
+    def _dict_encoder(self, hint: Any) -> Encoder:
+        kind, arg = self._classify(hint)
+        generic = self._generic_encode
+        max_str = self._max_string_length
+        max_items = self._max_list_length
+
+        if kind == 'str':
+            return lambda v: v if type(v) is str and len(v) <= max_str else generic(v)
+        if kind == 'scalar':
+            return lambda v: v if type(v) in SCALAR_TYPES else generic(v)
+        if kind == 'datetime':
+            return lambda v: {'__datetime__': v.isoformat()} if type(v) is datetime else generic(v)
+        if kind == 'uuid':
+            return lambda v: {'__uuid__': str(v)} if type(v) is UUID else generic(v)
+        if kind == 'value_object':
+            name = arg.__name__
+
+            def encode_value_object(v):
+                if type(v) is arg and type(v.value) in PRIMITIVE_TYPES and \
+                        (type(v.value) is not str or len(v.value) <= max_str):
+                    return {'__value_object__': name, 'value': v.value}
+                return generic(v)
+            return encode_value_object
+        if kind == 'dataclass':
+            name, module = arg.__name__, arg.__module__
+            nested = self._lazy_codec(arg)
+            encode_nested = self._descend(lambda v: nested().encode(v))
+
+            def encode_dataclass(v):
+                if type(v) is arg:
+                    return {'__dataclass__': name, '__module__': module,
+                            'data': encode_nested(v)}
+                return generic(v)
+            return encode_dataclass
+        if kind == 'list':
+            item = self._dict_encoder(arg)
+            return lambda v: [item(i) for i in v] \
+                if type(v) is list and len(v) <= max_items else generic(v)
+        if kind == 'dict':
+            item = self._dict_encoder(arg)
+            return lambda v: {k: item(i) for k, i in v.items()} \
+                if type(v) is dict and len(v) <= max_items else generic(v)
+        return self._any_encoder()
+
+    def _dict_decoder(self, hint: Any) -> Decoder:
+        kind, arg = self._classify(hint)
+        generic = self._generic_decode
+        max_items = self._max_list_length
+
+        if kind in ('str', 'scalar'):
+            return lambda r: r if type(r) in PRIMITIVE_TYPES else generic(r)
+        if kind == 'enum':
+            return self._enum_decoder(arg, generic)
+        if kind == 'datetime':
+            return lambda r: datetime.fromisoformat(r['__datetime__']) \
+                if type(r) is dict and '__uuid__' not in r and '__datetime__' in r else generic(r)
+        if kind == 'value_object':
+            name = arg.__name__
+            registry = self._type_registry
+
+            def decode_value_object(r):
+                if type(r) is dict and r.get('__value_object__') == name and \
+                        '__uuid__' not in r and '__datetime__' not in r and \
+                        registry.get(name) is arg and type(r['value']) in PRIMITIVE_TYPES:
+                    return arg(r['value'])
+                return generic(r)
+            return decode_value_object
+        if kind == 'dataclass':
+            name = arg.__name__
+            registry = self._type_registry
+            nested = self._lazy_codec(arg)
+            decode_nested = self._descend(lambda r: nested().decode(r))
+
+            def decode_dataclass(r):
+                if type(r) is dict and r.get('__dataclass__') == name and \
+                        '__value_object__' not in r and '__uuid__' not in r and \
+                        '__datetime__' not in r and registry.get(name) is arg:
+                    return decode_nested(r['data'])
+                return generic(r)
+            return decode_dataclass
+        if kind == 'list':
+            item = self._dict_decoder(arg)
+            return lambda r: [item(i) for i in r] \
+                if type(r) is list and len(r) <= max_items else generic(r)
+        if kind == 'dict':
+            item = self._dict_decoder(arg)
+            return lambda r: {k: item(i) for k, i in r.items()} \
+                if type(r) is dict and r.keys().isdisjoint(TAG_KEYS) else generic(r)
+        return self._any_decoder()
+
+    # Compact (MessagePack) codecs
+
+    def _compact_encoder(self, hint: Any) -> Encoder:
+        kind, arg = self._classify(hint)
+        generic = self._generic_encode
+        max_str = self._max_string_length
+        max_items = self._max_list_length
+
+        def wrap(v):
+            return None if v is None else {GENERIC_KEY: generic(v)}
+
+        if kind == 'any':
+            return self._any_encoder()
+        if kind == 'str':
+            return lambda v: v if type(v) is str and len(v) <= max_str else wrap(v)
+        if kind == 'scalar':
+            return lambda v: v if type(v) in SCALAR_TYPES else wrap(v)
+        if kind == 'datetime':
+            return lambda v: v.isoformat() if type(v) is datetime else wrap(v)
+        if kind == 'uuid':
+            return lambda v: str(v) if type(v) is UUID else wrap(v)
+        if kind == 'enum':
+            return lambda v: v.value if isinstance(v, arg) and type(v.value) in PRIMITIVE_TYPES else wrap(v)
+        if kind == 'value_object':
+            def encode_value_object(v):
+                if type(v) is arg and type(v.value) in PRIMITIVE_TYPES and \
+                        (type(v.value) is not str or len(v.value) <= max_str):
+                    return v.value
+                return wrap(v)
+            return encode_value_object
+        if kind == 'dataclass':
+            nested = self._lazy_codec(arg)
+            encode_nested = self._descend(lambda v: nested().encode_compact(v))
+            return lambda v: encode_nested(v) if type(v) is arg else wrap(v)
+        if kind == 'list':
+            item = self._compact_encoder(arg)
+            return lambda v: [item(i) for i in v] \
+                if type(v) is list and len(v) <= max_items else wrap(v)
+        if kind == 'dict':
+            item = self._compact_encoder(arg)
+            return lambda v: {k: item(i) for k, i in v.items()} \
+                if type(v) is dict and len(v) <= max_items and GENERIC_KEY not in v else wrap(v)
+        return generic
+
+    def _compact_decoder(self, hint: Any, layouts: Optional[Layouts] = None,
+                         building: Optional[Dict[Type, Decoder]] = None) -> Decoder:
+        kind, arg = self._classify(hint)
+        generic = self._generic_decode
+
+        if kind == 'any':
+            return self._any_decoder()
+
+        def unwrap(r):
+            if type(r) is dict and GENERIC_KEY in r:
+                return generic(r[GENERIC_KEY])
+            return generic(r)
+
+        if kind in ('str', 'scalar'):
+            return lambda r: r if type(r) in PRIMITIVE_TYPES else unwrap(r)
+        if kind == 'datetime':
+            return lambda r: datetime.fromisoformat(r) if type(r) is str else unwrap(r)
+        if kind == 'uuid':
+            return lambda r: UUID(r) if type(r) is str else unwrap(r)
+        if kind == 'enum':
+            return self._enum_decoder(arg, unwrap)
+        if kind == 'value_object':
+            return lambda r: arg(r) if type(r) in PRIMITIVE_TYPES else unwrap(r)
+        if kind == 'dataclass':
+            if layouts is None:
+                nested = self._lazy_codec(arg)
+                decode_nested = self._descend(lambda r: nested().decode_compact(r))
+                return lambda r: decode_nested(r) if type(r) is list else unwrap(r)
+
+            # Resolved lazily so self-referencing types terminate
+            resolved: List[Decoder] = []
+
+            def decode_layout(r):
+                if not resolved:
+                    resolved.append(self._compile_layout_decoder(arg, layouts, building))
+                return resolved[0](r)
+            decode_nested = self._descend(decode_layout)
+            return lambda r: decode_nested(r) if type(r) is list else unwrap(r)
+        if kind == 'list':
+            item = self._compact_decoder(arg, layouts, building)
+            return lambda r: [item(i) for i in r] if type(r) is list else unwrap(r)
+        if kind == 'dict':
+            item = self._compact_decoder(arg, layouts, building)
+            return lambda r: {k: item(i) for k, i in r.items()} \
+                if type(r) is dict and GENERIC_KEY not in r else unwrap(r)
+        return generic
+
+
+def _missing_field(name: str) -> None:
+    # Imported lazily to avoid a circular import with safe_serialization
+    from .safe_serialization import SerializationError
+    raise SerializationError(f"Missing required field: {name}")
+
+
+def _depth_exceeded(max_depth: int) -> None:
+    from .safe_serialization import SerializationError
+    raise SerializationError(f"Maximum recursion depth ({max_depth}) exceeded")
+
+
+def _codec_fields(entity_type: Type) -> list:
+    """Fields a codec handles: those accepted by the constructor."""
+    return [f for f in fields(entity_type) if f.init]
+
+
+def _field_hints(entity_type: Type) -> Dict[str, Any]:
+    """Resolve field annotations, falling back to raw annotations per field."""
+    try:
+        return typing.get_type_hints(entity_type)
+    except Exception:
+        return {
+            f.name: f.type if not isinstance(f.type, str) else Any
+            for f in fields(entity_type)
+        }
+
+
+def _referenced_types(hint: Any) -> List[Any]:
+    """Flatten a type hint into the classes it mentions."""
+    args = typing.get_args(hint)
+    if not args:
+        return [hint] if isinstance(hint, type) else []
+    referenced = []
+    for arg in args:
+        referenced.extend(_referenced_types(arg))
+    return referenced
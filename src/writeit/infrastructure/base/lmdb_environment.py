@@ -0,0 +1,192 @@
+"""Process-wide shared LMDB environments.
+
+LMDB forbids opening the same environment twice within one process, so
+every storage manager of a workspace acquires the environment from this
+registry instead of calling ``lmdb.open`` itself. Environments are
+reference counted and closed when their last user releases them.
+
+A ``SharedEnvironment`` also caches named database handles (handles are
+environment-wide) and pools read-only transactions: environments are
+opened with ``max_spare_txns``, so py-lmdb resets finished read
+transactions and renews them for the next read instead of allocating a
+new reader each time.
+"""
+
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+import lmdb
+
+# Environment holding every named database of a workspace
+STORE_FILE_NAME = "store.lmdb"
+
+# Finished read transactions kept for renewal, per environment
+MAX_SPARE_READERS = 8
+
+# Named databases a shared environment is opened with, whoever opens it
+# first: the limit cannot change while the environment is open
+SHARED_MAX_DBS = 128
+
+_registry: Dict[Path, 'SharedEnvironment'] = {}
+_registry_lock = threading.Lock()
+
+
+def sub_db_name(db_name: str, db_key: Optional[str] = None) -> bytes:
+    """Name of the named database backing a ``db_name``/``db_key`` pair."""
+    return (f"{db_name}/{db_key}" if db_key else db_name).encode("utf-8")
+
+
+class SharedEnvironment:
+    """A reference-counted LMDB environment with cached database handles."""
+
+    def __init__(self, path: Path, env: lmdb.Environment, max_dbs: int = SHARED_MAX_DBS):
+        """Initialize shared environment.
+
+        Args:
+            path: Environment path (registry key)
+            env: Open LMDB environment
+            max_dbs: Named database limit the environment was opened with
+        """
+        self.path = path
+        self.env = env
+        self.max_dbs = max_dbs
+        self._refs = 0
+        self._handles: Dict[bytes, lmdb._Database] = {}
+        self._lock = threading.Lock()
+        self.reads = 0
+
+    def database(self, name: bytes) -> lmdb._Database:
+        """Get the handle of a named database, creating the database if missing.
+
+        Must not be called while the calling thread holds a write
+        transaction: a new handle is opened in its own write transaction.
+        """
+        handle = self._handles.get(name)
+        if handle is None:
+            with self._lock:
+                handle = self._handles.get(name)
+                if handle is None:
+                    handle = self._handles[name] = self.env.open_db(name)
+        return handle
+
+    @contextmanager
+    def read(self) -> Iterator[lmdb.Transaction]:
+        """Read-only transaction, renewed from the spare transaction pool."""
+        with self.env.begin(write=False) as txn:
+            self.reads += 1
+            yield txn
+
+    def get_stats(self) -> Dict[str, int]:
+        """Usage statistics of the environment."""
+        return {
+            "references": self._refs,
+            "open_databases": len(self._handles),
+            "reads": self.reads,
+        }
+
+    def _close(self) -> None:
+        self._handles.clear()
+        self.env.close()
+
+
+def acquire_environment(path: Path, map_size: int, max_dbs: int) -> SharedEnvironment:
+    """Open an environment, or share the one already open at ``path``.
+
+    The first opener of a workspace environment also migrates legacy
+    per-database environments found next to it (see
+    ``migrate_legacy_environments``). A later opener asking for a larger
+    map grows the shared map.
+
+    Environments are opened with ``SHARED_MAX_DBS`` named databases (or
+    ``max_dbs`` if larger), so the limit does not depend on which storage
+    manager happens to open a workspace first.
+
+    Args:
+        path: Environment directory
+        map_size: Minimum map size in bytes
+        max_dbs: Maximum number of named databases the caller needs
+
+    Returns:
+        Shared environment; pass it to ``release_environment`` when done
+
+    Raises:
+        ValueError: If the environment is already open with fewer than
+            ``max_dbs`` named databases
+    """
+    key = path.resolve()
+    with _registry_lock:
+        shared = _registry.get(key)
+        if shared is None:
+            max_dbs = max(max_dbs, SHARED_MAX_DBS)
+            path.mkdir(parents=True, exist_ok=True)
+            env = lmdb.open(
+                str(path), map_size=map_size, max_dbs=max_dbs, max_spare_txns=MAX_SPARE_READERS
+            )
+            shared = SharedEnvironment(key, env, max_dbs)
+            if path.name == STORE_FILE_NAME:
+                migrate_legacy_environments(env, path.parent, max_dbs)
+            _registry[key] = shared
+        else:
+            if max_dbs > shared.max_dbs:
+                raise ValueError(
+                    f"LMDB environment {path} is already open with max_dbs={shared.max_dbs}; "
+                    f"{max_dbs} named databases were requested"
+                )
+            if shared.env.info()["map_size"] < map_size:
+                shared.env.set_mapsize(map_size)
+        shared._refs += 1
+        return shared
+
+
+def find_open_environment(path: Path) -> Optional[lmdb.Environment]:
+    """Get the environment open at ``path`` in this process, if any."""
+    with _registry_lock:
+        shared = _registry.get(Path(path).resolve())
+        return shared.env if shared is not None else None
+
+
+def release_environment(shared: SharedEnvironment) -> None:
+    """Release a shared environment, closing it after its last user."""
+    with _registry_lock:
+        shared._refs -= 1
+        if shared._refs <= 0 and _registry.get(shared.path) is shared:
+            del _registry[shared.path]
+            shared._close()
+
+
+def migrate_legacy_environments(env: lmdb.Environment, storage_path: Path, max_dbs: int) -> None:
+    """Copy databases from legacy per-database environments into ``env``.
+
+    Each ``<db_name>.lmdb`` directory in ``storage_path`` is copied in one
+    transaction: its named databases become ``"<db_name>/<db_key>"`` and
+    records of its default database go to ``"<db_name>"``. The directory
+    is then renamed with a ``.migrated`` suffix, so the migration runs
+    once and the old data stays on disk.
+    """
+    for legacy_path in sorted(storage_path.glob("*.lmdb")):
+        if legacy_path.name == STORE_FILE_NAME or not legacy_path.is_dir():
+            continue
+        db_name = legacy_path.name[:-len(".lmdb")]
+        legacy_env = lmdb.open(str(legacy_path), readonly=True, lock=False, max_dbs=max_dbs)
+        try:
+            with legacy_env.begin() as legacy_txn, env.begin(write=True) as txn:
+                plain = []
+                for key, value in legacy_txn.cursor():
+                    try:
+                        legacy_db = legacy_env.open_db(key, txn=legacy_txn, create=False)
+                    except lmdb.Error:
+                        # A record of the default database, not a named one
+                        plain.append((key, value))
+                        continue
+                    db = env.open_db(sub_db_name(db_name, key.decode("utf-8")), txn=txn)
+                    for item_key, item_value in legacy_txn.cursor(db=legacy_db):
+                        txn.put(item_key, item_value, db=db)
+                if plain:
+                    db = env.open_db(sub_db_name(db_name), txn=txn)
+                    for key, value in plain:
+                        txn.put(key, value, db=db)
+        finally:
+            legacy_env.close()
+        legacy_path.rename(legacy_path.with_name(legacy_path.name + ".migrated"))
@@ -9,7 +9,7 @@ import sys
 from typing import Type, TypeVar, Any, Dict, Optional, Union, List
 from datetime import datetime
 from uuid import UUID
-from dataclasses import is_dataclass, fields, asdict
+from dataclasses import is_dataclass, asdict
 from abc import ABC, abstractmethod
 from enum import Enum
 import importlib
@@ -25,6 +25,7 @@ except ImportError:
 from ...shared.repository import RepositoryError
 from .schema_validation import SerializationSchema, create_entity_schema, ValidationError as SchemaValidationError
 from .version_compatibility import VersionMigrationManager, VersionInfo, MigrationStrategy, VersionCompatibilityError
+from .entity_codecs import CodecCompiler
 
 T = TypeVar('T')
 
@@ -75,6 +76,17 @@ class SafeJSONEntitySerializer(SafeEntitySerializer):
         self._enable_schema_validation = enable_schema_validation
         self._entity_schemas: Dict[Type, SerializationSchema] = {}
         
+        # Specialised encoders/decoders compiled once per entity type
+        self._codecs = CodecCompiler(
+            self._type_registry,
+            self._value_object_types,
+            generic_encode=lambda value: self._serialize_value(value, self._codecs.depth + 1),
+            generic_decode=lambda value: self._deserialize_value(value, None, self._codecs.depth + 1),
+            max_string_length=self._max_string_length,
+            max_list_length=self._max_list_length,
+            max_depth=self._max_depth,
+        )
+        
         # Version migration support
         self._migration_manager = VersionMigrationManager(
             VersionInfo.from_string(schema_version),
@@ -85,6 +97,16 @@ class SafeJSONEntitySerializer(SafeEntitySerializer):
     def format(self) -> SerializationFormat:
         return SerializationFormat.JSON
     
+    @property
+    def schema_version(self) -> str:
+        """Schema version written into serialized data."""
+        return self._schema_version
+    
+    @property
+    def codecs(self) -> CodecCompiler:
+        """Compiled per-type codecs used by this serializer."""
+        return self._codecs
+    
     def register_type(self, name: str, type_class: Type) -> None:
         """Register a type for deserialization.
         
@@ -98,6 +120,7 @@ class SafeJSONEntitySerializer(SafeEntitySerializer):
             raise ValueError("type_class must be a class")
         
         self._type_registry[name] = type_class
+        self._codecs.clear()
     
     def register_value_object(self, type_class: Type) -> None:
         """Register a value object type.
@@ -167,12 +190,7 @@ class SafeJSONEntitySerializer(SafeEntitySerializer):
             }
             
             # Validate against schema if available
-            schema = self._get_entity_schema(entity.__class__)
-            if schema:
-                try:
-                    schema.validate(wrapper)
-                except SchemaValidationError as e:
-                    raise SerializationError(f"Schema validation failed for {type(entity).__name__}: {e}") from e
+            self._validate_document(wrapper, entity.__class__)
             
             # Serialize to JSON with security settings
             json_str = json.dumps(
@@ -216,6 +234,29 @@ class SafeJSONEntitySerializer(SafeEntitySerializer):
             json_str = data.decode('utf-8')
             json_data = json.loads(json_str)
             
+            return self.deserialize_document(json_data, entity_type)
+            
+        except json.JSONDecodeError as e:
+            raise SerializationError(f"JSON decoding failed: {e}") from e
+        except SerializationError:
+            raise
+        except Exception as e:
+            raise SerializationError(f"Failed to deserialize {entity_type.__name__}: {e}") from e
+    
+    def deserialize_document(self, json_data: Any, entity_type: Type[T]) -> T:
+        """Deserialize an already parsed wrapper document to an entity.
+        
+        Args:
+            json_data: Parsed wrapper produced by ``serialize``
+            entity_type: Expected entity type
+            
+        Returns:
+            Deserialized entity
+            
+        Raises:
+            SerializationError: If deserialization fails
+        """
+        try:
             # Security: Ensure we have a dict
             if not isinstance(json_data, dict):
                 raise SerializationError("Invalid data structure: expected object")
@@ -252,12 +293,7 @@ class SafeJSONEntitySerializer(SafeEntitySerializer):
                     )
             
             # Validate against schema if available
-            schema = self._get_entity_schema(entity_type)
-            if schema:
-                try:
-                    schema.validate(json_data)
-                except SchemaValidationError as e:
-                    raise SerializationError(f"Schema validation failed for {entity_type.__name__}: {e}") from e
+            self._validate_document(json_data, entity_type)
             
             # Extract and convert data
             entity_data = json_data.get('data', {})
@@ -266,11 +302,48 @@ class SafeJSONEntitySerializer(SafeEntitySerializer):
             
             return self._dict_to_entity(entity_data, entity_type, depth=0)
             
-        except json.JSONDecodeError as e:
-            raise SerializationError(f"JSON decoding failed: {e}") from e
+        except SerializationError:
+            raise
         except Exception as e:
             raise SerializationError(f"Failed to deserialize {entity_type.__name__}: {e}") from e
     
+    def validate_entity(self, entity: Any) -> None:
+        """Validate an entity against its schema, as ``serialize`` does.
+        
+        Args:
+            entity: Entity to validate
+            
+        Raises:
+            SerializationError: If validation fails
+        """
+        if self._get_entity_schema(type(entity)) is None:
+            return
+        wrapper = {
+            "__schema_version__": self._schema_version,
+            "__format__": self.format.value,
+            "__type__": type(entity).__name__,
+            "__module__": type(entity).__module__,
+            "data": self._entity_to_dict(entity, depth=0)
+        }
+        self._validate_document(wrapper, type(entity))
+    
+    def _validate_document(self, document: Dict[str, Any], entity_type: Type) -> None:
+        """Validate a wrapper document against the entity type's schema.
+        
+        Args:
+            document: Wrapper document
+            entity_type: Entity type the document holds
+            
+        Raises:
+            SerializationError: If validation fails
+        """
+        schema = self._get_entity_schema(entity_type)
+        if schema:
+            try:
+                schema.validate(document)
+            except SchemaValidationError as e:
+                raise SerializationError(f"Schema validation failed for {entity_type.__name__}: {e}") from e
+    
     def _is_safe_module_migration(self, old_module: str, new_module: str) -> bool:
         """Check if module migration is safe.
         
@@ -302,24 +375,12 @@ class SafeJSONEntitySerializer(SafeEntitySerializer):
         if depth > self._max_depth:
             raise SerializationError(f"Maximum recursion depth ({self._max_depth}) exceeded")
         
-        if is_dataclass(entity):
-            result = {}
-            for field in fields(entity):
-                value = getattr(entity, field.name)
-                result[field.name] = self._serialize_value(value, depth + 1)
-            return result
-        else:
-            # For non-dataclass entities, serialize public attributes
-            result = {}
-            for attr in dir(entity):
-                if not attr.startswith('_') and not callable(getattr(entity, attr, None)):
-                    try:
-                        value = getattr(entity, attr)
-                        result[attr] = self._serialize_value(value, depth + 1)
-                    except (AttributeError, TypeError):
-                        # Skip attributes that can't be accessed or serialized
-                        continue
-            return result
+        with self._codecs.at_depth(depth):
+            if is_dataclass(entity):
+                return self._codecs.codec_for(type(entity)).encode(entity)
+            else:
+                # For non-dataclass entities, serialize public attributes
+                return self._codecs.attribute_encoder(type(entity))(entity)
     
     def _serialize_value(self, value: Any, depth: int) -> Any:
         """Serialize a single value with security checks.
@@ -396,24 +457,16 @@ class SafeJSONEntitySerializer(SafeEntitySerializer):
         if depth > self._max_depth:
             raise SerializationError(f"Maximum recursion depth ({self._max_depth}) exceeded")
         
-        if not is_dataclass(entity_type):
-            raise SerializationError(f"Cannot deserialize non-dataclass type: {entity_type}")
+        if not isinstance(entity_type, type):
+            raise SerializationError(f"Cannot deserialize non-class type: {entity_type}")
         
-        # Deserialize field values
-        kwargs = {}
-        entity_fields = {f.name: f for f in fields(entity_type)}
-        
-        for field_name, field_info in entity_fields.items():
-            if field_name in data:
-                value = data[field_name]
-                kwargs[field_name] = self._deserialize_value(value, field_info.type, depth + 1)
-            elif field_info.default != field_info.default_factory:
-                # Has default value
-                pass
-            else:
-                raise SerializationError(f"Missing required field: {field_name}")
-        
-        return entity_type(**kwargs)
+        # Dataclasses decode by field; other classes through __init__ keywords
+        try:
+            codec = self._codecs.codec_for(entity_type)
+        except ValueError as e:
+            raise SerializationError(f"Cannot deserialize type {entity_type.__name__}: {e}") from e
+        with self._codecs.at_depth(depth):
+            return codec.decode(data)
     
     def _deserialize_value(self, value: Any, expected_type: Type = None, depth: int = 0) -> Any:
         """Deserialize a single value with security checks.
@@ -493,8 +546,25 @@ class SafeJSONEntitySerializer(SafeEntitySerializer):
             return {'__str__': str(obj), '__type__': type(obj).__name__}
 
 
+# Compact MessagePack records are arrays:
+# [magic, record version, schema version, type, module, field layouts, payload]
+COMPACT_RECORD_MAGIC = "WCB"
+COMPACT_RECORD_VERSION = 1
+
+
 class SafeMessagePackSerializer(SafeEntitySerializer):
-    """MessagePack-based entity serializer for binary efficiency."""
+    """MessagePack-based entity serializer for binary efficiency.
+    
+    Dataclass entities are written as compact records produced by compiled
+    codecs: field values are stored positionally and the field names of each
+    dataclass appear once in the record header, together with the schema
+    version. Entities are validated against their schema when written, so
+    records of the current schema version are decoded without re-validation
+    (by field name when their field layout differs). Records of another
+    schema version are converted to the JSON document structure, migrated
+    and validated. Other entities, and data written before
+    compact records existed, use the JSON document structure.
+    """
     
     def __init__(self, schema_version: str = "1.0.0", enable_schema_validation: bool = True,
                  migration_strategy: MigrationStrategy = MigrationStrategy.BACKWARD):
@@ -533,16 +603,27 @@ class SafeMessagePackSerializer(SafeEntitySerializer):
             SerializationError: If serialization fails
         """
         try:
-            # First convert to JSON-compatible dict
-            json_data = json.loads(self._json_serializer.serialize(entity).decode('utf-8'))
-            
-            # Then pack with MessagePack
-            return msgpack.packb(
-                json_data,
-                strict_types=True,
-                use_bin_type=True,
-                timestamp=3  # Use timestamp extension type
-            )
+            entity_type = type(entity)
+            if is_dataclass(entity):
+                # Validated once here; decoding trusts current-version records
+                self._json_serializer.validate_entity(entity)
+                codecs = self._json_serializer.codecs
+                document = [
+                    COMPACT_RECORD_MAGIC,
+                    COMPACT_RECORD_VERSION,
+                    self._schema_version,
+                    entity_type.__name__,
+                    entity_type.__module__,
+                    codecs.layouts_for(entity_type),
+                    codecs.codec_for(entity_type).encode_compact(entity),
+                ]
+            else:
+                # Non-dataclass entities keep the JSON document structure
+                document = json.loads(self._json_serializer.serialize(entity).decode('utf-8'))
+            
+            # Not strict_types: str and int subclasses (e.g. str enums) that
+            # codecs pass through are packed as their base type, as JSON does
+            return msgpack.packb(document, use_bin_type=True)
             
         except Exception as e:
             raise SerializationError(f"Failed to serialize {type(entity).__name__} with MessagePack: {e}") from e
@@ -562,20 +643,68 @@ class SafeMessagePackSerializer(SafeEntitySerializer):
         """
         try:
             # Unpack MessagePack
-            json_data = msgpack.unpackb(
+            document = msgpack.unpackb(
                 data,
                 strict_map_key=False,
                 timestamp=3
             )
             
-            # Convert back to JSON and deserialize
-            json_bytes = json.dumps(json_data).encode('utf-8')
-            return self._json_serializer.deserialize(json_bytes, entity_type)
+            if isinstance(document, list) and document and document[0] == COMPACT_RECORD_MAGIC:
+                return self._decode_compact_record(document, entity_type)
+            
+            # JSON document structure (non-dataclass entities, older data)
+            return self._json_serializer.deserialize_document(document, entity_type)
             
         except Exception as e:
             raise SerializationError(f"Failed to deserialize {entity_type.__name__} from MessagePack: {e}") from e
 
 
+    def _decode_compact_record(self, record: List[Any], entity_type: Type[T]) -> T:
+        """Decode a compact record produced by ``serialize``.
+        
+        Args:
+            record: Unpacked record array
+            entity_type: Expected entity type
+            
+        Returns:
+            Deserialized entity
+        """
+        if len(record) != 7:
+            raise SerializationError(f"Invalid compact record: expected 7 items, got {len(record)}")
+        
+        _, record_version, schema_version, stored_type, stored_module, layouts, payload = record
+        if record_version != COMPACT_RECORD_VERSION:
+            raise SerializationError(f"Unsupported compact record version: {record_version}")
+        
+        if stored_type != entity_type.__name__:
+            raise SerializationError(
+                f"Type mismatch: expected {entity_type.__name__}, got {stored_type}"
+            )
+        if stored_module != entity_type.__module__ and \
+                not self._json_serializer._is_safe_module_migration(stored_module, entity_type.__module__):
+            raise SerializationError(
+                f"Module mismatch: expected {entity_type.__module__}, got {stored_module}"
+            )
+        if not is_dataclass(entity_type):
+            raise SerializationError(f"Cannot deserialize non-dataclass type: {entity_type}")
+        if not isinstance(layouts, dict) or not isinstance(payload, list):
+            raise SerializationError("Invalid compact record: malformed layout or payload")
+        
+        codecs = self._json_serializer.codecs
+        if schema_version != self._schema_version:
+            # Migrations rewrite JSON documents, so convert the record first
+            document = {
+                "__schema_version__": schema_version,
+                "__format__": SerializationFormat.JSON.value,
+                "__type__": stored_type,
+                "__module__": stored_module,
+                "data": codecs.compact_to_dict(entity_type, layouts, payload),
+            }
+            return self._json_serializer.deserialize_document(document, entity_type)
+        
+        return codecs.compact_decoder(entity_type, layouts)(payload)
+
+
 class SafeDomainEntitySerializer:
     """Main safe serializer for domain entities with format selection."""
     
@@ -377,11 +377,8 @@ class DomainEntitySchemaBuilder:
                     schema.nullable = True
                     return schema
         
-        # Handle dataclasses
-        if is_dataclass(field_type):
-            return self._build_dataclass_schema(field_type)
-        
-        # Handle value objects
+        # Handle value objects (before dataclasses: value objects are
+        # usually dataclasses but serialize in their own wrapper)
         if field_type in self._value_object_types:
             return SchemaField(
                 schema_type=SchemaType.VALUE_OBJECT,
@@ -391,6 +388,10 @@ class DomainEntitySchemaBuilder:
                 }
             )
         
+        # Handle dataclasses
+        if is_dataclass(field_type):
+            return self._build_dataclass_schema(field_type)
+        
         # Fallback to generic object
         return SchemaField(SchemaType.OBJECT)
 
@@ -6,7 +6,7 @@ specifically for the infrastructure layer without dependencies on legacy storage
 
 import lmdb
 from pathlib import Path
-from typing import Optional, Dict, Any, List, AsyncContextManager, Type, TypeVar
+from typing import Optional, Dict, Any, List, AsyncContextManager, Type, TypeVar, TYPE_CHECKING
 from contextlib import asynccontextmanager, contextmanager
 from uuid import UUID
 import json
@@ -16,6 +16,16 @@ from datetime import datetime
 from ...shared.repository import RepositoryError, EntityNotFoundError, EntityAlreadyExistsError
 from ...domains.workspace.value_objects.workspace_name import WorkspaceName
 from .safe_serialization import SafeDomainEntitySerializer, SerializationFormat
+from .lmdb_environment import (
+    STORE_FILE_NAME,
+    SharedEnvironment,
+    acquire_environment,
+    release_environment,
+    sub_db_name,
+)
+
+if TYPE_CHECKING:
+    from .group_commit import GroupCommitter
 
 T = TypeVar('T')
 
@@ -29,6 +39,10 @@ class LMDBStorageManager:
     - Repository-specific error handling
     - Workspace isolation for multi-tenancy
     - Independent LMDB implementation
+    
+    Each workspace has a single LMDB environment; databases are named
+    databases inside it (``"<db_name>/<db_key>"``), so one write
+    transaction can update several of them atomically.
     """
     
     def __init__(
@@ -36,7 +50,7 @@ class LMDBStorageManager:
         workspace_manager=None,
         workspace_name: Optional[str] = None,
         map_size_mb: int = 500,  # Increased default for domain entities
-        max_dbs: int = 20,  # More databases for domain separation
+        max_dbs: int = 64,  # Named databases across all domains
     ):
         """Initialize independent storage manager.
         
@@ -44,14 +58,16 @@ class LMDBStorageManager:
             workspace_manager: Workspace instance for path resolution
             workspace_name: Specific workspace name (defaults to active workspace)
             map_size_mb: Initial LMDB map size in megabytes (default: 500)
-            max_dbs: Maximum number of named databases (default: 20)
+            max_dbs: Maximum number of named databases (default: 64)
         """
         self.workspace_manager = workspace_manager
         self.workspace_name = workspace_name
         self.map_size = map_size_mb * 1024 * 1024  # Convert to bytes
         self.max_dbs = max_dbs
         self._connections: Dict[str, lmdb.Environment] = {}
+        self._shared: Dict[str, SharedEnvironment] = {}
         self._serializer = None
+        self._group_committer: Optional['GroupCommitter'] = None
 
     def set_serializer(self, serializer: 'DomainEntitySerializer') -> None:
         """Set the domain entity serializer."""
@@ -72,7 +88,11 @@ class LMDBStorageManager:
         return workspace_path
 
     def get_db_path(self, db_name: str) -> Path:
-        """Get path for a specific database file.
+        """Get path of the legacy per-database environment.
+
+        Databases used to live in one LMDB environment each; they are now
+        named databases of the workspace environment at ``env_path`` and
+        this path is only read to migrate existing data.
 
         Args:
             db_name: Name of the database (e.g., 'artifacts', 'pipelines')
@@ -82,10 +102,23 @@ class LMDBStorageManager:
         """
         return self.storage_path / f"{db_name}.lmdb"
 
+    @property
+    def env_path(self) -> Path:
+        """Path of the LMDB environment holding all databases of the workspace."""
+        return self.storage_path / STORE_FILE_NAME
+
+    @staticmethod
+    def sub_db_name(db_name: str, db_key: Optional[str] = None) -> bytes:
+        """Name of the named database backing a ``db_name``/``db_key`` pair."""
+        return sub_db_name(db_name, db_key)
+
     @contextmanager
     def get_connection(self, db_name: str = "main", readonly: bool = False):
         """Get LMDB connection context manager.
 
+        All databases of a workspace share one environment, so a single
+        write transaction can span several of them.
+
         Args:
             db_name: Database name
             readonly: Whether to open in read-only mode
@@ -93,34 +126,35 @@ class LMDBStorageManager:
         Yields:
             LMDB environment
         """
-        connection_key = f"{self.workspace_name or 'default'}:{db_name}:{readonly}"
+        # LMDB allows a single environment per path and process, so read and
+        # write transactions share one writable environment, acquired from
+        # the process-wide registry shared with other storage managers.
+        connection_key = self.workspace_name or 'default'
 
         if connection_key not in self._connections:
-            db_path = self.get_db_path(db_name)
-            db_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # LMDB can't open non-existent databases in readonly mode
-            # If database doesn't exist and we need readonly access, create it first
-            if readonly and not db_path.exists():
-                # Create the database first
-                temp_env = lmdb.open(
-                    str(db_path),
-                    map_size=self.map_size,
-                    max_dbs=self.max_dbs,
-                    readonly=False,
-                )
-                temp_env.close()
-
-            env = lmdb.open(
-                str(db_path),
-                map_size=self.map_size,
-                max_dbs=self.max_dbs,
-                readonly=readonly,
-            )
-            self._connections[connection_key] = env
+            shared = acquire_environment(self.env_path, self.map_size, self.max_dbs)
+            self._shared[connection_key] = shared
+            self._connections[connection_key] = shared.env
 
         yield self._connections[connection_key]
 
+    def open_db(
+        self, txn: lmdb.Transaction, db_name: str = "main", db_key: Optional[str] = None, create: bool = True
+    ) -> lmdb._Database:
+        """Open the named database for a ``db_name``/``db_key`` pair.
+
+        Args:
+            txn: Transaction of the workspace environment
+            db_name: Database name
+            db_key: Specific sub-database key
+            create: Whether to create the database if missing
+
+        Returns:
+            Database handle
+        """
+        with self.get_connection(db_name) as env:
+            return env.open_db(self.sub_db_name(db_name, db_key), txn=txn, create=create)
+
     @contextmanager
     def get_transaction(
         self, db_name: str = "main", write: bool = True, db_key: Optional[str] = None
@@ -137,16 +171,25 @@ class LMDBStorageManager:
         """
         with self.get_connection(db_name, readonly=not write) as env:
             with env.begin(write=write) as txn:
-                if db_key:
-                    db = env.open_db(db_key.encode(), txn=txn, create=write)
-                else:
-                    db = env.open_db(txn=txn, create=write)
+                db = self.open_db(txn, db_name, db_key, create=write)
                 yield txn, db
 
+    @property
+    def group_committer(self) -> 'GroupCommitter':
+        """Group committer merging concurrent units of work into one commit."""
+        if self._group_committer is None:
+            from .group_commit import GroupCommitter
+            self._group_committer = GroupCommitter(self)
+        return self._group_committer
+
     def close(self) -> None:
         """Close all connections."""
-        for env in self._connections.values():
-            env.close()
+        if self._group_committer is not None:
+            self._group_committer.close()
+            self._group_committer = None
+        for shared in self._shared.values():
+            release_environment(shared)
+        self._shared.clear()
         self._connections.clear()
 
     def __del__(self):
@@ -12,6 +12,7 @@ import logging
 from ...shared.repository import UnitOfWork, UnitOfWorkError, RepositoryError
 from ...domains.workspace.value_objects.workspace_name import WorkspaceName
 from .storage_manager import LMDBStorageManager
+from .group_commit import WriteOperation, apply_operations
 
 logger = logging.getLogger(__name__)
 T = TypeVar('T')
@@ -22,6 +23,12 @@ class LMDBUnitOfWork(UnitOfWork):
     
     Coordinates transactions across multiple repositories ensuring
     atomic commits and proper cleanup on failures.
+    
+    Entities are serialized when they are queued, so the write lock is
+    only held to apply bytes. All databases live in the workspace
+    environment: a unit of work commits as one write transaction, merged
+    with concurrently committing units by the storage manager's
+    ``GroupCommitter``.
     """
     
     def __init__(
@@ -37,10 +44,11 @@ class LMDBUnitOfWork(UnitOfWork):
         """
         self._storage = storage_manager
         self._workspace_name = workspace_name
-        self._transactions: Dict[str, tuple[lmdb.Transaction, lmdb._Database]] = {}
+        self._txn: Optional[lmdb.Transaction] = None
+        self._databases: Dict[str, lmdb._Database] = {}
         self._is_committed = False
         self._is_rolled_back = False
-        self._pending_operations: List[dict] = []
+        self._pending_operations: List[WriteOperation] = []
         
     async def __aenter__(self) -> 'LMDBUnitOfWork':
         """Enter async context manager."""
@@ -72,18 +80,14 @@ class LMDBUnitOfWork(UnitOfWork):
             raise UnitOfWorkError("Unit of work was rolled back")
             
         try:
-            # Execute pending operations
-            for operation in self._pending_operations:
-                await self._execute_operation(operation)
-            
-            # Commit all transactions
-            for db_name, (txn, db) in self._transactions.items():
-                try:
-                    txn.commit()
-                    logger.debug(f"Committed transaction for database: {db_name}")
-                except Exception as e:
-                    logger.error(f"Failed to commit transaction for {db_name}: {e}")
-                    raise UnitOfWorkError(f"Commit failed for database {db_name}: {e}") from e
+            if self._txn is not None:
+                # Writes were made directly through get_transaction; queued
+                # operations join that transaction
+                apply_operations(self._storage, self._txn, self._pending_operations)
+                self._txn.commit()
+                self._txn = None
+            else:
+                await self._storage.group_committer.submit(self._pending_operations)
             
             self._is_committed = True
             logger.debug(f"Unit of work committed successfully for workspace: {self._workspace_name}")
@@ -107,14 +111,13 @@ class LMDBUnitOfWork(UnitOfWork):
             return  # Already rolled back
             
         try:
-            # Abort all transactions
-            for db_name, (txn, db) in self._transactions.items():
+            if self._txn is not None:
                 try:
-                    txn.abort()
-                    logger.debug(f"Rolled back transaction for database: {db_name}")
+                    self._txn.abort()
+                    logger.debug("Rolled back unit of work transaction")
                 except Exception as e:
-                    logger.warning(f"Failed to rollback transaction for {db_name}: {e}")
-                    # Continue with other transactions
+                    logger.warning(f"Failed to rollback transaction: {e}")
+                self._txn = None
             
             self._is_rolled_back = True
             logger.debug(f"Unit of work rolled back for workspace: {self._workspace_name}")
@@ -125,7 +128,12 @@ class LMDBUnitOfWork(UnitOfWork):
             self._cleanup()
     
     def get_transaction(self, db_name: str = "main", db_key: Optional[str] = None) -> tuple[lmdb.Transaction, lmdb._Database]:
-        """Get or create transaction for database.
+        """Get the write transaction of this unit of work and a database in it.
+        
+        The transaction holds the workspace write lock until the unit of
+        work commits or rolls back, and it is committed on its own rather
+        than grouped with other units; prefer ``save_entity`` and
+        ``delete_entity``.
         
         Args:
             db_name: Database name
@@ -142,23 +150,17 @@ class LMDBUnitOfWork(UnitOfWork):
             
         cache_key = f"{db_name}:{db_key or 'default'}"
         
-        if cache_key not in self._transactions:
-            try:
-                # Create new write transaction
+        try:
+            if self._txn is None:
                 with self._storage.get_connection(db_name, readonly=False) as env:
-                    txn = env.begin(write=True)
-                    if db_key:
-                        db = env.open_db(db_key.encode(), txn=txn, create=True)
-                    else:
-                        db = env.open_db(txn=txn, create=True)
-                    
-                    self._transactions[cache_key] = (txn, db)
-                    logger.debug(f"Created transaction for {cache_key}")
-                    
-            except Exception as e:
-                raise UnitOfWorkError(f"Failed to create transaction for {cache_key}: {e}") from e
+                    self._txn = env.begin(write=True)
+            if cache_key not in self._databases:
+                self._databases[cache_key] = self._storage.open_db(self._txn, db_name, db_key)
+                logger.debug(f"Opened database {cache_key} in unit of work transaction")
+        except Exception as e:
+            raise UnitOfWorkError(f"Failed to create transaction for {cache_key}: {e}") from e
         
-        return self._transactions[cache_key]
+        return self._txn, self._databases[cache_key]
     
     async def save_entity(
         self, 
@@ -169,20 +171,27 @@ class LMDBUnitOfWork(UnitOfWork):
     ) -> None:
         """Queue entity save operation.
         
+        The entity is serialized immediately, capturing its current state.
+        
         Args:
             entity: Entity to save
             entity_id: Entity identifier
             db_name: Database name
             db_key: Sub-database key
+            
+        Raises:
+            UnitOfWorkError: If the entity cannot be serialized
         """
-        operation = {
-            'type': 'save',
-            'entity': entity,
-            'entity_id': entity_id,
-            'db_name': db_name,
-            'db_key': db_key
-        }
-        self._pending_operations.append(operation)
+        if not self._storage._serializer:
+            raise UnitOfWorkError("No serializer configured")
+        try:
+            serialized = self._storage._serializer.serialize(entity)
+        except Exception as e:
+            raise UnitOfWorkError(f"Failed to serialize entity {entity_id}: {e}") from e
+        
+        self._pending_operations.append(
+            WriteOperation(db_name, db_key, self._make_key(entity_id), serialized)
+        )
     
     async def delete_entity(
         self, 
@@ -197,73 +206,16 @@ class LMDBUnitOfWork(UnitOfWork):
             db_name: Database name
             db_key: Sub-database key
         """
-        operation = {
-            'type': 'delete',
-            'entity_id': entity_id,
-            'db_name': db_name,
-            'db_key': db_key
-        }
-        self._pending_operations.append(operation)
-    
-    async def _execute_operation(self, operation: dict) -> None:
-        """Execute a pending operation.
-        
-        Args:
-            operation: Operation dictionary
-            
-        Raises:
-            UnitOfWorkError: If operation execution fails
-        """
-        try:
-            if operation['type'] == 'save':
-                await self._execute_save(operation)
-            elif operation['type'] == 'delete':
-                await self._execute_delete(operation)
-            else:
-                raise UnitOfWorkError(f"Unknown operation type: {operation['type']}")
-                
-        except Exception as e:
-            raise UnitOfWorkError(f"Failed to execute {operation['type']} operation: {e}") from e
+        self._pending_operations.append(WriteOperation(db_name, db_key, self._make_key(entity_id)))
     
-    async def _execute_save(self, operation: dict) -> None:
-        """Execute save operation.
-        
-        Args:
-            operation: Save operation dictionary
-        """
-        txn, db = self.get_transaction(operation['db_name'], operation['db_key'])
-        
-        if not self._storage._serializer:
-            raise UnitOfWorkError("No serializer configured")
-            
-        # Serialize entity
-        serialized = self._storage._serializer.serialize(operation['entity'])
-        
-        # Create storage key
-        key_str = self._storage._make_key(operation['entity_id'])
-        key_bytes = key_str.encode('utf-8')
-        
-        # Store in transaction
-        txn.put(key_bytes, serialized, db=db)
-    
-    async def _execute_delete(self, operation: dict) -> None:
-        """Execute delete operation.
-        
-        Args:
-            operation: Delete operation dictionary
-        """
-        txn, db = self.get_transaction(operation['db_name'], operation['db_key'])
-        
-        # Create storage key
-        key_str = self._storage._make_key(operation['entity_id'])
-        key_bytes = key_str.encode('utf-8')
-        
-        # Delete from transaction
-        txn.delete(key_bytes, db=db)
+    def _make_key(self, entity_id: Any) -> bytes:
+        """Create storage key bytes from an entity ID."""
+        return self._storage._make_key(entity_id).encode('utf-8')
     
     def _cleanup(self) -> None:
         """Clean up resources."""
-        self._transactions.clear()
+        self._txn = None
+        self._databases.clear()
         self._pending_operations.clear()
     
     @property
@@ -17,6 +17,7 @@ from ...domains.content.repositories.content_template_repository import (
     RecentTemplatesSpecification
 )
 from ...domains.content.entities.template import Template
+from ...domains.content.services.template_dependency_index import TemplateDependencyIndex
 from ...domains.content.value_objects.content_id import ContentId
 from ...domains.content.value_objects.template_name import TemplateName
 from ...domains.content.value_objects.content_type import ContentType
@@ -28,6 +29,7 @@ from ...shared.repository import RepositoryError, EntityNotFoundError
 from ..base.repository_base import LMDBRepositoryBase
 from ..base.storage_manager import LMDBStorageManager
 from ..base.serialization import DomainEntitySerializer
+from .template_dependency_store import TemplateDependencyStore
 
 
 class LMDBContentTemplateRepository(LMDBRepositoryBase[Template], ContentTemplateRepository):
@@ -35,6 +37,9 @@ class LMDBContentTemplateRepository(LMDBRepositoryBase[Template], ContentTemplat
     
     Stores content templates with workspace isolation and provides
     comprehensive template management with versioning and tagging.
+    Template dependencies are kept as forward and reverse adjacency in the
+    ``template_dependencies`` sub-database and updated on every save and
+    delete.
     """
     
     def __init__(
@@ -55,6 +60,13 @@ class LMDBContentTemplateRepository(LMDBRepositoryBase[Template], ContentTemplat
             db_name="content_templates",
             db_key="templates"
         )
+        self._dependency_store = TemplateDependencyStore(
+            storage_manager,
+            workspace_name,
+            db_name="content_templates"
+        )
+        self._dependency_graph_ready = False
+        self._dependency_index: Optional[TemplateDependencyIndex] = None
     
     def _setup_serializer(self, serializer: DomainEntitySerializer) -> None:
         """Setup serializer with template-specific types.
@@ -100,6 +112,105 @@ class LMDBContentTemplateRepository(LMDBRepositoryBase[Template], ContentTemplat
         else:
             return f"{workspace_prefix}template:{str(entity_id)}"
     
+    async def save(self, entity: Template) -> None:
+        """Save a template and update the dependency graph.
+        
+        Args:
+            entity: Template to save
+            
+        Raises:
+            RepositoryError: If save operation fails
+        """
+        await super().save(entity)
+        await self._ensure_dependency_graph()
+        dependencies = await self._dependency_store.index_template(entity)
+        if self._dependency_index is not None:
+            self._dependency_index.set_dependencies(entity.name.value, dependencies)
+    
+    async def delete_by_id(self, entity_id: Any) -> bool:
+        """Delete a template and remove it from the dependency graph.
+        
+        Args:
+            entity_id: Template identifier
+            
+        Returns:
+            True if template was deleted, False if not found
+            
+        Raises:
+            RepositoryError: If delete operation fails
+        """
+        deleted = await super().delete_by_id(entity_id)
+        if deleted:
+            name = await self._dependency_store.remove_template(entity_id)
+            if name is not None and self._dependency_index is not None:
+                self._dependency_index.remove_template(name)
+        return deleted
+    
+    async def get_template_dependencies(self, template: Template) -> List[TemplateName]:
+        """Get templates that this template depends on.
+        
+        Args:
+            template: Template to analyze dependencies for
+            
+        Returns:
+            List of template names this template depends on
+            
+        Raises:
+            RepositoryError: If dependency lookup fails
+        """
+        await self._ensure_dependency_graph()
+        dependencies = await self._dependency_store.get_dependencies(template.name.value)
+        return [TemplateName(name) for name in dependencies or []]
+    
+    async def get_template_dependents(self, template: Template) -> List[TemplateName]:
+        """Get templates that depend on this template.
+        
+        Args:
+            template: Template to analyze dependents for
+            
+        Returns:
+            List of template names that depend on this template
+            
+        Raises:
+            RepositoryError: If dependent lookup fails
+        """
+        await self._ensure_dependency_graph()
+        dependents = await self._dependency_store.get_dependents(template.name.value)
+        return [TemplateName(name) for name in dependents]
+    
+    async def load_dependency_index(self) -> TemplateDependencyIndex:
+        """Get the workspace dependency graph for analysis.
+        
+        The graph is read from LMDB once and then kept in step with saves
+        and deletes made through this repository.
+        
+        Returns:
+            Dependency index of all templates in the workspace
+        """
+        if self._dependency_index is None:
+            await self._ensure_dependency_graph()
+            self._dependency_index = await self._dependency_store.load_index()
+        return self._dependency_index
+    
+    async def rebuild_dependency_graph(self) -> int:
+        """Rebuild the dependency graph from all stored templates.
+        
+        Returns:
+            Number of recorded templates
+        """
+        templates = await self.find_by_workspace()
+        count = await self._dependency_store.rebuild(templates)
+        self._dependency_index = None
+        return count
+    
+    async def _ensure_dependency_graph(self) -> None:
+        """Build the graph on first use for workspaces created before it existed."""
+        if self._dependency_graph_ready:
+            return
+        self._dependency_graph_ready = True
+        if not await self._dependency_store.is_built():
+            await self.rebuild_dependency_graph()
+    
     async def find_by_name(self, name: TemplateName) -> Optional[Template]:
         """Find template by name within current workspace.
         
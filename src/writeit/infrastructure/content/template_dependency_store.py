@@ -0,0 +1,212 @@
+"""Persisted template dependency graph.
+
+Keeps forward and reverse dependency adjacency of content templates in an
+LMDB sub-database alongside the template store. Entries are updated
+incrementally when templates are saved or deleted, so dependency queries
+never have to scan and re-parse the templates.
+"""
+
+import json
+from typing import Any, Iterable, List, Optional
+
+from ...domains.content.entities.template import Template
+from ...domains.content.services.template_dependency_index import (
+    TemplateDependencyIndex,
+    extract_template_dependencies,
+)
+from ...domains.workspace.value_objects.workspace_name import WorkspaceName
+from ..base.storage_manager import LMDBStorageManager
+
+
+_SEPARATOR = '\x00'
+
+
+class TemplateDependencyStore:
+    """LMDB-backed forward and reverse template dependency adjacency.
+
+    Key layout within the sub-database (all keys are prefixed with
+    ``ws:<workspace>:``):
+
+    - ``fwd:<name>`` -> dependency names of the template
+    - ``rev:<dependency>\\0<name>`` -> empty marker
+    - ``id:<template_id>`` -> template name (to follow renames and deletes)
+    - ``stats`` -> template count
+
+    Examples:
+        store = TemplateDependencyStore(storage_manager, workspace_name)
+        await store.index_template(template)
+
+        dependents = await store.get_dependents("base-article")
+        index = await store.load_index()
+    """
+
+    def __init__(
+        self,
+        storage_manager: LMDBStorageManager,
+        workspace_name: WorkspaceName,
+        db_name: str = "content_templates",
+        db_key: str = "template_dependencies"
+    ):
+        """Initialize dependency store.
+
+        Args:
+            storage_manager: LMDB storage manager
+            workspace_name: Workspace the graph is scoped to
+            db_name: LMDB database holding the templates
+            db_key: Sub-database name for the graph
+        """
+        self._storage = storage_manager
+        self._workspace_name = workspace_name
+        self._db_name = db_name
+        self._db_key = db_key
+        self._prefix = f"ws:{workspace_name.value}:"
+
+    # Incremental maintenance
+
+    async def index_template(self, template: Template) -> List[str]:
+        """Add or replace a template's dependencies.
+
+        Args:
+            template: Saved template
+
+        Returns:
+            Dependency names recorded for the template
+
+        Raises:
+            RepositoryError: If the update fails
+        """
+        template_id = str(template.id.value)
+        name = template.name.value
+        dependencies = list(dict.fromkeys(
+            dep.value for dep in extract_template_dependencies(template.yaml_content)
+        ))
+
+        async with self._storage.transaction(self._db_name, write=True, db_key=self._db_key) as (txn, db):
+            existed = False
+            previous = txn.get(self._key(f"id:{template_id}"), db=db)
+            if previous is not None and previous.decode("utf-8") != name:
+                # Renamed: the old name no longer exists
+                existed = self._remove_name(txn, db, previous.decode("utf-8"))
+            existed = self._remove_name(txn, db, name) or existed
+
+            for dependency in dependencies:
+                txn.put(self._reverse_key(dependency, name), b"", db=db)
+            txn.put(self._key(f"fwd:{name}"), json.dumps(dependencies).encode("utf-8"), db=db)
+            txn.put(self._key(f"id:{template_id}"), name.encode("utf-8"), db=db)
+
+            if not existed:
+                self._adjust_count(txn, db, 1)
+
+        return dependencies
+
+    async def remove_template(self, template_id: Any) -> Optional[str]:
+        """Remove a template from the graph.
+
+        Args:
+            template_id: ID of the deleted template
+
+        Returns:
+            Name of the removed template, or None if it was not recorded
+        """
+        template_id = str(getattr(template_id, "value", template_id))
+        async with self._storage.transaction(self._db_name, write=True, db_key=self._db_key) as (txn, db):
+            raw = txn.get(self._key(f"id:{template_id}"), db=db)
+            if raw is None:
+                return None
+            name = raw.decode("utf-8")
+            txn.delete(self._key(f"id:{template_id}"), db=db)
+            if self._remove_name(txn, db, name):
+                self._adjust_count(txn, db, -1)
+            return name
+
+    async def rebuild(self, templates: Iterable[Template]) -> int:
+        """Rebuild the graph from scratch.
+
+        Args:
+            templates: All templates in the workspace
+
+        Returns:
+            Number of recorded templates
+        """
+        prefix = self._prefix.encode("utf-8")
+        async with self._storage.transaction(self._db_name, write=True, db_key=self._db_key) as (txn, db):
+            cursor = txn.cursor(db=db)
+            if cursor.set_range(prefix):
+                while cursor.key().startswith(prefix):
+                    if not cursor.delete():
+                        break
+            txn.put(self._key("stats"), json.dumps({"templates": 0}).encode("utf-8"), db=db)
+
+        count = 0
+        for template in templates:
+            await self.index_template(template)
+            count += 1
+        return count
+
+    # Queries
+
+    async def is_built(self) -> bool:
+        """Check whether the graph has been initialized for the workspace."""
+        # Write transaction: opening the sub-database read-only fails before it exists
+        async with self._storage.transaction(self._db_name, write=True, db_key=self._db_key) as (txn, db):
+            return txn.get(self._key("stats"), db=db) is not None
+
+    async def get_dependencies(self, name: str) -> Optional[List[str]]:
+        """Direct dependencies of a template, or None if it is not recorded."""
+        async with self._storage.transaction(self._db_name, write=False, db_key=self._db_key) as (txn, db):
+            raw = txn.get(self._key(f"fwd:{name}"), db=db)
+            return json.loads(raw) if raw is not None else None
+
+    async def get_dependents(self, name: str) -> List[str]:
+        """Templates that depend directly on ``name``."""
+        reverse_prefix = self._key(f"rev:{name}{_SEPARATOR}")
+        dependents: List[str] = []
+        async with self._storage.transaction(self._db_name, write=False, db_key=self._db_key) as (txn, db):
+            cursor = txn.cursor(db=db)
+            if cursor.set_range(reverse_prefix):
+                for key in cursor.iternext(keys=True, values=False):
+                    if not key.startswith(reverse_prefix):
+                        break
+                    dependents.append(key[len(reverse_prefix):].decode("utf-8"))
+        return dependents
+
+    async def load_index(self) -> TemplateDependencyIndex:
+        """Load the whole graph into a dependency index with one range scan."""
+        forward_prefix = self._key("fwd:")
+        adjacency = {}
+        async with self._storage.transaction(self._db_name, write=False, db_key=self._db_key) as (txn, db):
+            cursor = txn.cursor(db=db)
+            if cursor.set_range(forward_prefix):
+                for key, value in cursor.iternext(keys=True, values=True):
+                    if not key.startswith(forward_prefix):
+                        break
+                    adjacency[key[len(forward_prefix):].decode("utf-8")] = json.loads(value)
+        return TemplateDependencyIndex(adjacency)
+
+    # Internal helpers
+
+    def _key(self, suffix: str) -> bytes:
+        return f"{self._prefix}{suffix}".encode("utf-8")
+
+    def _reverse_key(self, dependency: str, name: str) -> bytes:
+        return self._key(f"rev:{dependency}{_SEPARATOR}{name}")
+
+    def _remove_name(self, txn: Any, db: Any, name: str) -> bool:
+        """Delete a template's forward entry and its reverse markers."""
+        forward_key = self._key(f"fwd:{name}")
+        raw = txn.get(forward_key, db=db)
+        if raw is None:
+            return False
+        for dependency in json.loads(raw):
+            txn.delete(self._reverse_key(dependency, name), db=db)
+        txn.delete(forward_key, db=db)
+        return True
+
+    def _adjust_count(self, txn: Any, db: Any, delta: int) -> None:
+        raw = txn.get(self._key("stats"), db=db)
+        count = json.loads(raw)["templates"] if raw is not None else 0
+        txn.put(
+            self._key("stats"),
+            json.dumps({"templates": max(0, count + delta)}).encode("utf-8"),
+            db=db
+        )
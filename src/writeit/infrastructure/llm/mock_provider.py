@@ -2,9 +2,16 @@
 
 Provides deterministic responses for testing pipeline functionality
 without requiring actual LLM API calls.
+
+For load simulation the provider can draw latencies from a heavy-tailed
+lognormal distribution, stream at a fixed token rate and answer with
+simulated rate-limit (429) errors. With a ``seed`` every random draw of a
+request comes from a generator seeded by the request's ``request_id``, so
+a simulation replays identically however its requests interleave.
 """
 
 import asyncio
+import math
 import random
 from datetime import datetime
 from typing import Dict, List, Optional, Any, AsyncGenerator
@@ -20,7 +27,8 @@ from .base_provider import (
     StreamingChunk,
     ModelInfo,
     TokenUsage,
-    ProviderError
+    ProviderError,
+    RateLimitError
 )
 
 
@@ -36,6 +44,17 @@ class MockLLMProvider(BaseLLMProvider):
         self.failure_rate = config.get("failure_rate", 0.0) if config else 0.0
         self.response_templates = config.get("response_templates", {}) if config else {}
         
+        # Load simulation configuration
+        config = config or {}
+        self.latency_distribution = config.get("latency_distribution", "fixed")
+        self.latency_sigma = config.get("latency_sigma", 0.5)
+        self.tokens_per_second: Optional[float] = config.get("tokens_per_second")
+        self.rate_limit_rate = config.get("rate_limit_rate", 0.0)
+        self.retry_after_seconds = config.get("retry_after_seconds", 1)
+        self.time_scale = config.get("time_scale", 1.0)
+        self.seed: Optional[int] = config.get("seed")
+        self._random = random.Random(self.seed) if self.seed is not None else random.Random()
+        
         # Default response templates
         self._default_templates = {
             "article": "# {topic}\n\nThis is a comprehensive article about {topic}. Lorem ipsum dolor sit amet, consectetur adipiscing elit.",
@@ -91,13 +110,14 @@ class MockLLMProvider(BaseLLMProvider):
     async def generate(self, request: LLMRequest) -> LLMResponse:
         """Generate a mock response."""
         await self.validate_request(request)
+        rng = self._request_random(request)
+        latency_ms = self._sample_latency_ms(rng)
         
         # Simulate network latency
-        await asyncio.sleep(self.latency_ms / 1000)
+        await self._sleep(latency_ms / 1000)
         
-        # Simulate random failures
-        if random.random() < self.failure_rate:
-            raise ProviderError("Mock failure for testing", "mock_error", "mock")
+        # Simulate rate limiting and random failures
+        self._simulate_errors(rng)
         
         # Generate mock content
         content = self._generate_mock_content(request)
@@ -117,7 +137,7 @@ class MockLLMProvider(BaseLLMProvider):
             model=request.model,
             finish_reason="stop",
             token_usage=token_usage,
-            response_time_ms=self.latency_ms,
+            response_time_ms=int(latency_ms),
             provider_response_id=f"mock-{uuid.uuid4().hex[:8]}",
             provider_metadata={
                 "mock_provider": True,
@@ -134,16 +154,27 @@ class MockLLMProvider(BaseLLMProvider):
         if not model_info or not model_info.supports_streaming:
             raise ProviderError(f"Model {request.model} does not support streaming")
         
+        rng = self._request_random(request)
+        latency_ms = self._sample_latency_ms(rng)
+        
         # Generate full content first
         content = self._generate_mock_content(request)
         words = content.split()
         
-        # Stream words with delays
-        chunk_delay = self.latency_ms / (len(words) + 1) / 1000
+        if self.tokens_per_second:
+            # Latency is the time to first token, then words arrive at the token rate
+            await self._sleep(latency_ms / 1000)
+            self._simulate_errors(rng)
+            word_delays = [self._estimate_tokens(word) / self.tokens_per_second for word in words]
+        else:
+            # Stream words with delays
+            self._simulate_errors(rng)
+            word_delays = [latency_ms / (len(words) + 1) / 1000] * len(words)
         
         current_content = ""
         for i, word in enumerate(words):
-            await asyncio.sleep(chunk_delay)
+            chunk_delay = word_delays[i]
+            await self._sleep(chunk_delay)
             
             current_content += (" " if current_content else "") + word
             
@@ -253,6 +284,32 @@ class MockLLMProvider(BaseLLMProvider):
         
         return variables
     
+    def _request_random(self, request: LLMRequest) -> random.Random:
+        """Random generator for one request (seeded by its id when a seed is set)."""
+        if self.seed is not None and request.request_id:
+            return random.Random(f"{self.seed}:{request.request_id}")
+        return self._random
+    
+    def _sample_latency_ms(self, rng: random.Random) -> float:
+        """Draw a request latency from the configured distribution."""
+        if self.latency_distribution == "lognormal" and self.latency_ms > 0:
+            # latency_ms is the median; sigma sets how heavy the tail is
+            return rng.lognormvariate(math.log(self.latency_ms), self.latency_sigma)
+        return float(self.latency_ms)
+    
+    def _simulate_errors(self, rng: random.Random) -> None:
+        """Raise a simulated rate-limit or provider error."""
+        if rng.random() < self.rate_limit_rate:
+            raise RateLimitError(
+                "Mock rate limit exceeded", retry_after=self.retry_after_seconds, provider="mock"
+            )
+        if rng.random() < self.failure_rate:
+            raise ProviderError("Mock failure for testing", "mock_error", "mock")
+    
+    async def _sleep(self, seconds: float) -> None:
+        """Sleep for a simulated duration, scaled by ``time_scale``."""
+        await asyncio.sleep(seconds * self.time_scale)
+    
     def _estimate_tokens(self, text: str) -> int:
         """Estimate token count (rough approximation)."""
         # Very rough approximation: 1 token ≈ 4 characters
@@ -269,3 +326,18 @@ class MockLLMProvider(BaseLLMProvider):
     def set_failure_rate(self, rate: float) -> None:
         """Set mock failure rate (0.0 to 1.0)."""
         self.failure_rate = max(0.0, min(1.0, rate))
+    
+    def set_latency_distribution(self, median_ms: float, sigma: float = 0.5) -> None:
+        """Draw latencies from a lognormal distribution with the given median."""
+        self.latency_ms = median_ms
+        self.latency_distribution = "lognormal"
+        self.latency_sigma = sigma
+    
+    def set_token_rate(self, tokens_per_second: Optional[float]) -> None:
+        """Stream at a fixed token rate after the sampled time to first token."""
+        self.tokens_per_second = tokens_per_second
+    
+    def set_rate_limit(self, rate: float, retry_after_seconds: int = 1) -> None:
+        """Answer a fraction of requests (0.0 to 1.0) with a rate-limit error."""
+        self.rate_limit_rate = max(0.0, min(1.0, rate))
+        self.retry_after_seconds = retry_after_seconds
@@ -3,7 +3,14 @@
 Provides storage abstractions and implementations for WriteIt infrastructure.
 """
 
-from .lmdb_storage import LMDBStorage, StorageConfig, TransactionStats, ConnectionPool
+from .lmdb_storage import (
+    LMDBStorage,
+    StorageConfig,
+    TransactionStats,
+    ConnectionPool,
+    DurabilityProfile,
+    WriteCoalescer,
+)
 from .file_storage import FileSystemStorage, FileMetadata, FileChangeHandler
 from .cache_storage import MultiTierCacheStorage, LRUCache, CacheEntry, CacheStats
 
@@ -12,6 +19,8 @@ __all__ = [
     "StorageConfig", 
     "TransactionStats",
     "ConnectionPool",
+    "DurabilityProfile",
+    "WriteCoalescer",
     "FileSystemStorage",
     "FileMetadata",
     "FileChangeHandler",
@@ -4,14 +4,23 @@ Provides comprehensive backup and rollback capabilities for migration operations
 ensuring data safety and recovery options during migration processes.
 """
 
+import io
+import os
+import stat
 import shutil
 import json
 import yaml
+import zlib
 import hashlib
 import tempfile
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Union, Tuple, Set
+from functools import partial
+from typing import (
+    TYPE_CHECKING, Any, BinaryIO, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
+)
 from pathlib import Path
 from enum import Enum
 from datetime import datetime, timedelta
@@ -23,6 +32,16 @@ import tarfile
 from ...domains.workspace.value_objects import WorkspaceName
 from ...domains.content.value_objects import TemplateName, StyleName
 from ...domains.pipeline.value_objects import PipelineId, StepId
+from ..base.lmdb_environment import find_open_environment
+
+if TYPE_CHECKING:
+    import lmdb
+
+
+LMDB_DATA_FILE = "data.mdb"
+LMDB_MAX_DBS = 128
+COPY_BUFFER_SIZE = 1024 * 1024
+DEFAULT_CHUNK_STORE_DIR = "chunks"
 
 
 class BackupType(str, Enum):
@@ -132,6 +151,7 @@ class BackupResult:
     execution_time: timedelta
     warnings: List[str] = field(default_factory=list)
     error_details: Optional[str] = None
+    statistics: Dict[str, Any] = field(default_factory=dict)
 
 
 @dataclass
@@ -158,10 +178,16 @@ class BackupConfig:
     temp_dir: Optional[Path] = None
     exclude_patterns: List[str] = field(default_factory=list)
     include_patterns: List[str] = field(default_factory=list)
+    max_workers: int = 4                   # Worker threads for archive and chunk work
+    chunk_size: int = 4 * 1024 * 1024      # Chunk size for deduplicated backups
+    chunk_compression_level: int = 6       # zlib level for stored chunks
+    chunk_store_path: Optional[Path] = None
     
     def __post_init__(self):
         if self.temp_dir is None:
             self.temp_dir = Path(tempfile.gettempdir()) / "writeit_backups"
+        if self.chunk_store_path is None:
+            self.chunk_store_path = self.backup_root_path / DEFAULT_CHUNK_STORE_DIR
 
 
 class BackupStrategy(ABC):
@@ -198,18 +224,132 @@ class BackupStrategy(ABC):
     def validate_backup(self, backup_path: Path, metadata: BackupMetadata) -> bool:
         """Validate backup integrity."""
         pass
+    
+    def backup_suffix(self, compression: CompressionType) -> str:
+        """File suffix for backups created with this strategy."""
+        return compression.value if compression != CompressionType.NONE else 'bak'
+    
+    def can_restore(self, backup_path: Path) -> bool:
+        """Check if this strategy can read a backup in its on-disk format."""
+        return True
+    
+    async def release_backup(self, backup_path: Path, config: BackupConfig) -> None:
+        """Release storage shared with a deleted backup."""
+        pass
+
+
+class HashingWriter(io.RawIOBase):
+    """Write-only stream that checksums bytes as they are written.
+
+    Wrapping an archive's output file lets the checksum be computed while
+    the archive is produced instead of re-reading it afterwards. The stream
+    is not seekable, so zip and tar writers use their streaming modes.
+    """
+    
+    def __init__(self, fileobj: BinaryIO, algorithm: str = "sha256"):
+        super().__init__()
+        self.algorithm = algorithm
+        self.bytes_written = 0
+        self._fileobj = fileobj
+        self._hash = hashlib.new(algorithm)
+    
+    def writable(self) -> bool:
+        return True
+    
+    def write(self, data) -> int:
+        self._fileobj.write(data)
+        self._hash.update(data)
+        self.bytes_written += len(data)
+        return len(data)
+    
+    def tell(self) -> int:
+        return self.bytes_written
+    
+    @property
+    def checksum(self) -> str:
+        """Checksum of everything written so far, as ``algorithm:hexdigest``."""
+        return f"{self.algorithm}:{self._hash.hexdigest()}"
+
+
+def is_lmdb_environment(path: Path) -> bool:
+    """Check whether a directory is an LMDB environment."""
+    return path.is_dir() and (path / LMDB_DATA_FILE).is_file()
+
+
+def snapshot_lmdb_environment(
+    source: Path,
+    target: Path,
+    env: Optional["lmdb.Environment"] = None,
+) -> Path:
+    """Take a consistent, compacted snapshot of a live LMDB environment.
+
+    The copy runs inside a read transaction, so concurrent writers are
+    neither blocked nor able to tear the snapshot, and free pages are
+    dropped from the copy.
+
+    Args:
+        source: LMDB environment directory
+        target: Directory to write the snapshot to
+        env: Already open environment for ``source``; LMDB allows one
+            environment per path and process, so callers holding one must
+            pass it in
+
+    Returns:
+        Path to the snapshot directory
+    """
+    import lmdb
+
+    target.mkdir(parents=True, exist_ok=True)
+    owns_env = env is None
+    if owns_env:
+        env = lmdb.open(str(source), readonly=True, max_dbs=LMDB_MAX_DBS)
+    
+    try:
+        with env.begin() as txn:
+            env.copy(str(target), compact=True, txn=txn)
+    finally:
+        if owns_env:
+            env.close()
+    
+    return target
 
 
 class FileSystemBackupStrategy(BackupStrategy):
-    """File system backup strategy using standard file operations."""
+    """File system backup strategy using standard file operations.
+
+    LMDB environments are captured with hot snapshots rather than copied
+    file by file, checksums are computed while the backup is written and
+    all blocking work runs on a worker pool.
+    """
     
-    def __init__(self):
+    def __init__(
+        self,
+        environment_resolver: Optional[Callable[[Path], Optional["lmdb.Environment"]]] = None,
+    ):
+        """Initialize strategy.
+
+        Args:
+            environment_resolver: Returns the already open LMDB environment
+                for a path, if this process has one
+        """
         self.logger = logging.getLogger(__name__)
+        self.environment_resolver = environment_resolver
+        self._executor: Optional[ThreadPoolExecutor] = None
     
     def can_handle(self, backup_type: BackupType) -> bool:
         """Handle all backup types."""
         return True
     
+    def can_restore(self, backup_path: Path) -> bool:
+        """Read archives and plain copies, not chunk manifests."""
+        return backup_path.suffix != ".manifest"
+    
+    def shutdown(self) -> None:
+        """Shut down the worker pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+    
     async def create_backup(
         self, 
         source_path: Path, 
@@ -225,24 +365,22 @@ class FileSystemBackupStrategy(BackupStrategy):
             backup_path.parent.mkdir(parents=True, exist_ok=True)
             
             # Create temporary backup file
+            config.temp_dir.mkdir(parents=True, exist_ok=True)
             temp_backup_path = config.temp_dir / f"temp_{metadata.backup_id}"
             
-            # Perform backup based on compression type
-            if config.compression == CompressionType.NONE:
-                await self._copy_directory(source_path, temp_backup_path, config)
-            elif config.compression == CompressionType.ZIP:
-                await self._create_zip_backup(source_path, temp_backup_path, config)
-            else:
-                await self._create_tar_backup(source_path, temp_backup_path, config, metadata.compression)
-            
-            # Calculate checksum
-            checksum = await self._calculate_checksum(temp_backup_path, config.checksum_algorithm)
+            # Snapshot LMDB environments and write the backup on the worker pool
+            with self._staging_directory(config) as staging_dir:
+                entries = await self._collect_entries(source_path, config, staging_dir)
+                checksum = await self._write_backup(
+                    entries, temp_backup_path, config, metadata.compression
+                )
             
             # Move to final location
             shutil.move(str(temp_backup_path), str(backup_path))
             
-            # Get file info
-            size_bytes = backup_path.stat().st_size if backup_path.exists() else 0
+            metadata.checksum = checksum
+            metadata.file_count = len(entries)
+            metadata.size_bytes = self._backup_size(backup_path)
             
             execution_time = datetime.now() - start_time
             
@@ -285,16 +423,10 @@ class FileSystemBackupStrategy(BackupStrategy):
             target_path.parent.mkdir(parents=True, exist_ok=True)
             
             # Create temporary restore directory
-            temp_restore_path = config.temp_dir / f"temp_restore_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            temp_restore_path = config.temp_dir / f"temp_restore_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
             
-            # Extract backup based on compression type
-            if backup_path.suffix == '.zip':
-                await self._extract_zip_backup(backup_path, temp_restore_path)
-            elif backup_path.suffix in ['.tar', '.tar.gz', '.tar.bz2', '.tar.xz']:
-                await self._extract_tar_backup(backup_path, temp_restore_path)
-            else:
-                # Direct copy for uncompressed backups
-                shutil.copytree(str(backup_path), str(temp_restore_path))
+            # Extract backup on the worker pool
+            await self._extract_backup(backup_path, temp_restore_path, config)
             
             # Restore based on strategy
             if strategy == RollbackStrategy.FULL_RESTORE:
@@ -354,7 +486,7 @@ class FileSystemBackupStrategy(BackupStrategy):
                 return False
             
             # Check file size
-            actual_size = backup_path.stat().st_size
+            actual_size = self._backup_size(backup_path)
             if actual_size != metadata.size_bytes:
                 self.logger.warning(f"Backup size mismatch: expected {metadata.size_bytes}, got {actual_size}")
                 return False
@@ -367,10 +499,10 @@ class FileSystemBackupStrategy(BackupStrategy):
                     return False
             
             # Try to read the backup file
-            if backup_path.suffix == '.zip':
+            if zipfile.is_zipfile(backup_path):
                 with zipfile.ZipFile(backup_path, 'r') as zf:
                     zf.testzip()
-            elif backup_path.suffix in ['.tar', '.tar.gz', '.tar.bz2', '.tar.xz']:
+            elif backup_path.is_file() and tarfile.is_tarfile(backup_path):
                 with tarfile.open(backup_path, 'r:*') as tf:
                     # Just try to get members to validate
                     tf.getmembers()
@@ -381,98 +513,543 @@ class FileSystemBackupStrategy(BackupStrategy):
             self.logger.error(f"Error validating backup: {e}")
             return False
     
-    async def _copy_directory(self, source: Path, target: Path, config: BackupConfig) -> None:
-        """Copy directory with filtering."""
-        target.mkdir(parents=True, exist_ok=True)
+    async def _run(self, config: BackupConfig, func: Callable[..., Any], *args: Any) -> Any:
+        """Run blocking backup work on the worker pool."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=config.max_workers,
+                thread_name_prefix="writeit-backup",
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args))
+    
+    @contextmanager
+    def _staging_directory(self, config: BackupConfig) -> Iterator[Path]:
+        """Temporary directory for LMDB snapshots."""
+        config.temp_dir.mkdir(parents=True, exist_ok=True)
+        staging_dir = Path(tempfile.mkdtemp(prefix="staging_", dir=config.temp_dir))
+        try:
+            yield staging_dir
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+    
+    async def _collect_entries(
+        self,
+        source: Path,
+        config: BackupConfig,
+        staging_dir: Path
+    ) -> List[Tuple[Path, str]]:
+        """Collect files to back up, snapshotting LMDB environments.
+
+        Returns:
+            Sorted list of (file path, archive name) pairs
+        """
+        return await self._run(config, self._collect_entries_sync, source, config, staging_dir)
+    
+    def _collect_entries_sync(
+        self,
+        source: Path,
+        config: BackupConfig,
+        staging_dir: Path
+    ) -> List[Tuple[Path, str]]:
+        """Walk the source tree (runs on the worker pool)."""
+        if source.is_file():
+            return [(source, source.name)]
         
-        for item in source.iterdir():
-            # Skip excluded patterns
-            if any(pattern in str(item) for pattern in config.exclude_patterns):
-                continue
-            
-            # Only include specified patterns
-            if config.include_patterns and not any(pattern in str(item) for pattern in config.include_patterns):
-                continue
-            
-            if item.is_dir():
-                await self._copy_directory(item, target / item.name, config)
-            else:
-                shutil.copy2(str(item), str(target / item.name))
-    
-    async def _create_zip_backup(self, source: Path, target: Path, config: BackupConfig) -> None:
-        """Create ZIP backup."""
-        with zipfile.ZipFile(str(target), 'w', zipfile.ZIP_DEFLATED) as zf:
-            for file_path in source.rglob('*'):
-                # Skip excluded patterns
-                if any(pattern in str(file_path) for pattern in config.exclude_patterns):
-                    continue
-                
-                # Only include specified patterns
-                if config.include_patterns and not any(pattern in str(file_path) for pattern in config.include_patterns):
+        entries: List[Tuple[Path, str]] = []
+        pending = [source]
+        
+        while pending:
+            directory = pending.pop()
+            for item in directory.iterdir():
+                if not self._is_included(item, config):
                     continue
                 
-                arcname = file_path.relative_to(source)
-                zf.write(str(file_path), str(arcname))
+                relative = item.relative_to(source).as_posix()
+                if is_lmdb_environment(item):
+                    env = self.environment_resolver(item) if self.environment_resolver else None
+                    snapshot_dir = snapshot_lmdb_environment(item, staging_dir / relative, env)
+                    for snapshot_file in sorted(snapshot_dir.iterdir()):
+                        entries.append((snapshot_file, f"{relative}/{snapshot_file.name}"))
+                elif item.is_dir():
+                    pending.append(item)
+                elif item.is_file():
+                    entries.append((item, relative))
+        
+        entries.sort(key=lambda entry: entry[1])
+        return entries
+    
+    def _is_included(self, path: Path, config: BackupConfig) -> bool:
+        """Apply include and exclude patterns."""
+        # Skip excluded patterns
+        if any(pattern in str(path) for pattern in config.exclude_patterns):
+            return False
+        
+        # Only include specified patterns (directories are always descended into)
+        if config.include_patterns and not path.is_dir():
+            return any(pattern in str(path) for pattern in config.include_patterns)
+        
+        return True
     
-    async def _create_tar_backup(self, source: Path, target: Path, config: BackupConfig, compression: CompressionType) -> None:
-        """Create TAR backup."""
+    async def _write_backup(
+        self,
+        entries: List[Tuple[Path, str]],
+        target: Path,
+        config: BackupConfig,
+        compression: CompressionType
+    ) -> str:
+        """Write entries to the backup target, returning its checksum."""
+        if compression == CompressionType.NONE:
+            return await self._run(config, self._copy_entries, entries, target, config.checksum_algorithm)
+        if compression == CompressionType.ZIP:
+            return await self._run(config, self._write_zip, entries, target, config.checksum_algorithm)
+        return await self._run(
+            config, self._write_tar, entries, target, config.checksum_algorithm, compression
+        )
+    
+    def _copy_entries(self, entries: List[Tuple[Path, str]], target: Path, algorithm: str) -> str:
+        """Copy entries into a directory, hashing each file as it is copied."""
+        target.mkdir(parents=True, exist_ok=True)
+        file_digests = []
+        
+        for source_file, arcname in entries:
+            destination = target / arcname
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            file_hash = hashlib.new(algorithm)
+            
+            with open(source_file, 'rb') as src, open(destination, 'wb') as dst:
+                for chunk in iter(lambda: src.read(COPY_BUFFER_SIZE), b""):
+                    file_hash.update(chunk)
+                    dst.write(chunk)
+            shutil.copystat(str(source_file), str(destination))
+            file_digests.append((arcname, file_hash.hexdigest()))
+        
+        return self._tree_checksum(file_digests, algorithm)
+    
+    def _write_zip(self, entries: List[Tuple[Path, str]], target: Path, algorithm: str) -> str:
+        """Create ZIP backup, checksumming the archive while it is written."""
+        with open(target, 'wb') as f:
+            writer = HashingWriter(f, algorithm)
+            with zipfile.ZipFile(writer, 'w', zipfile.ZIP_DEFLATED) as zf:
+                for source_file, arcname in entries:
+                    zf.write(str(source_file), arcname)
+        return writer.checksum
+    
+    def _write_tar(
+        self,
+        entries: List[Tuple[Path, str]],
+        target: Path,
+        algorithm: str,
+        compression: CompressionType
+    ) -> str:
+        """Create TAR backup, checksumming the archive while it is written."""
         mode_map = {
-            CompressionType.TAR_GZ: 'w:gz',
-            CompressionType.TAR_BZ2: 'w:bz2',
-            CompressionType.TAR_XZ: 'w:xz',
+            CompressionType.TAR_GZ: 'w|gz',
+            CompressionType.TAR_BZ2: 'w|bz2',
+            CompressionType.TAR_XZ: 'w|xz',
         }
         
-        mode = mode_map.get(compression, 'w')
+        mode = mode_map.get(compression, 'w|')
         
-        with tarfile.open(str(target), mode) as tf:
-            for file_path in source.rglob('*'):
-                # Skip excluded patterns
-                if any(pattern in str(file_path) for pattern in config.exclude_patterns):
-                    continue
-                
-                # Only include specified patterns
-                if config.include_patterns and not any(pattern in str(file_path) for pattern in config.include_patterns):
-                    continue
-                
-                arcname = file_path.relative_to(source)
-                tf.add(str(file_path), str(arcname))
+        with open(target, 'wb') as f:
+            writer = HashingWriter(f, algorithm)
+            with tarfile.open(fileobj=writer, mode=mode) as tf:
+                for source_file, arcname in entries:
+                    tf.add(str(source_file), arcname, recursive=False)
+        return writer.checksum
     
-    async def _extract_zip_backup(self, backup_path: Path, target_path: Path) -> None:
+    async def _extract_backup(self, backup_path: Path, target_path: Path, config: BackupConfig) -> None:
+        """Extract a backup into a directory."""
+        if zipfile.is_zipfile(backup_path):
+            await self._run(config, self._extract_zip_backup, backup_path, target_path)
+        elif backup_path.is_file() and tarfile.is_tarfile(backup_path):
+            await self._run(config, self._extract_tar_backup, backup_path, target_path)
+        else:
+            # Direct copy for uncompressed backups
+            await self._run(config, shutil.copytree, str(backup_path), str(target_path))
+    
+    def _extract_zip_backup(self, backup_path: Path, target_path: Path) -> None:
         """Extract ZIP backup."""
         with zipfile.ZipFile(str(backup_path), 'r') as zf:
             zf.extractall(str(target_path))
     
-    async def _extract_tar_backup(self, backup_path: Path, target_path: Path) -> None:
+    def _extract_tar_backup(self, backup_path: Path, target_path: Path) -> None:
         """Extract TAR backup."""
         with tarfile.open(str(backup_path), 'r:*') as tf:
             tf.extractall(str(target_path))
     
+    @staticmethod
+    def _tree_checksum(file_digests: List[Tuple[str, str]], algorithm: str) -> str:
+        """Combine per-file digests into one checksum for a directory backup."""
+        tree_hash = hashlib.new(algorithm)
+        for arcname, digest in sorted(file_digests):
+            tree_hash.update(f"{arcname}\0{digest}\n".encode("utf-8"))
+        return f"{algorithm}:{tree_hash.hexdigest()}"
+    
+    @staticmethod
+    def _backup_size(backup_path: Path) -> int:
+        """Size of a backup file, or total size of a backup directory."""
+        if backup_path.is_dir():
+            return sum(path.stat().st_size for path in backup_path.rglob('*') if path.is_file())
+        return backup_path.stat().st_size if backup_path.exists() else 0
+    
     async def _calculate_checksum(self, file_path: Path, algorithm: str) -> str:
         """Calculate checksum for file."""
-        hash_func = getattr(hashlib, algorithm)()
-        
-        with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_func.update(chunk)
-        
-        return f"{algorithm}:{hash_func.hexdigest()}"
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, self._calculate_file_checksum, file_path, algorithm
+        )
     
     def _calculate_file_checksum(self, file_path: Path, algorithm: str) -> str:
         """Calculate checksum for file (synchronous version)."""
-        hash_func = getattr(hashlib, algorithm)()
+        if file_path.is_dir():
+            file_digests = [
+                (path.relative_to(file_path).as_posix(), self._calculate_file_checksum(path, algorithm).split(':', 1)[1])
+                for path in file_path.rglob('*') if path.is_file()
+            ]
+            return self._tree_checksum(file_digests, algorithm)
+        
+        hash_func = hashlib.new(algorithm)
         
         with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b""):
+            for chunk in iter(lambda: f.read(COPY_BUFFER_SIZE), b""):
                 hash_func.update(chunk)
         
         return f"{algorithm}:{hash_func.hexdigest()}"
 
 
+class ContentAddressedChunkStore:
+    """Deduplicating chunk store keyed by content hash.
+
+    Chunks are stored zlib-compressed under ``<root>/<digest[:2]>/<digest>``.
+    Writes go to a temporary file and are renamed into place, so concurrent
+    writers of the same chunk are safe and a chunk is either complete or
+    absent.
+    """
+    
+    def __init__(self, root: Path, algorithm: str = "sha256", compression_level: int = 6):
+        self.root = root
+        self.algorithm = algorithm
+        self.compression_level = compression_level
+        self.root.mkdir(parents=True, exist_ok=True)
+    
+    def digest(self, data: bytes) -> str:
+        """Content hash of a chunk."""
+        return hashlib.new(self.algorithm, data).hexdigest()
+    
+    def chunk_path(self, digest: str) -> Path:
+        """Path of a stored chunk."""
+        return self.root / digest[:2] / digest
+    
+    def contains(self, digest: str) -> bool:
+        """Check whether a chunk is stored."""
+        return self.chunk_path(digest).exists()
+    
+    def put(self, data: bytes) -> Tuple[str, bool]:
+        """Store a chunk unless an identical one is already stored.
+
+        Returns:
+            Tuple of (digest, whether the chunk was newly written)
+        """
+        digest = self.digest(data)
+        path = self.chunk_path(digest)
+        if path.exists():
+            return digest, False
+        
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp_")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(zlib.compress(data, self.compression_level))
+            os.replace(temp_name, path)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+        return digest, True
+    
+    def get(self, digest: str) -> bytes:
+        """Read and verify a chunk.
+
+        Raises:
+            ValueError: If the chunk is corrupted
+        """
+        data = zlib.decompress(self.chunk_path(digest).read_bytes())
+        if self.digest(data) != digest:
+            raise ValueError(f"Chunk {digest} is corrupted")
+        return data
+    
+    def iter_digests(self) -> Iterator[str]:
+        """Iterate over all stored chunk digests."""
+        for path in self.root.glob("??/*"):
+            if not path.name.startswith("."):
+                yield path.name
+    
+    def remove_unreferenced(self, referenced: Set[str]) -> int:
+        """Delete chunks no longer referenced by any backup.
+
+        Returns:
+            Number of chunks removed
+        """
+        removed = 0
+        for digest in list(self.iter_digests()):
+            if digest not in referenced:
+                self.chunk_path(digest).unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+
+class DeduplicatedBackupStrategy(FileSystemBackupStrategy):
+    """Incremental backups into a shared content-addressed chunk store.
+
+    Each backup is a small JSON manifest listing, per file, the digests of
+    its fixed-size chunks. Chunks already present from earlier backups are
+    not written again, so repeat backups of a mostly unchanged workspace
+    only store the changed chunks. LMDB snapshots are compacted, so
+    unchanged pages land at the same offsets and deduplicate well.
+    
+    Creating a backup and collecting unreferenced chunks hold the same
+    lock, so garbage collection never sees the chunks of a backup whose
+    manifest is not written yet.
+    """
+    
+    MANIFEST_FORMAT = "writeit-chunked-backup"
+    MANIFEST_VERSION = 1
+    
+    def __init__(
+        self,
+        environment_resolver: Optional[Callable[[Path], Optional["lmdb.Environment"]]] = None,
+    ):
+        super().__init__(environment_resolver)
+        self._chunk_lock = asyncio.Lock()
+    
+    def can_handle(self, backup_type: BackupType) -> bool:
+        """Handle incremental and differential backups."""
+        return backup_type in (BackupType.INCREMENTAL, BackupType.DIFFERENTIAL)
+    
+    def can_restore(self, backup_path: Path) -> bool:
+        """Read chunk manifests only."""
+        return backup_path.suffix == ".manifest"
+    
+    def backup_suffix(self, compression: CompressionType) -> str:
+        """Backups are stored as manifests."""
+        return "manifest"
+    
+    def chunk_store(self, config: BackupConfig) -> ContentAddressedChunkStore:
+        """Get the chunk store for a configuration."""
+        return ContentAddressedChunkStore(
+            config.chunk_store_path,
+            algorithm=config.checksum_algorithm,
+            compression_level=config.chunk_compression_level,
+        )
+    
+    async def create_backup(
+        self, 
+        source_path: Path, 
+        backup_path: Path, 
+        config: BackupConfig,
+        metadata: BackupMetadata
+    ) -> BackupResult:
+        """Create a deduplicated backup."""
+        async with self._chunk_lock:
+            return await self._create_backup(source_path, backup_path, config, metadata)
+    
+    async def _create_backup(
+        self,
+        source_path: Path,
+        backup_path: Path,
+        config: BackupConfig,
+        metadata: BackupMetadata
+    ) -> BackupResult:
+        start_time = datetime.now()
+        
+        try:
+            backup_path.parent.mkdir(parents=True, exist_ok=True)
+            store = self.chunk_store(config)
+            
+            with self._staging_directory(config) as staging_dir:
+                entries = await self._collect_entries(source_path, config, staging_dir)
+                
+                # Files are chunked in parallel on the worker pool
+                file_records = await asyncio.gather(*(
+                    self._run(config, self._store_file, source_file, arcname, store, config.chunk_size)
+                    for source_file, arcname in entries
+                ))
+            
+            manifest = {
+                "format": self.MANIFEST_FORMAT,
+                "version": self.MANIFEST_VERSION,
+                "algorithm": store.algorithm,
+                "chunk_size": config.chunk_size,
+                "chunk_store": os.path.relpath(store.root, backup_path.parent),
+                "files": [record for record, _ in file_records],
+            }
+            metadata.checksum = await self._run(config, self._write_manifest, manifest, backup_path, config.checksum_algorithm)
+            metadata.file_count = len(entries)
+            metadata.size_bytes = backup_path.stat().st_size
+            
+            chunk_count = sum(len(record["chunks"]) for record, _ in file_records)
+            written = [stats for _, stats in file_records]
+            
+            return BackupResult(
+                success=True,
+                backup_id=metadata.backup_id,
+                metadata=metadata,
+                backup_path=backup_path,
+                execution_time=datetime.now() - start_time,
+                statistics={
+                    "bytes_total": sum(record["size"] for record, _ in file_records),
+                    "chunks_total": chunk_count,
+                    "chunks_written": sum(chunks for chunks, _ in written),
+                    "bytes_written": sum(size for _, size in written),
+                },
+            )
+            
+        except Exception as e:
+            self.logger.error(f"Error creating deduplicated backup: {e}")
+            return BackupResult(
+                success=False,
+                backup_id=metadata.backup_id,
+                metadata=metadata,
+                backup_path=backup_path,
+                execution_time=datetime.now() - start_time,
+                error_details=str(e),
+            )
+    
+    def validate_backup(self, backup_path: Path, metadata: BackupMetadata) -> bool:
+        """Validate manifest checksum and chunk presence."""
+        try:
+            if not backup_path.is_file():
+                return False
+            
+            if metadata.checksum:
+                actual_checksum = self._calculate_file_checksum(backup_path, metadata.checksum.split(':')[0])
+                if actual_checksum != metadata.checksum:
+                    self.logger.warning(f"Manifest checksum mismatch: expected {metadata.checksum}, got {actual_checksum}")
+                    return False
+            
+            manifest = self._read_manifest(backup_path)
+            chunk_root = backup_path.parent / manifest["chunk_store"]
+            missing = [
+                digest
+                for record in manifest["files"]
+                for digest in record["chunks"]
+                if not (chunk_root / digest[:2] / digest).exists()
+            ]
+            if missing:
+                self.logger.warning(f"Backup {backup_path.name} is missing {len(missing)} chunks")
+                return False
+            
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Error validating backup: {e}")
+            return False
+    
+    async def release_backup(self, backup_path: Path, config: BackupConfig) -> None:
+        """Remove chunks no longer referenced by any remaining manifest."""
+        async with self._chunk_lock:
+            removed = await self._run(config, self._collect_garbage, config)
+        if removed:
+            self.logger.info(f"Removed {removed} unreferenced backup chunks")
+    
+    async def _extract_backup(self, backup_path: Path, target_path: Path, config: BackupConfig) -> None:
+        """Reassemble files from the chunk store."""
+        manifest = self._read_manifest(backup_path)
+        store = ContentAddressedChunkStore(
+            backup_path.parent / manifest["chunk_store"], algorithm=manifest["algorithm"]
+        )
+        await asyncio.gather(*(
+            self._run(config, self._restore_file, record, target_path, store)
+            for record in manifest["files"]
+        ))
+    
+    def _store_file(
+        self,
+        source_file: Path,
+        arcname: str,
+        store: ContentAddressedChunkStore,
+        chunk_size: int
+    ) -> Tuple[Dict[str, Any], Tuple[int, int]]:
+        """Chunk a file into the store (runs on the worker pool).
+
+        Returns:
+            Tuple of (manifest record, (chunks written, bytes written))
+        """
+        digests = []
+        size = 0
+        chunks_written = 0
+        bytes_written = 0
+        
+        with open(source_file, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                digest, is_new = store.put(chunk)
+                digests.append(digest)
+                size += len(chunk)
+                if is_new:
+                    chunks_written += 1
+                    bytes_written += len(chunk)
+        
+        record = {
+            "path": arcname,
+            "size": size,
+            "mode": stat.S_IMODE(source_file.stat().st_mode),
+            "chunks": digests,
+        }
+        return record, (chunks_written, bytes_written)
+    
+    def _restore_file(self, record: Dict[str, Any], target_path: Path, store: ContentAddressedChunkStore) -> None:
+        """Reassemble one file (runs on the worker pool)."""
+        destination = target_path / record["path"]
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        
+        with open(destination, 'wb') as f:
+            for digest in record["chunks"]:
+                f.write(store.get(digest))
+        os.chmod(destination, record.get("mode", 0o644))
+    
+    def _write_manifest(self, manifest: Dict[str, Any], backup_path: Path, algorithm: str) -> str:
+        """Write the manifest atomically, checksumming it as it is written."""
+        temp_path = backup_path.with_name(f".{backup_path.name}.tmp")
+        with open(temp_path, 'wb') as f:
+            writer = HashingWriter(f, algorithm)
+            writer.write(json.dumps(manifest, separators=(",", ":")).encode("utf-8"))
+        os.replace(temp_path, backup_path)
+        return writer.checksum
+    
+    def _read_manifest(self, backup_path: Path) -> Dict[str, Any]:
+        """Read and check a backup manifest."""
+        with open(backup_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get("format") != self.MANIFEST_FORMAT:
+            raise ValueError(f"Not a chunked backup manifest: {backup_path}")
+        return manifest
+    
+    def _collect_garbage(self, config: BackupConfig) -> int:
+        """Delete chunks not referenced by any manifest in the backup root."""
+        referenced: Set[str] = set()
+        for manifest_path in config.backup_root_path.glob("*.manifest"):
+            try:
+                manifest = self._read_manifest(manifest_path)
+            except (OSError, ValueError) as e:
+                # Keep every chunk if a manifest cannot be read
+                self.logger.warning(f"Skipping chunk cleanup, unreadable manifest {manifest_path}: {e}")
+                return 0
+            for record in manifest["files"]:
+                referenced.update(record["chunks"])
+        
+        return self.chunk_store(config).remove_unreferenced(referenced)
+
+
 class BackupManager:
     """Manager for backup and rollback operations."""
     
-    def __init__(self, config: BackupConfig):
+    def __init__(
+        self,
+        config: BackupConfig,
+        environment_resolver: Optional[Callable[[Path], Optional["lmdb.Environment"]]] = None,
+    ):
         self.config = config
+        self.environment_resolver = environment_resolver
         self.strategies: List[BackupStrategy] = []
         self.logger = logging.getLogger(__name__)
         
@@ -501,13 +1078,18 @@ class BackupManager:
         
         try:
             # Generate backup ID
-            backup_id = f"{backup_type.value}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            backup_id = f"{backup_type.value}_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
             
             # Determine compression
             actual_compression = compression or self.config.compression
             
+            # Find appropriate strategy
+            strategy = self._find_strategy(backup_type)
+            if not strategy:
+                raise ValueError(f"No strategy found for backup type: {backup_type}")
+            
             # Create backup path
-            backup_filename = f"{backup_id}.{actual_compression.value if actual_compression != CompressionType.NONE else 'bak'}"
+            backup_filename = f"{backup_id}.{strategy.backup_suffix(actual_compression)}"
             backup_path = self.config.backup_root_path / backup_filename
             
             # Create metadata
@@ -528,16 +1110,12 @@ class BackupManager:
                 expiration_date=start_time + timedelta(days=self.config.retention_days),
             )
             
-            # Find appropriate strategy
-            strategy = self._find_strategy(backup_type)
-            if not strategy:
-                raise ValueError(f"No strategy found for backup type: {backup_type}")
-            
             # Create backup
             result = await strategy.create_backup(source_path, backup_path, self.config, metadata)
             
-            # Update metadata with actual size and checksum
-            if result.success and backup_path.exists():
+            # Strategies checksum while writing; only fall back to re-reading
+            # the backup for strategies that do not fill in the metadata
+            if result.success and backup_path.exists() and not metadata.checksum:
                 metadata.size_bytes = backup_path.stat().st_size
                 metadata.checksum = await strategy._calculate_checksum(backup_path, self.config.checksum_algorithm) if hasattr(strategy, '_calculate_checksum') else ""
                 
@@ -552,7 +1130,7 @@ class BackupManager:
                     metadata.file_count = len(list(backup_path.rglob('*'))) if backup_path.is_dir() else 1
             
             # Save metadata
-            metadata_path = backup_path.with_suffix('.meta')
+            metadata_path = self._metadata_path(backup_id)
             with open(metadata_path, 'w') as f:
                 json.dump(metadata.to_dict(), f, indent=2)
             
@@ -589,10 +1167,10 @@ class BackupManager:
             
             backup_path, metadata = backup_info
             
-            # Find appropriate strategy
-            backup_strategy = self._find_strategy(metadata.backup_type)
+            # The backup's on-disk format decides which strategy reads it
+            backup_strategy = self._find_restore_strategy(backup_path)
             if not backup_strategy:
-                raise ValueError(f"No strategy found for backup type: {metadata.backup_type}")
+                raise ValueError(f"No strategy can restore backup: {backup_path}")
             
             # Validate backup before restore
             if not backup_strategy.validate_backup(backup_path, metadata):
@@ -637,14 +1215,7 @@ class BackupManager:
                             continue
                         
                         # Check if backup file exists
-                        backup_file_path = backup_file.with_suffix('')
-                        compressed_extensions = ['.zip', '.tar', '.gz', '.bz2', '.xz']
-                        for ext in compressed_extensions:
-                            if backup_file.with_suffix(ext).exists():
-                                backup_file_path = backup_file.with_suffix(ext)
-                                break
-                        
-                        if not backup_file_path.exists():
+                        if not metadata.backup_path.exists():
                             continue
                         
                         backups.append(metadata)
@@ -679,10 +1250,15 @@ class BackupManager:
                     backup_path.unlink()
             
             # Delete metadata file
-            metadata_path = backup_path.with_suffix('.meta')
+            metadata_path = self._metadata_path(backup_id)
             if metadata_path.exists():
                 metadata_path.unlink()
             
+            # Release storage shared with other backups
+            strategy = self._find_restore_strategy(backup_path)
+            if strategy:
+                await strategy.release_backup(backup_path, self.config)
+            
             self.logger.info(f"Backup deleted: {backup_id}")
             return True
             
@@ -700,8 +1276,7 @@ class BackupManager:
             
             backup_path, metadata = backup_info
             
-            # Find appropriate strategy
-            strategy = self._find_strategy(metadata.backup_type)
+            strategy = self._find_restore_strategy(backup_path)
             if not strategy:
                 return False
             
@@ -711,9 +1286,20 @@ class BackupManager:
             self.logger.error(f"Error validating backup {backup_id}: {e}")
             return False
     
+    def close(self) -> None:
+        """Shut down strategy worker pools."""
+        for strategy in self.strategies:
+            if isinstance(strategy, FileSystemBackupStrategy):
+                strategy.shutdown()
+    
     def _register_default_strategies(self) -> None:
         """Register default backup strategies."""
-        self.register_strategy(FileSystemBackupStrategy())
+        self.register_strategy(DeduplicatedBackupStrategy(self.environment_resolver))
+        self.register_strategy(FileSystemBackupStrategy(self.environment_resolver))
+    
+    def _metadata_path(self, backup_id: str) -> Path:
+        """Path of a backup's metadata file."""
+        return self.config.backup_root_path / f"{backup_id}.meta"
     
     def _find_strategy(self, backup_type: BackupType) -> Optional[BackupStrategy]:
         """Find strategy for backup type."""
@@ -722,6 +1308,13 @@ class BackupManager:
                 return strategy
         return None
     
+    def _find_restore_strategy(self, backup_path: Path) -> Optional[BackupStrategy]:
+        """Find strategy that reads a backup's on-disk format."""
+        for strategy in self.strategies:
+            if strategy.can_restore(backup_path):
+                return strategy
+        return None
+    
     async def _find_backup(self, backup_id: str) -> Optional[Tuple[Path, BackupMetadata]]:
         """Find backup by ID."""
         # Look for metadata file
@@ -738,15 +1331,7 @@ class BackupManager:
                 metadata_dict = json.load(f)
                 metadata = BackupMetadata.from_dict(metadata_dict)
             
-            # Find backup file
-            backup_path = metadata_file.with_suffix('')
-            compressed_extensions = ['.zip', '.tar', '.gz', '.bz2', '.xz']
-            for ext in compressed_extensions:
-                if metadata_file.with_suffix(ext).exists():
-                    backup_path = metadata_file.with_suffix(ext)
-                    break
-            
-            return backup_path, metadata
+            return metadata.backup_path, metadata
             
         except Exception as e:
             self.logger.error(f"Error reading backup metadata for {backup_id}: {e}")
@@ -776,8 +1361,17 @@ class BackupManager:
 
 
 # Factory function for creating backup manager
-def create_backup_manager(backup_root_path: Path) -> BackupManager:
-    """Create backup manager with default configuration."""
+def create_backup_manager(
+    backup_root_path: Path,
+    environment_resolver: Optional[Callable[[Path], Optional["lmdb.Environment"]]] = find_open_environment,
+) -> BackupManager:
+    """Create backup manager with default configuration.
+
+    Args:
+        backup_root_path: Directory holding backups
+        environment_resolver: Returns the environment this process already
+            has open for a path (defaults to the shared environment registry)
+    """
     config = BackupConfig(
         backup_root_path=backup_root_path,
         compression=CompressionType.TAR_GZ,
@@ -785,4 +1379,4 @@ def create_backup_manager(backup_root_path: Path) -> BackupManager:
         max_backups=10,
     )
     
-    return BackupManager(config)
\ No newline at end of file
+    return BackupManager(config, environment_resolver=environment_resolver)
\ No newline at end of file
@@ -13,7 +13,9 @@ from typing import Dict, List, Optional, Any, Set, AsyncIterator
 from dataclasses import dataclass
 from datetime import datetime
 from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler, FileModifiedEvent, FileCreatedEvent, FileDeletedEvent
+from watchdog.events import (
+    FileSystemEventHandler, FileModifiedEvent, FileCreatedEvent, FileDeletedEvent, FileMovedEvent
+)
 import logging
 from contextlib import asynccontextmanager
 from tempfile import NamedTemporaryFile
@@ -26,19 +28,31 @@ from ..base.exceptions import StorageError, ValidationError, ConfigurationError
 logger = logging.getLogger(__name__)
 
 
+MANIFEST_FILENAME = ".file_manifest.json"
+MANIFEST_VERSION = 1
+HASH_BUFFER_SIZE = 1024 * 1024
+
+
 @dataclass
 class FileMetadata:
-    """Metadata for tracked files."""
+    """Metadata for tracked files.
+
+    ``content_hash`` is computed lazily; an empty hash means the file has
+    not been hashed since it last changed. ``inode``, ``size`` and
+    ``mtime_ns`` identify the file version a hash belongs to.
+    """
     
     path: Path
     size: int
     modified_time: datetime
     content_hash: str
     is_directory: bool = False
+    inode: int = 0
+    mtime_ns: int = 0
     
     @classmethod
     def from_path(cls, path: Path) -> 'FileMetadata':
-        """Create metadata from file path.
+        """Create metadata from file path, hashing file content.
         
         Args:
             path: File path to analyze
@@ -47,26 +61,50 @@ class FileMetadata:
             FileMetadata instance
         """
         stat = path.stat()
-        modified_time = datetime.fromtimestamp(stat.st_mtime)
         
         if path.is_file():
-            content_hash = cls._calculate_hash(path)
-            return cls(
-                path=path,
-                size=stat.st_size,
-                modified_time=modified_time,
-                content_hash=content_hash,
-                is_directory=False
-            )
+            return cls.from_stat(path, stat, cls._calculate_hash(path))
         else:
             return cls(
                 path=path,
                 size=0,
-                modified_time=modified_time,
+                modified_time=datetime.fromtimestamp(stat.st_mtime),
                 content_hash="",
-                is_directory=True
+                is_directory=True,
+                inode=stat.st_ino,
+                mtime_ns=stat.st_mtime_ns
             )
     
+    @classmethod
+    def from_stat(cls, path: Path, stat: os.stat_result, content_hash: str = "") -> 'FileMetadata':
+        """Create file metadata from a stat result without reading the file.
+        
+        Args:
+            path: File path
+            stat: Result of stat() for the path
+            content_hash: Known content hash, if any
+            
+        Returns:
+            FileMetadata instance
+        """
+        return cls(
+            path=path,
+            size=stat.st_size,
+            modified_time=datetime.fromtimestamp(stat.st_mtime),
+            content_hash=content_hash,
+            is_directory=False,
+            inode=stat.st_ino,
+            mtime_ns=stat.st_mtime_ns
+        )
+    
+    def matches(self, stat: os.stat_result) -> bool:
+        """Check whether a stat result describes the same file version."""
+        return (
+            self.inode == stat.st_ino
+            and self.size == stat.st_size
+            and self.mtime_ns == stat.st_mtime_ns
+        )
+    
     @staticmethod
     def _calculate_hash(path: Path) -> str:
         """Calculate SHA256 hash of file content.
@@ -79,13 +117,17 @@ class FileMetadata:
         """
         hash_sha256 = hashlib.sha256()
         with open(path, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b""):
+            for chunk in iter(lambda: f.read(HASH_BUFFER_SIZE), b""):
                 hash_sha256.update(chunk)
         return hash_sha256.hexdigest()
 
 
 class FileChangeHandler(FileSystemEventHandler):
-    """File system event handler for change detection."""
+    """File system event handler for change detection.
+
+    Watchdog delivers events on its own thread; they are handed to the
+    storage's event loop, where they are debounced and coalesced.
+    """
     
     def __init__(self, storage: 'FileSystemStorage'):
         """Initialize handler.
@@ -99,17 +141,23 @@ class FileChangeHandler(FileSystemEventHandler):
     def on_modified(self, event: FileModifiedEvent) -> None:
         """Handle file modification events."""
         if not event.is_directory:
-            asyncio.create_task(self.storage._on_file_changed(Path(event.src_path), 'modified'))
+            self.storage.notify_change(Path(event.src_path), 'modified')
     
     def on_created(self, event: FileCreatedEvent) -> None:
         """Handle file creation events."""
         if not event.is_directory:
-            asyncio.create_task(self.storage._on_file_changed(Path(event.src_path), 'created'))
+            self.storage.notify_change(Path(event.src_path), 'created')
     
     def on_deleted(self, event: FileDeletedEvent) -> None:
         """Handle file deletion events."""
         if not event.is_directory:
-            asyncio.create_task(self.storage._on_file_changed(Path(event.src_path), 'deleted'))
+            self.storage.notify_change(Path(event.src_path), 'deleted')
+    
+    def on_moved(self, event: FileMovedEvent) -> None:
+        """Handle file move events (e.g. atomic writes)."""
+        if not event.is_directory:
+            self.storage.notify_change(Path(event.src_path), 'deleted')
+            self.storage.notify_change(Path(event.dest_path), 'modified')
 
 
 class FileSystemStorage:
@@ -117,6 +165,11 @@ class FileSystemStorage:
     
     Provides high-level file operations with atomic writes, backup support,
     change detection, and workspace isolation.
+    
+    File metadata is tracked from stat() alone and persisted to a manifest
+    keyed by (inode, size, mtime_ns), so unchanged files are never rehashed
+    across restarts. Content hashes are computed on demand with bounded
+    parallelism.
     """
     
     def __init__(
@@ -124,7 +177,10 @@ class FileSystemStorage:
         base_path: Path,
         enable_watching: bool = True,
         backup_enabled: bool = True,
-        max_backups: int = 5
+        max_backups: int = 5,
+        manifest_path: Optional[Path] = None,
+        hash_workers: int = 4,
+        debounce_seconds: float = 0.2
     ):
         """Initialize file system storage.
         
@@ -133,17 +189,32 @@ class FileSystemStorage:
             enable_watching: Whether to enable file change detection
             backup_enabled: Whether to create backups on overwrites
             max_backups: Maximum number of backup files to keep
+            manifest_path: Where to persist file metadata (defaults to a
+                hidden file in the base directory)
+            hash_workers: Maximum number of files hashed concurrently
+            debounce_seconds: Quiet period before watcher events are processed
         """
         self.base_path = base_path
         self.enable_watching = enable_watching
         self.backup_enabled = backup_enabled
         self.max_backups = max_backups
+        self.manifest_path = manifest_path or base_path / MANIFEST_FILENAME
+        self.debounce_seconds = debounce_seconds
         
         self._file_metadata: Dict[Path, FileMetadata] = {}
         self._change_callbacks: List[callable] = []
         self._observer: Optional[Observer] = None
-        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="file_storage")
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(4, hash_workers), thread_name_prefix="file_storage"
+        )
+        self._hash_semaphore = asyncio.Semaphore(hash_workers)
+        self._hash_tasks: Dict[Path, asyncio.Future] = {}
         self._lock = asyncio.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending_changes: Dict[Path, str] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._manifest_dirty = False
+        self._stats = {'manifest_hits': 0, 'files_hashed': 0, 'events_coalesced': 0}
         
         logger.info(f"Initialized file system storage at {base_path}")
     
@@ -156,9 +227,11 @@ class FileSystemStorage:
         try:
             # Ensure base directory exists
             self.base_path.mkdir(parents=True, exist_ok=True)
+            self._loop = asyncio.get_running_loop()
             
-            # Scan existing files
+            # Scan existing files, reusing hashes from the manifest
             await self._scan_directory(self.base_path)
+            await self.save_manifest()
             
             # Start file watching
             if self.enable_watching:
@@ -176,20 +249,188 @@ class FileSystemStorage:
     async def _scan_directory(self, directory: Path) -> None:
         """Recursively scan directory for files.
         
+        Only stat() is called per file; hashes recorded in the manifest are
+        reused when (inode, size, mtime_ns) still match, all other hashes are
+        left to be computed on demand.
+        
         Args:
             directory: Directory to scan
         """
         try:
-            for item in directory.rglob('*'):
-                if item.is_file():
-                    metadata = await asyncio.get_event_loop().run_in_executor(
-                        self._executor, FileMetadata.from_path, item
-                    )
-                    self._file_metadata[item] = metadata
+            manifest = await self._run(self._load_manifest)
+            scanned = await self._run(self._stat_tree, directory)
+            
+            for path, stat in scanned:
+                known = manifest.get(path)
+                if known is not None and known.matches(stat):
+                    self._file_metadata[path] = known
+                    self._stats['manifest_hits'] += 1
+                else:
+                    self._file_metadata[path] = FileMetadata.from_stat(path, stat)
+                    self._manifest_dirty = True
+            
+            if len(manifest) != self._stats['manifest_hits']:
+                self._manifest_dirty = True
                     
         except Exception as e:
             logger.warning(f"Failed to scan directory {directory}: {e}")
     
+    def _stat_tree(self, directory: Path) -> List[tuple]:
+        """Walk a directory collecting (path, stat) for regular files."""
+        results = []
+        pending = [str(directory)]
+        
+        while pending:
+            current = pending.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.is_file():
+                            path = Path(entry.path)
+                            if not self._is_internal_file(path):
+                                results.append((path, entry.stat()))
+            except OSError as e:
+                logger.warning(f"Failed to scan directory {current}: {e}")
+        
+        return results
+    
+    def _is_internal_file(self, path: Path) -> bool:
+        """Check whether a path is storage bookkeeping rather than content."""
+        return (
+            path.parent == self.manifest_path.parent
+            and path.name.startswith(self.manifest_path.name)
+        )
+    
+    def _load_manifest(self) -> Dict[Path, FileMetadata]:
+        """Load persisted file metadata."""
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable file manifest {self.manifest_path}: {e}")
+            return {}
+        
+        if data.get('version') != MANIFEST_VERSION:
+            return {}
+        
+        manifest = {}
+        for relative, (inode, size, mtime_ns, content_hash) in data.get('files', {}).items():
+            path = self.base_path / relative
+            manifest[path] = FileMetadata(
+                path=path,
+                size=size,
+                modified_time=datetime.fromtimestamp(mtime_ns / 1e9),
+                content_hash=content_hash,
+                inode=inode,
+                mtime_ns=mtime_ns
+            )
+        return manifest
+    
+    def _write_manifest(self, files: Dict[str, list]) -> None:
+        """Atomically write the manifest file."""
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.manifest_path.with_name(f"{self.manifest_path.name}.tmp")
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': MANIFEST_VERSION, 'files': files}, f, separators=(',', ':'))
+        os.replace(temp_path, self.manifest_path)
+    
+    async def save_manifest(self) -> None:
+        """Persist tracked file metadata if it changed since the last save."""
+        if not self._manifest_dirty:
+            return
+        
+        files = {}
+        for path, metadata in self._file_metadata.items():
+            try:
+                relative = path.relative_to(self.base_path).as_posix()
+            except ValueError:
+                continue
+            files[relative] = [metadata.inode, metadata.size, metadata.mtime_ns, metadata.content_hash]
+        
+        self._manifest_dirty = False
+        try:
+            await self._run(self._write_manifest, files)
+        except Exception as e:
+            self._manifest_dirty = True
+            logger.warning(f"Failed to save file manifest {self.manifest_path}: {e}")
+    
+    async def get_content_hash(self, file_path: Path) -> str:
+        """Get the content hash of a file, hashing it only if it changed.
+        
+        Args:
+            file_path: File path
+            
+        Returns:
+            Hex digest of the file's SHA256 hash
+            
+        Raises:
+            StorageError: If the file cannot be read
+        """
+        absolute_path = self._resolve_path(file_path)
+        
+        try:
+            stat = await self._run(absolute_path.stat)
+        except OSError as e:
+            raise StorageError(
+                f"Failed to hash file {file_path}: {e}",
+                operation="hash",
+                cause=e
+            )
+        
+        metadata = self._file_metadata.get(absolute_path)
+        if metadata is not None and metadata.content_hash and metadata.matches(stat):
+            return metadata.content_hash
+        
+        # Share one hashing task between concurrent callers
+        task = self._hash_tasks.get(absolute_path)
+        if task is None:
+            task = asyncio.ensure_future(self._hash_file(absolute_path, stat))
+            self._hash_tasks[absolute_path] = task
+            task.add_done_callback(lambda _: self._hash_tasks.pop(absolute_path, None))
+        return await task
+    
+    async def compute_hashes(self, file_paths: Optional[List[Path]] = None) -> Dict[Path, str]:
+        """Hash files in parallel, skipping files whose hash is current.
+        
+        Args:
+            file_paths: Files to hash (defaults to all tracked files)
+            
+        Returns:
+            Mapping of absolute path to content hash
+        """
+        paths = (
+            [self._resolve_path(path) for path in file_paths]
+            if file_paths is not None else list(self._file_metadata)
+        )
+        hashes = await asyncio.gather(*(self.get_content_hash(path) for path in paths))
+        await self.save_manifest()
+        return dict(zip(paths, hashes))
+    
+    async def _hash_file(self, path: Path, stat: os.stat_result) -> str:
+        """Hash a file on the executor, bounded by the hashing semaphore."""
+        async with self._hash_semaphore:
+            try:
+                content_hash = await self._run(FileMetadata._calculate_hash, path)
+            except OSError as e:
+                raise StorageError(
+                    f"Failed to hash file {path}: {e}",
+                    operation="hash",
+                    cause=e
+                )
+        
+        self._file_metadata[path] = FileMetadata.from_stat(path, stat, content_hash)
+        self._manifest_dirty = True
+        self._stats['files_hashed'] += 1
+        return content_hash
+    
+    async def _run(self, func, *args):
+        """Run blocking work on the storage executor."""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+    
     async def _start_watching(self) -> None:
         """Start file system watching."""
         try:
@@ -203,9 +444,48 @@ class FileSystemStorage:
             logger.warning(f"Failed to start file watching: {e}")
             self._observer = None
     
+    def notify_change(self, path: Path, event_type: str) -> None:
+        """Record a file change; safe to call from any thread.
+        
+        Changes are coalesced per path and processed once no further events
+        arrived for ``debounce_seconds``.
+        
+        Args:
+            path: Path of changed file
+            event_type: Type of change (created, modified, deleted)
+        """
+        if self._loop is None or self._loop.is_closed() or self._is_internal_file(path):
+            return
+        self._loop.call_soon_threadsafe(self._queue_change, path, event_type)
+    
+    def _queue_change(self, path: Path, event_type: str) -> None:
+        """Coalesce a change and (re)arm the debounce timer."""
+        previous = self._pending_changes.get(path)
+        if previous is not None:
+            self._stats['events_coalesced'] += 1
+            if previous == 'created' and event_type == 'modified':
+                event_type = 'created'
+            elif previous == 'deleted' and event_type != 'deleted':
+                event_type = 'modified'
+        self._pending_changes[path] = event_type
+        
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+        self._flush_handle = self._loop.call_later(self.debounce_seconds, self._flush_changes)
+    
+    def _flush_changes(self) -> None:
+        """Process coalesced changes."""
+        self._flush_handle = None
+        changes, self._pending_changes = self._pending_changes, {}
+        for path, event_type in changes.items():
+            self._loop.create_task(self._on_file_changed(path, event_type))
+    
     async def _on_file_changed(self, path: Path, event_type: str) -> None:
         """Handle file change events.
         
+        The file is only stat()ed here; its hash is recomputed lazily the
+        next time it is requested.
+        
         Args:
             path: Path of changed file
             event_type: Type of change (created, modified, deleted)
@@ -213,12 +493,17 @@ class FileSystemStorage:
         async with self._lock:
             if event_type == 'deleted':
                 self._file_metadata.pop(path, None)
+                self._manifest_dirty = True
             else:
                 try:
-                    metadata = await asyncio.get_event_loop().run_in_executor(
-                        self._executor, FileMetadata.from_path, path
-                    )
-                    self._file_metadata[path] = metadata
+                    stat = await self._run(path.stat)
+                    known = self._file_metadata.get(path)
+                    if known is None or not known.matches(stat):
+                        self._file_metadata[path] = FileMetadata.from_stat(path, stat)
+                        self._manifest_dirty = True
+                except FileNotFoundError:
+                    self._file_metadata.pop(path, None)
+                    self._manifest_dirty = True
                 except Exception as e:
                     logger.warning(f"Failed to update metadata for {path}: {e}")
             
@@ -417,7 +702,7 @@ class FileSystemStorage:
             files = [
                 path.relative_to(self.base_path)
                 for path in matches
-                if path.is_file()
+                if path.is_file() and not self._is_internal_file(path)
             ]
             
             return files
@@ -707,6 +992,8 @@ class FileSystemStorage:
             'backup_enabled': self.backup_enabled,
             'max_backups': self.max_backups,
             'change_callbacks': len(self._change_callbacks),
+            'hashed_files': sum(1 for metadata in self._file_metadata.values() if metadata.content_hash),
+            **self._stats,
         }
     
     async def close(self) -> None:
@@ -719,6 +1006,15 @@ class FileSystemStorage:
             self._observer.join(timeout=5)
             self._observer = None
         
+        # Apply pending changes and persist metadata
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        for path, event_type in list(self._pending_changes.items()):
+            await self._on_file_changed(path, event_type)
+        self._pending_changes.clear()
+        await self.save_manifest()
+        
         # Shutdown executor
         self._executor.shutdown(wait=True)
         
@@ -2,16 +2,26 @@
 
 Provides high-level LMDB storage operations with transaction management,
 connection pooling, schema versioning, and performance optimization.
+
+Writes follow the durability profile of their database:
+
+- ``strict``: each write is its own transaction, synced before returning
+- ``group_commit``: writes are coalesced by a ``WriteCoalescer`` into one
+  transaction and one sync per batch
+- ``relaxed``: coalesced like ``group_commit`` but not synced; the
+  environment is synced periodically, so a crash can lose the last
+  ``relaxed_sync_interval_seconds`` of writes (meant for caches)
 """
 
 import lmdb
 import asyncio
 import logging
 from pathlib import Path
-from typing import Optional, Dict, Any, List, AsyncContextManager, TypeVar, Type
+from typing import Optional, Dict, Any, List, AsyncContextManager, TypeVar, Type, Union
 from contextlib import asynccontextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from enum import Enum
 from threading import RLock
 from weakref import WeakValueDictionary
 
@@ -22,6 +32,14 @@ logger = logging.getLogger(__name__)
 T = TypeVar('T')
 
 
+class DurabilityProfile(str, Enum):
+    """How writes to a database are made durable."""
+    
+    STRICT = "strict"  # One synced transaction per write
+    GROUP_COMMIT = "group_commit"  # Coalesced writes, one sync per batch
+    RELAXED = "relaxed"  # Coalesced writes, periodic sync
+
+
 @dataclass
 class StorageConfig:
     """Configuration for LMDB storage."""
@@ -32,11 +50,39 @@ class StorageConfig:
     sync: bool = True  # Sync writes to disk
     metasync: bool = True  # Sync metadata to disk
     readonly: bool = False  # Read-only mode
+    durability: DurabilityProfile = DurabilityProfile.STRICT  # Profile of databases not listed below
+    database_durability: Dict[str, DurabilityProfile] = field(
+        default_factory=lambda: {
+            "pipeline_runs": DurabilityProfile.GROUP_COMMIT,
+            "step_executions": DurabilityProfile.GROUP_COMMIT,
+            "token_usage": DurabilityProfile.GROUP_COMMIT,
+            "cache": DurabilityProfile.RELAXED,
+        }
+    )
+    group_commit_window_ms: float = 2.0  # Time writes wait to join a batch
+    group_commit_max_batch: int = 256  # Most writes committed in one transaction
+    relaxed_sync_interval_seconds: float = 1.0  # Sync period of relaxed databases
     
     @property
     def map_size_bytes(self) -> int:
         """Get map size in bytes."""
         return self.map_size_mb * 1024 * 1024
+    
+    def durability_for(self, db_name: str) -> DurabilityProfile:
+        """Get the durability profile of a database."""
+        return DurabilityProfile(self.database_durability.get(db_name, self.durability))
+    
+    @property
+    def env_sync(self) -> bool:
+        """Whether LMDB itself syncs every commit.
+        
+        Only when all databases are strict; otherwise syncs are issued
+        explicitly according to each database's profile.
+        """
+        return self.sync and self.durability == DurabilityProfile.STRICT and all(
+            DurabilityProfile(profile) == DurabilityProfile.STRICT
+            for profile in self.database_durability.values()
+        )
 
 
 @dataclass
@@ -136,7 +182,7 @@ class ConnectionPool:
             str(self.storage_path),
             map_size=self.config.map_size_bytes,
             max_dbs=self.config.max_dbs,
-            sync=self.config.sync,
+            sync=self.config.env_sync,
             metasync=self.config.metasync,
             readonly=self.config.readonly
         )
@@ -169,6 +215,173 @@ class ConnectionPool:
             }
 
 
+@dataclass
+class _PendingWrite:
+    db_name: str
+    key: bytes
+    value: Optional[bytes]  # None deletes the key
+    future: "asyncio.Future[bool]"
+
+
+@dataclass
+class WriteCoalescingStats:
+    """Statistics for coalesced writes."""
+    
+    writes: int = 0
+    batches: int = 0
+    syncs: int = 0
+    max_batch_size: int = 0
+
+
+class WriteCoalescer:
+    """Batches concurrent writes into shared LMDB transactions.
+    
+    Callers enqueue puts and deletes and await their outcome; a single
+    writer task collects everything enqueued within the group commit
+    window and applies it in one transaction. Batches touching a
+    ``group_commit`` database are synced once; batches touching only
+    ``relaxed`` databases are left to a periodic sync.
+    
+    The writer runs on the event loop rather than a thread: the connection
+    pool would otherwise open a second environment on the same path while
+    the loop holds one, which LMDB does not support within a process.
+    """
+    
+    def __init__(self, pool: ConnectionPool, config: StorageConfig, stats: TransactionStats):
+        """Initialize coalescer.
+        
+        Args:
+            pool: Connection pool of the storage
+            config: Storage configuration
+            stats: Transaction statistics of the storage
+        """
+        self._pool = pool
+        self._config = config
+        self._transaction_stats = stats
+        self._pending: List[_PendingWrite] = []
+        self._writer: Optional[asyncio.Task] = None
+        self._syncer: Optional[asyncio.Task] = None
+        self._dirty = False
+        self._stats = WriteCoalescingStats()
+    
+    async def put(self, db_name: str, key: bytes, value: bytes) -> None:
+        """Write a value once its batch is committed."""
+        await self._enqueue(db_name, key, value)
+    
+    async def delete(self, db_name: str, key: bytes) -> bool:
+        """Delete a key once its batch is committed.
+        
+        Returns:
+            True if the key existed
+        """
+        return await self._enqueue(db_name, key, None)
+    
+    async def flush(self) -> None:
+        """Wait for pending writes and sync relaxed databases."""
+        while self._writer is not None and not self._writer.done():
+            await asyncio.shield(self._writer)
+        if self._dirty:
+            self._sync()
+    
+    async def close(self) -> None:
+        """Flush pending writes and stop background tasks."""
+        await self.flush()
+        if self._syncer is not None:
+            self._syncer.cancel()
+            self._syncer = None
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get write coalescing statistics."""
+        stats = self._stats
+        return {
+            'writes': stats.writes,
+            'batches': stats.batches,
+            'avg_batch_size': stats.writes / stats.batches if stats.batches else 0.0,
+            'max_batch_size': stats.max_batch_size,
+            'syncs': stats.syncs,
+            'pending': len(self._pending),
+        }
+    
+    async def _enqueue(self, db_name: str, key: bytes, value: Optional[bytes]) -> bool:
+        loop = asyncio.get_running_loop()
+        write = _PendingWrite(db_name, key, value, loop.create_future())
+        self._pending.append(write)
+        if self._writer is None or self._writer.done():
+            self._writer = loop.create_task(self._drain())
+        return await write.future
+    
+    async def _drain(self) -> None:
+        while self._pending:
+            # Let concurrent writers join the batch
+            await asyncio.sleep(self._config.group_commit_window_ms / 1000)
+            batch = self._pending[:self._config.group_commit_max_batch]
+            del self._pending[:len(batch)]
+            try:
+                results = self._write_batch(batch)
+            except Exception as e:
+                logger.error(f"Coalesced write of {len(batch)} operations failed: {e}")
+                results = [e] * len(batch)
+            for write, result in zip(batch, results):
+                if write.future.done():
+                    continue
+                if isinstance(result, Exception):
+                    write.future.set_exception(result)
+                else:
+                    write.future.set_result(result)
+            if self._dirty and self._syncer is None:
+                self._syncer = asyncio.get_running_loop().create_task(self._sync_periodically())
+    
+    def _write_batch(self, batch: List[_PendingWrite]) -> List[Union[bool, Exception]]:
+        results: List[Union[bool, Exception]] = []
+        env = self._pool.get_environment()
+        try:
+            max_key_size = env.max_key_size()
+            with env.begin(write=True) as txn:
+                for write in batch:
+                    if not 0 < len(write.key) <= max_key_size:
+                        results.append(ValueError(f"Invalid key length {len(write.key)}"))
+                        continue
+                    db = env.open_db(write.db_name.encode(), txn=txn)
+                    if write.value is None:
+                        results.append(txn.delete(write.key, db=db))
+                    else:
+                        results.append(txn.put(write.key, write.value, db=db))
+            
+            self._transaction_stats.total_transactions += 1
+            self._transaction_stats.committed_transactions += 1
+            self._stats.writes += len(batch)
+            self._stats.batches += 1
+            self._stats.max_batch_size = max(self._stats.max_batch_size, len(batch))
+            
+            profiles = {self._config.durability_for(write.db_name) for write in batch}
+            if DurabilityProfile.RELAXED in profiles:
+                self._dirty = True
+            if self._config.sync and profiles - {DurabilityProfile.RELAXED}:
+                self._sync(env)
+        finally:
+            self._pool.return_environment(env)
+        return results
+    
+    async def _sync_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self._config.relaxed_sync_interval_seconds)
+            if self._dirty:
+                self._sync()
+    
+    def _sync(self, env: Optional[lmdb.Environment] = None) -> None:
+        if env is None:
+            env = self._pool.get_environment()
+            try:
+                self._sync(env)
+            finally:
+                self._pool.return_environment(env)
+            return
+        if not self._config.env_sync:
+            env.sync(True)
+            self._stats.syncs += 1
+        self._dirty = False
+
+
 class LMDBStorage:
     """High-level LMDB storage abstraction.
     
@@ -197,6 +410,7 @@ class LMDBStorage:
         self._databases: Dict[str, lmdb._Database] = {}
         self._lock = asyncio.Lock()
         self._stats = TransactionStats()
+        self._coalescer = WriteCoalescer(self._connection_pool, self.config, self._stats)
         self._schema_version = 1
         
         logger.info(f"Initialized LMDB storage at {storage_path}")
@@ -212,24 +426,26 @@ class LMDBStorage:
             self.storage_path.mkdir(parents=True, exist_ok=True)
             
             # Test connection
+            version_key = b"__schema_version__"
             async with self.transaction("main", write=False) as (txn, db):
                 # Check schema version
-                version_key = b"__schema_version__"
                 stored_version = txn.get(version_key, db=db)
-                
-                if stored_version is None:
-                    # First initialization - store schema version
-                    async with self.transaction("main", write=True) as (write_txn, write_db):
-                        write_txn.put(version_key, str(self._schema_version).encode(), db=write_db)
-                        logger.info(f"Initialized schema version {self._schema_version}")
-                else:
-                    stored_version_int = int(stored_version.decode())
-                    if stored_version_int != self._schema_version:
-                        logger.warning(
-                            f"Schema version mismatch: expected {self._schema_version}, "
-                            f"found {stored_version_int}"
-                        )
-                        # TODO: Implement schema migration
+            
+            if stored_version is None:
+                # First initialization - store schema version. Written after
+                # the read transaction ends: the pool cannot open a second
+                # environment on the same path while the first is in use
+                async with self.transaction("main", write=True) as (write_txn, write_db):
+                    write_txn.put(version_key, str(self._schema_version).encode(), db=write_db)
+                    logger.info(f"Initialized schema version {self._schema_version}")
+            else:
+                stored_version_int = int(stored_version.decode())
+                if stored_version_int != self._schema_version:
+                    logger.warning(
+                        f"Schema version mismatch: expected {self._schema_version}, "
+                        f"found {stored_version_int}"
+                    )
+                    # TODO: Implement schema migration
             
             logger.info("LMDB storage initialized successfully")
             
@@ -283,6 +499,9 @@ class LMDBStorage:
                 txn.commit()
                 self._stats.committed_transactions += 1
                 logger.debug(f"Committed transaction on {db_name}")
+                if self.config.sync and not self.config.env_sync:
+                    # Explicit writes are always made durable before returning
+                    env.sync(True)
             
         except Exception as e:
             # Abort transaction on error
@@ -355,9 +574,12 @@ class LMDBStorage:
             serialized_data = self.serializer.serialize(entity)
             
             # Store in database
-            async with self.transaction(db_name, write=True) as (txn, db):
-                key_bytes = entity_id.encode('utf-8')
-                txn.put(key_bytes, serialized_data, db=db)
+            key_bytes = entity_id.encode('utf-8')
+            if self._is_coalesced(db_name):
+                await self._coalescer.put(db_name, key_bytes, serialized_data)
+            else:
+                async with self.transaction(db_name, write=True) as (txn, db):
+                    txn.put(key_bytes, serialized_data, db=db)
                 
             logger.debug(f"Stored entity {entity_id} in {db_name}")
             
@@ -427,14 +649,17 @@ class LMDBStorage:
             StorageError: If delete operation fails
         """
         try:
-            async with self.transaction(db_name, write=True) as (txn, db):
-                key_bytes = entity_id.encode('utf-8')
-                deleted = txn.delete(key_bytes, db=db)
-                
-                if deleted:
-                    logger.debug(f"Deleted entity {entity_id} from {db_name}")
-                
-                return deleted
+            key_bytes = entity_id.encode('utf-8')
+            if self._is_coalesced(db_name):
+                deleted = await self._coalescer.delete(db_name, key_bytes)
+            else:
+                async with self.transaction(db_name, write=True) as (txn, db):
+                    deleted = txn.delete(key_bytes, db=db)
+            
+            if deleted:
+                logger.debug(f"Deleted entity {entity_id} from {db_name}")
+            
+            return deleted
                 
         except Exception as e:
             raise StorageError(
@@ -587,11 +812,25 @@ class LMDBStorage:
             },
             'connections': pool_stats,
             'databases': list(self._databases.keys()),
+            'durability': {
+                db_name: self.config.durability_for(db_name).value
+                for db_name in self._databases
+            },
+            'write_coalescing': self._coalescer.get_stats(),
         }
     
+    async def flush(self) -> None:
+        """Wait for coalesced writes and sync relaxed databases to disk."""
+        await self._coalescer.flush()
+    
+    def _is_coalesced(self, db_name: str) -> bool:
+        """Check if writes to a database go through the write coalescer."""
+        return self.config.durability_for(db_name) != DurabilityProfile.STRICT
+    
     async def close(self) -> None:
         """Close storage and clean up resources."""
         logger.info("Closing LMDB storage")
+        await self._coalescer.close()
         self._connection_pool.close_all()
         self._databases.clear()
     
@@ -3,9 +3,20 @@
 from .pipeline_template_repository_impl import LMDBPipelineTemplateRepository
 from .pipeline_run_repository_impl import LMDBPipelineRunRepository
 from .step_execution_repository_impl import LMDBStepExecutionRepository
+from .template_search_index import TemplateSearchIndex, TemplateSearchHit
+from .run_storage import ClusteredRunStore, RunKeyLayout, RunKeyMigrationResult
+from .run_archive import RunArchive
+from .step_output_blobs import FileStepOutputBlobStore
 
 __all__ = [
     "LMDBPipelineTemplateRepository",
     "LMDBPipelineRunRepository", 
     "LMDBStepExecutionRepository",
+    "TemplateSearchIndex",
+    "TemplateSearchHit",
+    "ClusteredRunStore",
+    "RunKeyLayout",
+    "RunKeyMigrationResult",
+    "RunArchive",
+    "FileStepOutputBlobStore",
 ]
\ No newline at end of file
@@ -4,12 +4,12 @@ Provides concrete LMDB-backed storage for pipeline runs with
 workspace isolation, status tracking, and execution monitoring.
 """
 
+from dataclasses import replace
 from typing import List, Optional, Any
 from datetime import datetime, timedelta
 
 from ...domains.pipeline.repositories.pipeline_run_repository import (
     PipelineRunRepository,
-    ByPipelineSpecification,
     ByStatusSpecification,
     ByWorkspaceSpecification,
     ActiveRunsSpecification,
@@ -17,6 +17,7 @@ from ...domains.pipeline.repositories.pipeline_run_repository import (
     RecentRunsSpecification
 )
 from ...domains.pipeline.entities.pipeline_run import PipelineRun
+from ...domains.pipeline.services.run_analytics import RunAnalytics, TOP_K
 from ...domains.pipeline.value_objects.pipeline_id import PipelineId
 from ...domains.pipeline.value_objects.execution_status import ExecutionStatus, PipelineExecutionStatus
 from ...domains.workspace.value_objects.workspace_name import WorkspaceName
@@ -24,33 +25,46 @@ from ...shared.repository import RepositoryError, EntityNotFoundError
 from ..base.repository_base import LMDBRepositoryBase
 from ..base.storage_manager import LMDBStorageManager
 from ..base.serialization import DomainEntitySerializer
+from .run_archive import RunArchive
+from .run_storage import ClusteredRunStore, RUNS_DB_NAME, RUNS_DB_KEY
 
 
 class LMDBPipelineRunRepository(LMDBRepositoryBase[PipelineRun], PipelineRunRepository):
     """LMDB implementation of PipelineRunRepository.
     
     Stores pipeline runs with workspace isolation and provides
-    advanced querying capabilities for execution monitoring.
+    advanced querying capabilities for execution monitoring. Runs share a
+    clustered key range with their step executions (see
+    ``ClusteredRunStore``), and pipeline lookups go through its index.
+    Finished runs can be moved to a monthly ``RunArchive`` with
+    ``archive_old_runs``; lookups by ID fall through to it. Statistics
+    are read from hourly aggregates maintained on every save. Step
+    progress is appended to a per-run journal (``record_step_event``)
+    rather than rewriting the run record.
     """
     
     def __init__(
         self, 
         storage_manager: LMDBStorageManager,
-        workspace_name: WorkspaceName
+        workspace_name: WorkspaceName,
+        archive: Optional[RunArchive] = None
     ):
         """Initialize repository.
         
         Args:
             storage_manager: LMDB storage manager
             workspace_name: Workspace for data isolation
+            archive: Cold storage for old runs (defaults to the
+                workspace's archive directory)
         """
         super().__init__(
             storage_manager=storage_manager,
             workspace_name=workspace_name,
             entity_type=PipelineRun,
-            db_name="pipeline_runs",
-            db_key="runs"
+            db_name=RUNS_DB_NAME,
+            db_key=RUNS_DB_KEY
         )
+        self._store = ClusteredRunStore(storage_manager, workspace_name, archive=archive)
     
     def _setup_serializer(self, serializer: DomainEntitySerializer) -> None:
         """Setup serializer with pipeline run-specific types.
@@ -92,6 +106,116 @@ class LMDBPipelineRunRepository(LMDBRepositoryBase[PipelineRun], PipelineRunRepo
         workspace_prefix = self._get_workspace_prefix()
         return f"{workspace_prefix}run:{str(entity_id)}"
     
+    async def save(self, entity: PipelineRun) -> None:
+        """Save a pipeline run and update its pipeline indexes.
+        
+        Args:
+            entity: Pipeline run to save
+            
+        Raises:
+            RepositoryError: If save operation fails
+        """
+        await self._store.save_run(entity)
+
+    async def record_step_event(self, run: PipelineRun, step_id: str, event: str) -> None:
+        """Append a step event to the run's journal.
+
+        The run record is not rewritten; its journaled fields are folded
+        in on read until the journal is compacted.
+
+        Args:
+            run: Run in its current state
+            step_id: Step the event belongs to
+            event: Event name, such as "started" or "completed"
+
+        Raises:
+            RepositoryError: If save operation fails
+        """
+        await self._store.append_run_event(run, step_id, event)
+
+    async def compact_journals(self) -> int:
+        """Fold every run journal in the workspace into its run record.
+
+        Returns:
+            Number of runs compacted
+        """
+        return await self._store.compact_journals()
+
+    async def find_by_id(self, entity_id: Any) -> Optional[PipelineRun]:
+        """Find pipeline run by ID.
+        
+        Args:
+            entity_id: Run identifier
+            
+        Returns:
+            The run if found, None otherwise
+        """
+        return await self._store.load_run(entity_id)
+    
+    async def find_all(self) -> List[PipelineRun]:
+        """Find all pipeline runs in current workspace.
+        
+        Returns:
+            List of runs; step executions stored with them are skipped
+        """
+        return await self._store.list_runs()
+    
+    async def find_with_limit(self, limit: int, offset: int = 0) -> List[PipelineRun]:
+        """Find pipeline runs with pagination.
+        
+        Args:
+            limit: Maximum number of runs to return
+            offset: Number of runs to skip
+            
+        Returns:
+            List of runs
+        """
+        runs = await self._store.list_runs(limit + offset)
+        return runs[offset:offset + limit]
+    
+    async def exists(self, entity_id: Any) -> bool:
+        """Check if a pipeline run exists.
+        
+        Args:
+            entity_id: Run identifier
+            
+        Returns:
+            True if the run exists
+        """
+        return await self._store.run_exists(entity_id)
+    
+    async def delete_by_id(self, entity_id: Any) -> bool:
+        """Delete a pipeline run together with its step executions.
+        
+        Args:
+            entity_id: Run identifier
+            
+        Returns:
+            True if the run was deleted, False if not found
+        """
+        return await self._store.delete_run(entity_id)
+    
+    async def count(self) -> int:
+        """Count pipeline runs in current workspace.
+        
+        Returns:
+            Total count of runs
+        """
+        return await self._store.count_runs()
+    
+    async def _find_by_workspace_impl(self, workspace: WorkspaceName) -> List[PipelineRun]:
+        """Load pipeline runs of a workspace.
+        
+        Args:
+            workspace: Workspace to search in
+            
+        Returns:
+            List of runs in the workspace
+        """
+        if workspace == self.workspace_name:
+            return await self._store.list_runs()
+        return await ClusteredRunStore(self._storage, workspace).list_runs()
+    
     async def find_by_pipeline(self, pipeline_id: PipelineId) -> List[PipelineRun]:
         """Find all runs for a specific pipeline.
         
@@ -104,8 +228,24 @@ class LMDBPipelineRunRepository(LMDBRepositoryBase[PipelineRun], PipelineRunRepo
         Raises:
             RepositoryError: If query operation fails
         """
-        spec = ByWorkspaceSpecification(self.workspace_name) & ByPipelineSpecification(pipeline_id)
-        return await self.find_by_specification(spec)
+        run_ids = await self._store.run_ids_for_pipeline(pipeline_id)
+        return await self._store.load_runs(run_ids)
+    
+    async def find_by_template_id(self, template_id: PipelineId) -> List[PipelineRun]:
+        """Find all runs for a specific template.
+        
+        Args:
+            template_id: Template (pipeline) identifier
+            
+        Returns:
+            List of pipeline runs, newest first
+            
+        Raises:
+            RepositoryError: If query operation fails
+        """
+        runs = await self.find_by_pipeline(template_id)
+        runs.sort(key=lambda r: r.created_at, reverse=True)
+        return runs
     
     async def find_by_status(self, status: PipelineExecutionStatus) -> List[PipelineRun]:
         """Find runs by execution status.
@@ -234,13 +374,20 @@ class LMDBPipelineRunRepository(LMDBRepositoryBase[PipelineRun], PipelineRunRepo
         Raises:
             RepositoryError: If query operation fails
         """
-        completed_runs = await self.find_completed_runs()
-        
-        # Filter runs with duration and sort by duration
-        runs_with_duration = [run for run in completed_runs if run.duration is not None]
-        runs_with_duration.sort(key=lambda r: r.duration, reverse=True)
-        
-        return runs_with_duration[:limit]
+        if limit > TOP_K:
+            # Hourly aggregates only keep the slowest TOP_K runs per hour
+            completed_runs = await self.find_completed_runs()
+            runs_with_duration = [run for run in completed_runs if run.duration is not None]
+            runs_with_duration.sort(key=lambda r: r.duration, reverse=True)
+            return runs_with_duration[:limit]
+        
+        analytics = await self._store.load_analytics()
+        runs = []
+        for _, run_id in analytics.slowest_runs(limit):
+            run = await self._store.load_run(run_id)
+            if run is not None:
+                runs.append(run)
+        return runs
     
     async def count_by_status(self, status: PipelineExecutionStatus) -> int:
         """Count runs by status.
@@ -272,54 +419,24 @@ class LMDBPipelineRunRepository(LMDBRepositoryBase[PipelineRun], PipelineRunRepo
     async def get_execution_statistics(self) -> dict:
         """Get execution statistics for current workspace.
         
+        Read from the hourly aggregates, so archived runs are included and
+        durations count finished runs only.
+        
         Returns:
             Dictionary with execution statistics
             
         Raises:
             RepositoryError: If statistics calculation fails
         """
-        all_runs = await self.find_by_workspace()
-        
-        if not all_runs:
-            return {
-                "total_runs": 0,
-                "success_rate": 0.0,
-                "avg_duration": 0.0,
-                "total_tokens": 0,
-                "status_counts": {}
-            }
-        
-        # Calculate statistics
-        total_runs = len(all_runs)
-        successful_runs = [r for r in all_runs if r.is_completed]
-        failed_runs = [r for r in all_runs if r.is_failed]
-        
-        success_rate = len(successful_runs) / total_runs if total_runs > 0 else 0.0
-        
-        # Calculate average duration for completed runs
-        completed_with_duration = [r for r in all_runs if r.duration is not None]
-        avg_duration = (
-            sum(r.duration for r in completed_with_duration) / len(completed_with_duration)
-            if completed_with_duration else 0.0
-        )
-        
-        # Calculate total tokens
-        total_tokens = sum(r.get_total_tokens() for r in all_runs)
-        
-        # Count by status
-        status_counts = {}
-        for run in all_runs:
-            status = run.status.status.value if hasattr(run.status.status, 'value') else str(run.status.status)
-            status_counts[status] = status_counts.get(status, 0) + 1
-        
+        summary = (await self._store.load_analytics()).summary()
         return {
-            "total_runs": total_runs,
-            "success_rate": success_rate,
-            "avg_duration": avg_duration,
-            "total_tokens": total_tokens,
-            "status_counts": status_counts,
-            "successful_runs": len(successful_runs),
-            "failed_runs": len(failed_runs)
+            "total_runs": summary["total_runs"],
+            "success_rate": summary["success_rate"],
+            "avg_duration": summary["avg_duration"],
+            "total_tokens": summary["total_tokens"],
+            "status_counts": summary["status_counts"],
+            "successful_runs": summary["successful_runs"],
+            "failed_runs": summary["failed_runs"]
         }
     
     async def cleanup_old_runs(self, older_than_days: int = 30) -> int:
@@ -350,11 +467,28 @@ class LMDBPipelineRunRepository(LMDBRepositoryBase[PipelineRun], PipelineRunRepo
         
         return deleted_count
     
+    async def archive_old_runs(self, older_than_days: int = 30) -> int:
+        """Move finished runs older than the given age to the archive.
+        
+        Unlike ``cleanup_old_runs`` nothing is lost: archived runs and their
+        steps stay readable by ID, timeline and date range.
+        
+        Args:
+            older_than_days: Archive runs finished more than this many days ago
+            
+        Returns:
+            Number of runs archived
+            
+        Raises:
+            RepositoryError: If archival fails
+        """
+        cutoff_date = datetime.now() - timedelta(days=older_than_days)
+        return await self._store.archive_runs(cutoff_date)
+    
     async def find_runs_by_pipeline_name(self, pipeline_name: str) -> List[PipelineRun]:
-        """Find runs by pipeline name (requires metadata lookup).
+        """Find runs by the pipeline name recorded on the run.
         
-        Note: This is a convenience method that requires additional
-        pipeline template lookups for name resolution.
+        Runs saved without a pipeline name are not found by this lookup.
         
         Args:
             pipeline_name: Pipeline template name
@@ -362,9 +496,8 @@ class LMDBPipelineRunRepository(LMDBRepositoryBase[PipelineRun], PipelineRunRepo
         Returns:
             List of matching pipeline runs
         """
-        # This would typically require a join with pipeline templates
-        # For now, return empty list - implement when needed
-        return []
+        run_ids = await self._store.run_ids_for_pipeline_name(pipeline_name)
+        return await self._store.load_runs(run_ids)
     
     async def get_run_timeline(self, run_id: str) -> Optional[dict]:
         """Get execution timeline for a specific run.
@@ -378,7 +511,7 @@ class LMDBPipelineRunRepository(LMDBRepositoryBase[PipelineRun], PipelineRunRepo
         Raises:
             RepositoryError: If query operation fails
         """
-        run = await self.find_by_id(run_id)
+        run, step_executions = await self._store.load_run_with_steps(run_id)
         if not run:
             return None
         
@@ -417,9 +550,153 @@ class LMDBPipelineRunRepository(LMDBRepositoryBase[PipelineRun], PipelineRunRepo
                 "error": run.error if run.error else None
             })
         
+        # Add step events, read from the same key range as the run
+        for execution in step_executions:
+            timeline.append({
+                "event": "step",
+                "timestamp": execution.started_at,
+                "step_id": str(execution.step_id),
+                "status": str(execution.status),
+                "completed_at": execution.completed_at,
+                "duration_ms": execution.execution_time_ms
+            })
+        timeline.sort(key=lambda event: event["timestamp"])
+        
         return {
             "run_id": run_id,
             "timeline": timeline,
             "duration": run.duration,
             "total_tokens": run.get_total_tokens()
-        }
\ No newline at end of file
+        }
+    
+    async def find_runs_by_date_range(
+        self, 
+        start_date: datetime, 
+        end_date: datetime
+    ) -> List[PipelineRun]:
+        """Find runs created within a date range.
+        
+        Archived runs are included; only the monthly archive segments
+        overlapping the range are read.
+        
+        Args:
+            start_date: Start of date range (inclusive)
+            end_date: End of date range (inclusive)
+            
+        Returns:
+            List of runs in the date range, oldest first
+            
+        Raises:
+            RepositoryError: If query operation fails
+        """
+        hot_runs = await self.find_by_workspace()
+        hot_ids = {run.id for run in hot_runs}
+        archived_runs = [
+            run for run in self._store.list_archived_runs(start_date, end_date)
+            if run.id not in hot_ids
+        ]
+        runs = [
+            run for run in hot_runs + archived_runs
+            if start_date <= run.created_at <= end_date
+        ]
+        runs.sort(key=lambda r: r.created_at)
+        return runs
+    
+    async def get_execution_stats(
+        self, 
+        template_id: Optional[PipelineId] = None
+    ) -> dict:
+        """Get execution statistics, optionally for one template.
+        
+        Args:
+            template_id: Optional template to get stats for
+            
+        Returns:
+            Dictionary with execution statistics
+            
+        Raises:
+            RepositoryError: If stats calculation fails
+        """
+        pipeline_id = None
+        if template_id is not None:
+            pipeline_id = str(getattr(template_id, "value", template_id))
+        summary = (await self._store.load_analytics()).summary(pipeline_id)
+        
+        return {
+            "total_runs": summary["total_runs"],
+            "successful_runs": summary["successful_runs"],
+            "failed_runs": summary["failed_runs"],
+            "average_duration": summary["avg_duration"],
+            "success_rate": summary["success_rate"]
+        }
+    
+    async def get_run_analytics(
+        self, 
+        start_date: Optional[datetime] = None, 
+        end_date: Optional[datetime] = None
+    ) -> RunAnalytics:
+        """Get analytics from the hourly aggregates of a time range.
+        
+        The range is applied at hour granularity.
+        
+        Args:
+            start_date: Start of time range (inclusive)
+            end_date: End of time range (inclusive)
+            
+        Returns:
+            Run analytics for the range
+        """
+        return await self._store.load_analytics(start_date, end_date)
+    
+    async def get_recent_runs(
+        self, 
+        limit: int = 10, 
+        workspace: Optional[WorkspaceName] = None
+    ) -> List[PipelineRun]:
+        """Get most recent runs.
+        
+        Args:
+            limit: Maximum number of runs to return
+            workspace: Optional workspace filter (defaults to current)
+            
+        Returns:
+            List of recent runs, ordered by start time desc
+            
+        Raises:
+            RepositoryError: If query operation fails
+        """
+        runs = await self.find_by_workspace(workspace)
+        runs.sort(key=lambda r: r.started_at or r.created_at, reverse=True)
+        return runs[:limit]
+    
+    async def update_run_status(
+        self, 
+        run_id: Any, 
+        status: ExecutionStatus, 
+        error_message: Optional[str] = None
+    ) -> None:
+        """Update run status and optional error message.
+        
+        Args:
+            run_id: Run identifier
+            status: New execution status
+            error_message: Optional error message for failed runs
+            
+        Raises:
+            EntityNotFoundError: If run not found
+            RepositoryError: If update operation fails
+        """
+        run = await self.find_by_id(run_id)
+        if not run:
+            raise EntityNotFoundError("PipelineRun", run_id)
+        
+        changes = {"status": status}
+        if error_message is not None:
+            changes["error"] = error_message
+        # Keep the run's timestamps consistent with the new status
+        if status.is_active and run.started_at is None:
+            changes["started_at"] = status.changed_at
+        if status.is_terminal and run.completed_at is None:
+            changes["completed_at"] = status.changed_at
+        
+        await self.save(replace(run, **changes))
@@ -4,14 +4,13 @@ Provides concrete LMDB-backed storage for pipeline templates with
 workspace isolation, versioning, and advanced querying capabilities.
 """
 
-from typing import List, Optional, Any
+from typing import Iterable, List, Optional, Any
 from datetime import datetime
 
 from ...domains.pipeline.repositories.pipeline_template_repository import (
     PipelineTemplateRepository,
     ByWorkspaceSpecification,
     ByNameSpecification,
-    ByTagSpecification,
     GlobalTemplateSpecification,
     ByVersionSpecification
 )
@@ -26,13 +25,17 @@ from ...shared.repository import RepositoryError, EntityNotFoundError
 from ..base.repository_base import LMDBRepositoryBase
 from ..base.storage_manager import LMDBStorageManager
 from ..base.serialization import DomainEntitySerializer
+from .template_search_index import TemplateSearchIndex, TemplateSearchHit
 
 
 class LMDBPipelineTemplateRepository(LMDBRepositoryBase[PipelineTemplate], PipelineTemplateRepository):
     """LMDB implementation of PipelineTemplateRepository.
     
     Stores pipeline templates with workspace isolation and provides
-    advanced querying capabilities including version management.
+    advanced querying capabilities including version management. Name,
+    tag and text lookups are served from an inverted index kept in the
+    ``template_index`` sub-database, updated in the same transaction as
+    every save and delete.
     """
     
     def __init__(
@@ -53,6 +56,12 @@ class LMDBPipelineTemplateRepository(LMDBRepositoryBase[PipelineTemplate], Pipel
             db_name="pipeline_templates",
             db_key="templates"
         )
+        self._search_index = TemplateSearchIndex(
+            storage_manager,
+            workspace_name,
+            db_name="pipeline_templates"
+        )
+        self._search_index_ready = False
     
     def _setup_serializer(self, serializer: DomainEntitySerializer) -> None:
         """Setup serializer with pipeline-specific types.
@@ -99,6 +108,47 @@ class LMDBPipelineTemplateRepository(LMDBRepositoryBase[PipelineTemplate], Pipel
         else:
             return f"{workspace_prefix}template:{str(entity_id)}"
     
+    async def save(self, entity: PipelineTemplate) -> None:
+        """Save a template and update the search index.
+        
+        Args:
+            entity: Template to save
+            
+        Raises:
+            RepositoryError: If save operation fails
+        """
+        if not self._storage._serializer:
+            raise RepositoryError("No serializer configured")
+        index_ready = self._search_index_ready or await self._search_index.is_built()
+        serialized = self._storage._serializer.serialize(entity)
+        async with self._storage.transaction(self._db_name, write=True, db_key=self._db_key) as (txn, db):
+            txn.put(self._entity_key(entity.id), serialized, db=db)
+            index_db = self._search_index.open_index(txn)
+            if index_ready:
+                self._search_index.put_document(txn, index_db, entity)
+            else:
+                # The stored templates now include this one
+                self._search_index.rebuild_documents(txn, index_db, self._stored_templates(txn, db))
+        self._search_index_ready = True
+    
+    async def delete_by_id(self, entity_id: Any) -> bool:
+        """Delete a template and remove it from the search index.
+        
+        Args:
+            entity_id: Template identifier
+            
+        Returns:
+            True if template was deleted, False if not found
+            
+        Raises:
+            RepositoryError: If delete operation fails
+        """
+        async with self._storage.transaction(self._db_name, write=True, db_key=self._db_key) as (txn, db):
+            deleted = txn.delete(self._entity_key(entity_id), db=db)
+            if deleted:
+                self._search_index.delete_document(txn, self._search_index.open_index(txn), entity_id)
+        return deleted
+    
     async def find_by_name(self, name: PipelineName) -> Optional[PipelineTemplate]:
         """Find template by name within current workspace.
         
@@ -106,14 +156,15 @@ class LMDBPipelineTemplateRepository(LMDBRepositoryBase[PipelineTemplate], Pipel
             name: Template name to search for
             
         Returns:
-            Template if found, None otherwise
+            Latest version of the template if found, None otherwise
             
         Raises:
             RepositoryError: If query operation fails
         """
-        spec = ByWorkspaceSpecification(self.workspace_name) & ByNameSpecification(name)
-        results = await self.find_by_specification(spec)
-        return results[0] if results else None
+        versions = await self._find_versions_by_name(name)
+        if not versions:
+            return None
+        return max(versions, key=lambda t: self._parse_version(t.version))
     
     async def find_by_name_and_workspace(
         self, 
@@ -183,15 +234,7 @@ class LMDBPipelineTemplateRepository(LMDBRepositoryBase[PipelineTemplate], Pipel
         Raises:
             RepositoryError: If query operation fails
         """
-        spec = ByWorkspaceSpecification(self.workspace_name) & ByNameSpecification(name)
-        results = await self.find_by_specification(spec)
-        
-        if not results:
-            return None
-        
-        # Sort by version and return latest
-        # Simple version comparison - for complex versioning, use packaging.version
-        return max(results, key=lambda t: self._parse_version(t.version))
+        return await self.find_by_name(name)
     
     async def find_all_versions(self, name: PipelineName) -> List[PipelineTemplate]:
         """Find all versions of a template.
@@ -205,10 +248,7 @@ class LMDBPipelineTemplateRepository(LMDBRepositoryBase[PipelineTemplate], Pipel
         Raises:
             RepositoryError: If query operation fails
         """
-        spec = ByWorkspaceSpecification(self.workspace_name) & ByNameSpecification(name)
-        results = await self.find_by_specification(spec)
-        
-        # Sort by version
+        results = await self._find_versions_by_name(name)
         return sorted(results, key=lambda t: self._parse_version(t.version))
     
     async def search_by_tag(self, tag: str) -> List[PipelineTemplate]:
@@ -223,8 +263,9 @@ class LMDBPipelineTemplateRepository(LMDBRepositoryBase[PipelineTemplate], Pipel
         Raises:
             RepositoryError: If query operation fails
         """
-        spec = ByWorkspaceSpecification(self.workspace_name) & ByTagSpecification(tag)
-        return await self.find_by_specification(spec)
+        await self._ensure_search_index()
+        template_ids = await self._search_index.find_ids_by_tag(tag)
+        return await self._load_templates(template_ids)
     
     async def search_by_description(self, query: str) -> List[PipelineTemplate]:
         """Search templates by description text.
@@ -238,15 +279,125 @@ class LMDBPipelineTemplateRepository(LMDBRepositoryBase[PipelineTemplate], Pipel
         Raises:
             RepositoryError: If query operation fails
         """
-        # Load all templates in workspace and filter by description
-        all_templates = await self.find_by_workspace()
+        # Narrow candidates through the description index, then confirm the
+        # phrase so results keep substring semantics for multi-word queries
+        await self._ensure_search_index()
+        hits = await self._search_index.search(query, prefix=True, fields=("description",))
+        candidates = await self._load_templates(hit.template_id for hit in hits)
         query_lower = query.lower()
         
         return [
-            template for template in all_templates
+            template for template in candidates
             if query_lower in template.description.lower()
         ]
     
+    async def search_templates(
+        self,
+        query: str,
+        limit: Optional[int] = 20,
+        prefix: bool = True
+    ) -> List[PipelineTemplate]:
+        """Ranked full-text search over names, descriptions, tags and step prompts.
+        
+        Args:
+            query: Free-text query; all terms must match
+            limit: Maximum number of templates to return
+            prefix: Treat the last term as a prefix for type-ahead
+            
+        Returns:
+            Matching templates, best match first
+            
+        Raises:
+            RepositoryError: If query operation fails
+        """
+        await self._ensure_search_index()
+        hits = await self._search_index.search(query, limit=limit, prefix=prefix)
+        return await self._load_templates(hit.template_id for hit in hits)
+    
+    async def search_template_hits(
+        self,
+        query: str,
+        limit: Optional[int] = 20,
+        prefix: bool = True
+    ) -> List[TemplateSearchHit]:
+        """Ranked search returning template IDs and scores without loading templates.
+        
+        Args:
+            query: Free-text query; all terms must match
+            limit: Maximum number of hits to return
+            prefix: Treat the last term as a prefix for type-ahead
+            
+        Returns:
+            Search hits, best match first
+        """
+        await self._ensure_search_index()
+        return await self._search_index.search(query, limit=limit, prefix=prefix)
+    
+    async def suggest_terms(self, prefix: str, limit: int = 10) -> List[str]:
+        """Complete a partially typed search term.
+        
+        Args:
+            prefix: Partial term
+            limit: Maximum number of completions
+            
+        Returns:
+            Matching index terms, most common first
+        """
+        await self._ensure_search_index()
+        return await self._search_index.suggest(prefix, limit)
+    
+    async def rebuild_search_index(self) -> int:
+        """Rebuild the search index from all stored templates.
+        
+        Returns:
+            Number of indexed templates
+        """
+        # A write transaction also creates the template database of a new workspace
+        async with self._storage.transaction(self._db_name, write=True, db_key=self._db_key) as (txn, db):
+            return self._search_index.rebuild_documents(
+                txn, self._search_index.open_index(txn), self._stored_templates(txn, db)
+            )
+    
+    async def _ensure_search_index(self) -> None:
+        """Build the index on first use for workspaces created before indexing."""
+        if self._search_index_ready:
+            return
+        if not await self._search_index.is_built():
+            await self.rebuild_search_index()
+        self._search_index_ready = True
+    
+    def _stored_templates(self, txn: Any, db: Any) -> Iterable[PipelineTemplate]:
+        """Decode every template record of the workspace within a transaction."""
+        for _, value in txn.cursor(db=db):
+            try:
+                yield self._storage._serializer.deserialize(value, PipelineTemplate)
+            except Exception as e:
+                # Skip undecodable records, as prefix queries do
+                print(f"Warning: Failed to deserialize template while indexing: {e}")
+    
+    async def _find_versions_by_name(self, name: Any) -> List[PipelineTemplate]:
+        """Load every template stored under a name via the index."""
+        await self._ensure_search_index()
+        template_ids = await self._search_index.find_ids_by_name(self._name_value(name))
+        return await self._load_templates(template_ids)
+    
+    def _entity_key(self, entity_id: Any) -> bytes:
+        """Key of a template record, as written by the storage manager."""
+        return self._storage._make_key(entity_id).encode("utf-8")
+    
+    async def _load_templates(self, template_ids: Iterable[str]) -> List[PipelineTemplate]:
+        """Load templates by ID, skipping stale index entries."""
+        templates = []
+        for template_id in template_ids:
+            template = await self.find_by_id(template_id)
+            if template is not None:
+                templates.append(template)
+        return templates
+    
+    def _name_value(self, name: Any) -> str:
+        """Normalize a template name for index lookup."""
+        return str(getattr(name, "value", name))
+    
     async def is_name_available(self, name: PipelineName) -> bool:
         """Check if template name is available in current workspace.
         
@@ -0,0 +1,275 @@
+"""Cold storage for old pipeline runs.
+
+Runs past a retention age are moved out of LMDB into append-only segment
+files, one per month of run creation:
+
+- ``<root>/<YYYY-MM>.seg`` holds records back to back. A record is one
+  run and its step executions (already serialized by the storage
+  serializer) framed with length prefixes and zlib-compressed.
+- ``<root>/<YYYY-MM>.idx`` is a small JSON index mapping run IDs to the
+  offset and length of their latest record in the segment.
+
+Segments are only ever appended to; re-archiving a run appends a new
+record and repoints the index, and removing a run only drops its index
+entry. Reads map segments with mmap, so looking up an archived run reads
+just its record.
+"""
+
+import json
+import mmap
+import os
+import struct
+import threading
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from ..base.exceptions import StorageError
+
+
+SEGMENT_SUFFIX = ".seg"
+INDEX_SUFFIX = ".idx"
+INDEX_VERSION = 1
+
+_FRAME = struct.Struct(">I")
+
+# Archived bundle: serialized run bytes and serialized step execution bytes
+ArchivedRun = Tuple[bytes, List[bytes]]
+
+
+def segment_name(created_at: datetime) -> str:
+    """Name of the monthly segment a run created at ``created_at`` goes to."""
+    return created_at.strftime("%Y-%m")
+
+
+def _encode_bundle(run_data: bytes, step_data: List[bytes]) -> bytes:
+    parts = [_FRAME.pack(len(step_data)), _FRAME.pack(len(run_data)), run_data]
+    for data in step_data:
+        parts.append(_FRAME.pack(len(data)))
+        parts.append(data)
+    return b"".join(parts)
+
+
+def _decode_bundle(payload: bytes) -> ArchivedRun:
+    (step_count,) = _FRAME.unpack_from(payload, 0)
+    offset = _FRAME.size
+    chunks = []
+    for _ in range(step_count + 1):
+        (length,) = _FRAME.unpack_from(payload, offset)
+        offset += _FRAME.size
+        chunks.append(payload[offset:offset + length])
+        offset += length
+    return chunks[0], chunks[1:]
+
+
+class _Segment:
+    """One monthly segment: its index and a read-only map of its data."""
+
+    def __init__(self, root: Path, name: str):
+        self.name = name
+        self.data_path = root / f"{name}{SEGMENT_SUFFIX}"
+        self.index_path = root / f"{name}{INDEX_SUFFIX}"
+        self.records: Dict[str, Tuple[int, int]] = {}
+        self.index_stamp: Optional[Tuple[int, int]] = None
+        self._map: Optional[mmap.mmap] = None
+        self._map_size = 0
+
+    def load_index(self) -> bool:
+        """(Re)load the index if it changed on disk. Returns True if reloaded."""
+        try:
+            stat = self.index_path.stat()
+        except FileNotFoundError:
+            return False
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if stamp == self.index_stamp:
+            return False
+        document = json.loads(self.index_path.read_text(encoding="utf-8"))
+        if document.get("version") != INDEX_VERSION:
+            raise StorageError(f"Unsupported run archive index version in {self.index_path}")
+        self.records = {run_id: (entry[0], entry[1]) for run_id, entry in document["records"].items()}
+        self.index_stamp = stamp
+        return True
+
+    def save_index(self) -> None:
+        document = {
+            "version": INDEX_VERSION,
+            "records": {run_id: list(entry) for run_id, entry in self.records.items()},
+        }
+        temp_path = self.index_path.with_suffix(INDEX_SUFFIX + ".tmp")
+        with open(temp_path, "w", encoding="utf-8") as index_file:
+            json.dump(document, index_file, separators=(",", ":"))
+            index_file.flush()
+            os.fsync(index_file.fileno())
+        os.replace(temp_path, self.index_path)
+        stat = self.index_path.stat()
+        self.index_stamp = (stat.st_mtime_ns, stat.st_size)
+
+    def read(self, offset: int, length: int) -> bytes:
+        """Read one compressed record through the segment's memory map."""
+        end = offset + length
+        if self._map is None or end > self._map_size:
+            # The segment grew since it was mapped (or was never mapped)
+            self.close()
+            with open(self.data_path, "rb") as data_file:
+                self._map = mmap.mmap(data_file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._map_size = len(self._map)
+            if end > self._map_size:
+                raise StorageError(f"Run archive record beyond end of segment {self.data_path}")
+        return self._map[offset:end]
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+            self._map_size = 0
+
+
+class RunArchive:
+    """Monthly, compressed, append-only archive of pipeline runs.
+
+    Examples:
+        archive = RunArchive(storage_path / "archive" / "runs" / "default")
+        archive.append(run.id, run.created_at, run_bytes, step_bytes)
+        run_bytes, step_bytes = archive.read(run.id)
+    """
+
+    def __init__(self, root: Path, compression_level: int = 6):
+        """Initialize archive.
+
+        Args:
+            root: Directory holding segment and index files
+            compression_level: zlib level for archived records
+        """
+        self.root = Path(root)
+        self.compression_level = compression_level
+        self._segments: Dict[str, _Segment] = {}
+        self._locations: Dict[str, str] = {}
+        self._lock = threading.RLock()
+
+    def append(
+        self,
+        run_id: str,
+        created_at: datetime,
+        run_data: bytes,
+        step_data: List[bytes]
+    ) -> None:
+        """Append a run and its steps to the segment of its creation month.
+
+        The record is written and synced before the index points at it, so
+        a crash leaves at most an unreferenced tail in the segment.
+
+        Args:
+            run_id: Run identifier
+            created_at: Run creation time, selects the monthly segment
+            run_data: Serialized run
+            step_data: Serialized step executions in run order
+        """
+        record = zlib.compress(_encode_bundle(run_data, step_data), self.compression_level)
+        with self._lock:
+            self.refresh()
+            self.root.mkdir(parents=True, exist_ok=True)
+            segment = self._segment(segment_name(created_at))
+
+            with open(segment.data_path, "ab") as data_file:
+                offset = data_file.tell()
+                data_file.write(record)
+                data_file.flush()
+                os.fsync(data_file.fileno())
+
+            previous = self._locations.get(run_id)
+            if previous is not None and previous != segment.name:
+                self._drop_record(previous, run_id)
+            segment.records[run_id] = (offset, len(record))
+            segment.save_index()
+            self._locations[run_id] = segment.name
+
+    def read(self, run_id: str) -> Optional[ArchivedRun]:
+        """Read an archived run and its steps.
+
+        Returns:
+            ``(run_data, step_data)``, or None if the run is not archived
+        """
+        with self._lock:
+            name = self._locate(run_id)
+            if name is None:
+                return None
+            segment = self._segments[name]
+            offset, length = segment.records[run_id]
+            record = segment.read(offset, length)
+        return _decode_bundle(zlib.decompress(record))
+
+    def contains(self, run_id: str) -> bool:
+        with self._lock:
+            return self._locate(run_id) is not None
+
+    def remove(self, run_id: str) -> bool:
+        """Drop a run from the index; its bytes stay in the segment.
+
+        Returns:
+            True if the run was archived
+        """
+        with self._lock:
+            name = self._locate(run_id)
+            if name is None:
+                return False
+            self._drop_record(name, run_id)
+            return True
+
+    def segments(self) -> List[str]:
+        """Names (``YYYY-MM``) of the monthly segments, oldest first."""
+        with self._lock:
+            self.refresh()
+            return sorted(self._segments)
+
+    def iter_segment(self, name: str) -> Iterator[Tuple[str, ArchivedRun]]:
+        """Yield ``(run_id, (run_data, step_data))`` for every run in a segment."""
+        with self._lock:
+            self.refresh()
+            segment = self._segments.get(name)
+            records = sorted(segment.records.items(), key=lambda item: item[1][0]) if segment else []
+            raw = [(run_id, segment.read(offset, length)) for run_id, (offset, length) in records]
+        for run_id, record in raw:
+            yield run_id, _decode_bundle(zlib.decompress(record))
+
+    def refresh(self) -> None:
+        """Pick up segments and index changes written by other instances."""
+        with self._lock:
+            if not self.root.exists():
+                return
+            for index_path in self.root.glob(f"*{INDEX_SUFFIX}"):
+                name = index_path.name[:-len(INDEX_SUFFIX)]
+                segment = self._segment(name)
+                if segment.load_index():
+                    self._locations = {
+                        run_id: location for run_id, location in self._locations.items()
+                        if location != name
+                    }
+                    for run_id in segment.records:
+                        self._locations[run_id] = name
+
+    def close(self) -> None:
+        """Unmap all segments."""
+        with self._lock:
+            for segment in self._segments.values():
+                segment.close()
+
+    def _segment(self, name: str) -> _Segment:
+        segment = self._segments.get(name)
+        if segment is None:
+            segment = _Segment(self.root, name)
+            self._segments[name] = segment
+        return segment
+
+    def _locate(self, run_id: str) -> Optional[str]:
+        location = self._locations.get(run_id)
+        if location is None:
+            self.refresh()
+            location = self._locations.get(run_id)
+        return location
+
+    def _drop_record(self, name: str, run_id: str) -> None:
+        segment = self._segments[name]
+        segment.records.pop(run_id, None)
+        segment.save_index()
+        self._locations.pop(run_id, None)
@@ -0,0 +1,966 @@
+"""Clustered LMDB storage for pipeline runs and their step executions.
+
+Step executions are stored next to the run they belong to, so a run and
+all of its steps are one contiguous key range:
+
+- ``ws:<ws>:run:<run_id>:meta`` -> serialized PipelineRun
+- ``ws:<ws>:run:<run_id>:step:<seq>`` -> serialized StepExecution, where
+  ``seq`` is a zero-padded per-run sequence number in save order
+- ``ws:<ws>:run:<run_id>:journal:<seq>`` -> JSON record of a step event
+  and the run fields it changed, appended instead of rewriting the run
+  record (see ``ClusteredRunStore.append_run_event``)
+
+Run records are read as the stored record with the run's journal folded
+over it. Saving the whole run, or reaching ``JOURNAL_COMPACT_THRESHOLD``
+journal records, compacts the journal into the run record.
+
+Secondary lookups live under ``ws:<ws>:idx:`` in the same sub-database,
+outside the run range:
+
+- ``idx:exec:<execution_id>`` -> step key
+- ``idx:step:<step_id>\\0<execution_id>`` -> step key
+- ``idx:pipeline:<pipeline_id>\\0<run_id>`` -> empty marker
+- ``idx:pipeline_name:<name>\\0<run_id>`` -> empty marker
+- ``idx:run:<run_id>`` -> indexed run attributes and the run's analytics
+  contribution (for index and analytics updates)
+- ``idx:step_stats:<execution_id>`` -> analytics contribution of a step
+- ``idx:archived_stats:<run_id>`` -> analytics contributions of an archived
+  run and its steps
+- ``idx:agg:<YYYYMMDDHH>`` -> hourly analytics bucket (see ``RunAnalytics``)
+
+Analytics buckets are updated in the same write transaction as the run or
+step they summarize; saving an entity again replaces its contribution.
+
+Earlier versions stored runs and step executions under their bare IDs in
+separate databases; ``ClusteredRunStore.migrate_legacy_keys`` rewrites
+them into this layout.
+
+Finished runs past a retention age can be moved to a ``RunArchive``
+(monthly compressed segments); point lookups fall through to it.
+"""
+
+import json
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from ...domains.pipeline.entities.pipeline_run import PipelineRun
+from ...domains.pipeline.repositories.step_execution_repository import StepExecution
+from ...domains.pipeline.services.run_analytics import (
+    AnalyticsBucket,
+    RunAnalytics,
+    hour_of,
+    run_contribution,
+    step_contribution,
+)
+from ...domains.pipeline.value_objects.execution_status import ExecutionStatus, PipelineExecutionStatus
+from ...domains.pipeline.value_objects.pipeline_id import PipelineId
+from ...domains.pipeline.value_objects.step_id import StepId
+from ...domains.workspace.value_objects.workspace_name import WorkspaceName
+from ...shared.repository import RepositoryError
+from ..base.exceptions import MigrationError
+from ..base.storage_manager import LMDBStorageManager
+from .run_archive import RunArchive
+
+
+RUNS_DB_NAME = "pipeline_runs"
+RUNS_DB_KEY = "runs"
+
+# Where step executions were stored before they were clustered under runs
+LEGACY_STEPS_DB_NAME = "step_executions"
+LEGACY_STEPS_DB_KEY = "executions"
+
+STEP_SEQUENCE_WIDTH = 8
+
+# Journal records a run may collect before they are folded into its record
+JOURNAL_COMPACT_THRESHOLD = 32
+
+# Run fields recorded by journal records; all others need a full save
+JOURNALED_RUN_FIELDS = ("total_tokens_used", "total_execution_time")
+
+# Bumped when contributions change shape, so buckets are rebuilt
+ANALYTICS_VERSION = 1
+
+_SEPARATOR = '\x00'
+
+
+class RunKeyLayout:
+    """Builds and parses clustered run keys for one workspace.
+
+    Examples:
+        layout = RunKeyLayout("default")
+        layout.run_key("run-1")      # b"ws:default:run:run-1:meta"
+        layout.step_key("run-1", 3)  # b"ws:default:run:run-1:step:00000003"
+        layout.journal_key("run-1", 0)  # b"ws:default:run:run-1:journal:00000000"
+    """
+
+    def __init__(self, workspace: str):
+        self.workspace_prefix = f"ws:{workspace}:"
+        self.runs_prefix = f"{self.workspace_prefix}run:".encode("utf-8")
+        self.index_prefix = f"{self.workspace_prefix}idx:"
+
+    def run_prefix(self, run_id: Any) -> bytes:
+        """Prefix of every key belonging to a run (its record and steps)."""
+        return self.runs_prefix + f"{run_id}:".encode("utf-8")
+
+    def run_key(self, run_id: Any) -> bytes:
+        return self.run_prefix(run_id) + b"meta"
+
+    def step_prefix(self, run_id: Any) -> bytes:
+        return self.run_prefix(run_id) + b"step:"
+
+    def step_key(self, run_id: Any, sequence: int) -> bytes:
+        return self.step_prefix(run_id) + str(sequence).zfill(STEP_SEQUENCE_WIDTH).encode("utf-8")
+
+    def journal_prefix(self, run_id: Any) -> bytes:
+        return self.run_prefix(run_id) + b"journal:"
+
+    def journal_key(self, run_id: Any, sequence: int) -> bytes:
+        return self.journal_prefix(run_id) + str(sequence).zfill(STEP_SEQUENCE_WIDTH).encode("utf-8")
+
+    def parse(self, key: bytes) -> Optional[Tuple[str, str, Optional[int]]]:
+        """Parse a key in the run range.
+
+        Returns:
+            ``(run_id, "meta", None)``, ``(run_id, "step", seq)`` or
+            ``(run_id, "journal", seq)``, or None if the key is not a
+            clustered run key
+        """
+        if not key.startswith(self.runs_prefix):
+            return None
+        rest = key[len(self.runs_prefix):].decode("utf-8")
+        if rest.endswith(":meta"):
+            return rest[:-len(":meta")], "meta", None
+        for kind in ("step", "journal"):
+            head, marker, sequence = rest.rpartition(f":{kind}:")
+            if marker and sequence.isdigit():
+                return head, kind, int(sequence)
+        return None
+
+    @staticmethod
+    def range_end(prefix: bytes) -> bytes:
+        """Smallest key sorting after every key that starts with ``prefix``."""
+        return prefix[:-1] + bytes([prefix[-1] + 1])
+
+    def index_key(self, kind: str, *parts: Any) -> bytes:
+        return f"{self.index_prefix}{kind}:{_SEPARATOR.join(str(part) for part in parts)}".encode("utf-8")
+
+    def index_prefix_for(self, kind: str, value: Any) -> bytes:
+        return f"{self.index_prefix}{kind}:{value}{_SEPARATOR}".encode("utf-8")
+
+
+def default_archive_path(storage_manager: LMDBStorageManager, workspace_name: WorkspaceName) -> Path:
+    """Directory of the run archive of a workspace."""
+    return storage_manager.storage_path / "archive" / "runs" / workspace_name.value
+
+
+def register_run_types(serializer: Any) -> None:
+    """Register the types stored in the clustered run range.
+
+    Runs and step executions share one storage manager, whose serializer
+    is configured by whichever repository is created first, so both
+    entity families are registered whenever either repository is used.
+
+    Args:
+        serializer: Serializer to configure
+    """
+    for value_object in (PipelineId, StepId, ExecutionStatus, WorkspaceName):
+        serializer.register_value_object(value_object)
+    serializer.register_type("PipelineRun", PipelineRun)
+    serializer.register_type("StepExecution", StepExecution)
+    serializer.register_type("PipelineExecutionStatus", PipelineExecutionStatus)
+
+
+@dataclass
+class RunKeyMigrationResult:
+    """Outcome of rewriting legacy run and step keys."""
+    runs_migrated: int = 0
+    steps_migrated: int = 0
+    skipped_keys: List[str] = field(default_factory=list)
+    failed_keys: Dict[str, str] = field(default_factory=dict)
+
+
+class ClusteredRunStore:
+    """Run and step execution storage using the clustered key layout.
+
+    Shared by the pipeline run and step execution repositories so both
+    write to the same sub-database and key range.
+    """
+
+    def __init__(
+        self,
+        storage_manager: LMDBStorageManager,
+        workspace_name: WorkspaceName,
+        db_name: str = RUNS_DB_NAME,
+        db_key: str = RUNS_DB_KEY,
+        archive: Optional[RunArchive] = None,
+        journal_compact_threshold: int = JOURNAL_COMPACT_THRESHOLD
+    ):
+        """Initialize store.
+
+        Args:
+            storage_manager: LMDB storage manager
+            workspace_name: Workspace the store is scoped to
+            db_name: LMDB database holding runs
+            db_key: Sub-database for runs, steps and their indexes
+            archive: Cold storage for old runs (defaults to the
+                workspace's archive directory)
+            journal_compact_threshold: Journal records a run may collect
+                before they are compacted into its record
+        """
+        self._storage = storage_manager
+        self._workspace_name = workspace_name
+        self._db_name = db_name
+        self._db_key = db_key
+        self.layout = RunKeyLayout(workspace_name.value)
+        self.archive = archive or RunArchive(default_archive_path(storage_manager, workspace_name))
+        self.journal_compact_threshold = journal_compact_threshold
+        self._analytics_ready = False
+        if storage_manager._serializer:
+            register_run_types(storage_manager._serializer)
+
+    # Serialization
+
+    def _serialize(self, entity: Any) -> bytes:
+        if not self._storage._serializer:
+            raise RepositoryError("No serializer configured")
+        return self._storage._serializer.serialize(entity)
+
+    def _deserialize(self, data: bytes, entity_type: type) -> Any:
+        if not self._storage._serializer:
+            raise RepositoryError("No serializer configured")
+        return self._storage._serializer.deserialize(data, entity_type)
+
+    # Runs
+
+    async def save_run(self, run: PipelineRun) -> None:
+        """Save a run record and update its pipeline indexes.
+
+        The whole record replaces the run's journal.
+
+        Args:
+            run: Run to save
+
+        Raises:
+            RepositoryError: If the write fails
+        """
+        run_id = str(run.id)
+        serialized = self._serialize(run)
+        async with self._storage.transaction(self._db_name, write=True, db_key=self._db_key) as (txn, db):
+            self._put_run(txn, db, run_id, run, serialized)
+
+    def _put_run(self, txn, db, run_id: str, run: PipelineRun, serialized: bytes) -> None:
+        layout = self.layout
+        indexed = {
+            "pipeline_id": str(getattr(run.pipeline_id, "value", run.pipeline_id)),
+            "pipeline_name": run.pipeline_name,
+        }
+        doc_key = layout.index_key("run", run_id)
+        previous = txn.get(doc_key, db=db)
+        previous_contribution = None
+        if previous is not None:
+            previous_indexed = json.loads(previous)
+            previous_contribution = previous_indexed.get("analytics")
+            self._remove_run_index(txn, db, run_id, previous_indexed)
+
+        indexed["analytics"] = run_contribution(run)
+        self._replace_contribution(txn, db, "run", run_id, previous_contribution, indexed["analytics"])
+
+        txn.put(layout.run_key(run_id), serialized, db=db)
+        for key, _ in list(self._range(txn, db, layout.journal_prefix(run_id))):
+            txn.delete(key, db=db)
+        txn.put(layout.index_key("pipeline", indexed["pipeline_id"], run_id), b"", db=db)
+        if indexed["pipeline_name"]:
+            txn.put(layout.index_key("pipeline_name", indexed["pipeline_name"], run_id), b"", db=db)
+        txn.put(doc_key, json.dumps(indexed).encode("utf-8"), db=db)
+
+    def _remove_run_index(self, txn, db, run_id: str, indexed: Dict[str, Any]) -> None:
+        layout = self.layout
+        txn.delete(layout.index_key("pipeline", indexed["pipeline_id"], run_id), db=db)
+        if indexed.get("pipeline_name"):
+            txn.delete(layout.index_key("pipeline_name", indexed["pipeline_name"], run_id), db=db)
+        txn.delete(layout.index_key("run", run_id), db=db)
+
+    async def load_run(self, run_id: Any) -> Optional[PipelineRun]:
+        """Load a run record without its steps, falling back to the archive."""
+        async with self._storage.transaction(self._db_name, write=False, db_key=self._db_key) as (txn, db):
+            data = txn.get(self.layout.run_key(run_id), db=db)
+            journal = self._read_journal(txn, db, run_id) if data is not None else []
+        if data is None:
+            archived = self.archive.read(str(run_id))
+            data = archived[0] if archived else None
+        return self._fold_journal(data, journal) if data is not None else None
+
+    async def load_run_with_steps(
+        self,
+        run_id: Any
+    ) -> Tuple[Optional[PipelineRun], List[StepExecution]]:
+        """Load a run and all of its step executions in one range read.
+
+        Runs that are no longer in LMDB are read from the archive.
+
+        Args:
+            run_id: Run identifier
+
+        Returns:
+            The run (None if it has no record) and its steps in save order
+        """
+        async with self._storage.transaction(self._db_name, write=False, db_key=self._db_key) as (txn, db):
+            run_data, journal, step_data = self._read_cluster(txn, db, run_id)
+        if run_data is None:
+            archived = self.archive.read(str(run_id))
+            if archived is not None:
+                run_data, step_data = archived
+
+        run = self._fold_journal(run_data, journal) if run_data is not None else None
+        return run, [self._deserialize(value, StepExecution) for value in step_data]
+
+    def _read_cluster(self, txn, db, run_id: Any) -> Tuple[Optional[bytes], List[bytes], List[bytes]]:
+        """Read a run's record, journal and step executions."""
+        run_data = None
+        journal = []
+        step_data = []
+        for key, value in self._range(txn, db, self.layout.run_prefix(run_id)):
+            kind = self.layout.parse(key)
+            if kind is None:
+                continue
+            if kind[1] == "meta":
+                run_data = value
+            elif kind[1] == "journal":
+                journal.append(value)
+            else:
+                step_data.append(value)
+        return run_data, journal, step_data
+
+    # Run journal
+
+    async def append_run_event(self, run: PipelineRun, step_id: Any, event: str) -> None:
+        """Record a step event of a run without rewriting the run record.
+
+        The event is appended to the run's journal together with the
+        current values of ``JOURNALED_RUN_FIELDS``; other changes to the
+        run need ``save_run``. A run without a stored record is saved
+        whole. Once the journal holds ``journal_compact_threshold``
+        records it is compacted into the run record.
+
+        Args:
+            run: Run in its current state
+            step_id: Step the event belongs to
+            event: Event name, such as "started" or "completed"
+
+        Raises:
+            RepositoryError: If the write fails
+        """
+        run_id = str(run.id)
+        record = json.dumps({
+            "event": event,
+            "step_id": str(step_id),
+            "recorded_at": datetime.now().isoformat(),
+            "changes": {name: getattr(run, name) for name in JOURNALED_RUN_FIELDS},
+        }).encode("utf-8")
+        async with self._storage.transaction(self._db_name, write=True, db_key=self._db_key) as (txn, db):
+            if txn.get(self.layout.run_key(run_id), db=db) is None:
+                self._put_run(txn, db, run_id, run, self._serialize(run))
+                return
+
+            sequence = self._next_key_sequence(txn, db, self.layout.journal_prefix(run_id))
+            txn.put(self.layout.journal_key(run_id, sequence), record, db=db)
+            self._update_run_tokens(txn, db, run_id, run.get_total_tokens())
+            if sequence + 1 >= self.journal_compact_threshold:
+                self._compact_journal(txn, db, run_id)
+
+    async def compact_journals(self) -> int:
+        """Fold every run journal in the workspace into its run record.
+
+        Returns:
+            Number of runs compacted
+        """
+        async with self._storage.transaction(self._db_name, write=True, db_key=self._db_key) as (txn, db):
+            run_ids = {
+                parsed[0]
+                for parsed in (self.layout.parse(key) for key, _ in self._range(txn, db, self.layout.runs_prefix))
+                if parsed is not None and parsed[1] == "journal"
+            }
+            return sum(1 for run_id in sorted(run_ids) if self._compact_journal(txn, db, run_id))
+
+    def _compact_journal(self, txn, db, run_id: str) -> bool:
+        """Replace a run's record by its materialized view and drop the journal."""
+        entries = list(self._range(txn, db, self.layout.journal_prefix(run_id)))
+        if not entries:
+            return False
+        run_data = txn.get(self.layout.run_key(run_id), db=db)
+        if run_data is not None:
+            run = self._fold_journal(run_data, [value for _, value in entries])
+            txn.put(self.layout.run_key(run_id), self._serialize(run), db=db)
+        for key, _ in entries:
+            txn.delete(key, db=db)
+        return True
+
+    def _read_journal(self, txn, db, run_id: Any) -> List[bytes]:
+        return [value for _, value in self._range(txn, db, self.layout.journal_prefix(run_id))]
+
+    def _fold_journal(self, run_data: bytes, journal: List[bytes]) -> PipelineRun:
+        """Materialize a run from its stored record and journal records."""
+        run = self._deserialize(run_data, PipelineRun)
+        for value in journal:
+            changes = json.loads(value)["changes"]
+            run = replace(run, **{name: changes[name] for name in JOURNALED_RUN_FIELDS if name in changes})
+        return run
+
+    def _snapshot(self, run_data: bytes, journal: List[bytes]) -> bytes:
+        """Serialized run record with its journal folded in."""
+        return self._serialize(self._fold_journal(run_data, journal)) if journal else run_data
+
+    def _update_run_tokens(self, txn, db, run_id: str, tokens: int) -> None:
+        """Bring the token count of a run's analytics contribution up to date."""
+        doc_key = self.layout.index_key("run", run_id)
+        doc = txn.get(doc_key, db=db)
+        if doc is None:
+            return
+        indexed = json.loads(doc)
+        previous = indexed.get("analytics")
+        if previous is None or previous.get("tokens") == tokens:
+            return
+        indexed["analytics"] = {**previous, "tokens": tokens}
+        self._replace_contribution(txn, db, "run", run_id, previous, indexed["analytics"])
+        txn.put(doc_key, json.dumps(indexed).encode("utf-8"), db=db)
+
+    async def delete_run(self, run_id: Any) -> bool:
+        """Delete a run together with its step executions and index entries.
+
+        Archived copies are removed as well.
+
+        Returns:
+            True if anything was deleted
+        """
+        run_id = str(run_id)
+        async with self._storage.transaction(self._db_name, write=True, db_key=self._db_key) as (txn, db):
+            deleted = self._delete_cluster(txn, db, run_id)
+        return self.archive.remove(run_id) or deleted
+
+    def _delete_cluster(self, txn, db, run_id: str, keep_analytics: bool = False) -> bool:
+        """Delete a run's keys and index entries.
+
+        Its analytics contributions are subtracted, or, with
+        ``keep_analytics`` (archival), kept in an ``archived_stats``
+        document so the run still counts and can be subtracted later.
+        """
+        run_contrib = None
+        doc = txn.get(self.layout.index_key("run", run_id), db=db)
+        if doc is not None:
+            indexed = json.loads(doc)
+            run_contrib = indexed.get("analytics")
+            self._remove_run_index(txn, db, run_id, indexed)
+
+        step_contribs = {}
+        entries = list(self._range(txn, db, self.layout.run_prefix(run_id)))
+        for key, value in entries:
+            parsed = self.layout.parse(key)
+            if parsed is not None and parsed[1] == "step":
+                execution = self._deserialize(value, StepExecution)
+                contribution = self._remove_step_index(txn, db, execution)
+                if contribution is not None:
+                    step_contribs[str(execution.execution_id)] = contribution
+            txn.delete(key, db=db)
+
+        archived_key = self.layout.index_key("archived_stats", run_id)
+        if keep_analytics:
+            txn.put(archived_key, json.dumps({"run": run_contrib, "steps": step_contribs}).encode("utf-8"), db=db)
+        else:
+            archived = txn.get(archived_key, db=db)
+            if archived is not None:
+                # The run was archived earlier: drop what it still contributes
+                archived_doc = json.loads(archived)
+                run_contrib = run_contrib or archived_doc["run"]
+                step_contribs = {**archived_doc["steps"], **step_contribs}
+                txn.delete(archived_key, db=db)
+            self._replace_contribution(txn, db, "run", run_id, run_contrib, None)
+            for execution_id, contribution in step_contribs.items():
+                self._replace_contribution(txn, db, "step", execution_id, contribution, None)
+        return bool(entries) or doc is not None
+
+    async def run_exists(self, run_id: Any) -> bool:
+        async with self._storage.transaction(self._db_name, write=False, db_key=self._db_key) as (txn, db):
+            if txn.get(self.layout.run_key(run_id), db=db) is not None:
+                return True
+        return self.archive.contains(str(run_id))
+
+    async def list_runs(self, limit: Optional[int] = None) -> List[PipelineRun]:
+        """Load run records in the workspace, skipping over their steps.
+
+        Args:
+            limit: Maximum number of runs to return
+        """
+        records = []
+        async with self._storage.transaction(self._db_name, write=False, db_key=self._db_key) as (txn, db):
+            for _, value, journal in self._iter_run_records(txn, db):
+                records.append((value, journal))
+                if limit and len(records) >= limit:
+                    break
+        return [self._fold_journal(value, journal) for value, journal in records]
+
+    async def count_runs(self) -> int:
+        async with self._storage.transaction(self._db_name, write=False, db_key=self._db_key) as (txn, db):
+            return sum(1 for _ in self._iter_run_records(txn, db))
+
+    async def run_ids_for_pipeline(self, pipeline_id: Any) -> List[str]:
+        """Get IDs of runs of a pipeline from the index."""
+        return await self._index_members("pipeline", str(getattr(pipeline_id, "value", pipeline_id)))
+
+    async def run_ids_for_pipeline_name(self, pipeline_name: str) -> List[str]:
+        """Get IDs of runs recorded under a pipeline name from the index."""
+        return await self._index_members("pipeline_name", pipeline_name)
+
+    async def load_runs(self, run_ids: List[str]) -> List[PipelineRun]:
+        """Load run records by ID in one read transaction, skipping missing IDs."""
+        records = []
+        async with self._storage.transaction(self._db_name, write=False, db_key=self._db_key) as (txn, db):
+            for run_id in run_ids:
+                data = txn.get(self.layout.run_key(run_id), db=db)
+                if data is not None:
+                    records.append((data, self._read_journal(txn, db, run_id)))
+        return [self._fold_journal(value, journal) for value, journal in records]
+
+    # Step executions
+
+    async def save_step(self, execution: StepExecution) -> bytes:
+        """Save a step execution under its run.
+
+        New executions get the next sequence number of the run; updates
+        keep their existing key.
+
+        Args:
+            execution: Step execution to save
+
+        Returns:
+            Storage key of the execution
+        """
+        serialized = self._serialize(execution)
+        async with self._storage.transaction(self._db_name, write=True, db_key=self._db_key) as (txn, db):
+            return self._put_step(txn, db, execution, serialized)
+
+    def _put_step(self, txn, db, execution: StepExecution, serialized: bytes) -> bytes:
+        layout = self.layout
+        exec_key = layout.index_key("exec", execution.execution_id)
+        key = txn.get(exec_key, db=db)
+        if key is None:
+            key = layout.step_key(execution.run_id, self._next_sequence(txn, db, execution.run_id))
+            txn.put(exec_key, key, db=db)
+            txn.put(layout.index_key("step", execution.step_id, execution.execution_id), key, db=db)
+        txn.put(key, serialized, db=db)
+
+        stats_key = layout.index_key("step_stats", execution.execution_id)
+        previous = txn.get(stats_key, db=db)
+        contribution = step_contribution(execution)
+        self._replace_contribution(
+            txn, db, "step", str(execution.execution_id),
+            json.loads(previous) if previous is not None else None, contribution
+        )
+        txn.put(stats_key, json.dumps(contribution).encode("utf-8"), db=db)
+        return key
+
+    def _next_sequence(self, txn, db, run_id: Any) -> int:
+        return self._next_key_sequence(txn, db, self.layout.step_prefix(run_id))
+
+    def _next_key_sequence(self, txn, db, prefix: bytes) -> int:
+        """Sequence number after the last key under ``prefix``."""
+        cursor = txn.cursor(db=db)
+        if cursor.set_range(self.layout.range_end(prefix)):
+            found = cursor.prev()
+        else:
+            found = cursor.last()
+        if found and cursor.key().startswith(prefix):
+            return int(cursor.key()[len(prefix):]) + 1
+        return 0
+
+    def _remove_step_index(self, txn, db, execution: StepExecution) -> Optional[Dict[str, Any]]:
+        """Delete a step's index entries; returns its analytics contribution."""
+        txn.delete(self.layout.index_key("exec", execution.execution_id), db=db)
+        txn.delete(self.layout.index_key("step", execution.step_id, execution.execution_id), db=db)
+        stats_key = self.layout.index_key("step_stats", execution.execution_id)
+        stats = txn.get(stats_key, db=db)
+        if stats is None:
+            return None
+        txn.delete(stats_key, db=db)
+        return json.loads(stats)
+
+    async def load_step(self, execution_id: Any) -> Optional[StepExecution]:
+        """Load a step execution by its execution ID."""
+        async with self._storage.transaction(self._db_name, write=False, db_key=self._db_key) as (txn, db):
+            key = txn.get(self.layout.index_key("exec", execution_id), db=db)
+            data = txn.get(key, db=db) if key is not None else None
+        return self._deserialize(data, StepExecution) if data is not None else None
+
+    async def load_steps(self, run_id: Any) -> List[StepExecution]:
+        """Load all step executions of a run in save order (one range read).
+
+        Steps of archived runs are read from the archive.
+        """
+        async with self._storage.transaction(self._db_name, write=False, db_key=self._db_key) as (txn, db):
+            run_data, _, values = self._read_cluster(txn, db, run_id)
+        if run_data is None and not values:
+            archived = self.archive.read(str(run_id))
+            if archived is not None:
+                values = archived[1]
+        return [self._deserialize(value, StepExecution) for value in values]
+
+    async def load_steps_by_step_id(self, step_id: Any) -> List[StepExecution]:
+        """Load executions of one pipeline step across all runs via the index."""
+        async with self._storage.transaction(self._db_name, write=False, db_key=self._db_key) as (txn, db):
+            keys = [key for _, key in self._range(txn, db, self.layout.index_prefix_for("step", step_id))]
+            values = [txn.get(key, db=db) for key in keys]
+        return [self._deserialize(value, StepExecution) for value in values if value is not None]
+
+    async def delete_step(self, execution_id: Any) -> bool:
+        """Delete a step execution and its index entries."""
+        async with self._storage.transaction(self._db_name, write=True, db_key=self._db_key) as (txn, db):
+            key = txn.get(self.layout.index_key("exec", execution_id), db=db)
+            if key is None:
+                return False
+            data = txn.get(key, db=db)
+            if data is not None:
+                execution = self._deserialize(data, StepExecution)
+                contribution = self._remove_step_index(txn, db, execution)
+                self._replace_contribution(txn, db, "step", str(execution.execution_id), contribution, None)
+                txn.delete(key, db=db)
+            else:
+                txn.delete(self.layout.index_key("exec", execution_id), db=db)
+            return True
+
+    async def step_exists(self, execution_id: Any) -> bool:
+        async with self._storage.transaction(self._db_name, write=False, db_key=self._db_key) as (txn, db):
+            return txn.get(self.layout.index_key("exec", execution_id), db=db) is not None
+
+    async def list_steps(self, limit: Optional[int] = None) -> List[StepExecution]:
+        """Load step executions in the workspace, run by run."""
+        values = []
+        async with self._storage.transaction(self._db_name, write=False, db_key=self._db_key) as (txn, db):
+            for key, value in self._range(txn, db, self.layout.runs_prefix):
+                parsed = self.layout.parse(key)
+                if parsed is not None and parsed[1] == "step":
+                    values.append(value)
+                    if limit and len(values) >= limit:
+                        break
+        return [self._deserialize(value, StepExecution) for value in values]
+
+    async def count_steps(self) -> int:
+        async with self._storage.transaction(self._db_name, write=False, db_key=self._db_key) as (txn, db):
+            return sum(1 for _ in self._range(txn, db, self.layout.index_prefix_for("exec", "")[:-1]))
+
+    # Cursor helpers
+
+    @staticmethod
+    def _range(txn, db, prefix: bytes) -> Iterator[Tuple[bytes, bytes]]:
+        cursor = txn.cursor(db=db)
+        if not cursor.set_range(prefix):
+            return
+        for key, value in cursor:
+            if not key.startswith(prefix):
+                break
+            yield key, value
+
+    @staticmethod
+    def _range_from(txn, db, start: bytes, prefix: bytes) -> Iterator[Tuple[bytes, bytes]]:
+        cursor = txn.cursor(db=db)
+        if not cursor.set_range(start):
+            return
+        for key, value in cursor:
+            if not key.startswith(prefix):
+                break
+            yield key, value
+
+    def _iter_run_records(self, txn, db) -> Iterator[Tuple[bytes, bytes, List[bytes]]]:
+        """Yield run records with their journals, seeking past each run's steps."""
+        cursor = txn.cursor(db=db)
+        runs_prefix = self.layout.runs_prefix
+        journal: List[bytes] = []
+        positioned = cursor.set_range(runs_prefix)
+        while positioned and cursor.key().startswith(runs_prefix):
+            key = cursor.key()
+            parsed = self.layout.parse(key)
+            if parsed is None:
+                positioned = cursor.next()
+                continue
+            if parsed[1] == "journal":
+                # Journal records sort before their run's record
+                journal.append(cursor.value())
+                positioned = cursor.next()
+                continue
+            if parsed[1] == "meta":
+                yield key, cursor.value(), journal
+            journal = []
+            # Everything after a run's record is its steps: jump to the next run
+            positioned = cursor.set_range(self.layout.range_end(self.layout.run_prefix(parsed[0])))
+
+    async def _index_members(self, kind: str, value: str) -> List[str]:
+        prefix = self.layout.index_prefix_for(kind, value)
+        async with self._storage.transaction(self._db_name, write=False, db_key=self._db_key) as (txn, db):
+            return [key[len(prefix):].decode("utf-8") for key, _ in self._range(txn, db, prefix)]
+
+    # Archival
+
+    async def archive_runs(self, older_than: datetime) -> int:
+        """Move finished runs last active before ``older_than`` to the archive.
+
+        Each run is copied into its monthly segment and removed from LMDB
+        within one write transaction, so steps cannot be added to it in
+        between. Runs that are still active are never archived.
+
+        Args:
+            older_than: Archive runs completed (or, if never completed,
+                created) before this time
+
+        Returns:
+            Number of runs archived
+        """
+        candidates = [
+            run for run in await self.list_runs()
+            if run.status.is_terminal and (run.completed_at or run.created_at) < older_than
+        ]
+
+        archived = 0
+        for run in candidates:
+            async with self._storage.transaction(self._db_name, write=True, db_key=self._db_key) as (txn, db):
+                run_data, journal, step_data = self._read_cluster(txn, db, run.id)
+                if run_data is None:
+                    continue
+                run_data = self._snapshot(run_data, journal)
+                self.archive.append(str(run.id), run.created_at, run_data, step_data)
+                self._delete_cluster(txn, db, str(run.id), keep_analytics=True)
+            archived += 1
+        return archived
+
+    def list_archived_runs(
+        self,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None
+    ) -> List[PipelineRun]:
+        """Load archived runs, reading only the monthly segments in range.
+
+        Args:
+            since: Only read segments of months ending after this time
+            until: Only read segments of months starting before this time
+        """
+        first = since.strftime("%Y-%m") if since else None
+        last = until.strftime("%Y-%m") if until else None
+        runs = []
+        for name in self.archive.segments():
+            if (first and name < first) or (last and name > last):
+                continue
+            for _, (run_data, _) in self.archive.iter_segment(name):
+                runs.append(self._deserialize(run_data, PipelineRun))
+        return runs
+
+    # Analytics
+
+    async def load_analytics(
+        self,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None
+    ) -> RunAnalytics:
+        """Load the hourly analytics buckets of a time range.
+
+        Buckets cover runs and steps by the hour they started, archived
+        ones included. The range is applied at hour granularity: the
+        hours containing ``since`` and ``until`` are included whole.
+
+        Args:
+            since: Start of the range
+            until: End of the range
+        """
+        await self._ensure_analytics()
+        prefix = self.layout.index_key("agg", "")
+        last = hour_of(until) if until else None
+        buckets = []
+        async with self._storage.transaction(self._db_name, write=False, db_key=self._db_key) as (txn, db):
+            start = prefix + hour_of(since).encode("utf-8") if since else prefix
+            for key, value in self._range_from(txn, db, start, prefix):
+                if last and key[len(prefix):].decode("utf-8") > last:
+                    break
+                buckets.append(AnalyticsBucket.from_dict(json.loads(value)))
+        return RunAnalytics(buckets)
+
+    def _replace_contribution(
+        self,
+        txn,
+        db,
+        kind: str,
+        entity_id: str,
+        old: Optional[Dict[str, Any]],
+        new: Optional[Dict[str, Any]]
+    ) -> None:
+        """Swap an entity's contribution in the hourly buckets."""
+        if old == new:
+            return
+        if old is not None:
+            self._apply_contribution(txn, db, kind, entity_id, old, -1)
+        if new is not None:
+            self._apply_contribution(txn, db, kind, entity_id, new, 1)
+
+    def _apply_contribution(
+        self,
+        txn,
+        db,
+        kind: str,
+        entity_id: str,
+        contribution: Dict[str, Any],
+        sign: int
+    ) -> None:
+        key = self.layout.index_key("agg", contribution["hour"])
+        data = txn.get(key, db=db)
+        bucket = (
+            AnalyticsBucket.from_dict(json.loads(data)) if data is not None
+            else AnalyticsBucket(contribution["hour"])
+        )
+        if kind == "run":
+            bucket.apply_run(entity_id, contribution, sign)
+        else:
+            bucket.apply_step(entity_id, contribution, sign)
+        if bucket.is_empty:
+            txn.delete(key, db=db)
+        else:
+            txn.put(key, json.dumps(bucket.to_dict()).encode("utf-8"), db=db)
+
+    async def _ensure_analytics(self) -> None:
+        """Build the analytics buckets once for data written before them."""
+        if self._analytics_ready:
+            return
+        version_key = self.layout.index_key("agg_version")
+        async with self._storage.transaction(self._db_name, write=False, db_key=self._db_key) as (txn, db):
+            current = txn.get(version_key, db=db) == str(ANALYTICS_VERSION).encode("utf-8")
+        if not current:
+            async with self._storage.transaction(self._db_name, write=True, db_key=self._db_key) as (txn, db):
+                self._rebuild_analytics(txn, db)
+                txn.put(version_key, str(ANALYTICS_VERSION).encode("utf-8"), db=db)
+        self._analytics_ready = True
+
+    def _rebuild_analytics(self, txn, db) -> None:
+        """Recompute every contribution and bucket from stored runs and steps."""
+        layout = self.layout
+        for kind in ("agg", "step_stats", "archived_stats"):
+            stale = [key for key, _ in self._range(txn, db, layout.index_key(kind, ""))]
+            for key in stale:
+                txn.delete(key, db=db)
+
+        buckets: Dict[str, AnalyticsBucket] = {}
+
+        def add(kind: str, entity_id: str, contribution: Dict[str, Any]) -> None:
+            bucket = buckets.setdefault(contribution["hour"], AnalyticsBucket(contribution["hour"]))
+            if kind == "run":
+                bucket.apply_run(entity_id, contribution, 1)
+            else:
+                bucket.apply_step(entity_id, contribution, 1)
+
+        for key, value in list(self._range(txn, db, layout.runs_prefix)):
+            parsed = layout.parse(key)
+            if parsed is None:
+                continue
+            if parsed[1] == "meta":
+                run = self._fold_journal(value, self._read_journal(txn, db, parsed[0]))
+                doc_key = layout.index_key("run", parsed[0])
+                doc = txn.get(doc_key, db=db)
+                if doc is None:
+                    continue
+                indexed = json.loads(doc)
+                indexed["analytics"] = run_contribution(run)
+                txn.put(doc_key, json.dumps(indexed).encode("utf-8"), db=db)
+                add("run", parsed[0], indexed["analytics"])
+            elif parsed[1] == "step":
+                execution = self._deserialize(value, StepExecution)
+                contribution = step_contribution(execution)
+                txn.put(
+                    layout.index_key("step_stats", execution.execution_id),
+                    json.dumps(contribution).encode("utf-8"),
+                    db=db
+                )
+                add("step", str(execution.execution_id), contribution)
+
+        for name in self.archive.segments():
+            for run_id, (run_data, step_data) in self.archive.iter_segment(name):
+                run_contrib = run_contribution(self._deserialize(run_data, PipelineRun))
+                add("run", run_id, run_contrib)
+                step_contribs = {}
+                for data in step_data:
+                    execution = self._deserialize(data, StepExecution)
+                    step_contribs[str(execution.execution_id)] = step_contribution(execution)
+                    add("step", str(execution.execution_id), step_contribs[str(execution.execution_id)])
+                txn.put(
+                    layout.index_key("archived_stats", run_id),
+                    json.dumps({"run": run_contrib, "steps": step_contribs}).encode("utf-8"),
+                    db=db
+                )
+
+        for hour, bucket in buckets.items():
+            txn.put(layout.index_key("agg", hour), json.dumps(bucket.to_dict()).encode("utf-8"), db=db)
+
+    # Migration
+
+    async def migrate_legacy_keys(
+        self,
+        legacy_steps_db_name: str = LEGACY_STEPS_DB_NAME,
+        legacy_steps_db_key: str = LEGACY_STEPS_DB_KEY
+    ) -> RunKeyMigrationResult:
+        """Rewrite runs and step executions stored under bare IDs.
+
+        Runs of this workspace are moved from ``<run_id>`` keys to the
+        clustered layout in one write transaction. Step executions are then
+        moved out of the legacy step database when their run belongs to
+        this workspace; steps of other workspaces are left for their own
+        migration. Re-running the migration is safe.
+
+        Args:
+            legacy_steps_db_name: Database that held step executions
+            legacy_steps_db_key: Sub-database that held step executions
+
+        Returns:
+            Migration counts, plus skipped and failed legacy keys
+
+        Raises:
+            MigrationError: If a migration transaction fails
+        """
+        result = RunKeyMigrationResult()
+        workspace = self._workspace_name.value
+
+        try:
+            async with self._storage.transaction(self._db_name, write=True, db_key=self._db_key) as (txn, db):
+                legacy = [
+                    (key, value) for key, value in txn.cursor(db=db)
+                    if not key.startswith(b"ws:")
+                ]
+                for key, value in legacy:
+                    try:
+                        run = self._deserialize(value, PipelineRun)
+                    except Exception as e:
+                        result.failed_keys[key.decode("utf-8", "replace")] = str(e)
+                        continue
+                    if run.workspace_name != workspace:
+                        result.skipped_keys.append(key.decode("utf-8", "replace"))
+                        continue
+                    self._put_run(txn, db, str(run.id), run, value)
+                    txn.delete(key, db=db)
+                    result.runs_migrated += 1
+        except RepositoryError as e:
+            raise MigrationError(f"Failed to migrate pipeline run keys: {e}", cause=e) from e
+
+        try:
+            async with self._storage.transaction(self._db_name, write=True, db_key=self._db_key) as (txn, db):
+                # Both databases live in the workspace environment, so steps
+                # move out of the legacy database in the same transaction
+                legacy_db = self._storage.open_db(txn, legacy_steps_db_name, legacy_steps_db_key)
+                for key, value in list(txn.cursor(db=legacy_db)):
+                    try:
+                        execution = self._deserialize(value, StepExecution)
+                    except Exception as e:
+                        result.failed_keys[key.decode("utf-8", "replace")] = str(e)
+                        continue
+                    if txn.get(self.layout.run_key(execution.run_id), db=db) is None:
+                        result.skipped_keys.append(key.decode("utf-8", "replace"))
+                        continue
+                    self._put_step(txn, db, execution, value)
+                    txn.delete(key, db=legacy_db)
+                    result.steps_migrated += 1
+        except RepositoryError as e:
+            raise MigrationError(f"Failed to migrate step execution keys: {e}", cause=e) from e
+
+        return result
@@ -12,12 +12,12 @@ import statistics
 from ...domains.pipeline.repositories.step_execution_repository import (
     StepExecutionRepository,
     StepExecution,
-    ByRunIdSpecification,
     ByStepIdSpecification,
     FailedExecutionsSpecification,
     RetryExecutionsSpecification,
     SuccessfulExecutionsSpecification
 )
+from ...domains.pipeline.services.run_analytics import TOP_K
 from ...domains.pipeline.value_objects.step_id import StepId
 from ...domains.pipeline.value_objects.execution_status import ExecutionStatus
 from ...domains.workspace.value_objects.workspace_name import WorkspaceName
@@ -25,33 +25,41 @@ from ...shared.repository import RepositoryError, EntityNotFoundError
 from ..base.repository_base import LMDBRepositoryBase
 from ..base.storage_manager import LMDBStorageManager
 from ..base.serialization import DomainEntitySerializer
+from .run_archive import RunArchive
+from .run_storage import ClusteredRunStore, RUNS_DB_NAME, RUNS_DB_KEY
 
 
 class LMDBStepExecutionRepository(LMDBRepositoryBase[StepExecution], StepExecutionRepository):
     """LMDB implementation of StepExecutionRepository.
     
     Stores step executions with performance tracking and provides
-    analytics capabilities for pipeline optimization.
+    analytics capabilities for pipeline optimization. Executions are
+    clustered under their pipeline run (see ``ClusteredRunStore``), so the
+    steps of a run are read with one range scan.
     """
     
     def __init__(
         self, 
         storage_manager: LMDBStorageManager,
-        workspace_name: WorkspaceName
+        workspace_name: WorkspaceName,
+        archive: Optional[RunArchive] = None
     ):
         """Initialize repository.
         
         Args:
             storage_manager: LMDB storage manager
             workspace_name: Workspace for data isolation
+            archive: Cold storage of archived runs, read by
+                ``find_by_run_id`` (defaults to the workspace's archive)
         """
         super().__init__(
             storage_manager=storage_manager,
             workspace_name=workspace_name,
             entity_type=StepExecution,
-            db_name="step_executions",
-            db_key="executions"
+            db_name=RUNS_DB_NAME,
+            db_key=RUNS_DB_KEY
         )
+        self._store = ClusteredRunStore(storage_manager, workspace_name, archive=archive)
     
     def _setup_serializer(self, serializer: DomainEntitySerializer) -> None:
         """Setup serializer with step execution-specific types.
@@ -90,9 +98,98 @@ class LMDBStepExecutionRepository(LMDBRepositoryBase[StepExecution], StepExecuti
         workspace_prefix = self._get_workspace_prefix()
         return f"{workspace_prefix}execution:{str(entity_id)}"
     
+    async def save(self, entity: StepExecution) -> None:
+        """Save a step execution under its run.
+        
+        Args:
+            entity: Step execution to save
+            
+        Raises:
+            RepositoryError: If save operation fails
+        """
+        await self._store.save_step(entity)
+    
+    async def find_by_id(self, entity_id: Any) -> Optional[StepExecution]:
+        """Find step execution by execution ID.
+        
+        Args:
+            entity_id: Execution identifier
+            
+        Returns:
+            The execution if found, None otherwise
+        """
+        return await self._store.load_step(entity_id)
+    
+    async def find_all(self) -> List[StepExecution]:
+        """Find all step executions in current workspace.
+        
+        Returns:
+            Executions grouped by run, in save order within a run
+        """
+        return await self._store.list_steps()
+    
+    async def find_with_limit(self, limit: int, offset: int = 0) -> List[StepExecution]:
+        """Find step executions with pagination.
+        
+        Args:
+            limit: Maximum number of executions to return
+            offset: Number of executions to skip
+            
+        Returns:
+            List of executions
+        """
+        executions = await self._store.list_steps(limit + offset)
+        return executions[offset:offset + limit]
+    
+    async def exists(self, entity_id: Any) -> bool:
+        """Check if a step execution exists.
+        
+        Args:
+            entity_id: Execution identifier
+            
+        Returns:
+            True if the execution exists
+        """
+        return await self._store.step_exists(entity_id)
+    
+    async def delete_by_id(self, entity_id: Any) -> bool:
+        """Delete step execution by execution ID.
+        
+        Args:
+            entity_id: Execution identifier
+            
+        Returns:
+            True if the execution was deleted, False if not found
+        """
+        return await self._store.delete_step(entity_id)
+    
+    async def count(self) -> int:
+        """Count step executions in current workspace.
+        
+        Returns:
+            Total count of executions
+        """
+        return await self._store.count_steps()
+    
+    async def _find_by_workspace_impl(self, workspace: WorkspaceName) -> List[StepExecution]:
+        """Load step executions of a workspace.
+        
+        Args:
+            workspace: Workspace to search in
+            
+        Returns:
+            List of executions in the workspace
+        """
+        if workspace == self.workspace_name:
+            return await self._store.list_steps()
+        return await ClusteredRunStore(self._storage, workspace).list_steps()
+    
     async def find_by_run_id(self, run_id: uuid.UUID) -> List[StepExecution]:
         """Find all step executions for a pipeline run.
         
+        Reads the run's contiguous step range instead of scanning the
+        workspace.
+        
         Args:
             run_id: Pipeline run identifier
             
@@ -102,8 +199,7 @@ class LMDBStepExecutionRepository(LMDBRepositoryBase[StepExecution], StepExecuti
         Raises:
             RepositoryError: If query operation fails
         """
-        spec = ByRunIdSpecification(run_id)
-        executions = await self.find_by_specification(spec)
+        executions = await self._store.load_steps(run_id)
         
         # Sort by started_at time
         executions.sort(key=lambda e: e.started_at)
@@ -126,9 +222,11 @@ class LMDBStepExecutionRepository(LMDBRepositoryBase[StepExecution], StepExecuti
         Raises:
             RepositoryError: If query operation fails
         """
-        spec = ByRunIdSpecification(run_id) & ByStepIdSpecification(step_id)
-        executions = await self.find_by_specification(spec)
-        return executions[0] if executions else None
+        spec = ByStepIdSpecification(step_id)
+        for execution in await self._store.load_steps(run_id):
+            if spec.is_satisfied_by(execution):
+                return execution
+        return None
     
     async def find_failed_executions(
         self, 
@@ -195,8 +293,7 @@ class LMDBStepExecutionRepository(LMDBRepositoryBase[StepExecution], StepExecuti
         """
         # Get relevant executions
         if step_id:
-            spec = ByStepIdSpecification(step_id)
-            executions = await self.find_by_specification(spec)
+            executions = await self._store.load_steps_by_step_id(step_id)
         else:
             executions = await self.find_by_workspace()
         
@@ -260,6 +357,10 @@ class LMDBStepExecutionRepository(LMDBRepositoryBase[StepExecution], StepExecuti
         Raises:
             RepositoryError: If query operation fails
         """
+        if limit <= TOP_K:
+            return await self._slowest_from_analytics(limit, since)
+        
+        # Hourly aggregates only keep the slowest TOP_K executions per hour
         executions = await self.find_by_workspace()
         
         # Filter by time if specified
@@ -274,6 +375,28 @@ class LMDBStepExecutionRepository(LMDBRepositoryBase[StepExecution], StepExecuti
         
         return executions_with_duration[:limit]
     
+    async def _slowest_from_analytics(
+        self, 
+        limit: int, 
+        since: Optional[datetime]
+    ) -> List[StepExecution]:
+        analytics = await self._store.load_analytics(since)
+        executions = []
+        for _, execution_id, run_id in analytics.slowest_steps(TOP_K):
+            execution = await self._store.load_step(execution_id)
+            if execution is None:
+                # Archived with its run
+                execution = next(
+                    (e for e in await self._store.load_steps(run_id) if str(e.execution_id) == execution_id),
+                    None
+                )
+            # The first hour is loaded whole, so apply ``since`` exactly here
+            if execution is not None and (since is None or execution.started_at >= since):
+                executions.append(execution)
+            if len(executions) >= limit:
+                break
+        return executions
+    
     async def get_most_failed_steps(
         self, 
         limit: int = 10,
@@ -281,6 +404,9 @@ class LMDBStepExecutionRepository(LMDBRepositoryBase[StepExecution], StepExecuti
     ) -> List[Dict[str, Any]]:
         """Get steps with highest failure rates.
         
+        Read from the hourly aggregates; ``since`` is applied at hour
+        granularity.
+        
         Args:
             limit: Maximum number of results
             since: Only include executions after this time
@@ -291,59 +417,11 @@ class LMDBStepExecutionRepository(LMDBRepositoryBase[StepExecution], StepExecuti
         Raises:
             RepositoryError: If query operation fails
         """
-        executions = await self.find_by_workspace()
-        
-        # Filter by time if specified
-        if since:
-            executions = [e for e in executions if e.started_at >= since]
-        
-        # Group by step ID
-        step_stats = {}
-        for execution in executions:
-            step_key = str(execution.step_id)
-            if step_key not in step_stats:
-                step_stats[step_key] = {
-                    "step_id": execution.step_id,
-                    "total_executions": 0,
-                    "failed_executions": 0,
-                    "error_messages": []
-                }
-            
-            step_stats[step_key]["total_executions"] += 1
-            if not execution.is_successful:
-                step_stats[step_key]["failed_executions"] += 1
-                if execution.error_message:
-                    step_stats[step_key]["error_messages"].append(execution.error_message)
-        
-        # Calculate failure rates and common errors
-        result = []
-        for stats in step_stats.values():
-            total = stats["total_executions"]
-            failed = stats["failed_executions"]
-            failure_rate = failed / total if total > 0 else 0.0
-            
-            # Find most common errors
-            error_counts = {}
-            for error in stats["error_messages"]:
-                error_counts[error] = error_counts.get(error, 0) + 1
-            
-            common_errors = sorted(
-                error_counts.items(), 
-                key=lambda x: x[1], 
-                reverse=True
-            )[:5]  # Top 5 errors
-            
-            result.append({
-                "step_id": stats["step_id"],
-                "total_executions": total,
-                "failed_executions": failed,
-                "failure_rate": failure_rate,
-                "common_errors": [{"error": error, "count": count} for error, count in common_errors]
-            })
-        
-        # Sort by failure rate and return top results
-        result.sort(key=lambda x: x["failure_rate"], reverse=True)
-        return result[:limit]
+        analytics = await self._store.load_analytics(since)
+        result = analytics.most_failed_steps(limit)
+        for stats in result:
+            stats["step_id"] = StepId(stats["step_id"])
+        return result
     
     async def record_execution_start(
         self, 
@@ -0,0 +1,86 @@
+"""Content-addressed file storage for spilled step outputs.
+
+Each blob is one file named after the SHA-256 of its content, fanned out
+over subdirectories by the first two hex digits::
+
+    <root>/<ab>/<cdef...>
+
+Blobs are written once: storing content that already exists is a no-op,
+so identical outputs across steps and runs share a file. Writes go
+through a temporary file and an atomic rename, so a blob file is always
+complete. Reads map the file with mmap.
+"""
+
+import mmap
+import os
+import tempfile
+from pathlib import Path
+
+from ...domains.pipeline.services.step_output_spill import StepOutputBlobStore, blob_digest
+from ..base.exceptions import StorageError
+
+
+class FileStepOutputBlobStore(StepOutputBlobStore):
+    """Step output blobs as files in a directory tree.
+
+    Examples:
+        store = FileStepOutputBlobStore(storage_path / "blobs" / "step_outputs")
+        digest = store.put(output.encode("utf-8"))
+        text = store.get(digest).decode("utf-8")
+    """
+
+    def __init__(self, root: Path):
+        """Initialize blob store.
+
+        Args:
+            root: Directory holding the blob files
+        """
+        self.root = Path(root)
+
+    def put(self, data: bytes) -> str:
+        digest = blob_digest(data)
+        path = self._path(digest)
+        if path.exists():
+            return digest
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+            try:
+                with os.fdopen(fd, "wb") as blob_file:
+                    blob_file.write(data)
+                    blob_file.flush()
+                    os.fsync(blob_file.fileno())
+                os.replace(temp_name, path)
+            except BaseException:
+                if os.path.exists(temp_name):
+                    os.unlink(temp_name)
+                raise
+        except OSError as e:
+            raise StorageError(
+                f"Failed to store step output blob {digest}: {e}", "put", "StepOutputBlob", e
+            ) from e
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        path = self._path(digest)
+        try:
+            with open(path, "rb") as blob_file:
+                if os.fstat(blob_file.fileno()).st_size == 0:
+                    return b""
+                with mmap.mmap(blob_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    return mapped[:]
+        except FileNotFoundError:
+            raise KeyError(digest) from None
+        except OSError as e:
+            raise StorageError(
+                f"Failed to read step output blob {digest}: {e}", "get", "StepOutputBlob", e
+            ) from e
+
+    def contains(self, digest: str) -> bool:
+        return self._path(digest).exists()
+
+    def _path(self, digest: str) -> Path:
+        if len(digest) < 3 or not all(char in "0123456789abcdef" for char in digest):
+            raise KeyError(digest)
+        return self.root / digest[:2] / digest[2:]
@@ -0,0 +1,473 @@
+"""Inverted full-text index for pipeline templates.
+
+Maintains an LMDB sub-database alongside the template store that maps terms
+from template names, descriptions, tags and step prompts to template IDs.
+The index is updated incrementally on save and delete, in the same
+transaction as the template itself, and supports ranked multi-term queries
+and prefix search for interactive type-ahead.
+"""
+
+import hashlib
+import json
+import math
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import lmdb
+
+from ...domains.pipeline.entities.pipeline_template import PipelineTemplate
+from ...domains.workspace.value_objects.workspace_name import WorkspaceName
+from ...shared.repository import RepositoryError
+from ..base.storage_manager import LMDBStorageManager
+
+
+_TOKEN_PATTERN = re.compile(r'[^\W_]+')
+_MAX_TERM_LENGTH = 64
+_SEPARATOR = '\x00'
+
+# Names and tags longer than this (in bytes) are hashed in keys, keeping
+# keys under LMDB's 511 byte limit
+_MAX_KEY_PART_BYTES = 200
+
+# Bumped when the key layout changes, so older indexes are rebuilt
+INDEX_VERSION = 2
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase index terms.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of terms in document order
+    """
+    return [
+        token[:_MAX_TERM_LENGTH]
+        for token in _TOKEN_PATTERN.findall(text.lower())
+        if len(token) > 1 or token.isdigit()
+    ]
+
+
+def _key_part(value: str) -> str:
+    """Name or tag as used in keys, hashed if too long for LMDB."""
+    if len(value.encode("utf-8")) <= _MAX_KEY_PART_BYTES:
+        return value
+    return "#" + hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class TemplateSearchHit:
+    """Ranked template search result."""
+    template_id: str
+    score: float
+    matched_terms: Tuple[str, ...]
+
+
+class TemplateSearchIndex:
+    """Incrementally maintained inverted index over pipeline templates.
+
+    Key layout within the index sub-database (all keys are prefixed with
+    ``ws:<workspace>:``):
+
+    - ``term:<term>\\0<template_id>`` -> per-field term frequencies
+    - ``doc:<template_id>`` -> indexed terms, name and tags (for removal)
+    - ``name:<name>\\0<template_id>`` -> empty marker (one per version)
+    - ``tag:<tag>\\0<template_id>`` -> empty marker
+    - ``stats`` -> document count and index version
+
+    Names and tags too long for a key are replaced by their hash.
+
+    Examples:
+        index = TemplateSearchIndex(storage_manager, workspace_name)
+        await index.index_template(template)
+
+        hits = await index.search("blog outline", prefix=True)
+        completions = await index.suggest("outl")
+    """
+
+    FIELD_WEIGHTS: Dict[str, float] = {
+        "name": 4.0,
+        "tags": 3.0,
+        "description": 2.0,
+        "steps": 1.0,
+    }
+
+    def __init__(
+        self,
+        storage_manager: LMDBStorageManager,
+        workspace_name: WorkspaceName,
+        db_name: str = "pipeline_templates",
+        db_key: str = "template_index"
+    ):
+        """Initialize search index.
+
+        Args:
+            storage_manager: LMDB storage manager
+            workspace_name: Workspace the index is scoped to
+            db_name: LMDB database holding the templates
+            db_key: Sub-database name for the index
+        """
+        self._storage = storage_manager
+        self._workspace_name = workspace_name
+        self._db_name = db_name
+        self._db_key = db_key
+        self._prefix = f"ws:{workspace_name.value}:"
+
+    # Document extraction
+
+    @classmethod
+    def extract_fields(cls, template: PipelineTemplate) -> Dict[str, List[str]]:
+        """Extract indexable terms per field from a template.
+
+        Args:
+            template: Template to index
+
+        Returns:
+            Mapping of field name to its terms
+        """
+        step_text: List[str] = []
+        for step in template.steps.values():
+            step_text.append(step.name)
+            step_text.append(step.description)
+            prompt = getattr(step.prompt_template, "template", step.prompt_template)
+            step_text.append(str(prompt))
+
+        return {
+            "name": tokenize(str(template.name)),
+            "description": tokenize(template.description or ""),
+            "tags": [term for tag in template.tags for term in tokenize(tag)],
+            "steps": tokenize(" ".join(step_text)),
+        }
+
+    @classmethod
+    def build_postings(cls, template: PipelineTemplate) -> Dict[str, Dict[str, int]]:
+        """Build term postings for a template.
+
+        Args:
+            template: Template to index
+
+        Returns:
+            Mapping of term to per-field frequencies
+        """
+        postings: Dict[str, Dict[str, int]] = {}
+        for field_name, terms in cls.extract_fields(template).items():
+            for term in terms:
+                fields = postings.setdefault(term, {})
+                fields[field_name] = fields.get(field_name, 0) + 1
+        return postings
+
+    # Incremental maintenance
+
+    def open_index(self, txn: Any) -> Any:
+        """Open the index database within a transaction of the template store."""
+        return self._storage.open_db(txn, self._db_name, self._db_key)
+
+    async def index_template(self, template: PipelineTemplate) -> None:
+        """Add or replace a template in the index.
+
+        Args:
+            template: Template to index
+
+        Raises:
+            RepositoryError: If the index update fails
+        """
+        async with self._storage.transaction(self._db_name, write=True, db_key=self._db_key) as (txn, db):
+            self.put_document(txn, db, template)
+
+    def put_document(self, txn: Any, db: Any, template: PipelineTemplate) -> None:
+        """Add or replace a template in the index within a write transaction."""
+        template_id = str(template.id.value)
+        postings = self.build_postings(template)
+        name = str(template.name)
+        tags = list(template.tags)
+
+        existed = self._remove_document(txn, db, template_id)
+
+        for term, fields in postings.items():
+            txn.put(
+                self._term_key(term, template_id),
+                json.dumps(fields, separators=(",", ":")).encode("utf-8"),
+                db=db
+            )
+        for tag in tags:
+            txn.put(self._tag_key(tag, template_id), b"", db=db)
+        txn.put(self._name_key(name, template_id), b"", db=db)
+        txn.put(
+            self._key(f"doc:{template_id}"),
+            json.dumps({"terms": sorted(postings), "name": name, "tags": tags}).encode("utf-8"),
+            db=db
+        )
+
+        if not existed:
+            self._adjust_document_count(txn, db, 1)
+
+    def delete_document(self, txn: Any, db: Any, template_id: Any) -> bool:
+        """Remove a template from the index within a write transaction."""
+        removed = self._remove_document(txn, db, str(getattr(template_id, "value", template_id)))
+        if removed:
+            self._adjust_document_count(txn, db, -1)
+        return removed
+
+    async def remove_template(self, template_id: Any) -> bool:
+        """Remove a template from the index.
+
+        Args:
+            template_id: ID of the template to remove
+
+        Returns:
+            True if the template was indexed, False otherwise
+
+        Raises:
+            RepositoryError: If the index update fails
+        """
+        async with self._storage.transaction(self._db_name, write=True, db_key=self._db_key) as (txn, db):
+            return self.delete_document(txn, db, template_id)
+
+    async def rebuild(self, templates: Iterable[PipelineTemplate]) -> int:
+        """Rebuild the index from scratch.
+
+        Args:
+            templates: All templates in the workspace
+
+        Returns:
+            Number of indexed templates
+        """
+        async with self._storage.transaction(self._db_name, write=True, db_key=self._db_key) as (txn, db):
+            return self.rebuild_documents(txn, db, templates)
+
+    def rebuild_documents(self, txn: Any, db: Any, templates: Iterable[PipelineTemplate]) -> int:
+        """Rebuild the index from scratch within a write transaction."""
+        prefix = self._prefix.encode("utf-8")
+        cursor = txn.cursor(db=db)
+        if cursor.set_range(prefix):
+            while cursor.key().startswith(prefix):
+                if not cursor.delete():
+                    break
+        self._write_stats(txn, db, 0)
+
+        count = 0
+        for template in templates:
+            self.put_document(txn, db, template)
+            count += 1
+        return count
+
+    # Queries
+
+    async def is_built(self) -> bool:
+        """Check whether a current-version index exists for the workspace."""
+        try:
+            with self._storage.get_transaction(self._db_name, write=False, db_key=self._db_key) as (txn, db):
+                raw = txn.get(self._key("stats"), db=db)
+        except lmdb.NotFoundError:
+            # The index database is created by the first index write
+            return False
+        except lmdb.Error as e:
+            raise RepositoryError(f"LMDB transaction failed: {e}") from e
+        return raw is not None and json.loads(raw).get("version") == INDEX_VERSION
+
+    async def document_count(self) -> int:
+        """Get number of indexed templates."""
+        async with self._storage.transaction(self._db_name, write=False, db_key=self._db_key) as (txn, db):
+            return self._read_document_count(txn, db)
+
+    async def search(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        prefix: bool = False,
+        fields: Optional[Sequence[str]] = None
+    ) -> List[TemplateSearchHit]:
+        """Run a ranked multi-term query.
+
+        All query terms must match. Each matching template is scored with a
+        BM25-style IDF weighted by the field the term was found in.
+
+        Args:
+            query: Free-text query
+            limit: Maximum number of hits to return
+            prefix: Treat the last query term as a prefix (type-ahead)
+            fields: Restrict matching to these fields (default: all)
+
+        Returns:
+            Hits ordered by descending score
+
+        Raises:
+            RepositoryError: If the index read fails
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+
+        weights = {
+            field_name: weight for field_name, weight in self.FIELD_WEIGHTS.items()
+            if fields is None or field_name in fields
+        }
+
+        scores: Optional[Dict[str, float]] = None
+        matched: Dict[str, List[str]] = {}
+
+        async with self._storage.transaction(self._db_name, write=False, db_key=self._db_key) as (txn, db):
+            total_documents = max(1, self._read_document_count(txn, db))
+            cursor = txn.cursor(db=db)
+
+            for position, term in enumerate(terms):
+                is_prefix = prefix and position == len(terms) - 1
+                term_scores = self._score_term(cursor, term, is_prefix, weights)
+                if not term_scores:
+                    return []
+
+                document_frequency = len(term_scores)
+                idf = math.log(
+                    1 + (total_documents - document_frequency + 0.5) / (document_frequency + 0.5)
+                )
+
+                if scores is None:
+                    scores = {doc_id: score * idf for doc_id, score in term_scores.items()}
+                else:
+                    scores = {
+                        doc_id: score + term_scores[doc_id] * idf
+                        for doc_id, score in scores.items()
+                        if doc_id in term_scores
+                    }
+                    if not scores:
+                        return []
+
+                for doc_id in scores:
+                    matched.setdefault(doc_id, []).append(term)
+
+        hits = [
+            TemplateSearchHit(doc_id, score, tuple(matched[doc_id]))
+            for doc_id, score in (scores or {}).items()
+        ]
+        hits.sort(key=lambda hit: (-hit.score, hit.template_id))
+        return hits[:limit] if limit is not None else hits
+
+    async def suggest(self, prefix: str, limit: int = 10) -> List[str]:
+        """Complete a partial term for type-ahead.
+
+        Args:
+            prefix: Partial term typed so far
+            limit: Maximum number of completions
+
+        Returns:
+            Indexed terms starting with the prefix, most common first
+        """
+        terms = tokenize(prefix)
+        if not terms:
+            return []
+
+        term_prefix = self._key(f"term:{terms[-1]}")
+        frequencies: Dict[str, int] = {}
+
+        async with self._storage.transaction(self._db_name, write=False, db_key=self._db_key) as (txn, db):
+            cursor = txn.cursor(db=db)
+            if cursor.set_range(term_prefix):
+                for key in cursor.iternext(keys=True, values=False):
+                    if not key.startswith(term_prefix):
+                        break
+                    term = key[len(self._key("term:")):].split(b"\x00", 1)[0].decode("utf-8")
+                    frequencies[term] = frequencies.get(term, 0) + 1
+
+        ranked = sorted(frequencies.items(), key=lambda item: (-item[1], item[0]))
+        return [term for term, _ in ranked[:limit]]
+
+    async def find_id_by_name(self, name: str) -> Optional[str]:
+        """Look up the ID of one template with an exact name."""
+        ids = await self.find_ids_by_name(name)
+        return ids[0] if ids else None
+
+    async def find_ids_by_name(self, name: str) -> List[str]:
+        """Look up the IDs of all templates (versions) with an exact name."""
+        return await self._find_ids(self._key(f"name:{_key_part(name)}{_SEPARATOR}"))
+
+    async def find_ids_by_tag(self, tag: str) -> List[str]:
+        """Look up template IDs carrying an exact tag."""
+        return await self._find_ids(self._key(f"tag:{_key_part(tag)}{_SEPARATOR}"))
+
+    # Internal helpers
+
+    async def _find_ids(self, key_prefix: bytes) -> List[str]:
+        ids: List[str] = []
+        async with self._storage.transaction(self._db_name, write=False, db_key=self._db_key) as (txn, db):
+            cursor = txn.cursor(db=db)
+            if cursor.set_range(key_prefix):
+                for key in cursor.iternext(keys=True, values=False):
+                    if not key.startswith(key_prefix):
+                        break
+                    ids.append(key[len(key_prefix):].decode("utf-8"))
+        return ids
+
+    def _key(self, suffix: str) -> bytes:
+        return f"{self._prefix}{suffix}".encode("utf-8")
+
+    def _term_key(self, term: str, template_id: str) -> bytes:
+        return self._key(f"term:{term}{_SEPARATOR}{template_id}")
+
+    def _tag_key(self, tag: str, template_id: str) -> bytes:
+        return self._key(f"tag:{_key_part(tag)}{_SEPARATOR}{template_id}")
+
+    def _name_key(self, name: str, template_id: str) -> bytes:
+        return self._key(f"name:{_key_part(name)}{_SEPARATOR}{template_id}")
+
+    def _score_term(
+        self,
+        cursor: Any,
+        term: str,
+        is_prefix: bool,
+        weights: Dict[str, float]
+    ) -> Dict[str, float]:
+        """Collect weighted term frequencies for one query term."""
+        term_prefix = self._key(f"term:{term}" if is_prefix else f"term:{term}{_SEPARATOR}")
+        scores: Dict[str, float] = {}
+
+        if not cursor.set_range(term_prefix):
+            return scores
+
+        for key, value in cursor.iternext(keys=True, values=True):
+            if not key.startswith(term_prefix):
+                break
+            doc_id = key.rsplit(b"\x00", 1)[1].decode("utf-8")
+            fields = json.loads(value)
+            score = sum(
+                weights[field_name] * (1 + math.log(frequency))
+                for field_name, frequency in fields.items()
+                if field_name in weights
+            )
+            if score > 0:
+                # Prefix expansions keep the best-matching completion per template
+                scores[doc_id] = max(scores.get(doc_id, 0.0), score)
+
+        return scores
+
+    def _remove_document(self, txn: Any, db: Any, template_id: str) -> bool:
+        """Delete all index entries for a template within a transaction."""
+        doc_key = self._key(f"doc:{template_id}")
+        raw = txn.get(doc_key, db=db)
+        if raw is None:
+            return False
+
+        document = json.loads(raw)
+        for term in document.get("terms", []):
+            txn.delete(self._term_key(term, template_id), db=db)
+        for tag in document.get("tags", []):
+            txn.delete(self._tag_key(tag, template_id), db=db)
+
+        txn.delete(self._name_key(document.get("name", ""), template_id), db=db)
+
+        txn.delete(doc_key, db=db)
+        return True
+
+    def _read_document_count(self, txn: Any, db: Any) -> int:
+        raw = txn.get(self._key("stats"), db=db)
+        if raw is None:
+            return 0
+        return int(json.loads(raw).get("documents", 0))
+
+    def _adjust_document_count(self, txn: Any, db: Any, delta: int) -> None:
+        self._write_stats(txn, db, max(0, self._read_document_count(txn, db) + delta))
+
+    def _write_stats(self, txn: Any, db: Any, documents: int) -> None:
+        stats = {"documents": documents, "version": INDEX_VERSION}
+        txn.put(self._key("stats"), json.dumps(stats).encode("utf-8"), db=db)
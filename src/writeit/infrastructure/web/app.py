@@ -22,6 +22,8 @@ import uvicorn
 from ...shared.dependencies.container import Container
 from ...shared.events.event_bus import EventBus
 from ...shared.errors.base import DomainError
+from ...shared.query_cache import QueryCache
+from ...application.queries.handlers.pipeline_handlers import register_pipeline_query_cache_invalidation
 from .context import APIContextMiddleware, APIContextManager
 from .error_handler import (
     error_handler, domain_exception_handler, generic_exception_handler,
@@ -212,6 +214,12 @@ class WriteItAPIApplication:
         if not self.container.is_registered(WebSocketManager):
             self.container.register_instance(WebSocketManager, self.websocket_manager)
         
+        # Keep cached query results in step with domain events on this bus
+        if not self.container.is_registered(QueryCache):
+            self.container.register_instance(QueryCache, QueryCache())
+        query_cache = await self.container.aresolve(QueryCache)
+        await register_pipeline_query_cache_invalidation(self.event_bus, query_cache)
+        
         # Register handlers would happen here if using DI for handlers
         # For now, handlers are static methods
     
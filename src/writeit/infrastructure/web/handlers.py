@@ -37,6 +37,7 @@ from ...application.queries.content_queries import (
 from ...shared.dependencies.container import Container
 from ...shared.command import CommandResult
 from ...shared.query import QueryResult
+from ...shared.query_cache import QueryCache
 from .context import APIContextManager, get_current_context, get_current_container
 from .validation import (
     CreateWorkspaceRequest, UpdateWorkspaceRequest,
@@ -559,6 +560,28 @@ class PipelineHandlers:
             error_response = error_handler.create_error_response(exc)
             http_exc = error_handler.to_http_exception(error_response)
             raise http_exc
+    
+    @staticmethod
+    async def get_query_cache_stats() -> JSONResponse:
+        """Get query result cache statistics."""
+        container = get_current_container()
+        if not container:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Dependency injection container not available"
+            )
+        
+        try:
+            query_cache = await container.aresolve(QueryCache)
+            return JSONResponse(
+                status_code=status.HTTP_200_OK,
+                content=response_mapper.create_success_response(query_cache.get_stats())
+            )
+        
+        except Exception as exc:
+            error_response = error_handler.create_error_response(exc)
+            http_exc = error_handler.to_http_exception(error_response)
+            raise http_exc
 
 
 class ContentHandlers:
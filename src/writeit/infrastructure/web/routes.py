@@ -164,6 +164,15 @@ def create_pipeline_router(handlers: Type[PipelineHandlers]) -> APIRouter:
         """
         return await handlers.get_pipeline_run(run_id, workspace_name)
     
+    @router.get("/cache/stats", response_model=None)
+    async def get_query_cache_stats() -> JSONResponse:
+        """Get pipeline query cache statistics.
+        
+        Returns hit ratio, staleness and size of the query result
+        cache, overall and per cached query handler.
+        """
+        return await handlers.get_query_cache_stats()
+    
     return router
 
 
@@ -7,6 +7,7 @@ from dataclasses import dataclass
 from typing import Optional, Dict, Any
 from datetime import datetime, timedelta, UTC
 
+from writeit.shared.single_flight import SingleFlight
 from writeit.storage.adapter import create_storage_adapter
 
 
@@ -71,6 +72,8 @@ class LLMCache:
         self.workspace_name = workspace_name
         self.memory_cache: Dict[str, CacheEntry] = {}
         self.cache_stats = {"hits": 0, "misses": 0, "evictions": 0}
+        # Concurrent misses for the same key share one LLM call
+        self.single_flight = SingleFlight()
 
         # Cache configuration
         self.max_memory_entries = 1000  # Maximum entries to keep in memory
@@ -218,6 +221,7 @@ class LLMCache:
             "evictions": self.cache_stats["evictions"],
             "hit_rate": hit_rate,
             "total_requests": total_requests,
+            "single_flight": self.single_flight.get_stats(),
         }
 
     async def cleanup_expired(self) -> int:
@@ -311,7 +315,16 @@ class CachedLLMClient:
             if cached:
                 return cached.response, cached.tokens_used
 
-        # Make actual LLM call
+        # Identical requests already in flight share this call
+        cache_key = self.cache._generate_cache_key(prompt, model_name, context)
+        return await self.cache.single_flight.do(
+            cache_key, lambda: self._prompt_and_cache(prompt, model_name, context)
+        )
+
+    async def _prompt_and_cache(
+        self, prompt: str, model_name: str, context: Optional[Dict[str, Any]]
+    ) -> tuple[str, Dict[str, int]]:
+        """Make the LLM call and cache its response."""
         import llm
 
         model = llm.get_model(model_name)
@@ -335,7 +348,20 @@ class CachedLLMClient:
     async def prompt_stream(
         self, prompt: str, model_name: str, context: Optional[Dict[str, Any]] = None
     ):
-        """Stream LLM response (bypasses cache for now)."""
+        """Stream LLM response (bypasses cache for now).
+
+        Concurrent streams of the same request share one LLM stream.
+        """
+        cache_key = self.cache._generate_cache_key(prompt, model_name, context)
+        async for chunk in self.cache.single_flight.stream(
+            cache_key, lambda: self._stream_and_cache(prompt, model_name, context)
+        ):
+            yield chunk
+
+    async def _stream_and_cache(
+        self, prompt: str, model_name: str, context: Optional[Dict[str, Any]]
+    ):
+        """Stream the LLM response and cache it once complete."""
         import llm
 
         model = llm.get_async_model(model_name)
@@ -19,6 +19,8 @@ from writeit.storage import StorageManager
 from writeit.workspace.workspace import Workspace
 from writeit.llm.token_usage import TokenUsageTracker
 from writeit.llm.cache import LLMCache, CachedLLMClient
+from writeit.domains.pipeline.services.prompt_budget import TokenBudgetPlanner
+from writeit.domains.pipeline.services.step_output_spill import StepOutputSpiller
 from writeit.domains.pipeline.errors import PipelineError, StepExecutionError, PipelineValidationError as ValidationError
 
 
@@ -56,11 +58,17 @@ class PipelineExecutor:
         workspace: Workspace,
         storage: StorageManager,
         workspace_name: str = "default",
+        token_budget: Optional[TokenBudgetPlanner] = None,
+        output_spiller: Optional[StepOutputSpiller] = None,
     ):
         self.workspace = workspace
         self.storage = storage
         self.workspace_name = workspace_name
         self.active_runs: Dict[str, PipelineRun] = {}
+        # Fits prompts of long step chains into the model's context window
+        self.token_budget = token_budget
+        # Keeps large step outputs in a blob store instead of memory and run records
+        self.output_spiller = output_spiller
 
         # Initialize caching
         self.llm_cache = LLMCache(storage, workspace_name)
@@ -194,8 +202,8 @@ class PipelineExecutor:
                     step_key=step.key,
                     status="completed",
                     started_at=datetime.now(UTC),
-                    responses=step_result.responses,
-                    selected_response=step_result.selected_response,
+                    responses=self._spill(step_result.responses),
+                    selected_response=self._spill(step_result.selected_response),
                     user_feedback=step_result.user_feedback,
                     tokens_used=step_result.tokens_used,
                     execution_time=step_result.execution_time,
@@ -205,7 +213,7 @@ class PipelineExecutor:
 
                 # Update context with step output
                 context.step_outputs[step.key] = (
-                    step_result.selected_response or step_result.responses[0]
+                    step_execution.selected_response or step_execution.responses[0]
                 )
 
                 if progress_callback:
@@ -245,14 +253,14 @@ class PipelineExecutor:
         start_time = datetime.now(UTC)
 
         try:
+            # Determine model to use
+            model_name = self._select_model(step.model_preference, pipeline.defaults)
+
             # Render prompt template
             rendered_prompt = self._render_prompt_template(
-                step.prompt_template, context, pipeline
+                step.prompt_template, context, pipeline, step.key, model_name
             )
 
-            # Determine model to use
-            model_name = self._select_model(step.model_preference, pipeline.defaults)
-
             # Execute LLM call
             responses = await self._execute_llm_call(
                 rendered_prompt, model_name, context, response_callback
@@ -261,6 +269,10 @@ class PipelineExecutor:
             # Calculate execution time
             execution_time = (datetime.now(UTC) - start_time).total_seconds()
 
+            metadata = {}
+            if self.token_budget and self.token_budget.get_report(step.key):
+                metadata["token_budget"] = self.token_budget.get_report(step.key).to_dict()
+
             return StepResult(
                 step_key=step.key,
                 responses=responses,
@@ -268,24 +280,47 @@ class PipelineExecutor:
                 tokens_used=context.token_tracker.get_step_usage(step.key)
                 if context.token_tracker
                 else {},
+                metadata=metadata,
             )
 
         except Exception as e:
             raise StepExecutionError(f"Failed to execute step {step.key}: {str(e)}")
 
     def _render_prompt_template(
-        self, template: str, context: ExecutionContext, pipeline: Pipeline
+        self,
+        template: str,
+        context: ExecutionContext,
+        pipeline: Pipeline,
+        step_key: Optional[str] = None,
+        model_name: Optional[str] = None,
     ) -> str:
-        """Render a prompt template with context variables."""
-        rendered = template
+        """Render a prompt template with context variables.
 
-        # Replace input variables
-        for key, value in context.inputs.items():
-            rendered = rendered.replace(f"{{{{ inputs.{key} }}}}", str(value))
+        With a token budget, input and step output values are reduced so
+        the prompt fits the budget of the step and model.
+        """
+        rendered = template
 
-        # Replace step output variables
-        for key, value in context.step_outputs.items():
-            rendered = rendered.replace(f"{{{{ steps.{key} }}}}", str(value))
+        variables = {f"inputs.{key}": value for key, value in context.inputs.items()}
+        variables.update(
+            (f"steps.{key}", value) for key, value in context.step_outputs.items()
+        )
+        # Only render referenced values, so spilled outputs are loaded on demand
+        values = {
+            path: str(value)
+            for path, value in variables.items()
+            if f"{{{{ {path} }}}}" in template
+        }
+        if self.token_budget and step_key:
+            fixed_text = template
+            for path in values:
+                fixed_text = fixed_text.replace(f"{{{{ {path} }}}}", "")
+            packed, _ = self.token_budget.pack_values(step_key, fixed_text, values, model_name)
+            values.update(packed)
+
+        # Replace input and step output variables
+        for path, value in values.items():
+            rendered = rendered.replace(f"{{{{ {path} }}}}", value)
 
         # Replace defaults
         for key, value in pipeline.defaults.items():
@@ -338,7 +373,7 @@ class PipelineExecutor:
             cache_context = {
                 "run_id": context.run_id,
                 "pipeline_id": context.pipeline_id,
-                "step_outputs": context.step_outputs,
+                "step_outputs": self._persisted(context.step_outputs),
             }
 
             # Make cached API call
@@ -413,8 +448,8 @@ class PipelineExecutor:
                         "started_at": step.started_at.isoformat()
                         if step.started_at
                         else None,
-                        "responses": step.responses,
-                        "selected_response": step.selected_response,
+                        "responses": self._persisted(step.responses),
+                        "selected_response": self._persisted(step.selected_response),
                         "user_feedback": step.user_feedback,
                         "tokens_used": step.tokens_used,
                         "execution_time": step.execution_time,
@@ -432,6 +467,18 @@ class PipelineExecutor:
             # Log error but don't fail pipeline execution
             print(f"Warning: Failed to store pipeline run {run.id}: {e}")
 
+    def _spill(self, value: Any) -> Any:
+        """Move large strings in a value to the blob store, if configured."""
+        if self.output_spiller is None:
+            return value
+        return self.output_spiller.spill(value)
+
+    def _persisted(self, value: Any) -> Any:
+        """Form of a value to persist: spilled outputs as blob references."""
+        if self.output_spiller is None:
+            return value
+        return self.output_spiller.to_refs(value)
+
     async def get_run(self, run_id: str) -> Optional[PipelineRun]:
         """Retrieve a pipeline run."""
         if run_id in self.active_runs:
@@ -0,0 +1,352 @@
+"""Query result cache for CQRS query handlers.
+
+Caches query results keyed by a normalized form of the query object, so
+two queries asking for the same thing share an entry regardless of their
+``query_id`` or ``timestamp``. Entries expire after a per-namespace TTL
+and are invalidated precisely through tags: handlers tag what a result
+depends on (e.g. ``"pipeline_runs:default"``) and domain events published
+on the event bus invalidate the tags they affect.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, fields, is_dataclass, replace
+from datetime import datetime
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple, Type, TypeVar
+
+from .events.domain_event import DomainEvent
+from .events.event_bus import EventBus
+from .events.event_handler import BaseEventHandler
+from .query import Query, QueryResult
+
+
+logger = logging.getLogger(__name__)
+
+# Base query fields that identify a request rather than what it asks for
+VOLATILE_QUERY_FIELDS = frozenset({"query_id", "timestamp", "correlation_id", "metadata"})
+
+CacheKey = Tuple[str, Hashable]
+
+R = TypeVar('R', bound=QueryResult)
+
+# Maps an event to the cache tags it invalidates
+InvalidationRule = Callable[[DomainEvent], Iterable[str]]
+
+
+def normalize_value(value: Any) -> Hashable:
+    """Convert a query field value into a hashable, order-stable form."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (str, int, float, bool, type(None), datetime)):
+        return value
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), normalize_value(v)) for k, v in value.items()))
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted((normalize_value(v) for v in value), key=repr))
+    if isinstance(value, (list, tuple)):
+        return tuple(normalize_value(v) for v in value)
+    if is_dataclass(value):
+        return (type(value).__name__,) + tuple(
+            (f.name, normalize_value(getattr(value, f.name))) for f in fields(value)
+        )
+    return repr(value)
+
+
+def normalize_query(query: Query) -> CacheKey:
+    """Build the cache key of a query from the fields that affect its result."""
+    return type(query).__name__, tuple(
+        (f.name, normalize_value(getattr(query, f.name)))
+        for f in fields(query)
+        if f.name not in VOLATILE_QUERY_FIELDS
+    )
+
+
+@dataclass
+class _CacheEntry:
+    namespace: str
+    value: Any
+    created_at: float
+    expires_at: float
+    tags: Tuple[str, ...]
+
+
+@dataclass
+class NamespaceStats:
+    """Counters for one cached query namespace (usually one handler)."""
+    ttl: float
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class QueryCache:
+    """TTL cache of query results with tag-based invalidation.
+
+    Examples:
+        cache = QueryCache()
+        cache.configure("pipeline_runs.list", ttl=10.0)
+        result = await cache.get_or_compute(
+            query, "pipeline_runs.list", compute, tags=["pipeline_runs:default"]
+        )
+        cache.invalidate("pipeline_runs:default")
+    """
+
+    def __init__(
+        self,
+        default_ttl: float = 30.0,
+        max_entries: int = 1024,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """Initialize cache.
+
+        Args:
+            default_ttl: TTL in seconds for namespaces without their own
+            max_entries: Entries kept before least recently used are evicted
+            clock: Monotonic time source (seconds)
+        """
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[CacheKey, _CacheEntry]" = OrderedDict()
+        self._tag_index: Dict[str, Set[CacheKey]] = {}
+        self._tag_versions: Dict[str, int] = {}
+        self._inflight: Dict[CacheKey, "asyncio.Future[Any]"] = {}
+        self._namespaces: Dict[str, NamespaceStats] = {}
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+        self._served_ages: List[float] = []
+        self._max_served_age = 0.0
+
+    def configure(self, namespace: str, ttl: float) -> None:
+        """Set the TTL (seconds) of a namespace."""
+        self._namespace(namespace).ttl = ttl
+
+    async def get_or_compute(
+        self,
+        query: Query,
+        namespace: str,
+        compute: Callable[[], Awaitable[R]],
+        tags: Iterable[str] = ()
+    ) -> R:
+        """Return the cached result of a query, computing it on a miss.
+
+        Concurrent misses for the same query share one computation. Only
+        successful results are cached, and a result is discarded if one of
+        its tags was invalidated while it was being computed.
+
+        Args:
+            query: Query being handled
+            namespace: Namespace the query belongs to (selects the TTL)
+            compute: Coroutine function producing the result
+            tags: Tags the result depends on
+
+        Returns:
+            The query result; cached results have ``cache_hit`` set
+        """
+        key = (namespace, normalize_query(query))
+        stats = self._namespace(namespace)
+
+        entry = self._lookup(key)
+        if entry is not None:
+            stats.hits += 1
+            self._record_served_age(self._clock() - entry.created_at)
+            return self._as_hit(entry.value)
+        stats.misses += 1
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            shared: R = await asyncio.shield(inflight)
+            return shared
+
+        tags = tuple(tags)
+        versions = {tag: self._tag_versions.get(tag, 0) for tag in tags}
+        future: "asyncio.Future[Any]" = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await compute()
+        except BaseException as e:
+            future.set_exception(e)
+            # Waiters re-raise it; mark it retrieved for the no-waiter case
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+        future.set_result(result)
+        unchanged = all(self._tag_versions.get(tag, 0) == version for tag, version in versions.items())
+        if result.success and unchanged:
+            self._store(key, namespace, result, tags, stats.ttl)
+        return result
+
+    def invalidate(self, *tags: str) -> int:
+        """Drop every entry carrying one of the tags.
+
+        Returns:
+            Number of entries dropped
+        """
+        dropped = 0
+        for tag in tags:
+            self._tag_versions[tag] = self._tag_versions.get(tag, 0) + 1
+            for key in self._tag_index.pop(tag, set()):
+                if self._remove(key):
+                    dropped += 1
+        self._invalidations += dropped
+        return dropped
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        for tag in list(self._tag_index):
+            self._tag_versions[tag] = self._tag_versions.get(tag, 0) + 1
+        self._entries.clear()
+        self._tag_index.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit ratio, staleness and size of the cache.
+
+        Staleness is the age of cached results when they were served:
+        the average and maximum over served hits, plus the age of the
+        oldest entry currently held.
+        """
+        now = self._clock()
+        hits = sum(stats.hits for stats in self._namespaces.values())
+        misses = sum(stats.misses for stats in self._namespaces.values())
+        entry_counts: Dict[str, int] = {}
+        for entry in self._entries.values():
+            entry_counts[entry.namespace] = entry_counts.get(entry.namespace, 0) + 1
+
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": hits / (hits + misses) if hits + misses else 0.0,
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+            "invalidations": self._invalidations,
+            "staleness": {
+                "avg_served_age_seconds": (
+                    sum(self._served_ages) / len(self._served_ages) if self._served_ages else 0.0
+                ),
+                "max_served_age_seconds": self._max_served_age,
+                "oldest_entry_age_seconds": max(
+                    (now - entry.created_at for entry in self._entries.values()), default=0.0
+                ),
+            },
+            "namespaces": {
+                name: {
+                    "ttl_seconds": stats.ttl,
+                    "hits": stats.hits,
+                    "misses": stats.misses,
+                    "hit_ratio": stats.hit_ratio,
+                    "entries": entry_counts.get(name, 0),
+                }
+                for name, stats in sorted(self._namespaces.items())
+            },
+        }
+
+    async def subscribe(self, event_bus: EventBus, rules: Dict[Type[DomainEvent], InvalidationRule]) -> None:
+        """Invalidate entries when events are published on an event bus.
+
+        Args:
+            event_bus: Bus publishing domain events
+            rules: For each event type, a function returning the tags an
+                event of that type invalidates
+        """
+        for event_type, rule in rules.items():
+            await event_bus.register_handler(QueryCacheInvalidationHandler(self, event_type, rule))
+
+    def _namespace(self, namespace: str) -> NamespaceStats:
+        stats = self._namespaces.get(namespace)
+        if stats is None:
+            stats = NamespaceStats(ttl=self.default_ttl)
+            self._namespaces[namespace] = stats
+        return stats
+
+    def _lookup(self, key: CacheKey) -> Optional[_CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= self._clock():
+            self._remove(key)
+            self._expirations += 1
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _store(self, key: CacheKey, namespace: str, result: Any, tags: Tuple[str, ...], ttl: float) -> None:
+        if ttl <= 0:
+            return
+        self._remove(key)
+        now = self._clock()
+        self._entries[key] = _CacheEntry(namespace, result, now, now + ttl, tags)
+        for tag in tags:
+            self._tag_index.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self._evictions += 1
+
+    def _remove(self, key: CacheKey) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        for tag in entry.tags:
+            keys = self._tag_index.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_index[tag]
+        return True
+
+    def _record_served_age(self, age: float) -> None:
+        # Keep a bounded window of recent ages for the average
+        self._served_ages.append(age)
+        if len(self._served_ages) > 1000:
+            del self._served_ages[:500]
+        self._max_served_age = max(self._max_served_age, age)
+
+    @staticmethod
+    def _as_hit(result: R) -> R:
+        return replace(result, cache_hit=True) if not result.cache_hit else result
+
+
+class QueryCacheInvalidationHandler(BaseEventHandler[DomainEvent]):
+    """Event handler invalidating query cache tags for one event type."""
+
+    def __init__(
+        self,
+        cache: QueryCache,
+        event_type: Type[DomainEvent],
+        rule: InvalidationRule,
+        priority: int = 10
+    ):
+        """Initialize handler.
+
+        Args:
+            cache: Cache to invalidate
+            event_type: Event type handled
+            rule: Function returning the tags an event invalidates
+            priority: Handler priority; runs early so later handlers
+                querying the cache see fresh results
+        """
+        super().__init__(priority)
+        self._cache = cache
+        self._event_type = event_type
+        self._rule = rule
+
+    @property
+    def event_type(self) -> Type[DomainEvent]:
+        return self._event_type
+
+    async def handle(self, event: DomainEvent) -> None:
+        tags = list(self._rule(event))
+        dropped = self._cache.invalidate(*tags)
+        logger.debug(f"Invalidated {dropped} cached queries for {type(event).__name__}: {tags}")
@@ -0,0 +1,214 @@
+"""Single-flight coalescing of identical in-flight work.
+
+When several callers ask for the same thing at the same moment (e.g. the
+same prompt to the same model from parallel steps), only the first one
+does the work; the others await its outcome. Calls are keyed by the
+caller, typically by a cache key, and a key is free again as soon as its
+call finishes, so coalescing never serves stale results: it only merges
+calls that overlap in time.
+
+Streaming calls are shared through a ``StreamBroadcaster``: the first
+subscriber starts the source and every subscriber receives all chunks
+from the beginning, including those produced before it subscribed.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Generic, Hashable, List, Optional, TypeVar
+
+
+T = TypeVar('T')
+
+
+@dataclass
+class SingleFlightStats:
+    """Counters of executed and coalesced calls."""
+    calls: int = 0
+    coalesced: int = 0
+    streams: int = 0
+    coalesced_streams: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "streams": self.streams,
+            "coalesced_streams": self.coalesced_streams,
+        }
+
+
+class _Flight:
+    """A running call and the number of callers awaiting it."""
+
+    def __init__(self, task: "asyncio.Task[Any]"):
+        self.task = task
+        self.waiters = 0
+
+
+class StreamBroadcaster(Generic[T]):
+    """Fan out one async iterator to any number of subscribers.
+
+    Chunks are buffered for the lifetime of the broadcaster, so a late
+    subscriber replays what it missed before following live chunks. An
+    error raised by the source is re-raised to every subscriber. The
+    source is cancelled once every subscriber has gone away.
+    """
+
+    def __init__(self, source: AsyncIterator[T]):
+        """Initialize broadcaster.
+
+        Args:
+            source: Iterator to broadcast; consumed once
+        """
+        self._source = source
+        self._chunks: List[T] = []
+        self._changed = asyncio.Event()
+        self._done = False
+        self._error: Optional[BaseException] = None
+        self._pump: Optional["asyncio.Task[None]"] = None
+        self._subscribers = 0
+
+    @property
+    def done(self) -> bool:
+        """Whether the source is exhausted (or failed)."""
+        return self._done
+
+    async def subscribe(self) -> AsyncIterator[T]:
+        """Iterate over every chunk of the source."""
+        if self._pump is None:
+            self._pump = asyncio.create_task(self._run())
+        self._subscribers += 1
+        position = 0
+        try:
+            while True:
+                while position < len(self._chunks):
+                    yield self._chunks[position]
+                    position += 1
+                if self._done:
+                    if self._error is not None:
+                        raise self._error
+                    return
+                await self._changed.wait()
+        finally:
+            self._subscribers -= 1
+            if self._subscribers == 0 and not self._done:
+                self._pump.cancel()
+
+    async def _run(self) -> None:
+        try:
+            async for chunk in self._source:
+                self._chunks.append(chunk)
+                self._notify()
+        except asyncio.CancelledError as e:
+            self._error = e
+            raise
+        except Exception as e:
+            self._error = e
+        finally:
+            self._done = True
+            self._notify()
+
+    def _notify(self) -> None:
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+
+class SingleFlight:
+    """Run at most one call per key at a time and share its outcome.
+
+    Examples:
+        flights = SingleFlight()
+
+        # Concurrent callers with the same key share one provider call
+        response = await flights.do(cache_key, lambda: provider.generate(request))
+
+        # Concurrent streams with the same key share one provider stream
+        async for chunk in flights.stream(cache_key, lambda: provider.generate_stream(request)):
+            ...
+    """
+
+    def __init__(self) -> None:
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._streams: Dict[Hashable, StreamBroadcaster[Any]] = {}
+        self._stats = SingleFlightStats()
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run ``fn`` unless a call with the same key is in flight, then await it.
+
+        The call runs in its own task: a caller that is cancelled stops
+        waiting without cancelling the call for the others. The call is
+        cancelled only when every caller has gone away.
+
+        Args:
+            key: Identity of the call
+            fn: Coroutine function performing the call
+
+        Returns:
+            Result of the (possibly shared) call
+
+        Raises:
+            Exception: Whatever the shared call raised
+        """
+        flight = self._flights.get(key)
+        if flight is None:
+            self._stats.calls += 1
+            flight = self._flights[key] = _Flight(asyncio.ensure_future(fn()))
+            flight.task.add_done_callback(lambda _: self._forget(self._flights, key, flight))
+        else:
+            self._stats.coalesced += 1
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if not flight.task.done() and flight.waiters == 1:
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+
+    async def stream(self, key: Hashable, fn: Callable[[], AsyncIterator[T]]) -> AsyncIterator[T]:
+        """Subscribe to the stream with the same key, or start it with ``fn``.
+
+        Args:
+            key: Identity of the stream
+            fn: Function returning the async iterator to share
+
+        Yields:
+            Every chunk of the (possibly shared) stream
+        """
+        broadcaster = self._streams.get(key)
+        if broadcaster is None or broadcaster.done:
+            self._stats.streams += 1
+            broadcaster = self._streams[key] = StreamBroadcaster(self._forget_stream(key, fn()))
+        else:
+            self._stats.coalesced_streams += 1
+
+        async for chunk in broadcaster.subscribe():
+            yield chunk
+
+    def in_flight(self, key: Hashable) -> bool:
+        """Whether a call or stream with this key is running."""
+        broadcaster = self._streams.get(key)
+        return key in self._flights or (broadcaster is not None and not broadcaster.done)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Executed and coalesced call counts."""
+        stats = self._stats.to_dict()
+        stats["in_flight"] = len(self._flights) + sum(1 for b in self._streams.values() if not b.done)
+        return stats
+
+    async def _forget_stream(self, key: Hashable, source: AsyncIterator[T]) -> AsyncIterator[T]:
+        broadcaster = self._streams.get(key)
+        try:
+            async for chunk in source:
+                yield chunk
+        finally:
+            # Stop handing the finished stream to new subscribers
+            if broadcaster is not None and self._streams.get(key) is broadcaster:
+                del self._streams[key]
+
+    @staticmethod
+    def _forget(registry: Dict[Hashable, Any], key: Hashable, value: Any) -> None:
+        if registry.get(key) is value:
+            del registry[key]
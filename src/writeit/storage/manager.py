@@ -7,6 +7,14 @@ from contextlib import contextmanager
 import json
 import warnings
 
+from ..infrastructure.base.lmdb_environment import (
+    STORE_FILE_NAME,
+    SharedEnvironment,
+    acquire_environment,
+    release_environment,
+    sub_db_name,
+)
+
 # Safe serialization - inline implementation to avoid circular imports
 from dataclasses import is_dataclass, fields
 from datetime import datetime
@@ -110,7 +118,12 @@ def create_safe_serializer(format_preference: str = SerializationFormat.JSON,
 
 
 class StorageManager:
-    """Workspace-aware storage manager for WriteIt data persistence."""
+    """Workspace-aware storage manager for WriteIt data persistence.
+
+    All databases of a workspace are named databases of one LMDB
+    environment, shared with every other storage manager of the process.
+    Reads use pooled read-only transactions.
+    """
 
     def __init__(
         self,
@@ -131,7 +144,7 @@ class StorageManager:
         self.workspace_name = workspace_name
         self.map_size = map_size_mb * 1024 * 1024  # Convert to bytes
         self.max_dbs = max_dbs
-        self._connections: Dict[str, lmdb.Environment] = {}
+        self._connections: Dict[str, SharedEnvironment] = {}
         
         # Initialize safe serializer for binary data
         self._safe_serializer = create_safe_serializer(SerializationFormat.MSGPACK)
@@ -151,7 +164,9 @@ class StorageManager:
         return workspace_path
 
     def get_db_path(self, db_name: str) -> Path:
-        """Get path for a specific database file.
+        """Get path of the legacy per-database environment.
+
+        Only read to migrate existing data into the workspace environment.
 
         Args:
             db_name: Name of the database (e.g., 'artifacts', 'pipelines')
@@ -161,44 +176,33 @@ class StorageManager:
         """
         return self.storage_path / f"{db_name}.lmdb"
 
+    @property
+    def env_path(self) -> Path:
+        """Path of the LMDB environment holding all databases of the workspace."""
+        return self.storage_path / STORE_FILE_NAME
+
+    def _shared_environment(self) -> SharedEnvironment:
+        """Acquire the workspace environment once per manager."""
+        connection_key = self.workspace_name or 'default'
+        if connection_key not in self._connections:
+            self._connections[connection_key] = acquire_environment(
+                self.env_path, self.map_size, self.max_dbs
+            )
+        return self._connections[connection_key]
+
     @contextmanager
     def get_connection(self, db_name: str = "main", readonly: bool = False) -> Any:
         """Get LMDB connection context manager.
 
         Args:
             db_name: Database name
-            readonly: Whether to open in read-only mode
+            readonly: Whether to open in read-only mode (transactions
+                decide; the environment is shared and always writable)
 
         Yields:
             LMDB environment
         """
-        connection_key = f"{self.workspace_name or 'default'}:{db_name}:{readonly}"
-
-        if connection_key not in self._connections:
-            db_path = self.get_db_path(db_name)
-            db_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # LMDB can't open non-existent databases in readonly mode
-            # If database doesn't exist and we need readonly access, create it first
-            if readonly and not db_path.exists():
-                # Create the database first
-                temp_env = lmdb.open(
-                    str(db_path),
-                    map_size=self.map_size,
-                    max_dbs=self.max_dbs,
-                    readonly=False,
-                )
-                temp_env.close()
-
-            env = lmdb.open(
-                str(db_path),
-                map_size=self.map_size,
-                max_dbs=self.max_dbs,
-                readonly=readonly,
-            )
-            self._connections[connection_key] = env
-
-        yield self._connections[connection_key]
+        yield self._shared_environment().env
 
     @contextmanager
     def get_transaction(
@@ -214,12 +218,15 @@ class StorageManager:
         Yields:
             Tuple of (transaction, database)
         """
-        with self.get_connection(db_name, readonly=not write) as env:
-            with env.begin(write=write) as txn:
-                if db_key:
-                    db = env.open_db(db_key.encode(), txn=txn, create=write)
-                else:
-                    db = env.open_db(txn=txn, create=write)
+        shared = self._shared_environment()
+        # Handles are resolved before the transaction starts: opening a new
+        # one takes the write lock
+        db = shared.database(sub_db_name(db_name, db_key))
+        if write:
+            with shared.env.begin(write=True) as txn:
+                yield txn, db
+        else:
+            with shared.read() as txn:
                 yield txn, db
 
     def store_json(
@@ -447,22 +454,21 @@ class StorageManager:
         Returns:
             Dictionary with database statistics
         """
-        with self.get_connection(db_name) as env:
-            with env.begin() as txn:
-                stats = txn.stat()
-                return {
-                    "entries": stats.get("entries", 0),
-                    "page_size": stats.get("psize", 0),
-                    "depth": stats.get("depth", 0),
-                    "branch_pages": stats.get("branch_pages", 0),
-                    "leaf_pages": stats.get("leaf_pages", 0),
-                    "overflow_pages": stats.get("overflow_pages", 0),
-                }
+        with self.get_transaction(db_name, write=False) as (txn, db):
+            stats = txn.stat(db)
+            return {
+                "entries": stats.get("entries", 0),
+                "page_size": stats.get("psize", 0),
+                "depth": stats.get("depth", 0),
+                "branch_pages": stats.get("branch_pages", 0),
+                "leaf_pages": stats.get("leaf_pages", 0),
+                "overflow_pages": stats.get("overflow_pages", 0),
+            }
 
     def close(self) -> None:
         """Close all connections."""
-        for env in self._connections.values():
-            env.close()
+        for shared in self._connections.values():
+            release_environment(shared)
         self._connections.clear()
 
     def __del__(self) -> None:
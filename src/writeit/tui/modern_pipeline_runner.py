@@ -5,9 +5,11 @@ the new Domain-Driven Design architecture for robust, scalable pipeline operatio
 """
 
 import asyncio
+import time
 import uuid
+from collections import deque
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Callable, Deque, Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -58,6 +60,82 @@ class TUIExecutionConfig:
     enable_animations: bool = True # Enable UI animations
     show_token_usage: bool = True  # Show token usage metrics
     show_performance: bool = True  # Show performance metrics
+    stream_render_fps: int = 20    # Maximum redraws per second while streaming
+
+
+class StreamRenderBuffer:
+    """Coalesces streamed response chunks into frame-rate capped flushes.
+
+    Chunks are buffered until the next frame is due, so a burst of tokens
+    results in a single append to the view instead of one redraw per token.
+    """
+
+    def __init__(
+        self,
+        max_fps: int = 20,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.frame_interval = 1.0 / max_fps if max_fps > 0 else 0.0
+        self._clock = clock
+        self._chunks: List[str] = []
+        self._text_parts: List[str] = []
+        self._text_length = 0
+        self._last_flush: Optional[float] = None
+        self._reset = False
+
+    @property
+    def text(self) -> str:
+        """Full accumulated response text, including pending chunks."""
+        if len(self._text_parts) > 1:
+            self._text_parts = ["".join(self._text_parts)]
+        return self._text_parts[0] if self._text_parts else ""
+
+    @property
+    def has_pending(self) -> bool:
+        """Whether chunks are waiting to be flushed."""
+        return bool(self._chunks) or self._reset
+
+    def append(self, chunk: str) -> None:
+        """Buffer a new chunk of response text."""
+        if chunk:
+            self._chunks.append(chunk)
+            self._text_parts.append(chunk)
+            self._text_length += len(chunk)
+
+    def feed(self, response: str) -> None:
+        """Buffer the new suffix of an accumulated response.
+
+        If the response does not extend the text seen so far (for example
+        after a regeneration), the view is reset to the new response.
+        """
+        if len(response) >= self._text_length and response.startswith(self.text):
+            self.append(response[self._text_length:])
+            return
+
+        self._chunks = [response] if response else []
+        self._text_parts = [response]
+        self._text_length = len(response)
+        self._reset = True
+
+    def flush_delay(self) -> float:
+        """Seconds until the next flush is allowed."""
+        if self._last_flush is None:
+            return 0.0
+        elapsed = self._clock() - self._last_flush
+        return max(0.0, self.frame_interval - elapsed)
+
+    def drain(self) -> Tuple[str, bool]:
+        """Take pending text for rendering.
+
+        Returns:
+            Tuple of (pending text, whether the view must be cleared first)
+        """
+        pending = "".join(self._chunks)
+        reset = self._reset
+        self._chunks.clear()
+        self._reset = False
+        self._last_flush = self._clock()
+        return pending, reset
 
 
 class ExecutionProgressWidget(Container):
@@ -154,14 +232,20 @@ class ExecutionProgressWidget(Container):
 
 
 class StepExecutionWidget(Container):
-    """Widget for executing and displaying a single pipeline step."""
+    """Widget for executing and displaying a single pipeline step.
+
+    While a response streams in, new text is appended to a plain log view at
+    a capped frame rate; the Markdown view is rendered once on completion.
+    """
     
-    def __init__(self, step_name: str, step_description: str):
+    def __init__(self, step_name: str, step_description: str, max_fps: int = 20):
         super().__init__()
         self.step_name = step_name
         self.step_description = step_description
         self.responses: List[str] = []
         self.current_response: str = ""
+        self.stream_buffer = StreamRenderBuffer(max_fps)
+        self._flush_scheduled = False
         
     def compose(self) -> ComposeResult:
         yield Static(f"📝 {self.step_name}", classes="step-header")
@@ -174,6 +258,7 @@ class StepExecutionWidget(Container):
             yield Tab("Metadata", id="metadata-tab")
         
         with TabPane("Response", id="response-pane"):
+            yield Log(id="response-stream", classes="response-content")
             yield Markdown(
                 "Generating response...",
                 id="response-markdown",
@@ -207,6 +292,7 @@ class StepExecutionWidget(Container):
     
     def on_mount(self) -> None:
         """Initialize metadata table."""
+        self.query_one("#response-stream").display = False
         table = self.query_one("#metadata-table")
         table.add_columns("Property", "Value")
         table.add_row("Step", self.step_name)
@@ -215,12 +301,61 @@ class StepExecutionWidget(Container):
         table.add_row("Tokens", "N/A")
         table.add_row("Duration", "N/A")
     
+    def append_chunk(self, chunk: str) -> None:
+        """Append a streamed chunk of the response."""
+        self.stream_buffer.append(chunk)
+        self._schedule_flush()
+    
+    def stream_response(self, response: str) -> None:
+        """Show a partial, still streaming response.
+
+        Args:
+            response: Response text accumulated so far
+        """
+        self.stream_buffer.feed(response)
+        self._schedule_flush()
+    
+    def _schedule_flush(self) -> None:
+        """Schedule a flush for the next frame if one is not pending."""
+        if self._flush_scheduled or not self.stream_buffer.has_pending:
+            return
+        self._flush_scheduled = True
+        delay = self.stream_buffer.flush_delay()
+        if delay > 0:
+            self.set_timer(delay, self._flush_stream)
+        else:
+            self.call_later(self._flush_stream)
+    
+    def _flush_stream(self) -> None:
+        """Append buffered text to the streaming view."""
+        self._flush_scheduled = False
+        if not self.stream_buffer.has_pending:
+            # The response completed before this frame was due
+            return
+        pending, reset = self.stream_buffer.drain()
+        self.current_response = self.stream_buffer.text
+        
+        stream_widget = self.query_one("#response-stream")
+        if not stream_widget.display:
+            stream_widget.display = True
+            self.query_one("#response-markdown").display = False
+        if reset:
+            stream_widget.clear()
+        if pending:
+            stream_widget.write(pending)
+    
     def update_response(self, response: str, metadata: Dict[str, Any]) -> None:
-        """Update the response display."""
+        """Show the completed response, rendering Markdown once."""
         self.current_response = response
+        self.stream_buffer.feed(response)
+        self.stream_buffer.drain()
         
-        # Update markdown
+        # Swap the streaming view for the rendered markdown
+        stream_widget = self.query_one("#response-stream")
+        stream_widget.display = False
+        stream_widget.clear()
         markdown_widget = self.query_one("#response-markdown")
+        markdown_widget.display = True
         markdown_widget.update(response)
         
         # Update raw text
@@ -361,11 +496,22 @@ class PipelineInputsWidget(Container):
 
 
 class ExecutionLogWidget(Container):
-    """Widget for displaying execution logs."""
+    """Widget for displaying execution logs.
+
+    Entries are kept in a ring buffer of at most ``max_entries`` items, so
+    long runs use constant memory.
+    """
+    
+    LEVEL_LABELS = {
+        "error": "ERROR",
+        "warning": "WARN",
+        "success": "SUCCESS",
+    }
     
     def __init__(self, max_entries: int = 1000):
         super().__init__()
         self.max_entries = max_entries
+        self.entries: Deque[Tuple[str, str, str]] = deque(maxlen=max_entries)
         
     def compose(self) -> ComposeResult:
         yield Static("📋 Execution Log", classes="section-header")
@@ -373,21 +519,16 @@ class ExecutionLogWidget(Container):
     
     def log_message(self, level: str, message: str) -> None:
         """Add a message to the log."""
-        log_widget = self.query_one("#execution-log")
         timestamp = datetime.now().strftime("%H:%M:%S")
+        label = self.LEVEL_LABELS.get(level.lower(), "INFO")
+        self.entries.append((timestamp, label, message))
         
-        # Color code based on level
-        if level.lower() == "error":
-            log_widget.write_line(f"[{timestamp}] [ERROR] {message}", style="red")
-        elif level.lower() == "warning":
-            log_widget.write_line(f"[{timestamp}] [WARN] {message}", style="yellow")
-        elif level.lower() == "success":
-            log_widget.write_line(f"[{timestamp}] [SUCCESS] {message}", style="green")
-        else:
-            log_widget.write_line(f"[{timestamp}] [INFO] {message}")
+        log_widget = self.query_one("#execution-log")
+        log_widget.write_line(f"[{timestamp}] [{label}] {message}")
     
     def clear_log(self) -> None:
         """Clear the log."""
+        self.entries.clear()
         log_widget = self.query_one("#execution-log")
         log_widget.clear()
 
@@ -697,21 +838,34 @@ class ModernPipelineRunnerApp(App[None]):
         if latest_step:
             step_data = step_results[latest_step]
             
-            # Create or update step widget
-            step_widget = StepExecutionWidget(
-                step_name=latest_step,
-                step_description=step_data.get("description", "")
+            # Reuse the widget while the same step is still streaming
+            step_widget = next(
+                (
+                    child for child in step_container.children
+                    if isinstance(child, StepExecutionWidget)
+                    and child.step_name == latest_step
+                ),
+                None
             )
-            
-            await step_container.remove_children()
-            await step_container.mount(step_widget)
+            if step_widget is None:
+                step_widget = StepExecutionWidget(
+                    step_name=latest_step,
+                    step_description=step_data.get("description", ""),
+                    max_fps=self.config.stream_render_fps
+                )
+                
+                await step_container.remove_children()
+                await step_container.mount(step_widget)
             
             # Update with step data
             if "response" in step_data:
-                step_widget.update_response(
-                    step_data["response"],
-                    step_data.get("metadata", {})
-                )
+                if step_data.get("status") in ("running", "streaming"):
+                    step_widget.stream_response(step_data["response"])
+                else:
+                    step_widget.update_response(
+                        step_data["response"],
+                        step_data.get("metadata", {})
+                    )
     
     async def show_completion_phase(self) -> None:
         """Show the pipeline completion phase."""
@@ -2,6 +2,8 @@
 Tests for documentation deployment
 """
 
+import pytest
+
 from writeit.docs.deployment import DocumentationDeployment
 from writeit.docs.models import (
     DocumentationSet,
@@ -14,6 +16,13 @@ from writeit.docs.models import (
 )
 
 
+@pytest.fixture(autouse=True)
+def isolated_cwd(tmp_path, monkeypatch):
+    """Run each test in a temporary directory, since default templates are
+    written to docs/templates relative to the working directory."""
+    monkeypatch.chdir(tmp_path)
+
+
 class TestDocumentationDeployment:
     """Test documentation deployment functionality"""
 
@@ -0,0 +1,107 @@
+"""
+Tests for incremental documentation generation
+"""
+
+from writeit.docs import DocumentationGenerator
+from writeit.docs.html_generator import HTMLDocumentationGenerator
+from writeit.docs.incremental import sync_tree, write_if_changed
+from writeit.docs.models import DocumentationSet
+
+
+def _write_modules(source_dir, count):
+    source_dir.mkdir(parents=True, exist_ok=True)
+    for i in range(count):
+        (source_dir / f"module_{i}.py").write_text(
+            f'"""Module {i}"""\n\n\nclass Thing{i}:\n    """Thing {i}"""\n\n\n'
+            f'def helper_{i}(value: int) -> int:\n    """Help {i}"""\n    return value\n'
+        )
+
+
+def _generator(tmp_path, source_dir, **kwargs):
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        f"documentation:\n  sources:\n    modules:\n      path: {source_dir}\n"
+    )
+    return DocumentationGenerator(config_path=config_path, **kwargs)
+
+
+class TestModuleCache:
+    """Test reuse of extracted module documentation"""
+
+    def test_unchanged_modules_are_reused(self, tmp_path):
+        source_dir = tmp_path / "src"
+        _write_modules(source_dir, 3)
+        cache_dir = tmp_path / "cache"
+
+        first = _generator(tmp_path, source_dir, cache_dir=cache_dir, workers=1)
+        first_docs = first._generate_module_docs()
+        assert first.metrics.extracted_modules == 3
+
+        (source_dir / "module_1.py").write_text('"""Changed"""\n')
+        second = _generator(tmp_path, source_dir, cache_dir=cache_dir, workers=1)
+        second_docs = second._generate_module_docs()
+
+        assert second.metrics.extracted_modules == 1
+        assert second.metrics.cached_modules == 2
+        assert [doc.name for doc in second_docs] == [doc.name for doc in first_docs]
+        changed = next(doc for doc in second_docs if doc.name == "module_1")
+        assert changed.description == "Changed"
+        assert second.metrics.total_classes == 2
+
+    def test_parallel_extraction_matches_serial(self, tmp_path):
+        source_dir = tmp_path / "src"
+        _write_modules(source_dir, 10)
+
+        serial = _generator(tmp_path, source_dir, workers=1)._generate_module_docs()
+        parallel = _generator(tmp_path, source_dir, workers=2)._generate_module_docs()
+
+        assert [doc.name for doc in parallel] == [doc.name for doc in serial]
+        assert [doc.classes[0].name for doc in parallel] == [
+            doc.classes[0].name for doc in serial
+        ]
+
+
+class TestIncrementalOutput:
+    """Test that unchanged outputs are left alone"""
+
+    def test_write_if_changed(self, tmp_path):
+        page = tmp_path / "pages" / "page.md"
+
+        assert write_if_changed(page, "# Page")
+        assert not write_if_changed(page, "# Page")
+        assert write_if_changed(page, "# Page 2")
+        assert page.read_text() == "# Page 2"
+
+    def test_sync_tree_copies_changes_and_removes_stale_files(self, tmp_path):
+        source, target = tmp_path / "source", tmp_path / "target"
+        write_if_changed(source / "a.md", "a")
+        write_if_changed(source / "sub" / "b.md", "b")
+        write_if_changed(target / "keep.css", "css")
+        write_if_changed(target / "stale.md", "old")
+
+        assert sync_tree(source, target, preserve=["keep.css"]) == (2, 1)
+        assert sync_tree(source, target, preserve=["keep.css"]) == (0, 0)
+        assert (target / "keep.css").exists()
+        assert not (target / "stale.md").exists()
+
+    def test_html_site_is_only_rebuilt_when_pages_change(self, tmp_path, monkeypatch):
+        markdown_path = tmp_path / "markdown"
+        write_if_changed(markdown_path / "README.md", "# Docs")
+        output_path = tmp_path / "html"
+        generator = HTMLDocumentationGenerator(tmp_path / "templates")
+        builds = []
+
+        def build(path, dirty=False):
+            builds.append(dirty)
+            (path / "site").mkdir(exist_ok=True)
+
+        monkeypatch.setattr(generator, "_build_with_mkdocs", build)
+        docs = DocumentationSet()
+
+        generator.deploy_html(docs, output_path, markdown_path)
+        generator.deploy_html(docs, output_path, markdown_path)
+        write_if_changed(markdown_path / "README.md", "# Docs 2")
+        generator.deploy_html(docs, output_path, markdown_path)
+
+        assert builds == [False, True]
+        assert (output_path / "docs" / "index.md").read_text() == "# Docs 2"
@@ -0,0 +1,180 @@
+"""
+Tests for concurrent link checking
+"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from writeit.docs import DocumentationValidator
+from writeit.docs.link_checker import AsyncLinkChecker, LinkCheckCache
+from writeit.docs.models import (
+    ClassDocumentation,
+    DocumentationSet,
+    ModuleDocumentation,
+)
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    """Serves a few fixed pages and records the requests it gets"""
+
+    requests = []
+
+    def _respond(self, body: bool):
+        self.requests.append((self.command, self.path))
+        if self.path.startswith("/slow"):
+            time.sleep(0.5)
+            status, headers = 200, {}
+        elif self.path == "/no-head" and self.command == "HEAD":
+            status, headers = 405, {}
+        elif self.path in ("/ok", "/no-head"):
+            status, headers = 200, {}
+        elif self.path == "/etag":
+            if self.headers.get("If-None-Match") == '"v1"':
+                status, headers = 304, {"ETag": '"v1"'}
+            else:
+                status, headers = 200, {"ETag": '"v1"'}
+        else:
+            status, headers = 404, {}
+
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", "2" if body and status == 200 else "0")
+        self.end_headers()
+        if body and status == 200:
+            self.wfile.write(b"ok")
+
+    def do_HEAD(self):
+        self._respond(body=False)
+
+    def do_GET(self):
+        self._respond(body=True)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    _StandInHandler.requests = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _StandInHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}", _StandInHandler.requests
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class TestAsyncLinkChecker:
+    """Test external link checking"""
+
+    def test_head_then_get_fallback(self, server):
+        base_url, requests = server
+        checker = AsyncLinkChecker(timeout=5)
+
+        results = checker.check_all(
+            [f"{base_url}/ok", f"{base_url}/no-head", f"{base_url}/missing"]
+        )
+
+        assert not results[f"{base_url}/ok"].is_broken
+        assert not results[f"{base_url}/no-head"].is_broken
+        assert results[f"{base_url}/missing"].is_broken
+        assert ("GET", "/no-head") in requests
+        assert ("GET", "/ok") not in requests
+
+    def test_links_queued_behind_a_slow_host_are_checked(self, server):
+        base_url, requests = server
+        urls = [f"{base_url}/slow/{i}" for i in range(12)]
+        checker = AsyncLinkChecker(per_host_limit=4, timeout=1)
+
+        results = checker.check_all(urls)
+
+        assert [results[url].status for url in urls] == [200] * 12
+        assert len(requests) == 12
+
+    def test_unreachable_links_are_not_broken(self):
+        checker = AsyncLinkChecker(timeout=2)
+
+        result = checker.check_all(["http://127.0.0.1:9/nothing"])[
+            "http://127.0.0.1:9/nothing"
+        ]
+
+        assert result.status is None
+        assert result.error
+        assert not result.is_broken
+
+    def test_fresh_results_come_from_disk_cache(self, server, tmp_path):
+        base_url, requests = server
+        cache_path = tmp_path / "links.json"
+        AsyncLinkChecker(cache=LinkCheckCache(cache_path)).check_all(
+            [f"{base_url}/ok", f"{base_url}/missing"]
+        )
+        requests.clear()
+
+        results = AsyncLinkChecker(cache=LinkCheckCache(cache_path)).check_all(
+            [f"{base_url}/ok", f"{base_url}/missing"]
+        )
+
+        assert requests == []
+        assert results[f"{base_url}/ok"].from_cache
+        assert results[f"{base_url}/missing"].is_broken
+
+    def test_expired_results_are_revalidated_with_etag(self, server, tmp_path):
+        base_url, requests = server
+        cache_path = tmp_path / "links.json"
+        url = f"{base_url}/etag"
+        AsyncLinkChecker(cache=LinkCheckCache(cache_path)).check_all([url])
+        requests.clear()
+
+        result = AsyncLinkChecker(cache=LinkCheckCache(cache_path, ttl=0)).check_all(
+            [url]
+        )[url]
+
+        assert result.revalidated
+        assert result.status == 200
+        assert requests == [("HEAD", "/etag")]
+
+
+class TestValidatorLinks:
+    """Test link validation in the documentation validator"""
+
+    def test_internal_references_use_reference_index(self):
+        docs = DocumentationSet(
+            module_docs=[
+                ModuleDocumentation(
+                    name="pkg.module",
+                    description="Module",
+                    purpose="Module",
+                    classes=[
+                        ClassDocumentation(
+                            name="Widget", description="W", purpose="W", methods=[]
+                        )
+                    ],
+                    functions=[],
+                )
+            ]
+        )
+        validator = DocumentationValidator()
+
+        index = validator._build_reference_index(docs)
+
+        assert {"Widget", "pkg.module.Widget"} <= index
+        assert validator._validate_internal_reference("Widget", docs, index)
+
+    def test_placeholder_links_are_not_requested(self):
+        class RecordingChecker(AsyncLinkChecker):
+            def check_all(self, urls):
+                self.checked = list(urls)
+                return {}
+
+        checker = RecordingChecker()
+        validator = DocumentationValidator(link_checker=checker)
+
+        validator._check_links(
+            ["https://example.com/page", "https://docs.python.org/3/"]
+        )
+
+        assert checker.checked == ["https://docs.python.org/3/"]
@@ -0,0 +1,79 @@
+"""Import-time budget for the writeit CLI entry point.
+
+Runs ``python -X importtime`` in a fresh interpreter so startup regressions
+(e.g. an eager import of a command module, Textual or the DI configuration)
+are caught before they reach shell completion and quick commands.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+SRC_PATH = Path(__file__).resolve().parents[2] / "src"
+
+# Cumulative import time budget for writeit.cli.main, in microseconds
+IMPORT_BUDGET_US = 750_000
+
+# Modules that must only be imported when a command needs them
+DEFERRED_MODULE_PREFIXES = (
+    "textual",
+    "writeit.cli.commands",
+    "writeit.application",
+    "writeit.docs",
+    "writeit.tui",
+)
+
+
+def _import_times(module: str) -> Dict[str, int]:
+    """Import a module in a fresh interpreter and parse -X importtime output."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        path for path in (str(SRC_PATH), env.get("PYTHONPATH")) if path
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+
+    cumulative: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative_us, name = (part.strip() for part in line[12:].split("|"))
+        if cumulative_us.isdigit():
+            cumulative[name] = int(cumulative_us)
+    return cumulative
+
+
+@pytest.mark.slow
+class TestCLIImportTime:
+    """Startup cost of the writeit CLI entry point."""
+
+    def test_command_modules_are_not_imported_eagerly(self):
+        imported = _import_times("writeit.cli.main")
+
+        eager = sorted(
+            name for name in imported
+            if name.startswith(DEFERRED_MODULE_PREFIXES)
+        )
+        assert eager == []
+
+    def test_import_time_within_budget(self):
+        # Best of three runs to reduce noise from a cold filesystem cache
+        best = min(
+            _import_times("writeit.cli.main")["writeit.cli.main"]
+            for _ in range(3)
+        )
+
+        assert best < IMPORT_BUDGET_US, (
+            f"importing writeit.cli.main took {best / 1000:.1f}ms "
+            f"(budget {IMPORT_BUDGET_US / 1000:.0f}ms)"
+        )
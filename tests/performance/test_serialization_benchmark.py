@@ -0,0 +1,153 @@
+"""Serializer benchmark: compiled per-type codecs against the generic walk.
+
+The generic path is what ``SafeJSONEntitySerializer`` did before codecs were
+compiled: ``dataclasses.fields()`` plus an ``isinstance`` chain for every
+value. Both paths produce the same documents, so only speed and (for
+MessagePack) size are compared. Timings are printed rather than asserted:
+wall-clock ratios depend on the machine and its load, so only round trips,
+equal output and encoded size are checked.
+"""
+
+import time
+from dataclasses import fields, is_dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict
+
+import pytest
+
+from writeit.domains.pipeline.entities.pipeline_template import (
+    ModelPreference,
+    PipelineInput,
+    PipelineStepTemplate,
+    PipelineTemplate,
+)
+from writeit.domains.pipeline.value_objects.pipeline_id import PipelineId
+from writeit.domains.pipeline.value_objects.prompt_template import PromptTemplate
+from writeit.domains.pipeline.value_objects.step_id import StepId
+from writeit.infrastructure.base.safe_serialization import (
+    SafeJSONEntitySerializer,
+    SafeMessagePackSerializer,
+)
+
+ITERATIONS = 300
+
+
+def _register(serializer):
+    for value_object in (PipelineId, StepId, PromptTemplate):
+        serializer.register_value_object(value_object)
+    for entity_type in (ModelPreference, PipelineInput, PipelineStepTemplate, PipelineTemplate):
+        serializer.register_type(entity_type.__name__, entity_type)
+    return serializer
+
+
+def _template(step_count: int = 12) -> PipelineTemplate:
+    steps = {
+        f"step_{index}": PipelineStepTemplate(
+            id=StepId(f"step_{index}"),
+            name=f"Step {index}",
+            description="Generate a section of the article",
+            type="llm_generate",
+            prompt_template=PromptTemplate(f"Write section {index} about {{{{ inputs.topic }}}}"),
+            depends_on=[StepId(f"step_{index - 1}")] if index else [],
+        )
+        for index in range(step_count)
+    }
+    return PipelineTemplate(
+        id=PipelineId("benchmark-pipeline"),
+        name="benchmark",
+        description="Serializer benchmark template",
+        inputs={
+            "topic": PipelineInput(key="topic", type="text", label="Topic", required=True),
+            "style": PipelineInput(key="style", type="choice", label="Style",
+                                   options=[{"label": "Formal", "value": "formal"}]),
+        },
+        steps=steps,
+        tags=["benchmark", "article"],
+        created_at=datetime(2024, 1, 1),
+        updated_at=datetime(2024, 1, 2),
+    )
+
+
+class GenericJSONEntitySerializer(SafeJSONEntitySerializer):
+    """The serializer as it was before codecs: a per-value walk of every entity."""
+
+    def _entity_to_dict(self, entity: Any, depth: int = 0) -> Dict[str, Any]:
+        if is_dataclass(entity):
+            return {
+                f.name: self._serialize_value(getattr(entity, f.name), depth + 1)
+                for f in fields(entity)
+            }
+        result = {}
+        for attr in dir(entity):
+            if not attr.startswith('_') and not callable(getattr(entity, attr, None)):
+                result[attr] = self._serialize_value(getattr(entity, attr), depth + 1)
+        return result
+
+    def _dict_to_entity(self, data: Dict[str, Any], entity_type, depth: int = 0):
+        kwargs = {}
+        for f in fields(entity_type):
+            if f.name in data:
+                kwargs[f.name] = self._deserialize_value(data[f.name], f.type, depth + 1)
+            elif f.default == f.default_factory:
+                raise ValueError(f"Missing required field: {f.name}")
+        return entity_type(**kwargs)
+
+
+def _best_of(operation: Callable[[], Any], repeats: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(ITERATIONS):
+            operation()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@pytest.mark.slow
+class TestSerializerBenchmark:
+    """Compare compiled codecs with the generic per-value walk."""
+
+    def test_encode_speedup(self):
+        reference = _register(GenericJSONEntitySerializer(enable_schema_validation=False))
+        serializer = _register(SafeJSONEntitySerializer(enable_schema_validation=False))
+        template = _template()
+        assert serializer._entity_to_dict(template) == reference._entity_to_dict(template)
+
+        generic = _best_of(lambda: reference._entity_to_dict(template))
+        compiled = _best_of(lambda: serializer._entity_to_dict(template))
+
+        print(f"\nencode: generic {generic * 1e6 / ITERATIONS:.1f}us, "
+              f"compiled {compiled * 1e6 / ITERATIONS:.1f}us ({generic / compiled:.1f}x)")
+
+    def test_decode_speedup(self):
+        reference = _register(GenericJSONEntitySerializer(enable_schema_validation=False))
+        serializer = _register(SafeJSONEntitySerializer(enable_schema_validation=False))
+        template = _template()
+        data = serializer._entity_to_dict(template)
+        assert reference._dict_to_entity(data, PipelineTemplate) == template
+
+        generic = _best_of(lambda: reference._dict_to_entity(data, PipelineTemplate))
+        compiled = _best_of(lambda: serializer._dict_to_entity(data, PipelineTemplate))
+
+        print(f"\ndecode: generic {generic * 1e6 / ITERATIONS:.1f}us, "
+              f"compiled {compiled * 1e6 / ITERATIONS:.1f}us ({generic / compiled:.1f}x)")
+
+    def test_compact_msgpack_round_trip(self):
+        json_serializer = _register(GenericJSONEntitySerializer(enable_schema_validation=False))
+        msgpack_serializer = _register(SafeMessagePackSerializer(enable_schema_validation=False))
+        template = _template()
+
+        json_bytes = json_serializer.serialize(template)
+        msgpack_bytes = msgpack_serializer.serialize(template)
+        assert msgpack_serializer.deserialize(msgpack_bytes, PipelineTemplate) == template
+
+        json_time = _best_of(
+            lambda: json_serializer.deserialize(json_serializer.serialize(template), PipelineTemplate)
+        )
+        msgpack_time = _best_of(
+            lambda: msgpack_serializer.deserialize(msgpack_serializer.serialize(template), PipelineTemplate)
+        )
+
+        print(f"\nround trip: json {len(json_bytes)}B {json_time * 1e6 / ITERATIONS:.1f}us, "
+              f"msgpack {len(msgpack_bytes)}B {msgpack_time * 1e6 / ITERATIONS:.1f}us")
+        assert len(msgpack_bytes) < len(json_bytes) * 0.75
@@ -0,0 +1,163 @@
+"""Tests for flattened style inheritance resolution."""
+
+import pytest
+from dataclasses import replace
+
+from writeit.domains.content.entities.style_primer import StylePrimer
+from writeit.domains.content.services.style_inheritance import StyleInheritanceResolver
+from writeit.domains.content.services.style_management_service import (
+    StyleInheritanceError,
+    StyleManagementService,
+)
+from writeit.domains.content.value_objects.style_name import StyleName
+
+
+class _Styles:
+    """In-memory style store counting loads."""
+
+    def __init__(self, *styles):
+        self.styles = {style.name.value: style for style in styles}
+        self.loads = 0
+
+    def put(self, style):
+        self.styles[style.name.value] = style
+
+    async def load(self, name):
+        self.loads += 1
+        return self.styles.get(name.value)
+
+    # Repository interface used by StyleManagementService
+    find_by_name = load
+
+    async def save(self, style, workspace_name=None):
+        self.put(style)
+        return style
+
+    async def delete(self, style):
+        del self.styles[style.name.value]
+
+
+def _style(name, *parents, **settings):
+    style = StylePrimer.create(name=StyleName(name), **settings)
+    for parent in parents:
+        style = style.inherit_from(StyleName(parent))
+    return style
+
+
+@pytest.fixture
+def styles():
+    base = _style("base", tone="formal", voice="third_person").add_guideline("Be accurate")
+    brand = _style("brand", "base", tone="friendly").add_guideline("Mention the product")
+    docs = _style("docs", "base", writing_style="technical").add_guideline("Show examples")
+    product = _style("product-docs", "brand", "docs").add_guideline("Link to the API")
+    return _Styles(base, brand, docs, product)
+
+
+class TestStyleInheritanceResolver:
+    """Test flattening, memoization and invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_diamond_is_merged_in_c3_order(self, styles):
+        resolver = StyleInheritanceResolver(styles.load)
+
+        flat = await resolver.resolve(styles.styles["product-docs"])
+
+        assert [name.value for name in flat.resolution_order] == ["product-docs", "brand", "docs", "base"]
+        assert flat.guidelines == ("Be accurate", "Show examples", "Mention the product", "Link to the API")
+        assert (flat.tone, flat.voice, flat.writing_style) == ("friendly", "third_person", "technical")
+        assert flat.depth == 2
+        assert any(rule.startswith("tone: 'formal' from base") for rule in flat.overridden_rules)
+        assert "Link to the API" in flat.prompt_text
+
+    @pytest.mark.asyncio
+    async def test_resolution_is_memoized(self, styles):
+        resolver = StyleInheritanceResolver(styles.load)
+        style = styles.styles["product-docs"]
+
+        first = await resolver.resolve(style)
+        stats, loads = resolver.get_stats(), styles.loads
+        second = await resolver.resolve(style)
+
+        assert second is first
+        assert styles.loads == loads
+        assert stats["misses"] == 4
+        assert resolver.get_stats()["misses"] == 4
+        assert resolver.get_stats()["hits"] > stats["hits"]
+
+    @pytest.mark.asyncio
+    async def test_memo_is_trusted_until_invalidated(self, styles):
+        resolver = StyleInheritanceResolver(styles.load)
+        first = await resolver.resolve(styles.styles["product-docs"])
+
+        styles.put(styles.styles["base"].add_guideline("Cite sources"))
+
+        assert await resolver.resolve(styles.styles["product-docs"]) is first
+
+    @pytest.mark.asyncio
+    async def test_ancestor_change_invalidates_descendants(self, styles):
+        resolver = StyleInheritanceResolver(styles.load)
+        first = await resolver.resolve(styles.styles["product-docs"])
+
+        styles.put(styles.styles["base"].add_guideline("Cite sources"))
+        dropped = resolver.invalidate(StyleName("base"))
+        second = await resolver.resolve(styles.styles["product-docs"])
+
+        assert dropped == 4
+        assert second.version_key != first.version_key
+        assert "Cite sources" in second.guidelines
+
+    @pytest.mark.asyncio
+    async def test_changed_style_is_flattened_again(self, styles):
+        resolver = StyleInheritanceResolver(styles.load)
+        style = styles.styles["docs"]
+        await resolver.resolve(style)
+
+        flat = await resolver.resolve(replace(style, tone="casual"))
+
+        assert flat.tone == "casual"
+
+    @pytest.mark.asyncio
+    async def test_conflicting_parents_are_reported(self):
+        styles = _Styles(
+            _style("formal", tone="formal"), _style("casual", tone="casual"), _style("mixed", "formal", "casual")
+        )
+        resolver = StyleInheritanceResolver(styles.load)
+
+        flat = await resolver.resolve(styles.styles["mixed"])
+
+        assert flat.tone == "formal"
+        assert flat.conflicts == ("tone: formal 'formal', casual 'casual'",)
+
+    @pytest.mark.asyncio
+    async def test_cycles_and_missing_parents_are_rejected(self):
+        styles = _Styles(_style("first", "second"), _style("second", "first"), _style("orphan", "missing"))
+        resolver = StyleInheritanceResolver(styles.load)
+
+        with pytest.raises(ValueError, match="Circular"):
+            await resolver.resolve(styles.styles["first"])
+        with pytest.raises(ValueError, match="not found"):
+            await resolver.resolve(styles.styles["orphan"])
+
+
+class TestStyleManagementServiceInvalidation:
+    """Test that saving and deleting styles invalidates flattened styles."""
+
+    @pytest.mark.asyncio
+    async def test_saving_an_ancestor_invalidates_descendants(self, styles):
+        service = StyleManagementService(styles)
+        await service.resolve_style(styles.styles["product-docs"])
+
+        await service.save_style(styles.styles["base"].add_guideline("Cite sources"))
+        flat = await service.resolve_style(styles.styles["product-docs"])
+
+        assert "Cite sources" in flat.guidelines
+
+    @pytest.mark.asyncio
+    async def test_deleting_an_ancestor_invalidates_descendants(self, styles):
+        service = StyleManagementService(styles)
+        await service.resolve_style(styles.styles["product-docs"])
+
+        await service.delete_style(styles.styles["docs"])
+
+        with pytest.raises(StyleInheritanceError, match="'docs'.*not found"):
+            await service.resolve_style(styles.styles["product-docs"])
@@ -0,0 +1,119 @@
+"""Tests for the template dependency index."""
+
+import pytest
+from unittest.mock import AsyncMock
+
+from writeit.domains.content.entities.template import Template
+from writeit.domains.content.services.template_dependency_index import (
+    TemplateDependencyIndex,
+    extract_template_dependencies,
+)
+from writeit.domains.content.services.template_management_service import (
+    create_template_management_service,
+)
+from writeit.domains.content.value_objects.content_type import ContentType
+from writeit.domains.content.value_objects.template_name import TemplateName
+
+
+def _index():
+    return TemplateDependencyIndex({
+        "article": ["base", "footer"],
+        "base": ["layout"],
+        "layout": [],
+        "newsletter": ["article"],
+    })
+
+
+class TestExtraction:
+    """Test dependency extraction from template YAML."""
+
+    def test_extends_includes_and_step_templates(self):
+        yaml_content = """
+extends: Base
+includes: [footer, header]
+steps:
+  draft:
+    template: outline
+"""
+        names = [name.value for name in extract_template_dependencies(yaml_content)]
+
+        assert names == ["base", "footer", "header", "outline"]
+
+    def test_unparseable_yaml_has_no_dependencies(self):
+        assert extract_template_dependencies("extends: [unclosed") == []
+
+
+class TestTemplateDependencyIndex:
+    """Test adjacency maintenance and graph analysis."""
+
+    def test_transitive_closure_dependents_and_missing(self):
+        index = _index()
+
+        assert index.transitive_dependencies("newsletter") == {"article", "base", "footer", "layout"}
+        assert index.dependents("article") == ["newsletter"]
+        assert index.transitive_dependents("layout") == {"base", "article", "newsletter"}
+        assert index.missing_dependencies("newsletter") == ["footer"]
+        assert index.depth("newsletter") == 3
+        assert index.depth("layout") == 0
+
+    def test_updates_invalidate_memoized_closures(self):
+        index = _index()
+        assert "layout" in index.transitive_dependencies("newsletter")
+        version = index.version
+
+        index.set_dependencies("base", ["theme"])
+
+        assert index.version > version
+        assert index.transitive_dependencies("newsletter") == {"article", "base", "footer", "theme"}
+        assert index.dependents("layout") == []
+        assert not index.set_dependencies("base", ["theme"])
+
+    def test_removed_template_becomes_missing(self):
+        index = _index()
+
+        index.remove_template("layout")
+
+        assert "layout" in index.missing_dependencies("article")
+        assert not index.has_template("layout")
+
+    def test_cycles_are_strongly_connected_components(self):
+        index = _index()
+        index.set_dependencies("layout", ["newsletter"])
+        index.set_dependencies("solo", ["solo"])
+
+        cycles = [sorted(cycle) for cycle in index.cycles()]
+
+        assert sorted(cycles) == [["article", "base", "layout", "newsletter"], ["solo"]]
+        assert sorted(index.cycle_containing("base")) == ["article", "base", "layout", "newsletter"]
+        assert index.cycle_containing("footer") is None
+        assert index.depth("newsletter") == 1
+
+    def test_long_chains_do_not_recurse(self):
+        index = TemplateDependencyIndex({f"t{i}": [f"t{i + 1}"] for i in range(5000)})
+        index.set_dependencies("t5000", ["t0"])
+
+        assert len(index.cycles()) == 1
+        assert len(index.transitive_dependencies("t0")) == 5001
+
+
+class TestTemplateManagementServiceFactory:
+    """Test analysis over the repository's dependency index."""
+
+    @pytest.mark.asyncio
+    async def test_analysis_uses_repository_index(self):
+        repository = AsyncMock()
+        repository.load_dependency_index.return_value = _index()
+        repository.get_template_dependents.return_value = []
+        service = await create_template_management_service(repository)
+        article = Template.create(
+            name=TemplateName("article"),
+            content_type=ContentType.article(),
+            yaml_content="extends: base\nincludes: [footer]\n",
+        )
+
+        graph = await service.analyze_template_dependencies(article)
+
+        assert [name.value for name in graph.indirect_dependencies] == ["layout"]
+        assert [name.value for name in graph.missing_dependencies] == ["footer"]
+        assert [name.value for name in graph.dependents] == ["newsletter"]
+        repository.find_by_name.assert_not_called()
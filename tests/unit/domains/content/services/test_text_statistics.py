@@ -0,0 +1,99 @@
+"""Unit tests for TextStatsAnalyzer.
+
+Tests the shared single-pass text statistics used by content quality scoring
+and content validation.
+"""
+
+import pytest
+
+from writeit.domains.content.services.text_statistics import (
+    HeadingInfo,
+    TextStatsAnalyzer,
+    count_syllables,
+)
+
+
+@pytest.fixture
+def analyzer():
+    """Create a fresh text statistics analyzer."""
+    return TextStatsAnalyzer()
+
+
+class TestTextStatsAnalyzer:
+    """Test cases for TextStatsAnalyzer."""
+
+    def test_counts_words_sentences_and_syllables(self, analyzer):
+        """Test basic counts computed in one pass."""
+        stats = analyzer.analyze("The cat sat. The dog ran away! Did it?")
+
+        assert stats.word_count == 9
+        assert stats.sentence_count == 3
+        assert stats.syllable_count == sum(
+            count_syllables(word) for word in "the cat sat. the dog ran away! did it?".split()
+        )
+        assert stats.character_count == len("The cat sat. The dog ran away! Did it?")
+
+    def test_unique_word_ratio_is_case_insensitive(self, analyzer):
+        """Test unique word ratio ignores case."""
+        stats = analyzer.analyze("Word word WORD other")
+
+        assert stats.unique_word_count == 2
+        assert stats.unique_word_ratio == pytest.approx(0.5)
+        assert stats.word_frequencies["word"] == 3
+
+    def test_heading_structure(self, analyzer):
+        """Test markdown headings are extracted with line numbers."""
+        text = "# Title\n\nIntro text.\n\n## Section\n\nBody.\n\n#### Deep\n"
+        stats = analyzer.analyze(text)
+
+        assert stats.headings == (
+            HeadingInfo(line=1, level=1, text="Title"),
+            HeadingInfo(line=5, level=2, text="Section"),
+            HeadingInfo(line=9, level=4, text="Deep"),
+        )
+        assert stats.heading_levels == [(1, 1), (5, 2), (9, 4)]
+        assert stats.paragraph_count == 5
+
+    def test_empty_text(self, analyzer):
+        """Test empty text yields zeroed statistics."""
+        stats = analyzer.analyze("")
+
+        assert stats.word_count == 0
+        assert stats.sentence_count == 0
+        assert stats.unique_word_ratio == 0.0
+        assert stats.average_sentence_length == 0.0
+        assert stats.average_syllables_per_word == 0.0
+
+    def test_results_memoized_by_content_hash(self, analyzer):
+        """Test identical content reuses the same precomputed stats."""
+        first = analyzer.analyze("Some repeated content.")
+        second = analyzer.analyze("Some repeated " + "content.")
+
+        assert first is second
+        assert first.content_hash == TextStatsAnalyzer.content_hash("Some repeated content.")
+        assert analyzer.get_cache_stats() == {"cached_stats": 1, "hits": 1, "misses": 1}
+
+    def test_cache_is_bounded(self):
+        """Test least recently used entries are evicted."""
+        analyzer = TextStatsAnalyzer(max_entries=2)
+        analyzer.analyze("one")
+        analyzer.analyze("two")
+        analyzer.analyze("three")
+
+        assert analyzer.get_cache_stats()["cached_stats"] == 2
+
+        analyzer.clear_cache()
+        assert analyzer.get_cache_stats() == {"cached_stats": 0, "hits": 0, "misses": 0}
+
+
+class TestCountSyllables:
+    """Test cases for the syllable heuristic."""
+
+    def test_matches_vowel_group_heuristic(self):
+        """Test syllable counts for common words."""
+        assert count_syllables("cat") == 1
+        assert count_syllables("happy") == 2
+        assert count_syllables("beautiful") == 3
+        assert count_syllables("Happy") == 2
+        assert count_syllables("make") == 1
+        assert count_syllables("") == 1
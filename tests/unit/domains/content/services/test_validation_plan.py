@@ -0,0 +1,158 @@
+"""Unit tests for compiled validation plans.
+
+Tests the Aho-Corasick keyword matcher, plan compilation and the
+(content hash, plan hash) result cache in ContentValidationService.
+"""
+
+import pytest
+
+from writeit.domains.content.entities.generated_content import GeneratedContent
+from writeit.domains.content.services.content_validation_service import (
+    ContentValidationService,
+    ValidationContext,
+    ValidationConfigurationError,
+)
+from writeit.domains.content.services.validation_plan import KeywordMatcher
+from writeit.domains.content.value_objects.content_id import ContentId
+from writeit.domains.content.value_objects.template_name import TemplateName
+from writeit.domains.content.value_objects.content_type import ContentType
+from writeit.domains.content.value_objects.content_format import ContentFormat
+from writeit.domains.content.value_objects.validation_rule import ValidationRule, ValidationRuleType
+
+
+def _content(text: str) -> GeneratedContent:
+    return GeneratedContent(
+        id=ContentId.generate(),
+        content_text=text,
+        template_name=TemplateName.from_user_input("test"),
+        content_type=ContentType.from_string("article"),
+        format=ContentFormat.from_string("markdown")
+    )
+
+
+def _context(*rules: ValidationRule) -> ValidationContext:
+    return ValidationContext(
+        rules=list(rules),
+        content_type=ContentType.from_string("article"),
+        content_format=ContentFormat.from_string("markdown"),
+        strict_mode=False
+    )
+
+
+class TestKeywordMatcher:
+    """Test cases for KeywordMatcher."""
+
+    def test_counts_all_keywords_in_one_pass(self):
+        """Test every keyword is counted, including overlapping matches."""
+        matcher = KeywordMatcher(["he", "she", "his", "hers", "Machine Learning"])
+
+        counts = matcher.count_occurrences("ushers and his machine learning hehe")
+
+        assert counts == {
+            "he": 3,
+            "she": 1,
+            "his": 1,
+            "hers": 1,
+            "machine learning": 1,
+        }
+
+    def test_matches_substring_semantics(self):
+        """Test results agree with lowercase substring search."""
+        keywords = ["ai", "neural", "network", "networks", "tw"]
+        text = "Artificial intelligence and neural networks.".lower()
+
+        counts = KeywordMatcher(keywords).count_occurrences(text)
+
+        for keyword in keywords:
+            assert (counts[keyword] > 0) == (keyword in text)
+
+    def test_duplicate_and_empty_keywords(self):
+        """Test duplicates collapse and empty keywords are ignored."""
+        matcher = KeywordMatcher(["Python", "python", ""])
+
+        assert matcher.keywords == ("python",)
+
+
+class TestCompiledValidationPlans:
+    """Test cases for plan compilation and result caching."""
+
+    @pytest.mark.asyncio
+    async def test_keyword_rules_share_one_scan(self):
+        """Test keyword rules report missing keywords from the shared scan."""
+        service = ContentValidationService()
+        context = _context(
+            ValidationRule.create(
+                type=ValidationRuleType.KEYWORD_PRESENCE,
+                value=["machine learning", "python"],
+            ),
+            ValidationRule.keyword_presence(["neural", "java"]),
+        )
+
+        result = await service.validate_content(
+            _content("An article about machine learning and neural networks."),
+            context
+        )
+
+        messages = [
+            issue.message for issue in result.issues
+            if issue.rule_type == ValidationRuleType.KEYWORD_PRESENCE
+        ]
+        assert messages == [
+            "Missing required keywords: python",
+            "Missing required keywords: java",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_plan_compiled_once_per_configuration(self):
+        """Test equivalent contexts reuse a single compiled plan."""
+        service = ContentValidationService()
+
+        first = service.compile_plan(_context(ValidationRule.word_count_min(5)))
+        second = service.compile_plan(_context(ValidationRule.word_count_min(5)))
+        other = service.compile_plan(_context(ValidationRule.word_count_min(6)))
+
+        assert first is second
+        assert other.plan_hash != first.plan_hash
+        assert service.get_cache_stats()["compiled_plans"] == 2
+
+    @pytest.mark.asyncio
+    async def test_results_cached_by_content_and_plan(self):
+        """Test unchanged drafts are served from the validation cache."""
+        service = ContentValidationService()
+        context = _context(ValidationRule.word_count_min(100))
+        text = "Too short to pass the word count rule."
+
+        first = await service.validate_content(_content(text), context)
+        second_content = _content(text)
+        second = await service.validate_content(second_content, context)
+
+        assert service.get_cache_stats()["cached_validations"] == 1
+        assert second.content_id == str(second_content.id)
+        assert [issue.message for issue in second.issues] == [
+            issue.message for issue in first.issues
+        ]
+
+        # Mutating a returned result must not leak into the cache
+        second.issues.clear()
+        third = await service.validate_content(_content(text), context)
+        assert third.issues
+
+    @pytest.mark.asyncio
+    async def test_custom_regex_rule(self):
+        """Test custom regex rules are evaluated with precompiled patterns."""
+        service = ContentValidationService()
+        context = _context(ValidationRule.custom_regex(r"^# ", must_match=True))
+
+        result = await service.validate_content(_content("No heading here at all."), context)
+
+        assert any(
+            issue.rule_type == ValidationRuleType.CUSTOM_REGEX
+            for issue in result.issues
+        )
+
+    def test_invalid_pattern_is_configuration_error(self):
+        """Test invalid regex patterns are reported as configuration errors."""
+        service = ContentValidationService()
+
+        with pytest.raises(ValidationConfigurationError):
+            service.compile_plan(_context(ValidationRule.custom_regex("(unclosed")))
@@ -0,0 +1,119 @@
+"""Unit tests for AdmissionScheduler."""
+
+import asyncio
+
+import pytest
+
+from writeit.domains.execution.services.admission_scheduler import (
+    AdmissionScheduler,
+    AdmissionTimeoutError,
+)
+from writeit.domains.execution.services.llm_orchestration_service import RequestPriority
+
+
+async def _admission_order(scheduler, requests):
+    """Queue requests behind a held slot and return the order they are admitted in."""
+    order = []
+    await scheduler.acquire("p", "blocker", "normal")
+
+    async def request(name, workspace, priority, timeout=None):
+        async with scheduler.slot("p", workspace, priority, timeout):
+            order.append(name)
+
+    tasks = []
+    for args in requests:
+        tasks.append(asyncio.create_task(request(*args)))
+        await asyncio.sleep(0)
+    scheduler.release("p")
+    await asyncio.gather(*tasks, return_exceptions=True)
+    return order, [task.exception() if not task.cancelled() else None for task in tasks]
+
+
+class TestAdmissionScheduler:
+    """Test admission order, capacity and metrics."""
+
+    @pytest.mark.asyncio
+    async def test_capacity_limits_in_flight_requests(self):
+        scheduler = AdmissionScheduler(default_capacity=2)
+        running = 0
+        peak = 0
+
+        async def request():
+            nonlocal running, peak
+            async with scheduler.slot("p", "ws", RequestPriority.NORMAL):
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*(request() for _ in range(6)))
+
+        assert peak == 2
+        assert scheduler.get_stats()["providers"]["p"]["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_priorities_share_capacity_by_weight(self):
+        scheduler = AdmissionScheduler(default_capacity=1)
+        requests = [(f"low-{i}", "batch", "low") for i in range(4)]
+        requests += [(f"high-{i}", "ui", "high") for i in range(4)]
+
+        order, _ = await _admission_order(scheduler, requests)
+
+        # High priority is served first, but low priority is not starved
+        assert order[:4] == ["high-0", "high-1", "high-2", "high-3"]
+        assert order[4:] == ["low-0", "low-1", "low-2", "low-3"]
+
+        scheduler = AdmissionScheduler(default_capacity=1, priority_weights={"high": 2, "low": 1})
+        order, _ = await _admission_order(scheduler, requests)
+        assert order.index("low-0") < order.index("high-3")
+
+    @pytest.mark.asyncio
+    async def test_workspaces_at_same_priority_alternate(self):
+        scheduler = AdmissionScheduler(default_capacity=1)
+        requests = [(f"a-{i}", "a", "normal") for i in range(3)]
+        requests += [(f"b-{i}", "b", "normal") for i in range(3)]
+
+        order, _ = await _admission_order(scheduler, requests)
+
+        assert order == ["a-0", "b-0", "a-1", "b-1", "a-2", "b-2"]
+
+    @pytest.mark.asyncio
+    async def test_near_deadline_request_jumps_queue(self):
+        scheduler = AdmissionScheduler(default_capacity=1, urgency_seconds=5)
+        requests = [("high", "ui", "high"), ("urgent-low", "batch", "low", 2.0)]
+
+        order, _ = await _admission_order(scheduler, requests)
+
+        assert order == ["urgent-low", "high"]
+
+    @pytest.mark.asyncio
+    async def test_expired_request_is_rejected(self):
+        scheduler = AdmissionScheduler(default_capacity=1)
+        await scheduler.acquire("p", "ws", "normal")
+
+        with pytest.raises(AdmissionTimeoutError):
+            await scheduler.acquire("p", "ws", "low", timeout_seconds=0.01)
+
+        stats = scheduler.get_stats()
+        assert stats["providers"]["p"]["queue_depth"] == 0
+        assert stats["wait_times"]["low"]["expired"] == 1
+        scheduler.release("p")
+        assert scheduler.get_stats()["providers"]["p"]["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_stats_report_queue_depth_and_waits(self):
+        scheduler = AdmissionScheduler(default_capacity=1)
+        await scheduler.acquire("p", "ws", "normal")
+        waiting = asyncio.create_task(scheduler.acquire("p", "other", RequestPriority.HIGH))
+        await asyncio.sleep(0.01)
+
+        provider = scheduler.get_stats()["providers"]["p"]
+        assert provider["queue_depth_by_priority"] == {"high": 1}
+        assert provider["queue_depth_by_workspace"] == {"other": 1}
+
+        scheduler.release("p")
+        assert await waiting > 0
+        wait_times = scheduler.get_stats()["wait_times"]
+        assert wait_times["high"]["admitted"] == 1
+        assert wait_times["high"]["max_wait_seconds"] > 0
+        assert wait_times["normal"]["avg_wait_seconds"] == 0
@@ -0,0 +1,131 @@
+"""Tests for token-budgeted prompt packing."""
+
+from types import SimpleNamespace
+
+from writeit.domains.pipeline.services.prompt_budget import (
+    ModelLimits,
+    PackingStrategy,
+    TokenBudgetPlanner,
+    estimate_tokens,
+)
+from writeit.domains.pipeline.value_objects.prompt_template import PromptTemplate
+
+
+def _planner(**kwargs):
+    return TokenBudgetPlanner(model_limits={"small": ModelLimits(1000, 200)}, **kwargs)
+
+
+class TestBudget:
+    """Test budget computation."""
+
+    def test_budget_reserves_output_tokens(self):
+        planner = _planner(step_budgets={"polish": 500})
+
+        assert planner.budget_for("draft", "small") == 800
+        assert planner.budget_for("draft", "small", max_output_tokens=300) == 700
+        assert planner.budget_for("polish", "small") == 500
+        assert planner.budget_for("draft", "unknown") is None
+
+    def test_limits_from_model_infos(self):
+        infos = [SimpleNamespace(name="m", context_length=4000, max_output_tokens=1000)]
+
+        planner = TokenBudgetPlanner.from_model_infos(infos)
+
+        assert planner.budget_for("s", "m") == 3000
+
+
+class TestPacking:
+    """Test value reduction."""
+
+    def test_prompt_within_budget_is_untouched(self):
+        values = {"inputs.topic": "bees"}
+
+        packed, report = _planner().pack_values("s", "Write about", values, "small")
+
+        assert packed == values
+        assert report.reduced == {}
+        assert report.tokens_saved == 0
+
+    def test_small_values_are_kept_and_large_ones_share_the_rest(self):
+        values = {"inputs.topic": "bees", "steps.a": "a" * 4000, "steps.b": "b" * 8000}
+
+        packed, report = _planner().pack_values("s", "x" * 400, values, "small")
+
+        assert packed["inputs.topic"] == "bees"
+        assert set(report.reduced) == {"steps.a", "steps.b"}
+        assert report.within_budget
+        assert report.packed_tokens <= 800
+        assert abs(estimate_tokens(packed["steps.a"]) - estimate_tokens(packed["steps.b"])) <= 2
+
+    def test_strategies_keep_head_tail_or_both_ends(self):
+        text = "H" * 4000 + "M" * 16000 + "T" * 4000
+        planner = _planner(
+            strategies={"steps.head": PackingStrategy.KEEP_HEAD, "steps.tail": PackingStrategy.KEEP_TAIL}
+        )
+
+        for path, head, tail in (("steps.head", "H", "]"), ("steps.tail", "[", "T"), ("steps.both", "H", "T")):
+            packed, report = planner.pack_values("s", "", {path: text}, "small")
+            value = packed[path]
+            assert "tokens omitted" in value
+            assert "M" not in value
+            assert value[0] == head and value[-1] == tail
+            assert report.within_budget
+
+    def test_values_are_cut_with_the_configured_estimator(self):
+        def count_characters(text, model=None):
+            return len(text)
+
+        for strategy in (PackingStrategy.TRUNCATE_MIDDLE, PackingStrategy.KEEP_HEAD, PackingStrategy.KEEP_TAIL):
+            planner = _planner(token_estimator=count_characters, default_strategy=strategy)
+
+            packed, report = planner.pack_values("s", "", {"steps.a": "a" * 4000}, "small")
+
+            assert report.within_budget
+            assert len(packed["steps.a"]) == 800
+
+    def test_summary_strategy_uses_registered_summary(self):
+        planner = _planner(strategies={"steps": PackingStrategy.SUMMARY})
+        planner.register_summary("research", "short summary")
+
+        packed, report = planner.pack_values("s", "", {"steps.research": "r" * 8000}, "small")
+
+        assert packed["steps.research"] == "short summary"
+        assert report.reduced == {"steps.research": "summary"}
+
+    def test_summary_strategy_falls_back_to_truncation(self):
+        planner = _planner(strategies={"steps": PackingStrategy.SUMMARY})
+
+        packed, report = planner.pack_values("s", "", {"steps.research": "r" * 8000}, "small")
+
+        assert report.reduced == {"steps.research": "truncate_middle"}
+        assert report.within_budget
+
+
+class TestTemplates:
+    """Test packing of prompt templates."""
+
+    def test_template_uses_step_summary_output(self):
+        planner = _planner(strategies={"steps": PackingStrategy.SUMMARY})
+        template = PromptTemplate("Polish {{ steps.draft.text }} about {{ inputs.topic }}")
+        variables = {
+            "inputs": {"topic": "bees"},
+            "steps": {"draft": {"text": "d" * 8000, "summary": "draft summary"}},
+        }
+
+        prompt, report = planner.pack_template("polish", template, variables, "small")
+
+        assert prompt == "Polish draft summary about bees"
+        assert variables["steps"]["draft"]["text"] == "d" * 8000
+
+    def test_stats_report_tokens_saved_by_step(self):
+        planner = _planner()
+        planner.pack_values("outline", "", {"inputs.topic": "bees"}, "small")
+        _, report = planner.pack_values("draft", "", {"steps.outline": "o" * 8000}, "small")
+
+        stats = planner.get_stats()
+
+        assert stats["packed_steps"] == 2
+        assert stats["reduced_steps"] == 1
+        assert stats["tokens_saved"] == report.tokens_saved > 0
+        assert stats["tokens_saved_by_step"] == {"outline": 0, "draft": report.tokens_saved}
+        assert planner.get_report("draft").to_dict()["tokens_saved"] == report.tokens_saved
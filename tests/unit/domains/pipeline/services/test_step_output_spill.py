@@ -0,0 +1,76 @@
+"""Tests for spilling large step outputs to blobs."""
+
+from writeit.domains.pipeline.services.step_output_spill import (
+    BLOB_REF_KEY,
+    SpilledOutput,
+    StepOutputBlobStore,
+    StepOutputSpiller,
+    blob_digest,
+)
+from writeit.domains.pipeline.value_objects.prompt_template import PromptTemplate
+
+
+class _MemoryBlobStore(StepOutputBlobStore):
+    def __init__(self):
+        self.blobs = {}
+        self.puts = 0
+        self.gets = 0
+
+    def put(self, data: bytes) -> str:
+        digest = blob_digest(data)
+        self.puts += 1
+        self.blobs.setdefault(digest, data)
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        self.gets += 1
+        return self.blobs[digest]
+
+    def contains(self, digest: str) -> bool:
+        return digest in self.blobs
+
+
+class TestSpill:
+    """Test replacing large outputs with handles."""
+
+    def test_only_large_strings_are_spilled(self):
+        store = _MemoryBlobStore()
+        spiller = StepOutputSpiller(store, threshold_bytes=16)
+        large = "x" * 32
+
+        outputs = spiller.spill({"short": "ok", "text": large, "count": 3, "items": [large]})
+
+        assert outputs["short"] == "ok"
+        assert outputs["count"] == 3
+        assert isinstance(outputs["text"], SpilledOutput)
+        assert isinstance(outputs["items"][0], SpilledOutput)
+        assert len(store.blobs) == 1
+        assert spiller.get_stats() == {"spilled": 2, "spilled_bytes": 64}
+
+    def test_refs_round_trip(self):
+        store = _MemoryBlobStore()
+        spiller = StepOutputSpiller(store, threshold_bytes=16)
+        large = "é" * 20
+
+        refs = spiller.to_refs(spiller.spill({"text": large}))
+
+        assert set(refs["text"]) == {BLOB_REF_KEY, "size"}
+        assert refs["text"]["size"] == 40
+        restored = spiller.from_refs(refs)
+        assert isinstance(restored["text"], SpilledOutput)
+        assert restored["text"] == large
+        assert spiller.materialize(refs) == {"text": large}
+        assert spiller.materialize(restored) == {"text": large}
+
+    def test_handles_load_only_when_rendered(self):
+        store = _MemoryBlobStore()
+        spiller = StepOutputSpiller(store, threshold_bytes=16)
+        outputs = spiller.spill({"text": "draft " * 10})
+        assert store.gets == 0
+
+        rendered = PromptTemplate("Polish: {{ steps.draft.text }}").render(
+            {"steps": {"draft": outputs}}
+        )
+
+        assert rendered == "Polish: " + "draft " * 10
+        assert store.gets == 1
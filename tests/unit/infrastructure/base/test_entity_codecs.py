@@ -0,0 +1,263 @@
+"""Tests for compiled per-type entity codecs."""
+
+import json
+from dataclasses import dataclass, field, fields
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID, uuid4
+
+import msgpack
+import pytest
+
+from writeit.infrastructure.base.entity_codecs import GENERIC_KEY
+from writeit.infrastructure.base.safe_serialization import (
+    COMPACT_RECORD_MAGIC,
+    SafeJSONEntitySerializer,
+    SafeMessagePackSerializer,
+    SerializationError,
+)
+from writeit.infrastructure.base.version_compatibility import FieldRenameMigration, VersionInfo
+
+
+@dataclass(frozen=True)
+class NoteId:
+    value: str
+
+
+@dataclass
+class Attachment:
+    name: str
+    size: int = 0
+
+
+@dataclass
+class Note:
+    id: NoteId
+    title: str
+    created_at: datetime
+    owner: UUID
+    score: float = 0.0
+    archived: bool = False
+    parent: Optional[NoteId] = None
+    attachments: List[Attachment] = field(default_factory=list)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class Node:
+    name: str
+    child: Optional["Node"] = None
+
+
+class Settings:
+    """Non-dataclass entity."""
+
+    kind = "settings"
+
+    def __init__(self):
+        self.theme = "dark"
+        self.font_size = 12
+        self._secret = "hidden"
+
+    @property
+    def label(self) -> str:
+        return f"{self.theme}:{self.font_size}"
+
+    def describe(self) -> str:
+        return self.label
+
+
+def _register(serializer):
+    serializer.register_value_object(NoteId)
+    serializer.register_type("Attachment", Attachment)
+    serializer.register_type("Note", Note)
+    serializer.register_type("Node", Node)
+    return serializer
+
+
+def _note(**overrides) -> Note:
+    values = dict(
+        id=NoteId("note-1"),
+        title="Codecs",
+        created_at=datetime(2024, 5, 1, 12, 30),
+        owner=uuid4(),
+        score=4.5,
+        parent=NoteId("root"),
+        attachments=[Attachment("a.txt", 10), Attachment("b.png")],
+        metadata={"tags": ("x", "y"), "seen": {1}, "when": datetime(2024, 1, 1), "n": None},
+    )
+    values.update(overrides)
+    return Note(**values)
+
+
+def _chain(length: int) -> Node:
+    node = None
+    for index in range(length):
+        node = Node(f"node-{index}", node)
+    return node
+
+
+def _generic_to_dict(serializer, entity) -> Dict[str, Any]:
+    """Reference: the per-value walk the compiled codecs replace."""
+    return {f.name: serializer._serialize_value(getattr(entity, f.name), 1) for f in fields(entity)}
+
+
+@pytest.fixture
+def json_serializer():
+    return _register(SafeJSONEntitySerializer(enable_schema_validation=False))
+
+
+@pytest.fixture
+def msgpack_serializer():
+    return _register(SafeMessagePackSerializer(schema_version="2.1.0", enable_schema_validation=False))
+
+
+class TestDictCodecs:
+    """Test codecs producing the JSON document structure."""
+
+    def test_output_matches_generic_walk(self, json_serializer):
+        note = _note()
+
+        assert json_serializer._entity_to_dict(note) == _generic_to_dict(json_serializer, note)
+
+    def test_json_round_trip(self, json_serializer):
+        note = _note()
+
+        restored = json_serializer.deserialize(json_serializer.serialize(note), Note)
+
+        assert restored.id == note.id
+        assert restored.attachments == note.attachments
+        assert restored.metadata == {
+            "tags": ("x", "y"), "seen": {1}, "when": datetime(2024, 1, 1), "n": None
+        }
+        assert restored == _note(owner=note.owner, metadata=restored.metadata)
+
+    def test_unexpected_runtime_types_use_generic_path(self, json_serializer):
+        note = _note(title=("not", "a", "string"), attachments=None, score=None)
+
+        assert json_serializer._entity_to_dict(note) == _generic_to_dict(json_serializer, note)
+        restored = json_serializer.deserialize(json_serializer.serialize(note), Note)
+        assert restored.title == ("not", "a", "string")
+        assert restored.attachments is None
+
+    def test_missing_required_field(self, json_serializer):
+        document = json.loads(json_serializer.serialize(_note()))
+        del document["data"]["title"]
+
+        with pytest.raises(SerializationError, match="Missing required field: title"):
+            json_serializer.deserialize(json.dumps(document).encode(), Note)
+
+    def test_non_dataclass_matches_dir_walk(self, json_serializer):
+        settings = Settings()
+        settings.extra = [1, 2]
+
+        expected = {
+            name: json_serializer._serialize_value(getattr(settings, name), 1)
+            for name in dir(settings)
+            if not name.startswith("_") and not callable(getattr(settings, name))
+        }
+        assert json_serializer._entity_to_dict(settings) == expected
+
+    def test_depth_limit_spans_nested_dataclasses(self, json_serializer):
+        restored = json_serializer.deserialize(json_serializer.serialize(_chain(50)), Node)
+        assert restored == _chain(50)
+
+        with pytest.raises(SerializationError, match="Maximum recursion depth"):
+            json_serializer.serialize(_chain(150))
+
+    def test_codecs_compiled_once_and_reset_on_registration(self, json_serializer):
+        codec = json_serializer.codecs.codec_for(Note)
+        assert json_serializer.codecs.codec_for(Note) is codec
+
+        json_serializer.register_type("Settings", Settings)
+        assert json_serializer.codecs.codec_for(Note) is not codec
+
+
+class TestCompactMessagePack:
+    """Test compact MessagePack records."""
+
+    def test_round_trip_with_schema_header(self, msgpack_serializer, json_serializer):
+        note = _note()
+
+        data = msgpack_serializer.serialize(note)
+        record = msgpack.unpackb(data, strict_map_key=False)
+
+        assert record[:5] == [COMPACT_RECORD_MAGIC, 1, "2.1.0", "Note", Note.__module__]
+        assert record[5]["Attachment"] == ["name", "size"]
+        assert len(data) < len(json_serializer.serialize(note))
+
+        restored = msgpack_serializer.deserialize(data, Note)
+        assert json_serializer.serialize(restored) == json_serializer.serialize(note)
+
+    def test_unexpected_runtime_types_are_wrapped(self, msgpack_serializer):
+        note = _note(title=("a", "b"), created_at="yesterday", attachments={"not": "a list"})
+
+        record = msgpack.unpackb(msgpack_serializer.serialize(note), strict_map_key=False)
+        assert record[6][1] == {GENERIC_KEY: {"__tuple__": ["a", "b"]}}
+
+        restored = msgpack_serializer.deserialize(msgpack_serializer.serialize(note), Note)
+        assert restored.title == ("a", "b")
+        assert restored.created_at == "yesterday"
+        assert restored.attachments == {"not": "a list"}
+
+    def test_older_field_layout_decodes_by_name(self, msgpack_serializer):
+        record = msgpack.unpackb(msgpack_serializer.serialize(_note()), strict_map_key=False)
+
+        # Simulate a record written before Attachment.size and Note.score existed,
+        # and with a field that has since been removed
+        record[5]["Attachment"] = ["name"]
+        record[6][7] = [["a.txt"]]
+        note_fields = record[5]["Note"]
+        score_index = note_fields.index("score")
+        note_fields[score_index] = "legacy_rating"
+        record[6][score_index] = 9
+
+        restored = msgpack_serializer.deserialize(msgpack.packb(record), Note)
+
+        assert restored.attachments == [Attachment("a.txt", 0)]
+        assert restored.score == 0.0
+        assert restored.title == "Codecs"
+
+    def test_older_schema_version_is_migrated(self, msgpack_serializer):
+        msgpack_serializer.register_migration(FieldRenameMigration(
+            VersionInfo.from_string("2.0.0"), VersionInfo.from_string("2.1.0"), {"headline": "title"}
+        ))
+        note = _note()
+        record = msgpack.unpackb(msgpack_serializer.serialize(note), strict_map_key=False)
+        record[2] = "2.0.0"
+        record[5]["Note"][record[5]["Note"].index("title")] = "headline"
+
+        restored = msgpack_serializer.deserialize(msgpack.packb(record), Note)
+
+        assert restored == _note(owner=note.owner, metadata=restored.metadata)
+
+    def test_records_are_schema_validated(self):
+        serializer = _register(SafeMessagePackSerializer(schema_version="2.1.0"))
+        data = serializer.serialize(Attachment("a.txt", 3))
+
+        assert serializer.deserialize(data, Attachment) == Attachment("a.txt", 3)
+        with pytest.raises(SerializationError, match="Schema validation failed"):
+            serializer.serialize(Attachment("a.txt", "large"))
+
+    def test_depth_limit_spans_nested_dataclasses(self, msgpack_serializer):
+        assert msgpack_serializer.deserialize(msgpack_serializer.serialize(_chain(50)), Node) == _chain(50)
+
+        with pytest.raises(SerializationError, match="Maximum recursion depth"):
+            msgpack_serializer.serialize(_chain(150))
+
+    def test_type_mismatch_rejected(self, msgpack_serializer):
+        data = msgpack_serializer.serialize(_note())
+
+        with pytest.raises(SerializationError, match="Type mismatch"):
+            msgpack_serializer.deserialize(data, Attachment)
+
+    def test_json_document_records_still_decode(self, msgpack_serializer):
+        json_serializer = _register(
+            SafeJSONEntitySerializer(schema_version="2.1.0", enable_schema_validation=False)
+        )
+        note = _note()
+        legacy = msgpack.packb(json.loads(json_serializer.serialize(note)))
+
+        restored = msgpack_serializer.deserialize(legacy, Note)
+
+        assert json_serializer.serialize(restored) == json_serializer.serialize(note)
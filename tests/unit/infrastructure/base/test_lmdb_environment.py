@@ -0,0 +1,99 @@
+"""Tests for process-wide shared LMDB environments."""
+
+import lmdb
+import pytest
+
+from writeit.infrastructure.base import lmdb_environment
+from writeit.infrastructure.base.lmdb_environment import acquire_environment, release_environment
+from writeit.infrastructure.base.storage_manager import LMDBStorageManager
+from writeit.storage.manager import StorageManager
+
+
+class _WorkspaceManager:
+    def __init__(self, base_path):
+        self.base_path = base_path
+
+    def get_workspace_path(self, workspace_name: str):
+        return self.base_path / workspace_name
+
+
+@pytest.fixture
+def workspace_manager(tmp_path):
+    return _WorkspaceManager(tmp_path)
+
+
+class TestSharedEnvironment:
+    """Test sharing and reference counting of environments."""
+
+    def test_managers_of_a_workspace_share_one_environment(self, workspace_manager):
+        legacy = StorageManager(workspace_manager, "shared", map_size_mb=10)
+        infra = LMDBStorageManager(workspace_manager, "shared", map_size_mb=10)
+
+        legacy.store_json("key", {"a": 1}, db_name="pipelines", db_key="runs")
+        with legacy.get_connection() as legacy_env, infra.get_connection() as infra_env:
+            assert legacy_env is infra_env
+        with infra.get_transaction("pipelines", write=False, db_key="runs") as (txn, db):
+            assert txn.get(b"key", db=db) == b'{"a": 1}'
+
+        shared = legacy._connections["shared"]
+        legacy.close()
+        assert legacy.load_json("key", db_name="pipelines", db_key="runs") == {"a": 1}
+        legacy.close()
+        infra.close()
+        assert shared.path not in lmdb_environment._registry
+        with pytest.raises(lmdb.Error):
+            shared.env.info()
+
+    def test_database_limit_does_not_depend_on_first_opener(self, workspace_manager):
+        legacy = StorageManager(workspace_manager, "limits", map_size_mb=10, max_dbs=10)
+        legacy.store_json("key", 1)
+        infra = LMDBStorageManager(workspace_manager, "limits", map_size_mb=10)
+
+        for index in range(20):
+            with infra.get_transaction(f"db{index}", write=True) as (txn, db):
+                txn.put(b"key", b"value", db=db)
+
+        path = legacy._shared_environment().path
+        with pytest.raises(ValueError):
+            acquire_environment(path, 10 * 1024 * 1024, lmdb_environment.SHARED_MAX_DBS + 1)
+        legacy.close()
+        infra.close()
+
+    def test_reads_reuse_pooled_transactions(self, workspace_manager):
+        storage = StorageManager(workspace_manager, "reads", map_size_mb=10)
+        storage.store_json("key", 1)
+
+        for value in range(2, 5):
+            assert storage.load_json("key") == value - 1
+            storage.store_json("key", value)
+
+        shared = storage._shared_environment()
+        assert shared.get_stats()["reads"] == 3
+        # One reader slot, renewed for every read
+        assert shared.env.readers().strip().count("\n") == 1
+        assert storage.list_keys() == ["key"]
+        assert storage.get_stats()["entries"] == 1
+        storage.close()
+
+    def test_larger_map_request_grows_shared_map(self, tmp_path):
+        first = acquire_environment(tmp_path / "env", 1024 * 1024, 4)
+        second = acquire_environment(tmp_path / "env", 4 * 1024 * 1024, 4)
+
+        assert first is second
+        assert first.env.info()["map_size"] == 4 * 1024 * 1024
+        release_environment(second)
+        release_environment(first)
+
+    def test_legacy_manager_data_is_migrated(self, workspace_manager):
+        legacy_path = workspace_manager.get_workspace_path("old") / "pipeline_events.lmdb"
+        legacy_path.parent.mkdir(parents=True)
+        env = lmdb.open(str(legacy_path), max_dbs=4)
+        with env.begin(write=True) as txn:
+            txn.put(b"event-1", b'{"type": "started"}')
+        env.close()
+
+        storage = StorageManager(workspace_manager, "old", map_size_mb=10)
+
+        assert storage.load_json("event-1", db_name="pipeline_events") == {"type": "started"}
+        assert not legacy_path.exists()
+        storage.close()
@@ -0,0 +1,144 @@
+"""Tests for units of work over the consolidated workspace environment."""
+
+import asyncio
+import json
+
+import lmdb
+import pytest
+
+from writeit.domains.workspace.value_objects.workspace_name import WorkspaceName
+from writeit.infrastructure.base.group_commit import WriteOperation
+from writeit.infrastructure.base.storage_manager import LMDBStorageManager
+from writeit.infrastructure.base.unit_of_work import LMDBUnitOfWork
+from writeit.shared.repository import UnitOfWorkError
+
+
+class _WorkspaceManager:
+    def __init__(self, base_path):
+        self.base_path = base_path
+
+    def get_workspace_path(self, workspace_name: str):
+        return self.base_path / workspace_name
+
+
+class _JSONSerializer:
+    def serialize(self, entity) -> bytes:
+        return json.dumps(entity).encode("utf-8")
+
+    def deserialize(self, data: bytes, entity_type):
+        return json.loads(data)
+
+
+WORKSPACE = WorkspaceName("test-workspace")
+
+
+@pytest.fixture
+def storage_manager(tmp_path):
+    manager = LMDBStorageManager(
+        workspace_manager=_WorkspaceManager(tmp_path),
+        workspace_name="uow",
+        map_size_mb=10,
+    )
+    manager.set_serializer(_JSONSerializer())
+    yield manager
+    manager.close()
+
+
+async def _load(storage_manager, key, db_name, db_key):
+    return await storage_manager.load_entity(key, dict, db_name=db_name, db_key=db_key)
+
+
+class TestUnitOfWork:
+    """Test commits spanning several databases."""
+
+    @pytest.mark.asyncio
+    async def test_commit_spans_databases(self, storage_manager):
+        await storage_manager.save_entity({"v": 0}, "stale", db_name="runs", db_key="runs")
+
+        async with LMDBUnitOfWork(storage_manager, WORKSPACE) as uow:
+            await uow.save_entity({"v": 1}, "run-1", db_name="runs", db_key="runs")
+            await uow.save_entity({"v": 2}, "tpl-1", db_name="templates", db_key="templates")
+            await uow.delete_entity("stale", db_name="runs", db_key="runs")
+
+        assert await _load(storage_manager, "run-1", "runs", "runs") == {"v": 1}
+        assert await _load(storage_manager, "tpl-1", "templates", "templates") == {"v": 2}
+        assert await _load(storage_manager, "stale", "runs", "runs") is None
+        assert list(storage_manager.storage_path.iterdir()) == [storage_manager.env_path]
+
+    @pytest.mark.asyncio
+    async def test_entities_are_serialized_when_queued(self, storage_manager):
+        entity = {"v": 1}
+        async with LMDBUnitOfWork(storage_manager, WORKSPACE) as uow:
+            await uow.save_entity(entity, "run-1", db_name="runs", db_key="runs")
+            entity["v"] = 2
+
+        assert await _load(storage_manager, "run-1", "runs", "runs") == {"v": 1}
+
+        with pytest.raises(UnitOfWorkError):
+            await LMDBUnitOfWork(storage_manager, WORKSPACE).save_entity(object(), "bad", db_name="runs")
+
+    @pytest.mark.asyncio
+    async def test_rollback_discards_direct_writes(self, storage_manager):
+        await storage_manager.save_entity({"v": 0}, "existing", db_name="runs", db_key="runs")
+        uow = LMDBUnitOfWork(storage_manager, WORKSPACE)
+        txn, db = uow.get_transaction("runs", "runs")
+        txn.put(b"direct", b"{}", db=db)
+        await uow.save_entity({"v": 1}, "queued", db_name="templates", db_key="templates")
+        await uow.rollback()
+
+        assert await storage_manager.entity_exists("direct", db_name="runs", db_key="runs") is False
+        committed = LMDBUnitOfWork(storage_manager, WORKSPACE)
+        txn, db = committed.get_transaction("runs", "runs")
+        txn.put(b"direct", b"{}", db=db)
+        await committed.save_entity({"v": 1}, "queued", db_name="templates", db_key="templates")
+        await committed.commit()
+
+        assert await storage_manager.entity_exists("direct", db_name="runs", db_key="runs")
+        assert await _load(storage_manager, "queued", "templates", "templates") == {"v": 1}
+
+
+class TestGroupCommit:
+    """Test merging of concurrent units of work."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_units_share_one_commit(self, storage_manager):
+        async def unit(i: int) -> None:
+            async with LMDBUnitOfWork(storage_manager, WORKSPACE) as uow:
+                await uow.save_entity({"v": i}, f"run-{i}", db_name="runs", db_key="runs")
+
+        await asyncio.gather(*(unit(i) for i in range(10)))
+
+        stats = storage_manager.group_committer.get_stats()
+        assert (stats["units"], stats["batches"], stats["max_batch_units"]) == (10, 1, 10)
+        assert await storage_manager.count_entities(db_name="runs", db_key="runs") == 10
+
+    @pytest.mark.asyncio
+    async def test_failing_unit_does_not_fail_its_batch(self, storage_manager):
+        committer = storage_manager.group_committer
+        good = WriteOperation("runs", "runs", b"good", b"{}")
+        bad = [WriteOperation("runs", "runs", b"partial", b"{}"), WriteOperation("runs", "runs", b"", b"{}")]
+
+        results = await asyncio.gather(committer.submit([good]), committer.submit(bad), return_exceptions=True)
+
+        assert results[0] is None
+        assert isinstance(results[1], UnitOfWorkError)
+        assert await storage_manager.entity_exists("good", db_name="runs", db_key="runs")
+        assert not await storage_manager.entity_exists("partial", db_name="runs", db_key="runs")
+        assert committer.get_stats()["failed_units"] == 1
+
+
+class TestLegacyEnvironments:
+    """Test migration from one environment per database."""
+
+    @pytest.mark.asyncio
+    async def test_legacy_databases_are_copied_once(self, storage_manager):
+        legacy_path = storage_manager.get_db_path("pipeline_runs")
+        legacy_path.parent.mkdir(parents=True)
+        legacy = lmdb.open(str(legacy_path), max_dbs=4)
+        with legacy.begin(write=True) as txn:
+            txn.put(b"run-1", b'{"v": 1}', db=legacy.open_db(b"runs", txn=txn))
+        legacy.close()
+
+        assert await _load(storage_manager, "run-1", "pipeline_runs", "runs") == {"v": 1}
+        assert not legacy_path.exists()
+        assert legacy_path.with_name("pipeline_runs.lmdb.migrated").exists()
@@ -0,0 +1,89 @@
+"""Tests for the persisted template dependency graph."""
+
+import pytest
+from dataclasses import replace
+from pathlib import Path
+
+from writeit.domains.content.entities.template import Template
+from writeit.domains.content.value_objects.content_type import ContentType
+from writeit.domains.content.value_objects.template_name import TemplateName
+from writeit.domains.workspace.value_objects.workspace_name import WorkspaceName
+from writeit.infrastructure.base.storage_manager import LMDBStorageManager
+from writeit.infrastructure.content.template_dependency_store import TemplateDependencyStore
+
+
+class _WorkspaceManager:
+    def __init__(self, base_path: Path):
+        self.base_path = base_path
+
+    def get_workspace_path(self, workspace_name: str) -> Path:
+        return self.base_path / workspace_name
+
+
+def _template(name: str, yaml_content: str) -> Template:
+    return Template.create(
+        name=TemplateName(name),
+        content_type=ContentType.article(),
+        yaml_content=yaml_content,
+    )
+
+
+@pytest.fixture
+def storage_manager(tmp_path):
+    manager = LMDBStorageManager(
+        workspace_manager=_WorkspaceManager(tmp_path),
+        workspace_name="deps",
+        map_size_mb=10,
+    )
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def store(storage_manager):
+    return TemplateDependencyStore(storage_manager, WorkspaceName("test-workspace"))
+
+
+class TestTemplateDependencyStore:
+    """Test incremental maintenance of forward and reverse adjacency."""
+
+    @pytest.mark.asyncio
+    async def test_forward_and_reverse_adjacency(self, store):
+        article = _template("article", "extends: base\nincludes: [footer]\n")
+        await store.index_template(article)
+        await store.index_template(_template("base", "steps: {}\n"))
+
+        assert await store.get_dependencies("article") == ["base", "footer"]
+        assert await store.get_dependents("base") == ["article"]
+        assert await store.get_dependencies("footer") is None
+
+        index = await store.load_index()
+        assert index.transitive_dependencies("article") == {"base", "footer"}
+        assert index.missing_dependencies("article") == ["footer"]
+
+    @pytest.mark.asyncio
+    async def test_updates_renames_and_deletes(self, store):
+        article = _template("article", "extends: base\n")
+        await store.index_template(article)
+
+        await store.index_template(replace(article, yaml_content="extends: layout\n"))
+        assert await store.get_dependents("base") == []
+        assert await store.get_dependents("layout") == ["article"]
+
+        await store.index_template(replace(article, name=TemplateName("essay"), yaml_content="extends: layout\n"))
+        assert await store.get_dependencies("article") is None
+        assert await store.get_dependents("layout") == ["essay"]
+
+        assert await store.remove_template(article.id) == "essay"
+        assert await store.get_dependents("layout") == []
+        assert (await store.load_index()).templates == []
+
+    @pytest.mark.asyncio
+    async def test_rebuild(self, store):
+        assert not await store.is_built()
+
+        count = await store.rebuild([_template("article", "extends: base\n"), _template("base", "steps: {}\n")])
+
+        assert count == 2
+        assert await store.is_built()
+        assert sorted((await store.load_index()).templates) == ["article", "base"]
@@ -0,0 +1,205 @@
+"""Tests for LMDB snapshots and deduplicated workspace backups."""
+
+import asyncio
+import hashlib
+
+import lmdb
+import pytest
+
+from writeit.infrastructure.persistence.backup_manager import (
+    BackupConfig,
+    BackupManager,
+    BackupType,
+    CompressionType,
+    ContentAddressedChunkStore,
+    DeduplicatedBackupStrategy,
+    FileSystemBackupStrategy,
+    create_backup_manager,
+    snapshot_lmdb_environment,
+)
+from writeit.infrastructure.base.lmdb_environment import acquire_environment, release_environment
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    """Workspace directory with a live LMDB environment and plain files."""
+    root = tmp_path / "workspace"
+    root.mkdir()
+    (root / "config.yaml").write_text("name: test\n")
+    (root / "templates").mkdir()
+    (root / "templates" / "article.yaml").write_text("steps: {}\n" * 100)
+
+    env = lmdb.open(str(root / "pipelines.lmdb"), map_size=10 * 1024 * 1024, max_dbs=4)
+    with env.begin(write=True) as txn:
+        for index in range(200):
+            txn.put(f"key-{index}".encode(), b"x" * 512)
+    yield root, env
+    env.close()
+
+
+@pytest.fixture
+def manager(tmp_path, workspace):
+    _, env = workspace
+    config = BackupConfig(
+        backup_root_path=tmp_path / "backups",
+        temp_dir=tmp_path / "tmp",
+        chunk_size=4096,
+        max_backups=50,
+    )
+    manager = BackupManager(config, environment_resolver=lambda path: env)
+    yield manager
+    manager.close()
+
+
+def _read_keys(env_path):
+    env = lmdb.open(str(env_path), readonly=True, lock=False)
+    try:
+        with env.begin() as txn:
+            return {key: value for key, value in txn.cursor()}
+    finally:
+        env.close()
+
+
+class TestLMDBSnapshots:
+    """Test hot LMDB snapshots."""
+
+    def test_snapshot_of_open_environment(self, tmp_path, workspace):
+        root, env = workspace
+
+        snapshot = snapshot_lmdb_environment(root / "pipelines.lmdb", tmp_path / "snap", env)
+
+        assert len(_read_keys(snapshot)) == 200
+
+
+class TestArchiveBackups:
+    """Test archive backups with inline checksums."""
+
+    @pytest.mark.parametrize("compression", [
+        CompressionType.TAR_GZ, CompressionType.ZIP, CompressionType.NONE
+    ])
+    @pytest.mark.asyncio
+    async def test_backup_and_restore(self, tmp_path, workspace, manager, compression):
+        root, _ = workspace
+
+        result = await manager.create_backup(root, BackupType.FULL, compression=compression)
+
+        assert result.success, result.error_details
+        assert result.metadata.file_count == 3
+        assert await manager.validate_backup(result.backup_id)
+        if result.backup_path.is_file():
+            digest = hashlib.sha256(result.backup_path.read_bytes()).hexdigest()
+            assert result.metadata.checksum == f"sha256:{digest}"
+
+        target = tmp_path / "restored"
+        restored = await manager.restore_backup(result.backup_id, target)
+
+        assert restored.success, restored.error_details
+        assert (target / "templates" / "article.yaml").read_text() == "steps: {}\n" * 100
+        assert len(_read_keys(target / "pipelines.lmdb")) == 200
+        assert not (target / "pipelines.lmdb" / "lock.mdb").exists()
+
+
+class TestDeduplicatedBackups:
+    """Test incremental backups into the content-addressed chunk store."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_backups_only_write_changed_chunks(self, tmp_path, workspace, manager):
+        root, _ = workspace
+
+        first = await manager.create_backup(root, BackupType.INCREMENTAL)
+        assert first.success, first.error_details
+        assert first.backup_path.suffix == ".manifest"
+        assert first.statistics["chunks_written"] > 0
+
+        second = await manager.create_backup(root, BackupType.INCREMENTAL)
+        assert second.statistics["chunks_written"] == 0
+
+        (root / "config.yaml").write_text("name: changed\n")
+        third = await manager.create_backup(root, BackupType.INCREMENTAL)
+        assert third.statistics["chunks_written"] == 1
+
+        target = tmp_path / "restored"
+        restored = await manager.restore_backup(third.backup_id, target)
+
+        assert restored.success, restored.error_details
+        assert (target / "config.yaml").read_text() == "name: changed\n"
+        assert len(_read_keys(target / "pipelines.lmdb")) == 200
+
+    @pytest.mark.asyncio
+    async def test_delete_collects_unreferenced_chunks(self, workspace, manager):
+        root, _ = workspace
+        store = ContentAddressedChunkStore(manager.config.chunk_store_path)
+
+        first = await manager.create_backup(root, BackupType.INCREMENTAL)
+        (root / "config.yaml").write_text("name: changed\n")
+        second = await manager.create_backup(root, BackupType.INCREMENTAL)
+        chunks_before = set(store.iter_digests())
+
+        assert await manager.delete_backup(first.backup_id)
+
+        chunks_after = set(store.iter_digests())
+        assert len(chunks_before - chunks_after) == 1
+        assert await manager.validate_backup(second.backup_id)
+
+    @pytest.mark.asyncio
+    async def test_missing_chunk_fails_validation(self, workspace, manager):
+        root, _ = workspace
+        result = await manager.create_backup(root, BackupType.INCREMENTAL)
+        store = ContentAddressedChunkStore(manager.config.chunk_store_path)
+
+        store.chunk_path(next(store.iter_digests())).unlink()
+
+        assert not await manager.validate_backup(result.backup_id)
+
+    @pytest.mark.asyncio
+    async def test_archived_incremental_backups_are_still_restored(self, tmp_path, workspace, manager):
+        root, _ = workspace
+        # An incremental backup written as an archive, as before chunking
+        manager.strategies = [FileSystemBackupStrategy(manager.environment_resolver)]
+        archived = await manager.create_backup(root, BackupType.INCREMENTAL)
+        assert archived.backup_path.suffix != ".manifest"
+        manager._register_default_strategies()
+
+        target = tmp_path / "restored"
+        restored = await manager.restore_backup(archived.backup_id, target)
+
+        assert restored.success, restored.error_details
+        assert (target / "config.yaml").read_text() == "name: test\n"
+
+    @pytest.mark.asyncio
+    async def test_garbage_collection_waits_for_running_backups(self, workspace, manager):
+        root, _ = workspace
+        first = await manager.create_backup(root, BackupType.INCREMENTAL)
+        strategy = next(s for s in manager.strategies if isinstance(s, DeduplicatedBackupStrategy))
+        store = ContentAddressedChunkStore(manager.config.chunk_store_path)
+        chunks = set(store.iter_digests())
+
+        await strategy._chunk_lock.acquire()
+        first.backup_path.unlink()
+        release = asyncio.create_task(strategy.release_backup(first.backup_path, manager.config))
+        await asyncio.sleep(0.05)
+        assert not release.done()
+        assert set(store.iter_digests()) == chunks
+
+        strategy._chunk_lock.release()
+        await release
+        assert set(store.iter_digests()) == set()
+
+
+class TestBackupManagerFactory:
+    """Test the default backup manager."""
+
+    @pytest.mark.asyncio
+    async def test_uses_shared_environments(self, tmp_path):
+        root = tmp_path / "workspace"
+        shared = acquire_environment(root / "store.lmdb", 10 * 1024 * 1024, 8)
+        with shared.env.begin(write=True) as txn:
+            txn.put(b"key", b"value")
+        manager = create_backup_manager(tmp_path / "backups")
+        try:
+            result = await manager.create_backup(root, BackupType.INCREMENTAL)
+        finally:
+            manager.close()
+            release_environment(shared)
+
+        assert result.success, result.error_details
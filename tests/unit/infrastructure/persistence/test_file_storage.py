@@ -0,0 +1,128 @@
+"""Tests for FileSystemStorage manifest, lazy hashing and change debouncing."""
+
+import asyncio
+import hashlib
+import threading
+
+import pytest
+
+from writeit.infrastructure.persistence.file_storage import FileSystemStorage, MANIFEST_FILENAME
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    root = tmp_path / "workspace"
+    (root / "templates").mkdir(parents=True)
+    (root / "templates" / "article.yaml").write_text("steps: {}\n")
+    (root / "notes.md").write_text("# Notes\n")
+    return root
+
+
+async def _open(root, **kwargs):
+    storage = FileSystemStorage(root, enable_watching=False, backup_enabled=False, **kwargs)
+    await storage.initialize()
+    return storage
+
+
+class TestFileManifest:
+    """Test persisted metadata and lazy hashing."""
+
+    @pytest.mark.asyncio
+    async def test_initialize_does_not_hash(self, workspace):
+        storage = await _open(workspace)
+        try:
+            stats = storage.get_stats()
+            assert stats['tracked_files'] == 2
+            assert stats['files_hashed'] == 0
+            assert storage.get_file_metadata(workspace / "notes.md").content_hash == ""
+            assert (workspace / MANIFEST_FILENAME).exists()
+            assert all(
+                path.name != MANIFEST_FILENAME
+                for path in await storage.list_files(recursive=True)
+            )
+        finally:
+            await storage.close()
+
+    @pytest.mark.asyncio
+    async def test_hashes_are_computed_once_and_persisted(self, workspace):
+        storage = await _open(workspace)
+        try:
+            hashes = await storage.compute_hashes()
+            assert hashes[workspace / "notes.md"] == _sha256(b"# Notes\n")
+            assert await storage.get_content_hash(workspace / "notes.md") == _sha256(b"# Notes\n")
+            assert storage.get_stats()['files_hashed'] == 2
+        finally:
+            await storage.close()
+
+        reopened = await _open(workspace)
+        try:
+            assert reopened.get_stats()['manifest_hits'] == 2
+            assert await reopened.get_content_hash(workspace / "notes.md") == _sha256(b"# Notes\n")
+            assert reopened.get_stats()['files_hashed'] == 0
+        finally:
+            await reopened.close()
+
+    @pytest.mark.asyncio
+    async def test_changed_file_is_rehashed(self, workspace):
+        storage = await _open(workspace)
+        try:
+            await storage.compute_hashes()
+            (workspace / "notes.md").write_text("# Notes\n\nMore text.\n")
+
+            content_hash = await storage.get_content_hash(workspace / "notes.md")
+
+            assert content_hash == _sha256(b"# Notes\n\nMore text.\n")
+            assert storage.get_stats()['files_hashed'] == 3
+        finally:
+            await storage.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_hash(self, workspace):
+        storage = await _open(workspace)
+        try:
+            results = await asyncio.gather(*(
+                storage.get_content_hash(workspace / "notes.md") for _ in range(5)
+            ))
+
+            assert set(results) == {_sha256(b"# Notes\n")}
+            assert storage.get_stats()['files_hashed'] == 1
+        finally:
+            await storage.close()
+
+
+class TestChangeDebouncing:
+    """Test coalescing of watcher events."""
+
+    @pytest.mark.asyncio
+    async def test_events_are_coalesced_per_path(self, workspace):
+        storage = await _open(workspace, debounce_seconds=0.05)
+        received = []
+
+        async def on_change(path, event_type):
+            received.append((path.name, event_type))
+
+        storage.add_change_callback(on_change)
+        try:
+            new_file = workspace / "draft.md"
+            new_file.write_text("draft")
+
+            def emit():
+                storage.notify_change(new_file, 'created')
+                for _ in range(10):
+                    storage.notify_change(new_file, 'modified')
+                storage.notify_change(workspace / "notes.md", 'modified')
+
+            thread = threading.Thread(target=emit)
+            thread.start()
+            thread.join()
+            await asyncio.sleep(0.2)
+
+            assert sorted(received) == [("draft.md", "created"), ("notes.md", "modified")]
+            assert storage.get_file_metadata(new_file) is not None
+            assert storage.get_stats()['events_coalesced'] == 10
+        finally:
+            await storage.close()
@@ -0,0 +1,95 @@
+"""Tests for coalesced writes and durability profiles of LMDBStorage."""
+
+import asyncio
+from dataclasses import dataclass
+
+import pytest
+
+from writeit.infrastructure.base.exceptions import StorageError
+from writeit.infrastructure.persistence.lmdb_storage import (
+    DurabilityProfile,
+    LMDBStorage,
+    StorageConfig,
+)
+
+
+@dataclass
+class Note:
+    title: str
+
+
+@pytest.fixture
+async def storage(tmp_path):
+    storage = LMDBStorage(
+        tmp_path / "db",
+        StorageConfig(
+            map_size_mb=10,
+            database_durability={
+                "runs": DurabilityProfile.GROUP_COMMIT,
+                "cache": DurabilityProfile.RELAXED,
+            },
+        ),
+    )
+    await storage.initialize()
+    yield storage
+    await storage.close()
+
+
+class TestStorageConfig:
+    """Test durability profile selection."""
+
+    def test_profiles_per_database(self):
+        config = StorageConfig(database_durability={"cache": DurabilityProfile.RELAXED})
+
+        assert config.durability_for("cache") == DurabilityProfile.RELAXED
+        assert config.durability_for("templates") == DurabilityProfile.STRICT
+        assert config.env_sync is False
+        assert StorageConfig(database_durability={}).env_sync is True
+
+
+class TestWriteCoalescing:
+    """Test batching of concurrent writes."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_writes_share_one_sync(self, storage):
+        await asyncio.gather(*(
+            storage.store_entity(Note(f"run {i}"), f"run-{i}", "runs") for i in range(10)
+        ))
+
+        stats = storage.get_stats()["write_coalescing"]
+        assert (stats["writes"], stats["batches"], stats["syncs"]) == (10, 1, 1)
+        assert await storage.load_entity("run-7", Note, "runs") == Note("run 7")
+
+        deleted = await asyncio.gather(
+            storage.delete_entity("run-7", "runs"), storage.delete_entity("missing", "runs")
+        )
+        assert deleted == [True, False]
+
+    @pytest.mark.asyncio
+    async def test_strict_writes_bypass_coalescer(self, storage):
+        await storage.store_entity(Note("template"), "tpl-1", "templates")
+
+        assert storage.get_stats()["write_coalescing"]["writes"] == 0
+        assert await storage.load_entity("tpl-1", Note, "templates") == Note("template")
+
+    @pytest.mark.asyncio
+    async def test_relaxed_writes_are_synced_on_flush(self, storage):
+        await storage.store_entity(Note("cached"), "entry", "cache")
+        assert storage.get_stats()["write_coalescing"]["syncs"] == 0
+
+        await storage.flush()
+
+        assert storage.get_stats()["write_coalescing"]["syncs"] == 1
+        assert await storage.load_entity("entry", Note, "cache") == Note("cached")
+
+    @pytest.mark.asyncio
+    async def test_invalid_write_fails_alone(self, storage):
+        results = await asyncio.gather(
+            storage.store_entity(Note("ok"), "run-1", "runs"),
+            storage.store_entity(Note("bad"), "", "runs"),
+            return_exceptions=True,
+        )
+
+        assert results[0] is None
+        assert isinstance(results[1], StorageError)
+        assert await storage.entity_exists("run-1", "runs")
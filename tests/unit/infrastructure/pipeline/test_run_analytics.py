@@ -0,0 +1,196 @@
+"""Tests for hourly run analytics maintained by the clustered run store."""
+
+import pytest
+from dataclasses import replace
+from datetime import datetime, timedelta
+from pathlib import Path
+from uuid import UUID, uuid4
+
+from writeit.domains.pipeline.entities.pipeline_run import PipelineRun
+from writeit.domains.pipeline.repositories.step_execution_repository import StepExecution
+from writeit.domains.pipeline.services.run_analytics import (
+    MAX_ERRORS_PER_STEP,
+    RunAnalytics,
+    StepCounters,
+    step_contribution,
+)
+from writeit.domains.pipeline.value_objects.execution_status import ExecutionStatus
+from writeit.domains.pipeline.value_objects.pipeline_id import PipelineId
+from writeit.domains.pipeline.value_objects.step_id import StepId
+from writeit.domains.workspace.value_objects.workspace_name import WorkspaceName
+from writeit.infrastructure.base.storage_manager import LMDBStorageManager
+from writeit.infrastructure.pipeline.pipeline_run_repository_impl import LMDBPipelineRunRepository
+from writeit.infrastructure.pipeline.run_storage import RUNS_DB_KEY, RUNS_DB_NAME
+from writeit.infrastructure.pipeline.step_execution_repository_impl import LMDBStepExecutionRepository
+
+
+class _WorkspaceManager:
+    def __init__(self, base_path: Path):
+        self.base_path = base_path
+
+    def get_workspace_path(self, workspace_name: str) -> Path:
+        return self.base_path / workspace_name
+
+
+WORKSPACE = WorkspaceName("test-workspace")
+START = datetime(2024, 1, 1, 9, 15)
+
+
+def _run(status: ExecutionStatus, started_at: datetime, seconds: float, pipeline: str = "blog") -> PipelineRun:
+    run = PipelineRun.create(id=str(uuid4()), pipeline_id=PipelineId(pipeline), workspace_name=WORKSPACE.value)
+    completed_at = started_at + timedelta(seconds=seconds) if status.is_terminal else None
+    return replace(
+        run,
+        status=status,
+        error="boom" if status.is_failed else None,
+        created_at=started_at,
+        started_at=started_at,
+        completed_at=completed_at,
+    )
+
+
+def _step(run: PipelineRun, step: str, ms: int, failed: bool = False) -> StepExecution:
+    return StepExecution(
+        execution_id=uuid4(),
+        run_id=UUID(run.id),
+        step_id=StepId(step),
+        status=ExecutionStatus.failed("timeout") if failed else ExecutionStatus.completed(),
+        started_at=run.started_at,
+        error_message="timeout" if failed else None,
+        execution_time_ms=ms,
+    )
+
+
+@pytest.fixture
+def storage_manager(tmp_path):
+    manager = LMDBStorageManager(
+        workspace_manager=_WorkspaceManager(tmp_path),
+        workspace_name="runs",
+        map_size_mb=10,
+    )
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def runs(storage_manager):
+    return LMDBPipelineRunRepository(storage_manager, WORKSPACE)
+
+
+@pytest.fixture
+def steps(storage_manager, runs):
+    return LMDBStepExecutionRepository(storage_manager, WORKSPACE)
+
+
+class TestRunAnalytics:
+    """Test aggregation of hourly buckets."""
+
+    def test_time_series_groups_hours(self):
+        analytics = RunAnalytics.from_entities([
+            _run(ExecutionStatus.completed(), START, 10),
+            _run(ExecutionStatus.completed(), START + timedelta(hours=1), 30),
+            _run(ExecutionStatus.failed("boom"), START + timedelta(days=1), 5),
+        ])
+
+        assert [p["period"] for p in analytics.time_series("hour")] == [
+            "2024-01-01 09:00", "2024-01-01 10:00", "2024-01-02 09:00"
+        ]
+        daily = analytics.time_series("day")
+        assert [(p["period"], p["total_runs"], p["success_rate"]) for p in daily] == [
+            ("2024-01-01", 2, 100.0), ("2024-01-02", 1, 0.0)
+        ]
+        summary = analytics.summary()
+        assert (summary["total_runs"], summary["successful_runs"], summary["failed_runs"]) == (3, 2, 1)
+        assert summary["avg_duration"] == pytest.approx(15.0)
+        assert [run_id for _, run_id in analytics.slowest_runs(1)] == [
+            analytics.buckets[1].slowest_runs[0][1]
+        ]
+
+    def test_removing_uncounted_errors_leaves_error_counts_intact(self):
+        run = _run(ExecutionStatus.completed(), START, 10)
+        counters = StepCounters()
+        contributions = []
+        for i in range(MAX_ERRORS_PER_STEP + 1):
+            contribution = step_contribution(_step(run, "draft", 100, failed=True))
+            contributions.append({**contribution, "error": f"error {i}"})
+            counters.apply(contributions[-1], 1)
+
+        counters.apply(contributions[-1], -1)
+        counters.apply(contributions[0], -1)
+
+        assert len(counters.errors) == MAX_ERRORS_PER_STEP - 1
+        assert f"error {MAX_ERRORS_PER_STEP}" not in counters.errors
+        assert all(count > 0 for count in counters.errors.values())
+
+
+class TestMaterializedAnalytics:
+    """Test buckets kept in step with saves, deletes and archival."""
+
+    @pytest.mark.asyncio
+    async def test_statistics_follow_updates_without_double_counting(self, runs):
+        run = _run(ExecutionStatus.running(), START, 0)
+        await runs.save(run)
+        await runs.save(_run(ExecutionStatus.completed(), START, 20))
+
+        stats = await runs.get_execution_statistics()
+        assert stats["total_runs"] == 2
+        assert stats["status_counts"] == {"running": 1, "completed": 1}
+
+        await runs.save(replace(
+            run, status=ExecutionStatus.completed(), completed_at=START + timedelta(seconds=60)
+        ))
+
+        stats = await runs.get_execution_statistics()
+        assert (stats["total_runs"], stats["successful_runs"]) == (2, 2)
+        assert stats["avg_duration"] == pytest.approx(40.0)
+        assert [r.id for r in await runs.find_longest_running(1)] == [run.id]
+
+        await runs.delete_by_id(run.id)
+        stats = await runs.get_execution_statistics()
+        assert (stats["total_runs"], stats["avg_duration"]) == (1, pytest.approx(20.0))
+
+    @pytest.mark.asyncio
+    async def test_step_rankings_and_archived_runs(self, runs, steps):
+        old = _run(ExecutionStatus.completed(), START, 100)
+        recent = _run(ExecutionStatus.completed(), datetime.now() - timedelta(hours=1), 10)
+        for run in (old, recent):
+            await runs.save(run)
+        slow = _step(old, "draft", 9000)
+        await steps.save(slow)
+        await steps.save(_step(old, "outline", 500, failed=True))
+        await steps.save(_step(recent, "outline", 400))
+
+        assert await runs.archive_old_runs(older_than_days=30) == 1
+
+        assert (await runs.get_execution_statistics())["total_runs"] == 2
+        slowest = await steps.get_slowest_steps(limit=1)
+        assert [e.execution_id for e in slowest] == [slow.execution_id]
+        failed = await steps.get_most_failed_steps(limit=1)
+        assert failed[0]["step_id"] == StepId("outline")
+        assert (failed[0]["total_executions"], failed[0]["failed_executions"]) == (2, 1)
+        assert failed[0]["common_errors"] == [{"error": "timeout", "count": 1}]
+
+        recent_only = await steps.get_most_failed_steps(since=datetime.now() - timedelta(days=1))
+        assert [(s["step_id"], s["failed_executions"]) for s in recent_only] == [(StepId("outline"), 0)]
+
+        await runs.delete_by_id(old.id)
+        assert (await runs.get_execution_statistics())["total_runs"] == 1
+        assert [s["total_executions"] for s in await steps.get_most_failed_steps()] == [1]
+
+    @pytest.mark.asyncio
+    async def test_buckets_are_rebuilt_for_existing_data(self, runs, steps, storage_manager):
+        run = _run(ExecutionStatus.completed(), START, 30)
+        await runs.save(run)
+        await steps.save(_step(run, "draft", 700))
+        async with storage_manager.transaction(RUNS_DB_NAME, write=True, db_key=RUNS_DB_KEY) as (txn, db):
+            stale = [key for key, _ in txn.cursor(db=db) if b":idx:agg" in key or b":idx:step_stats:" in key]
+            for key in stale:
+                txn.delete(key, db=db)
+
+        fresh = LMDBPipelineRunRepository(storage_manager, WORKSPACE)
+        stats = await fresh.get_execution_statistics()
+
+        assert (stats["total_runs"], stats["avg_duration"]) == (1, pytest.approx(30.0))
+        analytics = await fresh.get_run_analytics(START, START)
+        assert [name for name in analytics.step_counters()] == ["draft"]
+        assert (await fresh.get_run_analytics(START + timedelta(hours=1))).summary()["total_runs"] == 0
@@ -0,0 +1,138 @@
+"""Tests for monthly run archive segments and archive fall-through."""
+
+import pytest
+from dataclasses import replace
+from datetime import datetime, timedelta
+from pathlib import Path
+from uuid import UUID, uuid4
+
+from writeit.domains.pipeline.entities.pipeline_run import PipelineRun
+from writeit.domains.pipeline.repositories.step_execution_repository import StepExecution
+from writeit.domains.pipeline.value_objects.execution_status import ExecutionStatus
+from writeit.domains.pipeline.value_objects.pipeline_id import PipelineId
+from writeit.domains.pipeline.value_objects.step_id import StepId
+from writeit.domains.workspace.value_objects.workspace_name import WorkspaceName
+from writeit.infrastructure.base.storage_manager import LMDBStorageManager
+from writeit.infrastructure.pipeline.pipeline_run_repository_impl import LMDBPipelineRunRepository
+from writeit.infrastructure.pipeline.run_archive import RunArchive
+from writeit.infrastructure.pipeline.step_execution_repository_impl import LMDBStepExecutionRepository
+
+
+class _WorkspaceManager:
+    def __init__(self, base_path: Path):
+        self.base_path = base_path
+
+    def get_workspace_path(self, workspace_name: str) -> Path:
+        return self.base_path / workspace_name
+
+
+WORKSPACE = WorkspaceName("test-workspace")
+
+
+def _finished_run(created_at: datetime) -> PipelineRun:
+    run = PipelineRun.create(
+        id=str(uuid4()),
+        pipeline_id=PipelineId("blog"),
+        workspace_name=WORKSPACE.value,
+    )
+    return replace(
+        run,
+        status=ExecutionStatus.completed(),
+        created_at=created_at,
+        started_at=created_at,
+        completed_at=created_at + timedelta(minutes=5),
+    )
+
+
+def _step(run: PipelineRun, step: str) -> StepExecution:
+    return StepExecution(
+        execution_id=uuid4(),
+        run_id=UUID(run.id),
+        step_id=StepId(step),
+        status=ExecutionStatus.completed(),
+        started_at=run.created_at,
+    )
+
+
+@pytest.fixture
+def storage_manager(tmp_path):
+    manager = LMDBStorageManager(
+        workspace_manager=_WorkspaceManager(tmp_path),
+        workspace_name="runs",
+        map_size_mb=10,
+    )
+    yield manager
+    manager.close()
+
+
+class TestRunArchive:
+    """Test segment files and their indexes."""
+
+    def test_records_go_to_monthly_segments(self, tmp_path):
+        archive = RunArchive(tmp_path)
+
+        archive.append("a", datetime(2024, 1, 5), b"run-a", [b"s1", b"s2"])
+        archive.append("b", datetime(2024, 2, 5), b"run-b", [])
+
+        assert archive.segments() == ["2024-01", "2024-02"]
+        assert archive.read("a") == (b"run-a", [b"s1", b"s2"])
+        assert archive.read("b") == (b"run-b", [])
+        assert archive.read("missing") is None
+        assert (tmp_path / "2024-01.seg").stat().st_size < 100
+
+    def test_reappend_and_remove_keep_segments_append_only(self, tmp_path):
+        archive = RunArchive(tmp_path)
+        archive.append("a", datetime(2024, 1, 5), b"old", [])
+        size = (tmp_path / "2024-01.seg").stat().st_size
+
+        archive.append("a", datetime(2024, 1, 5), b"new", [b"step"])
+        assert archive.read("a") == (b"new", [b"step"])
+        assert (tmp_path / "2024-01.seg").stat().st_size > size
+
+        assert archive.remove("a")
+        assert not archive.contains("a")
+        assert [run_id for run_id, _ in archive.iter_segment("2024-01")] == []
+
+    def test_other_instances_see_appends(self, tmp_path):
+        reader = RunArchive(tmp_path)
+        assert reader.read("a") is None
+
+        RunArchive(tmp_path).append("a", datetime(2024, 3, 1), b"run", [])
+
+        assert reader.read("a") == (b"run", [])
+
+
+class TestArchivalFallThrough:
+    """Test archiving from the hot store and reading archived runs back."""
+
+    @pytest.mark.asyncio
+    async def test_old_runs_move_to_archive_and_stay_readable(self, storage_manager):
+        runs = LMDBPipelineRunRepository(storage_manager, WORKSPACE)
+        steps = LMDBStepExecutionRepository(storage_manager, WORKSPACE)
+        old = _finished_run(datetime(2024, 1, 10))
+        recent = _finished_run(datetime.now() - timedelta(days=1))
+        active = replace(
+            PipelineRun.create(id=str(uuid4()), pipeline_id=PipelineId("blog"), workspace_name=WORKSPACE.value),
+            created_at=datetime(2024, 1, 11),
+        )
+        for run in (old, recent, active):
+            await runs.save(run)
+        await steps.save(_step(old, "outline"))
+        await steps.save(_step(old, "draft"))
+
+        assert await runs.archive_old_runs(older_than_days=30) == 1
+
+        assert {run.id for run in await runs.find_all()} == {recent.id, active.id}
+        assert await runs.count() == 2
+        assert (await runs.find_by_id(old.id)).id == old.id
+        assert await runs.exists(old.id)
+        assert [str(e.step_id) for e in await steps.find_by_run_id(UUID(old.id))] == ["outline", "draft"]
+
+        timeline = await runs.get_run_timeline(old.id)
+        assert [event["event"] for event in timeline["timeline"]].count("step") == 2
+
+        january = await runs.find_runs_by_date_range(datetime(2024, 1, 1), datetime(2024, 1, 31))
+        assert {run.id for run in january} == {old.id, active.id}
+
+        assert await runs.delete_by_id(old.id)
+        assert await runs.find_by_id(old.id) is None
@@ -0,0 +1,260 @@
+"""Tests for the clustered run and step execution key layout."""
+
+import pytest
+from dataclasses import replace
+from datetime import datetime, timedelta
+from pathlib import Path
+from uuid import UUID, uuid4
+
+from writeit.domains.pipeline.entities.pipeline_run import PipelineRun
+from writeit.domains.pipeline.repositories.step_execution_repository import StepExecution
+from writeit.domains.pipeline.value_objects.execution_status import ExecutionStatus
+from writeit.domains.pipeline.value_objects.pipeline_id import PipelineId
+from writeit.domains.pipeline.value_objects.step_id import StepId
+from writeit.domains.workspace.value_objects.workspace_name import WorkspaceName
+from writeit.infrastructure.base.storage_manager import LMDBStorageManager
+from writeit.infrastructure.pipeline.pipeline_run_repository_impl import LMDBPipelineRunRepository
+from writeit.infrastructure.pipeline.step_execution_repository_impl import LMDBStepExecutionRepository
+from writeit.infrastructure.pipeline.run_storage import (
+    LEGACY_STEPS_DB_KEY,
+    LEGACY_STEPS_DB_NAME,
+    RUNS_DB_KEY,
+    RUNS_DB_NAME,
+    RunKeyLayout,
+)
+
+
+class _WorkspaceManager:
+    def __init__(self, base_path: Path):
+        self.base_path = base_path
+
+    def get_workspace_path(self, workspace_name: str) -> Path:
+        return self.base_path / workspace_name
+
+
+WORKSPACE = WorkspaceName("test-workspace")
+
+
+def _run(pipeline: str = "blog", name: str = "Blog Post") -> PipelineRun:
+    return PipelineRun.create(
+        id=str(uuid4()),
+        pipeline_id=PipelineId(pipeline),
+        pipeline_name=name,
+        workspace_name=WORKSPACE.value,
+    )
+
+
+def _step(run: PipelineRun, step: str, offset: int = 0) -> StepExecution:
+    return StepExecution(
+        execution_id=uuid4(),
+        run_id=UUID(run.id),
+        step_id=StepId(step),
+        status=ExecutionStatus.completed(),
+        started_at=datetime(2024, 1, 1) + timedelta(seconds=offset),
+        execution_time_ms=100 + offset,
+    )
+
+
+@pytest.fixture
+def storage_manager(tmp_path):
+    manager = LMDBStorageManager(
+        workspace_manager=_WorkspaceManager(tmp_path),
+        workspace_name="runs",
+        map_size_mb=10,
+    )
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def runs(storage_manager):
+    return LMDBPipelineRunRepository(storage_manager, WORKSPACE)
+
+
+@pytest.fixture
+def steps(storage_manager, runs):
+    return LMDBStepExecutionRepository(storage_manager, WORKSPACE)
+
+
+class TestRunKeyLayout:
+    """Test clustered key construction and parsing."""
+
+    def test_steps_sort_after_their_run_and_before_the_next(self):
+        layout = RunKeyLayout("ws")
+
+        keys = sorted([
+            layout.run_key("b"),
+            layout.step_key("a", 10),
+            layout.step_key("a", 2),
+            layout.run_key("a"),
+        ])
+
+        assert keys == [
+            layout.run_key("a"), layout.step_key("a", 2), layout.step_key("a", 10), layout.run_key("b")
+        ]
+        assert layout.parse(layout.step_key("a", 10)) == ("a", "step", 10)
+        assert layout.parse(layout.run_key("a")) == ("a", "meta", None)
+        assert layout.parse(layout.journal_key("a", 4)) == ("a", "journal", 4)
+        assert layout.parse(b"ws:ws:idx:exec:1") is None
+
+
+class TestClusteredRepositories:
+    """Test run and step repositories sharing the clustered layout."""
+
+    @pytest.mark.asyncio
+    async def test_steps_are_read_with_their_run(self, runs, steps, storage_manager):
+        run = _run()
+        other = _run()
+        await runs.save(run)
+        await runs.save(other)
+        for index, name in enumerate(["outline", "draft", "edit"]):
+            await steps.save(_step(run, name, offset=index))
+        await steps.save(_step(other, "outline"))
+
+        found = await steps.find_by_run_id(UUID(run.id))
+        assert [str(e.step_id) for e in found] == ["outline", "draft", "edit"]
+
+        layout = RunKeyLayout(WORKSPACE.value)
+        async with storage_manager.transaction(RUNS_DB_NAME, write=False, db_key=RUNS_DB_KEY) as (txn, db):
+            assert txn.get(layout.step_key(run.id, 2), db=db) is not None
+
+        timeline = await runs.get_run_timeline(run.id)
+        assert [e.get("step_id") for e in timeline["timeline"] if e["event"] == "step"] == [
+            "outline", "draft", "edit"
+        ]
+        assert {r.id for r in await runs.find_all()} == {run.id, other.id}
+        assert await runs.count() == 2
+        assert await steps.count() == 4
+
+    @pytest.mark.asyncio
+    async def test_updating_a_step_keeps_its_position(self, runs, steps):
+        run = _run()
+        await runs.save(run)
+        first = _step(run, "outline")
+        await steps.save(first)
+        await steps.save(_step(run, "draft", offset=1))
+
+        await steps.record_retry(first.execution_id, "timeout")
+
+        found = await steps.find_by_run_id(UUID(run.id))
+        assert [e.retry_count for e in found] == [1, 0]
+        assert (await steps.find_by_step_id(UUID(run.id), StepId("draft"))).step_id == StepId("draft")
+        by_step = await steps._store.load_steps_by_step_id(StepId("outline"))
+        assert [e.execution_id for e in by_step] == [first.execution_id]
+
+    @pytest.mark.asyncio
+    async def test_pipeline_indexes_follow_updates_and_deletes(self, runs, steps):
+        run = _run(pipeline="blog", name="Blog Post")
+        await runs.save(run)
+        await runs.save(_run(pipeline="news", name="News"))
+        await steps.save(_step(run, "outline"))
+
+        assert [r.id for r in await runs.find_by_pipeline(PipelineId("blog"))] == [run.id]
+        assert [r.id for r in await runs.find_runs_by_pipeline_name("Blog Post")] == [run.id]
+
+        await runs.save(replace(run, pipeline_name="Renamed"))
+        assert await runs.find_runs_by_pipeline_name("Blog Post") == []
+        assert [r.id for r in await runs.find_runs_by_pipeline_name("Renamed")] == [run.id]
+
+        assert await runs.delete_by_id(run.id)
+        assert await runs.find_by_pipeline(PipelineId("blog")) == []
+        assert await steps.find_by_run_id(UUID(run.id)) == []
+        assert await steps.count() == 0
+
+    @pytest.mark.asyncio
+    async def test_update_run_status(self, runs):
+        run = _run()
+        await runs.save(run)
+
+        await runs.update_run_status(run.id, ExecutionStatus.failed("boom"), error_message="boom")
+
+        stored = await runs.find_by_id(run.id)
+        assert stored.is_failed
+        assert stored.error == "boom"
+
+
+class TestRunJournal:
+    """Test appending step events instead of rewriting run records."""
+
+    @pytest.mark.asyncio
+    async def test_events_are_folded_into_the_run_on_read(self, runs, steps, storage_manager):
+        run = _run().start()
+        await runs.save(run)
+        await steps.save(_step(run, "outline"))
+        layout = RunKeyLayout(WORKSPACE.value)
+        async with storage_manager.transaction(RUNS_DB_NAME, write=False, db_key=RUNS_DB_KEY) as (txn, db):
+            record = bytes(txn.get(layout.run_key(run.id), db=db))
+
+        for step in ["outline", "draft"]:
+            await runs.record_step_event(run, step, "started")
+            run = run.add_token_usage("openai", 100)
+            await runs.record_step_event(run, step, "completed")
+
+        async with storage_manager.transaction(RUNS_DB_NAME, write=False, db_key=RUNS_DB_KEY) as (txn, db):
+            assert bytes(txn.get(layout.run_key(run.id), db=db)) == record
+            assert txn.get(layout.journal_key(run.id, 3), db=db) is not None
+        assert (await runs.find_by_id(run.id)).total_tokens_used == {"openai": 200}
+        assert [r.total_tokens_used for r in await runs.find_all()] == [{"openai": 200}]
+        assert await runs.count() == 1
+        assert len(await steps.find_by_run_id(UUID(run.id))) == 1
+        assert (await runs.get_run_analytics()).summary()["total_tokens"] == 200
+
+    @pytest.mark.asyncio
+    async def test_journal_is_compacted(self, runs, storage_manager):
+        runs._store.journal_compact_threshold = 3
+        run = _run()
+        await runs.save(run)
+        layout = RunKeyLayout(WORKSPACE.value)
+
+        for _ in range(3):
+            run = run.add_token_usage("openai", 10)
+            await runs.record_step_event(run, "draft", "completed")
+
+        async with storage_manager.transaction(RUNS_DB_NAME, write=False, db_key=RUNS_DB_KEY) as (txn, db):
+            assert txn.get(layout.journal_key(run.id, 0), db=db) is None
+        assert (await runs._store.load_run(run.id)).total_tokens_used == {"openai": 30}
+
+        run = run.add_token_usage("openai", 10)
+        await runs.record_step_event(run, "edit", "completed")
+        assert await runs.compact_journals() == 1
+        assert await runs.compact_journals() == 0
+        assert (await runs.find_by_id(run.id)).total_tokens_used == {"openai": 40}
+
+    @pytest.mark.asyncio
+    async def test_saving_the_run_replaces_its_journal(self, runs, storage_manager):
+        run = _run()
+        await runs.save(run)
+        await runs.record_step_event(run.add_token_usage("openai", 10), "draft", "completed")
+
+        await runs.save(run.add_token_usage("openai", 5))
+
+        assert (await runs.find_by_id(run.id)).total_tokens_used == {"openai": 5}
+        assert await runs.delete_by_id(run.id)
+        assert await runs.find_by_id(run.id) is None
+
+
+class TestLegacyKeyMigration:
+    """Test rewriting runs and steps stored under bare IDs."""
+
+    @pytest.mark.asyncio
+    async def test_migrates_bare_keys_into_clusters(self, runs, steps, storage_manager):
+        run = _run()
+        foreign = PipelineRun.create(id=str(uuid4()), pipeline_id=PipelineId("blog"), workspace_name="other")
+        execution = _step(run, "outline")
+        orphan = _step(foreign, "outline")
+        await storage_manager.save_entity(run, run.id, RUNS_DB_NAME, RUNS_DB_KEY)
+        await storage_manager.save_entity(foreign, foreign.id, RUNS_DB_NAME, RUNS_DB_KEY)
+        await storage_manager.save_entity(execution, execution.execution_id, LEGACY_STEPS_DB_NAME, LEGACY_STEPS_DB_KEY)
+        await storage_manager.save_entity(orphan, orphan.execution_id, LEGACY_STEPS_DB_NAME, LEGACY_STEPS_DB_KEY)
+
+        result = await runs._store.migrate_legacy_keys()
+
+        assert (result.runs_migrated, result.steps_migrated) == (1, 1)
+        assert sorted(result.skipped_keys) == sorted([foreign.id, str(orphan.execution_id)])
+        assert [r.id for r in await runs.find_by_pipeline(PipelineId("blog"))] == [run.id]
+        assert [e.execution_id for e in await steps.find_by_run_id(UUID(run.id))] == [execution.execution_id]
+        assert not await storage_manager.entity_exists(run.id, RUNS_DB_NAME, RUNS_DB_KEY)
+        assert await storage_manager.entity_exists(foreign.id, RUNS_DB_NAME, RUNS_DB_KEY)
+
+        again = await runs._store.migrate_legacy_keys()
+        assert (again.runs_migrated, again.steps_migrated) == (0, 0)
@@ -0,0 +1,50 @@
+"""Tests for content-addressed step output blob files."""
+
+import pytest
+
+from writeit.domains.pipeline.services.step_output_spill import StepOutputSpiller, blob_digest
+from writeit.infrastructure.pipeline.step_output_blobs import FileStepOutputBlobStore
+
+
+class TestFileStepOutputBlobStore:
+    """Test blob file storage."""
+
+    def test_put_and_get(self, tmp_path):
+        store = FileStepOutputBlobStore(tmp_path / "blobs")
+        data = "output ".encode("utf-8") * 100
+
+        digest = store.put(data)
+
+        assert digest == blob_digest(data)
+        assert store.contains(digest)
+        assert store.get(digest) == data
+        assert (tmp_path / "blobs" / digest[:2] / digest[2:]).exists()
+
+    def test_blobs_are_written_once(self, tmp_path):
+        store = FileStepOutputBlobStore(tmp_path)
+        digest = store.put(b"same")
+        path = tmp_path / digest[:2] / digest[2:]
+        mtime = path.stat().st_mtime_ns
+
+        assert store.put(b"same") == digest
+        assert path.stat().st_mtime_ns == mtime
+        assert not list(path.parent.glob(".tmp-*"))
+
+    def test_empty_and_missing_blobs(self, tmp_path):
+        store = FileStepOutputBlobStore(tmp_path)
+
+        assert store.get(store.put(b"")) == b""
+        with pytest.raises(KeyError):
+            store.get(blob_digest(b"missing"))
+        with pytest.raises(KeyError):
+            store.get("../escape")
+
+    def test_identical_outputs_share_a_blob(self, tmp_path):
+        store = FileStepOutputBlobStore(tmp_path)
+        spiller = StepOutputSpiller(store, threshold_bytes=8)
+
+        first = spiller.spill("the same long output")
+        second = spiller.spill("the same long output")
+
+        assert first == second
+        assert len([p for p in tmp_path.rglob("*") if p.is_file()]) == 1
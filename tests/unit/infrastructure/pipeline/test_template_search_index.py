@@ -0,0 +1,200 @@
+"""Tests for the pipeline template inverted search index."""
+
+import pytest
+from dataclasses import replace
+from pathlib import Path
+from uuid import uuid4
+
+from writeit.domains.pipeline.entities.pipeline_template import PipelineTemplate, PipelineStepTemplate
+from writeit.domains.pipeline.value_objects.pipeline_id import PipelineId
+from writeit.domains.pipeline.value_objects.step_id import StepId
+from writeit.domains.pipeline.value_objects.prompt_template import PromptTemplate
+from writeit.domains.workspace.value_objects.workspace_name import WorkspaceName
+from writeit.infrastructure.base.storage_manager import LMDBStorageManager
+from writeit.infrastructure.pipeline.pipeline_template_repository_impl import LMDBPipelineTemplateRepository
+from writeit.infrastructure.pipeline.template_search_index import TemplateSearchIndex, tokenize
+
+
+class _WorkspaceManager:
+    def __init__(self, base_path: Path):
+        self.base_path = base_path
+
+    def get_workspace_path(self, workspace_name: str) -> Path:
+        return self.base_path / workspace_name
+
+
+def _template(name: str, description: str, tags=(), prompt: str = "Write about {{ inputs.topic }}"):
+    return PipelineTemplate(
+        id=PipelineId(str(uuid4())),
+        name=name,
+        description=description,
+        tags=list(tags),
+        steps={
+            "draft": PipelineStepTemplate(
+                id=StepId("draft"),
+                name="Draft",
+                description="Draft the content",
+                type="llm_generate",
+                prompt_template=PromptTemplate(prompt),
+            )
+        },
+    )
+
+
+@pytest.fixture
+def storage_manager(tmp_path):
+    manager = LMDBStorageManager(
+        workspace_manager=_WorkspaceManager(tmp_path),
+        workspace_name="search",
+        map_size_mb=10,
+    )
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def index(storage_manager):
+    return TemplateSearchIndex(storage_manager, WorkspaceName("test-workspace"))
+
+
+class TestTokenize:
+    """Test index tokenization."""
+
+    def test_lowercases_and_drops_single_letters(self):
+        assert tokenize("Tech Blog: a How-To, v2 & 3") == ["tech", "blog", "how", "to", "v2", "3"]
+
+
+class TestTemplateSearchIndex:
+    """Test TemplateSearchIndex maintenance and queries."""
+
+    @pytest.mark.asyncio
+    async def test_ranked_multi_term_search(self, index):
+        blog = _template("tech-blog", "Write a technical blog post", tags=["blog"])
+        outline = _template("outline", "Outline for a blog series")
+        newsletter = _template("newsletter", "Weekly newsletter", prompt="Summarize blog posts")
+        for template in (blog, outline, newsletter):
+            await index.index_template(template)
+
+        hits = await index.search("blog")
+        assert [hit.template_id for hit in hits][0] == blog.id.value
+        assert {hit.template_id for hit in hits} == {
+            blog.id.value, outline.id.value, newsletter.id.value
+        }
+
+        hits = await index.search("blog series")
+        assert [hit.template_id for hit in hits] == [outline.id.value]
+
+    @pytest.mark.asyncio
+    async def test_prefix_search_and_suggestions(self, index):
+        template = _template("outline", "Outline generator for long articles")
+        await index.index_template(template)
+
+        assert await index.search("outl") == []
+        hits = await index.search("long outl", prefix=True)
+        assert [hit.template_id for hit in hits] == [template.id.value]
+
+        assert await index.suggest("art") == ["articles"]
+
+    @pytest.mark.asyncio
+    async def test_field_restricted_search(self, index):
+        template = _template("haiku", "Short poems", prompt="Compose a haiku about autumn")
+        await index.index_template(template)
+
+        assert await index.search("autumn", fields=("description",)) == []
+        assert len(await index.search("autumn", fields=("steps",))) == 1
+
+    @pytest.mark.asyncio
+    async def test_update_replaces_previous_entries(self, index):
+        template = _template("report", "Quarterly report", tags=["finance"])
+        await index.index_template(template)
+
+        template.description = "Annual summary"
+        template.tags = ["summary"]
+        await index.index_template(template)
+
+        assert await index.search("quarterly") == []
+        assert len(await index.search("annual")) == 1
+        assert await index.find_ids_by_tag("finance") == []
+        assert await index.find_ids_by_tag("summary") == [template.id.value]
+        assert await index.document_count() == 1
+
+    @pytest.mark.asyncio
+    async def test_delete_removes_all_entries(self, index):
+        template = _template("report", "Quarterly report", tags=["finance"])
+        await index.index_template(template)
+
+        assert await index.find_id_by_name("report") == template.id.value
+        assert await index.remove_template(template.id) is True
+        assert await index.remove_template(template.id) is False
+
+        assert await index.search("report") == []
+        assert await index.find_id_by_name("report") is None
+        assert await index.find_ids_by_tag("finance") == []
+        assert await index.document_count() == 0
+
+    @pytest.mark.asyncio
+    async def test_workspaces_are_isolated(self, storage_manager, index):
+        other = TemplateSearchIndex(storage_manager, WorkspaceName("other-workspace"))
+        await index.index_template(_template("shared", "Shared description"))
+
+        assert await other.search("shared") == []
+        assert await other.is_built() is False
+
+    @pytest.mark.asyncio
+    async def test_is_built_before_the_index_database_exists(self, index):
+        assert await index.is_built() is False
+
+        await index.rebuild([])
+
+        assert await index.is_built() is True
+
+    @pytest.mark.asyncio
+    async def test_rebuild(self, index):
+        await index.index_template(_template("stale", "Stale entry"))
+        fresh = _template("fresh", "Fresh entry")
+
+        assert await index.rebuild([fresh]) == 1
+        assert await index.search("stale") == []
+        assert [hit.template_id for hit in await index.search("fresh")] == [fresh.id.value]
+
+    @pytest.mark.asyncio
+    async def test_long_names_and_tags_are_hashed_in_keys(self, index):
+        long_tag = "t" * 600
+        template = _template("n" * 600, "Long keys", tags=[long_tag])
+
+        await index.index_template(template)
+
+        assert await index.find_ids_by_tag(long_tag) == [template.id.value]
+        assert await index.find_id_by_name("n" * 600) == template.id.value
+        assert await index.remove_template(template.id)
+        assert await index.find_ids_by_tag(long_tag) == []
+
+
+class TestTemplateRepositoryIndex:
+    """Test index maintenance by the template repository."""
+
+    @pytest.mark.asyncio
+    async def test_older_versions_stay_findable_by_name(self, storage_manager):
+        repository = LMDBPipelineTemplateRepository(storage_manager, WorkspaceName("test-workspace"))
+        first = _template("report", "Quarterly report")
+        second = replace(first, id=PipelineId(str(uuid4())), version="2.0.0")
+        await repository.save(first)
+        await repository.save(second)
+
+        assert (await repository.find_by_name("report")).version == "2.0.0"
+        assert [t.version for t in await repository.find_all_versions("report")] == ["1.0.0", "2.0.0"]
+
+        assert await repository.delete_by_id(second.id)
+        assert (await repository.find_by_name("report")).id == first.id
+        assert not await repository.is_name_available("report")
+        assert await repository.is_name_available("other")
+
+    @pytest.mark.asyncio
+    async def test_templates_stored_before_indexing_are_indexed(self, storage_manager):
+        repository = LMDBPipelineTemplateRepository(storage_manager, WorkspaceName("test-workspace"))
+        legacy = _template("legacy", "Quarterly report")
+        await storage_manager.save_entity(legacy, legacy.id, "pipeline_templates", "templates")
+
+        await repository.save(_template("current", "Monthly report"))
+
+        assert sorted(t.name for t in await repository.search_templates("report")) == ["current", "legacy"]
@@ -0,0 +1,186 @@
+"""Tests for the query result cache."""
+
+import asyncio
+import pytest
+from dataclasses import dataclass
+from typing import List, Optional
+
+from writeit.shared.events import AsyncEventBus, DomainEvent
+from writeit.shared.query import Query, QueryResult
+from writeit.shared.query_cache import QueryCache, normalize_query
+
+
+@dataclass(frozen=True)
+class RunsQuery(Query):
+    """Test list query."""
+
+    workspace_name: Optional[str] = None
+    tags: List[str] = None
+
+
+@dataclass(frozen=True)
+class RunsResult(QueryResult):
+    """Test query result."""
+
+
+class RunFinished(DomainEvent):
+    """Test domain event carrying a workspace."""
+
+    def __init__(self, workspace_name: str):
+        super().__init__()
+        self.workspace_name = workspace_name
+
+    @property
+    def event_type(self) -> str:
+        return "test.run.finished"
+
+    @property
+    def aggregate_id(self) -> str:
+        return self.workspace_name
+
+    def to_dict(self) -> dict:
+        return {'event_type': self.event_type, 'workspace_name': self.workspace_name}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Counter:
+    """Compute function counting its calls."""
+
+    def __init__(self, success: bool = True):
+        self.calls = 0
+        self.success = success
+
+    async def __call__(self) -> RunsResult:
+        self.calls += 1
+        return RunsResult(success=self.success, data=self.calls)
+
+
+class TestQueryKeys:
+    """Test query normalization."""
+
+    def test_request_identity_is_ignored(self):
+        first = RunsQuery(workspace_name="a", tags=["x"])
+        second = RunsQuery(workspace_name="a", tags=["x"])
+
+        assert first.query_id != second.query_id
+        assert normalize_query(first) == normalize_query(second)
+        assert normalize_query(first) != normalize_query(RunsQuery(workspace_name="b", tags=["x"]))
+
+
+class TestQueryCache:
+    """Test caching, expiry and invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_hits_until_ttl_expires(self):
+        clock = FakeClock()
+        cache = QueryCache(clock=clock)
+        cache.configure("runs", ttl=10.0)
+        compute = Counter()
+
+        first = await cache.get_or_compute(RunsQuery(workspace_name="a"), "runs", compute)
+        clock.now = 4.0
+        second = await cache.get_or_compute(RunsQuery(workspace_name="a"), "runs", compute)
+
+        assert (first.cache_hit, second.cache_hit) == (False, True)
+        assert compute.calls == 1
+
+        clock.now = 11.0
+        await cache.get_or_compute(RunsQuery(workspace_name="a"), "runs", compute)
+        assert compute.calls == 2
+
+        stats = cache.get_stats()
+        assert (stats["hits"], stats["misses"], stats["expirations"]) == (1, 2, 1)
+        assert stats["staleness"]["max_served_age_seconds"] == 4.0
+        assert stats["namespaces"]["runs"]["ttl_seconds"] == 10.0
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached(self):
+        cache = QueryCache()
+        compute = Counter(success=False)
+
+        await cache.get_or_compute(RunsQuery(), "runs", compute)
+        await cache.get_or_compute(RunsQuery(), "runs", compute)
+
+        assert compute.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidation_is_limited_to_tags(self):
+        cache = QueryCache()
+        compute = Counter()
+        await cache.get_or_compute(RunsQuery(workspace_name="a"), "runs", compute, tags=["runs:a"])
+        await cache.get_or_compute(RunsQuery(workspace_name="b"), "runs", compute, tags=["runs:b"])
+
+        assert cache.invalidate("runs:a") == 1
+
+        await cache.get_or_compute(RunsQuery(workspace_name="a"), "runs", compute, tags=["runs:a"])
+        await cache.get_or_compute(RunsQuery(workspace_name="b"), "runs", compute, tags=["runs:b"])
+        assert compute.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_computation(self):
+        cache = QueryCache()
+        release = asyncio.Event()
+        calls = []
+
+        async def compute() -> RunsResult:
+            calls.append(1)
+            await release.wait()
+            return RunsResult(data="done")
+
+        tasks = [asyncio.create_task(cache.get_or_compute(RunsQuery(), "runs", compute)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert len(calls) == 1
+        assert [r.data for r in results] == ["done"] * 3
+
+    @pytest.mark.asyncio
+    async def test_result_invalidated_during_compute_is_not_stored(self):
+        cache = QueryCache()
+
+        async def compute() -> RunsResult:
+            cache.invalidate("runs:a")
+            return RunsResult()
+
+        await cache.get_or_compute(RunsQuery(), "runs", compute, tags=["runs:a"])
+
+        assert cache.get_stats()["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_entries_are_evicted(self):
+        cache = QueryCache(max_entries=2)
+        compute = Counter()
+        for name in ["a", "b", "a", "c"]:
+            await cache.get_or_compute(RunsQuery(workspace_name=name), "runs", compute)
+
+        assert compute.calls == 3
+        assert cache.get_stats()["evictions"] == 1
+        await cache.get_or_compute(RunsQuery(workspace_name="a"), "runs", compute)
+        assert compute.calls == 3
+
+
+class TestEventInvalidation:
+    """Test invalidation driven by events on the event bus."""
+
+    @pytest.mark.asyncio
+    async def test_published_events_invalidate_their_tags(self):
+        bus = AsyncEventBus()
+        cache = QueryCache()
+        await cache.subscribe(bus, {RunFinished: lambda event: [f"runs:{event.workspace_name}"]})
+        compute = Counter()
+        await cache.get_or_compute(RunsQuery(workspace_name="a"), "runs", compute, tags=["runs:a"])
+        await cache.get_or_compute(RunsQuery(workspace_name="b"), "runs", compute, tags=["runs:b"])
+
+        result = await bus.publish(RunFinished("a"))
+
+        assert result.success
+        assert cache.get_stats()["entries"] == 1
+        assert cache.get_stats()["invalidations"] == 1
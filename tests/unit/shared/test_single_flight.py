@@ -0,0 +1,109 @@
+"""Tests for single-flight coalescing of in-flight calls and streams."""
+
+import asyncio
+
+import pytest
+
+from writeit.shared.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    """Test sharing of concurrent identical calls."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_call(self):
+        flights = SingleFlight()
+        calls = 0
+
+        async def call():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return calls
+
+        results = await asyncio.gather(*(flights.do("key", call) for _ in range(5)))
+
+        assert results == [1] * 5
+        assert flights.get_stats() == {
+            "calls": 1, "coalesced": 4, "streams": 0, "coalesced_streams": 0, "in_flight": 0
+        }
+        # Finished calls are not reused
+        assert await flights.do("key", call) == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_every_caller(self):
+        flights = SingleFlight()
+
+        async def call():
+            await asyncio.sleep(0.01)
+            raise ValueError("provider down")
+
+        results = await asyncio.gather(
+            flights.do("key", call), flights.do("key", call), return_exceptions=True
+        )
+
+        assert [type(r) for r in results] == [ValueError, ValueError]
+        assert not flights.in_flight("key")
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_call(self):
+        flights = SingleFlight()
+        release = asyncio.Event()
+
+        async def call():
+            await release.wait()
+            return "done"
+
+        first = asyncio.create_task(flights.do("key", call))
+        second = asyncio.create_task(flights.do("key", call))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await second == "done"
+        assert first.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_streams_are_broadcast_to_late_subscribers(self):
+        flights = SingleFlight()
+        started = 0
+        step = asyncio.Event()
+
+        async def source():
+            nonlocal started
+            started += 1
+            yield "a"
+            await step.wait()
+            yield "b"
+
+        async def collect():
+            return [chunk async for chunk in flights.stream("key", source)]
+
+        early = asyncio.create_task(collect())
+        await asyncio.sleep(0.01)
+        late = asyncio.create_task(collect())
+        await asyncio.sleep(0.01)
+        step.set()
+
+        assert await early == ["a", "b"]
+        assert await late == ["a", "b"]
+        assert started == 1
+        assert flights.get_stats()["coalesced_streams"] == 1
+        assert not flights.in_flight("key")
+
+    @pytest.mark.asyncio
+    async def test_stream_errors_reach_every_subscriber(self):
+        flights = SingleFlight()
+
+        async def source():
+            yield "a"
+            await asyncio.sleep(0.01)
+            raise RuntimeError("stream broke")
+
+        async def collect():
+            return [chunk async for chunk in flights.stream("key", source)]
+
+        results = await asyncio.gather(collect(), collect(), return_exceptions=True)
+
+        assert [type(r) for r in results] == [RuntimeError, RuntimeError]
@@ -0,0 +1,153 @@
+"""Tests for the load-simulation benchmark harness."""
+
+import pytest
+import yaml
+from typer.testing import CliRunner
+
+from writeit.benchmarks import (
+    BenchmarkRunner,
+    Scenario,
+    ScenarioError,
+    compare_reports,
+    save_report,
+)
+from writeit.benchmarks.runner import render_prompt
+from writeit.cli.commands.bench import app as bench_app
+from writeit.infrastructure.llm.base_provider import LLMRequest, RateLimitError
+from writeit.infrastructure.llm.mock_provider import MockLLMProvider
+
+
+def _scenario(tmp_path, **overrides):
+    template = {
+        "steps": {
+            "outline": {"prompt_template": "Outline {{ inputs.topic }}"},
+            "draft": {"prompt_template": "Draft from {{ steps.outline }}"},
+        },
+        "inputs": {"topic": {"default": "bees"}},
+    }
+    (tmp_path / "article.yaml").write_text(yaml.safe_dump(template, sort_keys=False))
+    data = {
+        "name": "test",
+        "seed": 7,
+        "concurrency": 4,
+        "runs": 12,
+        "time_scale": 0.001,
+        "provider": {"latency": {"median_ms": 200, "sigma": 0.8}, "max_concurrent": 2},
+        "templates": [{"path": "article.yaml"}],
+    }
+    data.update(overrides)
+    path = tmp_path / "scenario.yaml"
+    path.write_text(yaml.safe_dump(data))
+    return Scenario.load(path)
+
+
+class TestMockProviderSimulation:
+    """Test seeded latency and rate-limit simulation."""
+
+    @pytest.mark.asyncio
+    async def test_latencies_are_seeded_per_request(self):
+        config = {"latency_ms": 100, "latency_distribution": "lognormal", "seed": 3, "time_scale": 0.001}
+        first, second = MockLLMProvider(config), MockLLMProvider(config)
+
+        latencies = []
+        for provider in (first, second):
+            responses = [
+                await provider.generate(LLMRequest(prompt="hi", model="mock-fast", request_id=f"r{i}"))
+                for i in range(5)
+            ]
+            latencies.append([r.response_time_ms for r in responses])
+
+        assert latencies[0] == latencies[1]
+        assert len(set(latencies[0])) > 1
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_carries_retry_after(self):
+        provider = MockLLMProvider({"latency_ms": 0})
+        provider.set_rate_limit(1.0, retry_after_seconds=5)
+
+        with pytest.raises(RateLimitError) as error:
+            await provider.generate(LLMRequest(prompt="hi", model="mock-fast"))
+
+        assert error.value.retry_after == 5
+
+
+class TestScenario:
+    """Test scenario loading."""
+
+    def test_template_steps_and_defaults_are_loaded(self, tmp_path):
+        scenario = _scenario(tmp_path)
+
+        template = scenario.templates[0]
+        assert [step_id for step_id, _ in template.steps] == ["outline", "draft"]
+        assert template.inputs == {"topic": "bees"}
+        assert scenario.provider.latency.distribution == "lognormal"
+
+    def test_scenario_needs_a_stop_condition(self, tmp_path):
+        with pytest.raises(ScenarioError):
+            _scenario(tmp_path, runs=None)
+
+    def test_prompts_render_nested_context(self):
+        context = {"inputs": {"topic": "bees"}, "steps": {}}
+
+        assert render_prompt("About {{ inputs.topic }}{{ steps.x }}", context) == "About bees"
+
+
+class TestBenchmarkRunner:
+    """Test scenario execution and reporting."""
+
+    @pytest.mark.asyncio
+    async def test_report_counts_runs_and_retries(self, tmp_path):
+        scenario = _scenario(
+            tmp_path, provider={"rate_limit": {"rate": 0.3, "retry_after_seconds": 1}, "latency": {"median_ms": 50}}
+        )
+
+        report = await BenchmarkRunner(scenario).run()
+
+        assert report["runs"]["completed"] + report["runs"]["failed"] == 12
+        assert report["requests"]["rate_limited"] > 0
+        assert report["requests"]["retries"] > 0
+        latency = report["requests"]["latency_ms"]
+        assert 0 < latency["p50"] <= latency["p95"] <= latency["p99"] <= latency["max"]
+        assert report["memory"]["rss_peak_mb"] >= report["memory"]["rss_start_mb"]
+
+    @pytest.mark.asyncio
+    async def test_streaming_reports_time_to_first_token(self, tmp_path):
+        scenario = _scenario(
+            tmp_path, runs=2, provider={"streaming": True, "tokens_per_second": 1000, "latency": {"median_ms": 20}}
+        )
+
+        report = await BenchmarkRunner(scenario).run()
+
+        assert report["requests"]["time_to_first_token_ms"]["count"] == 4
+        assert report["requests"]["completion_tokens"] > 0
+
+
+class TestComparison:
+    """Test regression detection against baselines."""
+
+    def test_regressions_respect_direction_and_tolerance(self):
+        baseline = {
+            "runs": {"latency_ms": {"p95": 100.0}, "throughput_per_second": 10.0},
+            "memory": {"rss_peak_mb": 50.0},
+        }
+        current = {
+            "runs": {"latency_ms": {"p95": 125.0}, "throughput_per_second": 12.0},
+            "memory": {"rss_peak_mb": 54.0},
+        }
+
+        regressed = {c.metric: c.regressed for c in compare_reports(current, baseline, tolerance=0.10)}
+
+        assert regressed == {
+            "runs.latency_ms.p95": True,
+            "runs.throughput_per_second": False,
+            "memory.rss_peak_mb": False,
+        }
+
+    def test_compare_command_fails_on_regression(self, tmp_path):
+        save_report({"scenario": "s", "runs": {"throughput_per_second": 10.0}}, tmp_path / "base.json")
+        save_report({"scenario": "s", "runs": {"throughput_per_second": 5.0}}, tmp_path / "new.json")
+
+        result = CliRunner().invoke(bench_app, ["compare", str(tmp_path / "new.json"), str(tmp_path / "base.json")])
+
+        assert result.exit_code == 1
+        assert "runs.throughput_per_second" in result.output
@@ -0,0 +1,80 @@
+"""Tests for lazy command loading in the writeit CLI."""
+
+import sys
+
+import typer
+from typer.testing import CliRunner
+
+from writeit.cli.lazy import LazyCommand, LazyTyperGroup
+
+MODULE = __name__
+
+sub_app = typer.Typer(help="Sub commands")
+
+
+@sub_app.command()
+def hello(name: str = "world"):
+    """Say hello."""
+    print(f"hello {name}")
+
+
+@sub_app.command()
+def bye():
+    """Say bye."""
+    print("bye")
+
+
+def shout(text: str):
+    """Shout text."""
+    print(text.upper())
+
+
+def _app(import_path: str = f"{MODULE}:sub_app") -> typer.Typer:
+    app = typer.Typer()
+
+    @app.callback()
+    def main():
+        """Test application."""
+
+    app.info.cls = LazyTyperGroup.with_commands(
+        LazyCommand("greet", import_path, "Greeting commands"),
+        LazyCommand("shout", f"{MODULE}:shout", "Shout text"),
+    )
+    return app
+
+
+class TestLazyTyperGroup:
+    """Test lazy resolution of CLI commands."""
+
+    def test_invokes_lazy_sub_app(self):
+        result = CliRunner().invoke(_app(), ["greet", "hello", "--name", "lazy"])
+
+        assert result.exit_code == 0
+        assert "hello lazy" in result.output
+
+    def test_invokes_lazy_function_command(self):
+        result = CliRunner().invoke(_app(), ["shout", "quiet"])
+
+        assert result.exit_code == 0
+        assert "QUIET" in result.output
+
+    def test_group_help_does_not_import_commands(self):
+        result = CliRunner().invoke(_app("writeit_missing_module:app"), ["--help"])
+
+        assert result.exit_code == 0
+        assert "greet" in result.output
+        assert "Greeting commands" in result.output
+        assert "writeit_missing_module" not in sys.modules
+
+    def test_sub_app_help_resolves_command(self):
+        result = CliRunner().invoke(_app(), ["greet", "--help"])
+
+        assert result.exit_code == 0
+        assert "hello" in result.output
+        assert "bye" in result.output
+
+    def test_function_command_has_no_completion_options(self):
+        result = CliRunner().invoke(_app(), ["shout", "--help"])
+
+        assert result.exit_code == 0
+        assert "--install-completion" not in result.output
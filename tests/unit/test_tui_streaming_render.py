@@ -0,0 +1,124 @@
+"""Tests for frame-coalesced streaming render in the modern pipeline runner."""
+
+import pytest
+from textual.app import App, ComposeResult
+
+from writeit.tui.modern_pipeline_runner import (
+    ExecutionLogWidget,
+    StepExecutionWidget,
+    StreamRenderBuffer,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestStreamRenderBuffer:
+    """Test chunk buffering and frame pacing."""
+
+    def test_chunks_coalesce_into_one_flush(self):
+        clock = FakeClock()
+        buffer = StreamRenderBuffer(max_fps=10, clock=clock)
+
+        for chunk in ["Hel", "lo ", "world"]:
+            buffer.append(chunk)
+
+        assert buffer.flush_delay() == 0.0
+        assert buffer.drain() == ("Hello world", False)
+        assert buffer.text == "Hello world"
+        assert not buffer.has_pending
+
+    def test_flushes_are_frame_rate_capped(self):
+        clock = FakeClock()
+        buffer = StreamRenderBuffer(max_fps=10, clock=clock)
+        buffer.append("a")
+        buffer.drain()
+
+        clock.now += 0.04
+        buffer.append("b")
+        assert buffer.flush_delay() == pytest.approx(0.06)
+
+        clock.now += 0.1
+        assert buffer.flush_delay() == 0.0
+
+    def test_feed_appends_only_new_suffix(self):
+        buffer = StreamRenderBuffer()
+        buffer.feed("The quick")
+        buffer.drain()
+
+        buffer.feed("The quick brown")
+        buffer.feed("The quick brown fox")
+
+        assert buffer.drain() == (" brown fox", False)
+        assert buffer.text == "The quick brown fox"
+
+    def test_feed_resets_on_divergent_response(self):
+        buffer = StreamRenderBuffer()
+        buffer.feed("First draft")
+        buffer.drain()
+
+        buffer.feed("Second")
+
+        assert buffer.drain() == ("Second", True)
+        assert buffer.text == "Second"
+
+
+class _StepApp(App[None]):
+    def __init__(self, widget):
+        super().__init__()
+        self.widget = widget
+
+    def compose(self) -> ComposeResult:
+        yield self.widget
+
+
+class TestStepExecutionWidget:
+    """Test streaming and final render of a step response."""
+
+    @pytest.mark.asyncio
+    async def test_streams_then_renders_markdown_once(self):
+        widget = StepExecutionWidget("draft", "Draft step", max_fps=1000)
+        app = _StepApp(widget)
+
+        async with app.run_test() as pilot:
+            widget.stream_response("# Title\n\nPartial")
+            widget.stream_response("# Title\n\nPartial text")
+            await pilot.pause(0.05)
+
+            stream_log = widget.query_one("#response-stream")
+            markdown = widget.query_one("#response-markdown")
+            assert stream_log.display and not markdown.display
+            assert widget.current_response == "# Title\n\nPartial text"
+
+            widget.update_response("# Title\n\nPartial text done.", {"status": "Completed"})
+            await pilot.pause()
+
+            assert markdown.display and not stream_log.display
+            assert widget.query_one("#response-raw").text == "# Title\n\nPartial text done."
+            assert not widget.query_one("#continue-btn").disabled
+
+
+class TestExecutionLogWidget:
+    """Test the bounded execution log."""
+
+    @pytest.mark.asyncio
+    async def test_entries_are_ring_buffered(self):
+        widget = ExecutionLogWidget(max_entries=3)
+        app = _StepApp(widget)
+
+        async with app.run_test():
+            for index in range(5):
+                widget.log_message("error" if index == 4 else "info", f"message {index}")
+
+            assert [entry[2] for entry in widget.entries] == [
+                "message 2", "message 3", "message 4"
+            ]
+            assert widget.entries[-1][1] == "ERROR"
+
+            widget.clear_log()
+            assert len(widget.entries) == 0